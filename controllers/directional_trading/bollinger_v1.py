@@ -1,5 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional
 
+import pandas as pd
 import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
@@ -69,8 +70,8 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
     def __init__(self, config: BollingerV1ControllerConfig, *args, **kwargs):
         self.config = config
         self.max_records = self.config.bb_length
-        if len(self.config.candles_config) == 0:
-            self.config.candles_config = [CandlesConfig(
+        if self._signal_candles_index(self.config) is None:
+            self.config.candles_config = self.config.candles_config + [CandlesConfig(
                 connector=config.candles_connector,
                 trading_pair=config.candles_trading_pair,
                 interval=config.interval,
@@ -79,23 +80,32 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
-        df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                      trading_pair=self.config.candles_trading_pair,
-                                                      interval=self.config.interval,
-                                                      max_records=self.max_records)
+        await self.update_processed_data_from_candles()
+
+    @staticmethod
+    def _signal_candles_index(config: BollingerV1ControllerConfig) -> Optional[int]:
+        # The signal is computed with the candles of candles_connector, candles_trading_pair and interval
+        for index, candles_config in enumerate(config.candles_config):
+            if (candles_config.connector == config.candles_connector
+                    and candles_config.trading_pair == config.candles_trading_pair
+                    and candles_config.interval == config.interval):
+                return index
+        return None
+
+    @staticmethod
+    def compute_processed_data(config: BollingerV1ControllerConfig, candles: List[pd.DataFrame]) -> Dict:
+        df = candles[BollingerV1Controller._signal_candles_index(config)]
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+        df.ta.bbands(length=config.bb_length, std=config.bb_std, append=True)
+        bbp = df[f"BBP_{config.bb_length}_{config.bb_std}"]
 
         # Generate signal
-        long_condition = bbp < self.config.bb_long_threshold
-        short_condition = bbp > self.config.bb_short_threshold
+        long_condition = bbp < config.bb_long_threshold
+        short_condition = bbp > config.bb_short_threshold
 
         # Generate signal
         df["signal"] = 0
         df.loc[long_condition, "signal"] = 1
         df.loc[short_condition, "signal"] = -1
 
-        # Update processed data
-        self.processed_data["signal"] = df["signal"].iloc[-1]
-        self.processed_data["features"] = df
+        return {"signal": df["signal"].iloc[-1], "features": df}
@@ -87,6 +87,14 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "db_archive",
+                             "db_archive_enabled",
+                             "db_archive_hot_months",
+                             "perf_metrics",
+                             "perf_metrics_enabled",
+                             "perf_metrics_port",
+                             "perf_metrics_tick_sampling",
+                             "perf_metrics_loop_lag_interval",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -2,7 +2,7 @@ import os
 from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, joinedload
 
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
@@ -107,6 +107,19 @@ class ExportCommand:
         else:
             result: List[TradeFill] = query.limit(number_of_rows).all() or []
 
+        # The trades of the archived months are merged with the ones in the trades database
+        archived_trades: List[TradeFill] = self.trade_fill_db.query_archives(
+            lambda archive_session: (archive_session
+                                     .query(TradeFill)
+                                     .options(joinedload(TradeFill.order))
+                                     .filter(*filters)
+                                     .order_by(TradeFill.timestamp.desc())
+                                     .limit(number_of_rows)),
+            start_timestamp=start_timestamp / 1e3)
+        if len(archived_trades) > 0:
+            result = sorted(result + archived_trades, key=lambda trade: trade.timestamp, reverse=True)
+            result = result[:number_of_rows]
+
         # Get the latest 100 trades in ascending timestamp order
         result.reverse()
         return result
@@ -22,6 +22,7 @@ from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
 from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -246,6 +247,7 @@ class StartCommand(GatewayChainApiManager):
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            await self._start_runtime_metrics()
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -266,6 +268,23 @@ class StartCommand(GatewayChainApiManager):
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    async def _start_runtime_metrics(self,  # type: HummingbotApplication
+                                     ):
+        perf_metrics_config = self.client_config_map.perf_metrics
+        if not perf_metrics_config.perf_metrics_enabled:
+            return
+        runtime_metrics = RuntimeMetrics.get_instance()
+        runtime_metrics.reset()
+        runtime_metrics.enable(
+            tick_sampling=perf_metrics_config.perf_metrics_tick_sampling,
+            loop_lag_interval=perf_metrics_config.perf_metrics_loop_lag_interval,
+        )
+        try:
+            await runtime_metrics.start_http_server(port=perf_metrics_config.perf_metrics_port)
+        except Exception:
+            self.logger().error("Error starting the performance metrics endpoint. The metrics are still available "
+                                "with `status --perf`.", exc_info=True)
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
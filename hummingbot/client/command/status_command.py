@@ -18,6 +18,7 @@ from hummingbot.client.settings import ethereum_wallet_required, required_exchan
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -123,13 +124,32 @@ class StatusCommand:
         return validation_errors
 
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               perf: bool = False):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.status, live)
+            self.ev_loop.call_soon_threadsafe(self.status, live, perf)
             return
 
+        if perf:
+            safe_ensure_future(self.runtime_metrics_status(live=live), loop=self.ev_loop)
+            return
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
 
+    async def runtime_metrics_status(self,  # type: HummingbotApplication
+                                     live: bool = False):
+        runtime_metrics = RuntimeMetrics.get_instance()
+        if live and runtime_metrics.enabled:
+            await self.stop_live_update()
+            self.app.live_updates = True
+            while self.app.live_updates and runtime_metrics.enabled:
+                await self.cls_display_delay(
+                    runtime_metrics.format_status() + "\n\n Press escape key to stop update.", 1
+                )
+            self.app.live_updates = False
+            self.notify("Stopped live status display update.")
+        else:
+            self.notify(runtime_metrics.format_status())
+
     async def status_check_all(self,  # type: HummingbotApplication
                                notify_success=True,
                                live=False) -> bool:
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 if TYPE_CHECKING:
@@ -57,6 +58,10 @@ class StopCommand:
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
+        if RuntimeMetrics.get_instance().enabled:
+            RuntimeMetrics.get_instance().disable()
+            await RuntimeMetrics.get_instance().stop_http_server()
+
         self.strategy_task = None
         self.strategy = None
         self.market_pair = None
@@ -173,6 +173,70 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class DBArchiveConfigMap(BaseClientModel):
+    db_archive_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the archival of the closed months of the trades database"
+            ),
+        ),
+    )
+    db_archive_hot_months: int = Field(
+        default=3,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many months (including the current one) do you want to keep in the trades database? (Default=3)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "db_archive"
+
+
+class PerformanceMetricsConfigMap(BaseClientModel):
+    perf_metrics_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the tick, event loop lag and queue depth performance metrics"
+            ),
+        ),
+    )
+    perf_metrics_port: int = Field(
+        default=9464,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the local port of the Prometheus metrics endpoint (Default=9464)"
+            ),
+        ),
+    )
+    perf_metrics_tick_sampling: int = Field(
+        default=1,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Measure one out of how many ticks and control loops? (Default=1)"
+            ),
+        ),
+    )
+    perf_metrics_loop_lag_interval: float = Field(
+        default=1.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the event loop lag sampling interval in seconds (Default=1.0)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "perf_metrics"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -1102,6 +1166,8 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    db_archive: DBArchiveConfigMap = Field(default=DBArchiveConfigMap())
+    perf_metrics: PerformanceMetricsConfigMap = Field(default=PerformanceMetricsConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import six
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -104,7 +107,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 refresh_interval=0.05):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -182,8 +186,21 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
-        self.log(initial_text)
+        # The log lines are kept in a ring buffer, and the document is refreshed at most once every `refresh_interval`
+        # seconds no matter how many lines are logged in between (log can be called from executor threads).
+        # A refresh only appends the new lines to the document, and removes the lines evicted from the ring buffer.
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self.refresh_interval = refresh_interval
+        self._log_lock = threading.Lock()
+        self._unsaved_text: Optional[str] = None
+        self._refresh_scheduled = False
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._appended_line_count = 0
+        self._rendered_line_count = 0
+        self._document_line_count = 0
+        self._rendered_text: Optional[str] = None
+        self.log(initial_text, silent=True)
+        self._refresh_document()
 
     @property
     def text(self):
@@ -243,12 +260,68 @@ class CustomTextArea:
                 line = line[max_width:]
             new_lines.append(line)
 
-        if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
-            new_text: str = "\n".join(new_lines)
+        with self._log_lock:
+            if save_log:
+                self.log_lines.extend(new_lines)
+                self._appended_line_count += len(new_lines)
+                if not silent:
+                    self._unsaved_text = None
+            else:
+                self._unsaved_text = "\n".join(new_lines)
         if not silent:
-            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+            self._request_document_refresh()
+
+    def _get_event_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        if self._ev_loop is None:
+            try:
+                self._ev_loop = asyncio.get_event_loop()
+            except RuntimeError:
+                # Logging from a thread without event loop before the UI event loop is known
+                return None
+        return self._ev_loop
+
+    def _request_document_refresh(self):
+        ev_loop = self._get_event_loop()
+        if ev_loop is None or not ev_loop.is_running():
+            self._refresh_document()
+            return
+        with self._log_lock:
+            if self._refresh_scheduled:
+                return
+            self._refresh_scheduled = True
+        ev_loop.call_soon_threadsafe(ev_loop.call_later, self.refresh_interval, self._refresh_document)
+
+    def _refresh_document(self):
+        with self._log_lock:
+            self._refresh_scheduled = False
+            if self._unsaved_text is not None:
+                new_text: str = self._unsaved_text
+                self._rendered_text = None
+            else:
+                new_text = self._render_log_lines()
+                self._rendered_text = new_text
+        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    def _render_log_lines(self) -> str:
+        new_line_count = self._appended_line_count - self._rendered_line_count
+        line_count = len(self.log_lines)
+        if (self._rendered_text is None
+                or self.buffer.text is not self._rendered_text
+                or new_line_count >= line_count):
+            # The document shows something else (e.g. a live status display) or all its lines were evicted
+            text = "\n".join(self.log_lines)
+        else:
+            text = self._rendered_text
+            evicted_line_count = self._document_line_count + new_line_count - line_count
+            if evicted_line_count > 0:
+                start = 0
+                for _ in range(evicted_line_count):
+                    start = text.index("\n", start) + 1
+                text = text[start:]
+            if new_line_count > 0:
+                new_lines = list(islice(reversed(self.log_lines), new_line_count))
+                new_lines.reverse()
+                text = text + "\n" + "\n".join(new_lines)
+        self._rendered_line_count = self._appended_line_count
+        self._document_line_count = line_count
+        return text
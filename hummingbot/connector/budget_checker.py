@@ -2,9 +2,12 @@ import typing
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
@@ -45,15 +48,22 @@ class BudgetChecker:
         See the doc string for `adjust_candidate` to learn more about how the adjusted order
         amount is derived.
 
+        When the exchange fee schema only has percent fees charged in the tokens of the trading pair, all the
+        candidates are sized in a single pass (see `_adjust_candidates_in_batch`).
+
         :param order_candidates: A list of candidate orders to check and adjust.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
         :return: The list of adjusted order candidates.
         """
         self.reset_locked_collateral()
-        adjusted_candidates = [
-            self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
-            for order_candidate in order_candidates
-        ]
+        fee_schema = self._batch_sizing_fee_schema(order_candidates)
+        if fee_schema is not None:
+            adjusted_candidates = self._adjust_candidates_in_batch(order_candidates, all_or_none, fee_schema)
+        else:
+            adjusted_candidates = [
+                self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
         self.reset_locked_collateral()
         return adjusted_candidates
 
@@ -119,6 +129,64 @@ class BudgetChecker:
         order_candidate.populate_collateral_entries(self._exchange)
         return order_candidate
 
+    def _batch_sizing_fee_schema(self, order_candidates: List[OrderCandidate]) -> Optional[TradeFeeSchema]:
+        """
+        Returns the fee schema of the exchange if the candidates can be sized in batch, None if they require the
+        per-candidate path: specialized budget checkers and candidates, and fee schemas with fixed fees or a percent
+        fee token, which need conversion rates from the exchange for every candidate.
+        """
+        if (type(self) is not BudgetChecker
+                or len(order_candidates) == 0
+                or any(type(order_candidate) is not OrderCandidate for order_candidate in order_candidates)):
+            return None
+        fee_schema = TradeFeeSchemaLoader.configured_schema_for_exchange(exchange_name=self._exchange.name)
+        if (fee_schema.percent_fee_token is not None
+                or len(fee_schema.maker_fixed_fees) > 0
+                or len(fee_schema.taker_fixed_fees) > 0):
+            return None
+        return fee_schema
+
+    def _adjust_candidates_in_batch(
+        self, order_candidates: List[OrderCandidate], all_or_none: bool, fee_schema: TradeFeeSchema
+    ) -> List[OrderCandidate]:
+        """
+        Sizes the candidates in order with the same greedy allocation as
+        `adjust_candidate_and_lock_available_collateral`, but the fee schema is loaded once, the collateral entries are
+        calculated directly from the percent fee instead of building a trade fee per candidate, and the balance of each
+        token is queried once.
+        """
+        balances: Dict[Tuple[bool, str], Decimal] = {}
+        adjusted_candidates = []
+        for order_candidate in order_candidates:
+            order_candidate = copy(order_candidate)
+            fee_percent = (fee_schema.maker_percent_fee_decimal
+                           if order_candidate.is_maker
+                           else fee_schema.taker_percent_fee_decimal)
+            fee_added_to_cost = (order_candidate.order_side == TradeType.BUY
+                                 and not fee_schema.buy_percent_fee_deducted_from_returns)
+            order_candidate.populate_percent_fee_collateral_entries(fee_percent, fee_added_to_cost)
+
+            token = order_candidate.order_collateral.token
+            balance_key = (order_candidate.from_total_balances, token)
+            if balance_key not in balances:
+                balances[balance_key] = (self._exchange.get_balance(token)
+                                         if order_candidate.from_total_balances
+                                         else self._exchange.get_available_balance(token))
+            order_candidate.adjust_from_balances({token: balances[balance_key] - self._locked_collateral[token]})
+
+            if order_candidate.resized:
+                if all_or_none:
+                    order_candidate.set_to_zero()
+                else:
+                    quantized_amount = self._exchange.quantize_order_amount(order_candidate.trading_pair,
+                                                                            order_candidate.amount)
+                    if order_candidate.amount != quantized_amount:
+                        order_candidate.amount = quantized_amount
+                        order_candidate.populate_percent_fee_collateral_entries(fee_percent, fee_added_to_cost)
+            self._lock_available_collateral(order_candidate)
+            adjusted_candidates.append(order_candidate)
+        return adjusted_candidates
+
     def _get_available_balances(self, order_candidate: OrderCandidate) -> Dict[str, Decimal]:
         available_balances = {}
         balance_fn = (
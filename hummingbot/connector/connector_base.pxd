@@ -6,6 +6,7 @@ cdef class ConnectorBase(NetworkIterator):
     cdef:
         EventReporter _event_reporter
         EventLogger _event_logger
+        public object _fill_balance_ledger
         public bint _trading_required
         public dict _account_available_balances
         public dict _account_balances
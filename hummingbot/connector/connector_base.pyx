@@ -4,6 +4,7 @@ from decimal import Decimal
 from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.connector.fill_balance_ledger import FillBalanceLedger
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
@@ -43,15 +44,20 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionUpdateFailure,
         MarketEvent.RangePositionFeeCollected,
     ]
+    # Maximum number of order filled events kept in the connector event logs
+    ORDER_FILLED_EVENT_LOGS_LENGTH = 10_000
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name,
+                                         max_order_filled_events=self.ORDER_FILLED_EVENT_LOGS_LENGTH)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        self._fill_balance_ledger = FillBalanceLedger()
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._fill_balance_ledger)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -142,24 +148,16 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
-        balances = {}
-        for event in order_filled_events:
-            base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
-        return balances
+        return self._fill_balance_ledger.balances_since(starting_timestamp)
+
+    def order_filled_balance(self, currency: str, starting_timestamp = 0) -> Decimal:
+        """
+        Calculates the balance change of a token from filled orders since the timestamp (see `order_filled_balances`)
+        :param currency: The currency (token) name
+        :param starting_timestamp: The starting timestamp to include filter order filled events
+        :returns The balance change of the token
+        """
+        return self._fill_balance_ledger.balance_since(currency, starting_timestamp)
 
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
@@ -388,7 +386,7 @@ cdef class ConnectorBase(NetworkIterator):
         """
         in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
         limit -= in_flight_balance
-        filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
+        filled_balance = self.order_filled_balance(currency)
         limit += filled_balance
         limit = max(limit, s_decimal_0)
         return min(available_balance, limit)
@@ -403,8 +401,7 @@ cdef class ConnectorBase(NetworkIterator):
         """
         snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
         in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
+        orders_filled_bal = self.order_filled_balance(currency, self._in_flight_orders_snapshot_timestamp)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
         return actual_available
 
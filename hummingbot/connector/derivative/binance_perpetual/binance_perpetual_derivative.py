@@ -18,7 +18,7 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_auth im
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_data_source import (
     BinancePerpetualUserStreamDataSource,
 )
-from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.derivative.position import Position, PositionUpdate
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -115,6 +115,10 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     def funding_fee_poll_interval(self) -> int:
         return 600
 
+    @property
+    def position_updates_streamed(self) -> bool:
+        return True
+
     def supported_order_types(self) -> List[OrderType]:
         """
         :return a list of OrderType supported by this connector
@@ -207,7 +211,8 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             self._update_order_fills_from_trades(),
             self._update_order_status(),
             self._update_balances(),
-            self._update_positions(),
+            self._reconcile_positions(),
+            self._reconcile_funding_info(),
         )
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
@@ -449,19 +454,14 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                     # Ignore results for which their symbols is not tracked by the connector
                     continue
 
-                side = PositionSide[asset['ps']]
-                position = self._perpetual_trading.get_position(hb_trading_pair, side)
-                if position is not None:
-                    amount = Decimal(asset["pa"])
-                    if amount == Decimal("0"):
-                        pos_key = self._perpetual_trading.position_key(hb_trading_pair, side)
-                        self._perpetual_trading.remove_position(pos_key)
-                    else:
-                        position.update_position(position_side=PositionSide[asset["ps"]],
-                                                 unrealized_pnl=Decimal(asset["up"]),
-                                                 entry_price=Decimal(asset["ep"]),
-                                                 amount=Decimal(asset["pa"]))
-                else:
+                position_update = PositionUpdate(
+                    trading_pair=hb_trading_pair,
+                    position_side=PositionSide[asset["ps"]],
+                    amount=Decimal(asset["pa"]),
+                    unrealized_pnl=Decimal(asset["up"]),
+                    entry_price=Decimal(asset["ep"]),
+                )
+                if not self._perpetual_trading.process_position_update(position_update):
                     await self._update_positions()
         elif event_type == "MARGIN_CALL":
             positions = event_message.get("p", [])
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 from collections import OrderedDict
@@ -11,6 +12,7 @@ from hummingbot.connector.derivative.hyperliquid_perpetual import hyperliquid_pe
 from hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_web_utils import (
     order_spec_to_order_wire,
 )
+from hummingbot.connector.exchange.hyperliquid.hyperliquid_auth import HyperliquidAuth
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
@@ -18,6 +20,10 @@ from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RES
 class HyperliquidPerpetualAuth(AuthBase):
     """
     Auth class required by Hyperliquid Perpetual API
+
+    The requests are signed in a signing thread instead of the event loop: encoding and signing the actions (msgpack,
+    keccak and EIP-712) is CPU bound and would delay the processing of the market data. The signing thread is shared
+    with the Hyperliquid spot connector.
     """
 
     def __init__(self, api_key: str, api_secret: str, use_vault: bool):
@@ -80,7 +86,8 @@ class HyperliquidPerpetualAuth(AuthBase):
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         base_url = request.url
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params_post(request.data, base_url)
+            request.data = await asyncio.get_running_loop().run_in_executor(
+                HyperliquidAuth.signing_executor(), self.add_auth_to_params_post, request.data, base_url)
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -103,9 +110,11 @@ class HyperliquidPerpetualAuth(AuthBase):
         return payload
 
     def _sign_cancel_params(self, params, base_url, timestamp):
+        # A batch of cancels is signed once for all the orders
+        cancels = params["cancels"] if isinstance(params["cancels"], list) else [params["cancels"]]
         order_action = {
             "type": "cancelByCloid",
-            "cancels": [params["cancels"]],
+            "cancels": cancels,
         }
         signature = self.sign_l1_action(
             self.wallet,
@@ -124,12 +133,12 @@ class HyperliquidPerpetualAuth(AuthBase):
         return payload
 
     def _sign_order_params(self, params, base_url, timestamp):
-
-        order = params["orders"]
+        # A batch of orders is signed once for all the orders
+        orders = params["orders"] if isinstance(params["orders"], list) else [params["orders"]]
         grouping = params["grouping"]
         order_action = {
             "type": "order",
-            "orders": [order_spec_to_order_wire(order)],
+            "orders": [order_spec_to_order_wire(order) for order in orders],
             "grouping": grouping,
         }
         signature = self.sign_l1_action(
@@ -1,5 +1,4 @@
 import asyncio
-import hashlib
 import time
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
@@ -19,12 +18,14 @@ from hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual
     HyperliquidPerpetualUserStreamDataSource,
 )
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.exchange.hyperliquid.hyperliquid_batch_orders import HyperliquidBatchOrdersMixin
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import combine_to_hb_trading_pair, get_new_client_order_id
+from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -38,7 +39,7 @@ if TYPE_CHECKING:
 bpm_logger = None
 
 
-class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
+class HyperliquidPerpetualDerivative(HyperliquidBatchOrdersMixin, PerpetualDerivativePyBase):
     web_utils = web_utils
 
     SHORT_POLL_INTERVAL = 5.0
@@ -253,15 +254,9 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         pass
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
-        coin = symbol.split("-")[0]
-
         api_params = {
             "type": "cancel",
-            "cancels": {
-                "asset": self.coin_to_asset[coin],
-                "cloid": order_id
-            },
+            "cancels": await self._cancel_spec(order_id=order_id, trading_pair=tracked_order.trading_pair),
         }
         cancel_result = await self._api_post(
             path_url=CONSTANTS.CANCEL_ORDER_URL,
@@ -295,15 +290,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
 
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=True,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_hex_order_id(is_buy=True, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
             mid_price = self.get_mid_price(trading_pair)
             slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
@@ -334,15 +321,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         :param price: the order price
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=False,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_hex_order_id(is_buy=False, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
             mid_price = self.get_mid_price(trading_pair)
             slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
@@ -371,26 +350,17 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        coin = symbol.split("-")[0]
-        param_order_type = {"limit": {"tif": "Gtc"}}
-        if order_type is OrderType.LIMIT_MAKER:
-            param_order_type = {"limit": {"tif": "Alo"}}
-        if order_type is OrderType.MARKET:
-            param_order_type = {"limit": {"tif": "Ioc"}}
-
         api_params = {
             "type": "order",
             "grouping": "na",
-            "orders": {
-                "asset": self.coin_to_asset[coin],
-                "isBuy": True if trade_type is TradeType.BUY else False,
-                "limitPx": float(price),
-                "sz": float(amount),
-                "reduceOnly": position_action == PositionAction.CLOSE,
-                "orderType": param_order_type,
-                "cloid": order_id,
-            }
+            "orders": await self._order_spec(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price,
+                position_action=position_action),
         }
         order_result = await self._api_post(
             path_url=CONSTANTS.CREATE_ORDER_URL,
@@ -406,6 +376,18 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         o_id = str(o_data["oid"])
         return (o_id, self.current_timestamp)
 
+    async def _asset_index(self, trading_pair: str) -> int:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        coin = symbol.split("-")[0]
+        return self.coin_to_asset[coin]
+
+    def _batch_order_position_action(self, order: LimitOrder) -> PositionAction:
+        # Limit orders default to PositionAction.NIL, the orders of strategies that don't manage positions open one
+        return PositionAction.OPEN if order.position is PositionAction.NIL else order.position
+
+    def _is_valid_position_action(self, position_action: PositionAction) -> bool:
+        return position_action in self.VALID_POSITION_ACTIONS
+
     async def _update_trade_history(self):
         orders = list(self._order_tracker.all_fillable_orders.values())
         all_fillable_orders = self._order_tracker.all_fillable_orders_by_exchange_order_id
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from decimal import Decimal
+from typing import Optional
 
 from hummingbot.core.data_type.common import PositionSide
 
@@ -65,3 +67,19 @@ class Position:
         self._entry_price = entry_price if entry_price is not None else self._entry_price
         self._amount = amount if amount is not None else self._amount
         self._leverage = leverage if leverage is not None else self._leverage
+
+
+@dataclass
+class PositionUpdate:
+    """
+    Position state for a trading pair and side, as published by the exchange through a stream channel.
+    The fields that are not provided keep the value of the tracked position.
+    update_id is the exchange sequence number of the message, when the channel provides one.
+    """
+    trading_pair: str
+    position_side: PositionSide
+    amount: Decimal
+    unrealized_pnl: Optional[Decimal] = None
+    entry_price: Optional[Decimal] = None
+    leverage: Optional[Decimal] = None
+    update_id: Optional[int] = None
@@ -15,6 +15,8 @@ class BinanceAuth(AuthBase):
         self.api_key = api_key
         self.secret_key = secret_key
         self.time_provider = time_provider
+        # The HMAC key schedule is calculated once and copied for every signature
+        self._signature_hmac = hmac.new(secret_key.encode("utf8"), digestmod=hashlib.sha256)
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -60,5 +62,7 @@ class BinanceAuth(AuthBase):
     def _generate_signature(self, params: Dict[str, Any]) -> str:
 
         encoded_params_str = urlencode(params)
-        digest = hmac.new(self.secret_key.encode("utf8"), encoded_params_str.encode("utf8"), hashlib.sha256).hexdigest()
+        signature_hmac = self._signature_hmac.copy()
+        signature_hmac.update(encoded_params_str.encode("utf8"))
+        digest = signature_hmac.hexdigest()
         return digest
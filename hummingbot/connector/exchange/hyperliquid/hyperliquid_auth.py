@@ -1,6 +1,9 @@
+import asyncio
 import json
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import eth_account
 import msgpack
@@ -16,7 +19,17 @@ from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RES
 class HyperliquidAuth(AuthBase):
     """
     Auth class required by Hyperliquid API
+
+    The requests are signed in a signing thread instead of the event loop: encoding and signing the actions (msgpack,
+    keccak and EIP-712) is CPU bound and would delay the processing of the market data.
     """
+    _signing_executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def signing_executor(cls) -> ThreadPoolExecutor:
+        if cls._signing_executor is None:
+            cls._signing_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hyperliquid_signing")
+        return cls._signing_executor
 
     def __init__(self, api_key: str, api_secret: str, use_vault: bool):
         self._api_key: str = api_key
@@ -78,7 +91,8 @@ class HyperliquidAuth(AuthBase):
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         base_url = request.url
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params_post(request.data, base_url)
+            request.data = await asyncio.get_running_loop().run_in_executor(
+                self.signing_executor(), self.add_auth_to_params_post, request.data, base_url)
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -101,9 +115,11 @@ class HyperliquidAuth(AuthBase):
         return payload
 
     def _sign_cancel_params(self, params, base_url, timestamp):
+        # A batch of cancels is signed once for all the orders
+        cancels = params["cancels"] if isinstance(params["cancels"], list) else [params["cancels"]]
         order_action = {
             "type": "cancelByCloid",
-            "cancels": [params["cancels"]],
+            "cancels": cancels,
         }
         signature = self.sign_l1_action(
             self.wallet,
@@ -122,12 +138,12 @@ class HyperliquidAuth(AuthBase):
         return payload
 
     def _sign_order_params(self, params, base_url, timestamp):
-
-        order = params["orders"]
+        # A batch of orders is signed once for all the orders
+        orders = params["orders"] if isinstance(params["orders"], list) else [params["orders"]]
         grouping = params["grouping"]
         order_action = {
             "type": "order",
-            "orders": [order_spec_to_order_wire(order)],
+            "orders": [order_spec_to_order_wire(order) for order in orders],
             "grouping": grouping,
         }
         signature = self.sign_l1_action(
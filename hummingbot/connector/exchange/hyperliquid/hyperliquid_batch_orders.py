@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from hummingbot.connector.exchange.hyperliquid import hyperliquid_constants as CONSTANTS
+from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class HyperliquidBatchOrdersMixin:
+    """
+    Order and cancel actions shared by the Hyperliquid spot and perpetual connectors. Batches of orders are sent in a
+    single order or cancel action, so one signature and one request cover the whole batch.
+
+    The connectors using it implement `_asset_index` to map their trading pairs to the Hyperliquid asset index.
+    """
+
+    def batch_order_create(self, orders_to_create: List[LimitOrder]) -> List[LimitOrder]:
+        """
+        Creates the orders with a single order action, signed once for all the orders.
+
+        :param orders_to_create: the orders to create, their order ids are ignored
+        :return: the orders to create with the client order ids assigned to them
+        """
+        orders_with_ids_to_create = [
+            order.copy_with_id(client_order_id=self._new_hex_order_id(is_buy=order.is_buy,
+                                                                      trading_pair=order.trading_pair))
+            for order in orders_to_create
+        ]
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels the orders with a single cancel action, signed once for all the orders.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+    async def _asset_index(self, trading_pair: str) -> int:
+        raise NotImplementedError
+
+    def _batch_order_position_action(self, order: LimitOrder) -> PositionAction:
+        # Spot orders don't open or close positions
+        return PositionAction.NIL
+
+    def _is_valid_position_action(self, position_action: PositionAction) -> bool:
+        return True
+
+    async def _execute_batch_order_create(self, orders_to_create: List[LimitOrder]):
+        in_flight_orders = []
+        for order in orders_to_create:
+            in_flight_order = self._start_tracking_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=Decimal(str(order.quantity)),
+                order_type=order.order_type(),
+                price=order.price,
+                position_action=self._batch_order_position_action(order),
+            )
+            if in_flight_order is not None:
+                in_flight_orders.append(in_flight_order)
+        if len(in_flight_orders) == 0:
+            return
+
+        try:
+            api_params = {
+                "type": "order",
+                "grouping": "na",
+                "orders": [await self._order_spec(order_id=order.client_order_id,
+                                                  trading_pair=order.trading_pair,
+                                                  amount=order.amount,
+                                                  trade_type=order.trade_type,
+                                                  order_type=order.order_type,
+                                                  price=order.price,
+                                                  position_action=order.position)
+                           for order in in_flight_orders],
+            }
+            order_result = await self._api_post(
+                path_url=CONSTANTS.CREATE_ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+            if order_result.get("status") == "err":
+                raise IOError(f"Error submitting orders: {order_result['response']}")
+            statuses = order_result["response"]["data"]["statuses"]
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            for order in in_flight_orders:
+                self._on_order_failure(order_id=order.client_order_id,
+                                       trading_pair=order.trading_pair,
+                                       amount=order.amount,
+                                       trade_type=order.trade_type,
+                                       order_type=order.order_type,
+                                       price=order.price,
+                                       exception=ex)
+            return
+
+        for order, status in zip(in_flight_orders, statuses):
+            o_data = status.get("resting") or status.get("filled")
+            if "error" in status or o_data is None:
+                self._on_order_failure(order_id=order.client_order_id,
+                                       trading_pair=order.trading_pair,
+                                       amount=order.amount,
+                                       trade_type=order.trade_type,
+                                       order_type=order.order_type,
+                                       price=order.price,
+                                       exception=IOError(f"Error submitting order {order.client_order_id}: "
+                                                         f"{status.get('error')}"))
+            else:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(o_data["oid"]),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=self.current_timestamp,
+                    new_state=OrderState.OPEN,
+                ))
+
+    def _start_tracking_and_validate_order(
+            self,
+            trade_type: TradeType,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction,
+    ) -> Optional[InFlightOrder]:
+        """
+        Starts tracking an order of a batch and applies the validations done for single orders by `_create_order`.
+
+        :return: the tracked order, or None if the order is not valid and was marked as failed
+        """
+        trading_rule = self._trading_rules[trading_pair]
+        price = self.quantize_order_price(trading_pair, price)
+        quantized_amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount)
+
+        self.start_tracking_order(
+            order_id=order_id,
+            exchange_order_id=None,
+            trading_pair=trading_pair,
+            order_type=order_type,
+            trade_type=trade_type,
+            price=price,
+            amount=quantized_amount,
+            position_action=position_action,
+        )
+
+        if not self._is_valid_position_action(position_action):
+            self.logger().error(f"Invalid position action {position_action} for order {order_id}. The order will not "
+                                f"be created.")
+        elif order_type not in self.supported_order_types():
+            self.logger().error(f"{order_type} is not in the list of supported order types")
+        elif quantized_amount < trading_rule.min_order_size:
+            self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
+                                  f"size {trading_rule.min_order_size}. The order will not be created.")
+        elif price * quantized_amount < trading_rule.min_notional_size:
+            self.logger().warning(f"{trade_type.name.title()} order notional {price * quantized_amount} is lower "
+                                  f"than the minimum notional size {trading_rule.min_notional_size}. The order will "
+                                  f"not be created.")
+        else:
+            return self._order_tracker.active_orders[order_id]
+        self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+        return None
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        results = []
+        tracked_orders = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+        if len(tracked_orders) == 0:
+            return results
+
+        try:
+            api_params = {
+                "type": "cancel",
+                "cancels": [await self._cancel_spec(order_id=order.client_order_id, trading_pair=order.trading_pair)
+                            for order in tracked_orders],
+            }
+            cancel_result = await self._api_post(
+                path_url=CONSTANTS.CANCEL_ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+            if cancel_result.get("status") == "err":
+                raise IOError(f"Error canceling orders: {cancel_result['response']}")
+            statuses = cancel_result["response"]["data"]["statuses"]
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                f"Failed to cancel orders {', '.join([o.client_order_id for o in tracked_orders])}", exc_info=True)
+            return results + [CancellationResult(order_id=order.client_order_id, success=False)
+                              for order in tracked_orders]
+
+        for order, status in zip(tracked_orders, statuses):
+            success = status == "success"
+            if success:
+                self._order_tracker.process_order_update(OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    update_timestamp=self.current_timestamp,
+                    new_state=(OrderState.CANCELED
+                               if self.is_cancel_request_in_exchange_synchronous
+                               else OrderState.PENDING_CANCEL),
+                ))
+            else:
+                self.logger().debug(f"The order {order.client_order_id} does not exist on {self.name_cap}. "
+                                    f"No cancelation needed.")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            results.append(CancellationResult(order_id=order.client_order_id, success=success))
+        return results
+
+    async def _order_spec(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction = PositionAction.NIL,
+    ) -> Dict[str, Any]:
+        param_order_type = {"limit": {"tif": "Gtc"}}
+        if order_type is OrderType.LIMIT_MAKER:
+            param_order_type = {"limit": {"tif": "Alo"}}
+        if order_type is OrderType.MARKET:
+            param_order_type = {"limit": {"tif": "Ioc"}}
+        return {
+            "asset": await self._asset_index(trading_pair=trading_pair),
+            "isBuy": True if trade_type is TradeType.BUY else False,
+            "limitPx": float(price),
+            "sz": float(amount),
+            "reduceOnly": position_action == PositionAction.CLOSE,
+            "orderType": param_order_type,
+            "cloid": order_id,
+        }
+
+    async def _cancel_spec(self, order_id: str, trading_pair: str) -> Dict[str, Any]:
+        return {
+            "asset": await self._asset_index(trading_pair=trading_pair),
+            "cloid": order_id
+        }
+
+    def _new_hex_order_id(self, is_buy: bool, trading_pair: str) -> str:
+        # Hyperliquid requires the client order ids to be 16 bytes hex strings
+        order_id = get_new_client_order_id(
+            is_buy=is_buy,
+            trading_pair=trading_pair,
+            hbot_order_id_prefix=self.client_order_id_prefix,
+            max_id_len=self.client_order_id_max_length
+        )
+        md5 = hashlib.md5()
+        md5.update(order_id.encode('utf-8'))
+        return f"0x{md5.hexdigest()}"
@@ -1,5 +1,4 @@
 import asyncio
-import hashlib
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
 
@@ -17,9 +16,10 @@ from hummingbot.connector.exchange.hyperliquid.hyperliquid_api_user_stream_data_
     HyperliquidAPIUserStreamDataSource,
 )
 from hummingbot.connector.exchange.hyperliquid.hyperliquid_auth import HyperliquidAuth
+from hummingbot.connector.exchange.hyperliquid.hyperliquid_batch_orders import HyperliquidBatchOrdersMixin
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair, get_new_client_order_id
+from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
@@ -34,7 +34,7 @@ if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
 
-class HyperliquidExchange(ExchangePyBase):
+class HyperliquidExchange(HyperliquidBatchOrdersMixin, ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
 
     web_utils = web_utils
@@ -239,13 +239,9 @@ class HyperliquidExchange(ExchangePyBase):
         pass
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
         api_params = {
             "type": "cancel",
-            "cancels": {
-                "asset": self.coin_to_asset[symbol],
-                "cloid": order_id
-            },
+            "cancels": await self._cancel_spec(order_id=order_id, trading_pair=tracked_order.trading_pair),
         }
         cancel_result = await self._api_post(
             path_url=CONSTANTS.CANCEL_ORDER_URL,
@@ -279,15 +275,7 @@ class HyperliquidExchange(ExchangePyBase):
 
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=True,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_hex_order_id(is_buy=True, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
             mid_price = self.get_mid_price(trading_pair)
             slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
@@ -318,15 +306,7 @@ class HyperliquidExchange(ExchangePyBase):
         :param price: the order price
         :return: the id assigned by the connector to the order (the client id)
         """
-        order_id = get_new_client_order_id(
-            is_buy=False,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=self.client_order_id_prefix,
-            max_id_len=self.client_order_id_max_length
-        )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._new_hex_order_id(is_buy=False, trading_pair=trading_pair)
         if order_type is OrderType.MARKET:
             mid_price = self.get_mid_price(trading_pair)
             slippage = CONSTANTS.MARKET_ORDER_SLIPPAGE
@@ -354,25 +334,16 @@ class HyperliquidExchange(ExchangePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        param_order_type = {"limit": {"tif": "Gtc"}}
-        if order_type is OrderType.LIMIT_MAKER:
-            param_order_type = {"limit": {"tif": "Alo"}}
-        if order_type is OrderType.MARKET:
-            param_order_type = {"limit": {"tif": "Ioc"}}
-
         api_params = {
             "type": "order",
             "grouping": "na",
-            "orders": {
-                "asset": self.coin_to_asset[symbol],
-                "isBuy": True if trade_type is TradeType.BUY else False,
-                "limitPx": float(price),
-                "sz": float(amount),
-                "reduceOnly": False,
-                "orderType": param_order_type,
-                "cloid": order_id,
-            }
+            "orders": await self._order_spec(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price),
         }
         order_result = await self._api_post(
             path_url = CONSTANTS.CREATE_ORDER_URL,
@@ -388,6 +359,10 @@ class HyperliquidExchange(ExchangePyBase):
         o_id = str(o_data["oid"])
         return (o_id, self.current_timestamp)
 
+    async def _asset_index(self, trading_pair: str) -> int:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        return self.coin_to_asset[symbol]
+
     async def _update_trade_history(self):
         orders = list(self._order_tracker.all_fillable_orders.values())
         all_fillable_orders = self._order_tracker.all_fillable_orders_by_exchange_order_id
@@ -181,6 +181,10 @@ class InjectiveDataSource(ABC):
     async def initialize_trading_account(self):
         raise NotImplementedError
 
+    @abstractmethod
+    def set_trading_account_sequence(self, sequence: int):
+        raise NotImplementedError
+
     @abstractmethod
     async def update_markets(self):
         raise NotImplementedError
@@ -414,7 +418,10 @@ class InjectiveDataSource(ABC):
             )
 
             try:
-                result = await self._send_in_transaction(messages=order_creation_messages)
+                result = await self._send_in_transaction(
+                    messages=order_creation_messages,
+                    orders_count=len(spot_orders) + len(perpetual_orders),
+                )
                 if result["code"] != 0 or result["txhash"] in [None, ""]:
                     raise ValueError(f"Error sending the order creation transaction ({result['rawLog']})")
                 else:
@@ -471,7 +478,10 @@ class InjectiveDataSource(ABC):
                 )
 
                 try:
-                    result = await self._send_in_transaction(messages=[delegated_message])
+                    result = await self._send_in_transaction(
+                        messages=[delegated_message],
+                        orders_count=len(orders_with_hash),
+                    )
                     if result["code"] != 0:
                         raise ValueError(f"Error sending the order cancel transaction ({result['rawLog']})")
                     else:
@@ -978,33 +988,8 @@ class InjectiveDataSource(ABC):
 
         return parsed_event
 
-    async def _send_in_transaction(self, messages: List[any_pb2.Any]) -> Dict[str, Any]:
-        transaction = Transaction()
-        transaction.with_messages(*messages)
-        transaction.with_sequence(await self.trading_account_sequence())
-        transaction.with_account_num(await self.trading_account_number())
-        transaction.with_chain_id(self.injective_chain_id)
-
-        async with self.throttler.execute_task(limit_id=CONSTANTS.SIMULATE_TRANSACTION_LIMIT_ID):
-            try:
-                await self._configure_gas_fee_for_transaction(transaction=transaction)
-            except RuntimeError as simulation_ex:
-                if CONSTANTS.ACCOUNT_SEQUENCE_MISMATCH_ERROR in str(simulation_ex):
-                    await self.initialize_trading_account()
-                raise
-
-        transaction.with_memo("")
-        transaction.with_timeout_height(await self.timeout_height())
-
-        signed_transaction_data = self._sign_and_encode(transaction=transaction)
-
-        async with self.throttler.execute_task(limit_id=CONSTANTS.SEND_TRANSACTION):
-            result = await self.query_executor.send_tx_sync_mode(tx_byte=signed_transaction_data)
-
-        if CONSTANTS.ACCOUNT_SEQUENCE_MISMATCH_ERROR in result.get("rawLog", ""):
-            await self.initialize_trading_account()
-
-        return result
+    async def _send_in_transaction(self, messages: List[any_pb2.Any], orders_count: int = 0) -> Dict[str, Any]:
+        return await self._transaction_pipeline.send(messages=messages, orders_count=orders_count)
 
     def _chain_stream_exception_handler(self, exception: RpcError):
         self.logger().warning(f"Error while listening to chain stream ({exception})")
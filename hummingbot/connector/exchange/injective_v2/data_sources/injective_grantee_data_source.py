@@ -11,6 +11,9 @@ from pyinjective.wallet import Address, PrivateKey
 
 from hummingbot.connector.exchange.injective_v2 import injective_constants as CONSTANTS
 from hummingbot.connector.exchange.injective_v2.data_sources.injective_data_source import InjectiveDataSource
+from hummingbot.connector.exchange.injective_v2.data_sources.injective_transaction_pipeline import (
+    InjectiveTransactionPipeline,
+)
 from hummingbot.connector.exchange.injective_v2.injective_market import (
     InjectiveDerivativeMarket,
     InjectiveSpotMarket,
@@ -79,6 +82,7 @@ class InjectiveGranteeDataSource(InjectiveDataSource):
 
         self._is_timeout_height_initialized = False
         self._is_trading_account_initialized = False
+        self._transaction_pipeline = InjectiveTransactionPipeline(data_source=self)
         self._markets_initialization_lock = asyncio.Lock()
         self._spot_market_info_map: Optional[Dict[str, InjectiveSpotMarket]] = None
         self._derivative_market_info_map: Optional[Dict[str, InjectiveDerivativeMarket]] = None
@@ -252,6 +256,9 @@ class InjectiveGranteeDataSource(InjectiveDataSource):
         await self._client.fetch_account(address=self.trading_account_injective_address)
         self._is_trading_account_initialized = True
 
+    def set_trading_account_sequence(self, sequence: int):
+        self._client.sequence = sequence
+
     def supported_order_types(self) -> List[OrderType]:
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -209,6 +209,9 @@ class InjectiveReadOnlyDataSource(InjectiveDataSource):
         # Do nothing
         pass
 
+    def set_trading_account_sequence(self, sequence: int):
+        raise NotImplementedError
+
     async def update_markets(self):
         (
             self._tokens_map,
@@ -0,0 +1,150 @@
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from google.protobuf.message import Message
+from pyinjective import Transaction
+
+from hummingbot.connector.exchange.injective_v2 import injective_constants as CONSTANTS
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange.injective_v2.data_sources.injective_data_source import InjectiveDataSource
+
+GasEstimationKey = Tuple[Tuple[Tuple[str, ...], int], ...]
+
+EXPECTED_SEQUENCE_PATTERN = re.compile(r"expected (\d+)")
+
+
+class _TransactionRequest:
+    def __init__(self, messages: List[Message], orders_count: int, future: asyncio.Future):
+        self.messages = messages
+        self.orders_count = orders_count
+        self.future = future
+
+    @property
+    def gas_estimation_key(self) -> Tuple[Tuple[str, ...], int]:
+        return tuple(message.DESCRIPTOR.full_name for message in self.messages), self.orders_count
+
+
+class InjectiveTransactionPipeline:
+    """
+    Sends the transactions of the trading account of a data source.
+
+    - The messages requested within the coalescing window are sent together in a single transaction.
+    - The account sequence is kept locally and the transactions are broadcast in sequence order, each one as soon as
+      the previous one was accepted in the mempool.
+    - The gas limit simulated for a transaction is reused for the following transactions with the same messages types
+      and number of orders, instead of simulating every transaction.
+    - When the chain rejects a transaction the local sequence is restored to the sequence the chain expects, without
+      fetching the account again.
+    """
+
+    def __init__(
+            self,
+            data_source: "InjectiveDataSource",
+            coalescing_window: float = CONSTANTS.TRANSACTIONS_COALESCING_WINDOW,
+            gas_estimation_ttl: float = CONSTANTS.GAS_ESTIMATION_TTL,
+    ):
+        self._data_source = data_source
+        self._coalescing_window = coalescing_window
+        self._gas_estimation_ttl = gas_estimation_ttl
+        self._pending_requests: List[_TransactionRequest] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._broadcast_lock = asyncio.Lock()
+        # gas estimation key -> (gas limit, fee, timestamp of the simulation)
+        self._gas_estimations: Dict[GasEstimationKey, Tuple[int, List[Any], float]] = {}
+
+    async def send(self, messages: List[Message], orders_count: int = 0) -> Dict[str, Any]:
+        """
+        Sends the messages in the next transaction and returns the broadcast result of the transaction.
+
+        :param messages: the messages to include in the transaction
+        :param orders_count: the number of orders created or cancelled by the messages, used to reuse gas estimations
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_requests.append(_TransactionRequest(messages=messages, orders_count=orders_count, future=future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = safe_ensure_future(self._flush_after_coalescing_window())
+        return await future
+
+    async def _flush_after_coalescing_window(self):
+        await asyncio.sleep(self._coalescing_window)
+        requests = self._pending_requests
+        self._pending_requests = []
+        # The next requests start a new window while this transaction is being broadcast
+        self._flush_task = None
+        try:
+            result = await self._send_transaction(
+                messages=[message for request in requests for message in request.messages],
+                gas_estimation_key=tuple(sorted(request.gas_estimation_key for request in requests)),
+            )
+        except asyncio.CancelledError:
+            for request in requests:
+                request.future.cancel()
+            raise
+        except Exception as ex:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(ex)
+        else:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_result(result)
+
+    async def _send_transaction(self, messages: List[Message], gas_estimation_key: GasEstimationKey):
+        data_source = self._data_source
+        async with self._broadcast_lock:
+            sequence = await data_source.trading_account_sequence()
+            transaction = Transaction()
+            transaction.with_messages(*messages)
+            transaction.with_sequence(sequence)
+            transaction.with_account_num(await data_source.trading_account_number())
+            transaction.with_chain_id(data_source.injective_chain_id)
+
+            gas_estimation = self._gas_estimations.get(gas_estimation_key)
+            if gas_estimation is not None and data_source._time() - gas_estimation[2] < self._gas_estimation_ttl:
+                transaction.with_gas(gas=gas_estimation[0])
+                transaction.with_fee(fee=gas_estimation[1])
+            else:
+                async with data_source.throttler.execute_task(limit_id=CONSTANTS.SIMULATE_TRANSACTION_LIMIT_ID):
+                    try:
+                        await data_source._configure_gas_fee_for_transaction(transaction=transaction)
+                    except RuntimeError as simulation_ex:
+                        await self._restore_sequence(failed_sequence=sequence, error_message=str(simulation_ex))
+                        raise
+                self._gas_estimations[gas_estimation_key] = (
+                    transaction.fee.gas_limit, list(transaction.fee.amount), data_source._time())
+
+            transaction.with_memo("")
+            transaction.with_timeout_height(await data_source.timeout_height())
+
+            signed_transaction_data = data_source._sign_and_encode(transaction=transaction)
+
+            try:
+                async with data_source.throttler.execute_task(limit_id=CONSTANTS.SEND_TRANSACTION):
+                    result = await data_source.query_executor.send_tx_sync_mode(tx_byte=signed_transaction_data)
+            except Exception as ex:
+                await self._restore_sequence(failed_sequence=sequence, error_message=str(ex))
+                raise
+
+            if result.get("code", CONSTANTS.TRANSACTION_SUCCEEDED_CODE) != CONSTANTS.TRANSACTION_SUCCEEDED_CODE:
+                # The estimation could be the reason of the failure, the next transaction simulates its gas again
+                self._gas_estimations.pop(gas_estimation_key, None)
+                await self._restore_sequence(failed_sequence=sequence, error_message=result.get("rawLog", ""))
+
+        return result
+
+    async def _restore_sequence(self, failed_sequence: int, error_message: str):
+        """
+        Sets the local sequence after a transaction was rejected. The sequence of the rejected transaction was not
+        used, unless the chain reports a sequence mismatch with the sequence it expects.
+        """
+        if CONSTANTS.ACCOUNT_SEQUENCE_MISMATCH_ERROR in error_message:
+            match = EXPECTED_SEQUENCE_PATTERN.search(error_message)
+            if match is None:
+                await self._data_source.initialize_trading_account()
+            else:
+                self._data_source.set_trading_account_sequence(int(match.group(1)))
+        else:
+            self._data_source.set_trading_account_sequence(failed_sequence)
@@ -20,6 +20,10 @@ GAS_LIMIT_ADJUSTMENT_MULTIPLIER = None  # Leave as None to use the default value
 EXPECTED_BLOCK_TIME = 1.5
 TRANSACTIONS_CHECK_INTERVAL = 3 * EXPECTED_BLOCK_TIME
 TRANSACTION_SUCCEEDED_CODE = 0
+# Orders creations and cancellations requested within this time (in seconds) are sent in the same transaction
+TRANSACTIONS_COALESCING_WINDOW = 0.05
+# Time (in seconds) a simulated gas limit is reused for the transactions with the same kind of messages
+GAS_ESTIMATION_TTL = 300
 
 # Public limit ids
 SPOT_MARKETS_LIMIT_ID = "SpotMarkets"
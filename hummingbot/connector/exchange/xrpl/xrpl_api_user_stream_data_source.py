@@ -3,7 +3,7 @@ import time
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from xrpl.asyncio.clients import AsyncWebsocketClient
-from xrpl.models import Subscribe
+from xrpl.models import StreamParameter, Subscribe
 
 from hummingbot.connector.exchange.xrpl.xrpl_auth import XRPLAuth
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -43,7 +43,8 @@ class XRPLAPIUserStreamDataSource(UserStreamTrackerDataSource):
         while True:
             listener = None
             try:
-                subscribe = Subscribe(accounts=[self._auth.get_account()])
+                # The ledger closes are used by the submission engine to verify the transactions without polling
+                subscribe = Subscribe(accounts=[self._auth.get_account()], streams=[StreamParameter.LEDGER])
 
                 async with self._xrpl_client as client:
                     client._websocket.max_size = 2**23
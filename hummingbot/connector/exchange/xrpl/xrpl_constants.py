@@ -90,6 +90,14 @@ CANCEL_RETRY_INTERVAL = 3
 VERIFY_TRANSACTION_MAX_RETRY = 3
 VERIFY_TRANSACTION_RETRY_INTERVAL = 2
 
+# Submission engine parameters
+# Seconds without ledger closed messages in the stream after which transactions are verified polling the node
+LEDGER_STREAM_MAX_DELAY = 10
+# Seconds between the checks of the validated ledger while waiting for a transaction validation
+LEDGER_CLOSE_INTERVAL = 1
+# Seconds the fee of the last autofilled transaction is reused
+FEE_REFRESH_INTERVAL = 60
+
 # Autofill transaction retry parameters
 AUTOFILL_TRANSACTION_MAX_RETRY = 5
 
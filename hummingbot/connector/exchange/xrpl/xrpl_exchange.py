@@ -42,6 +42,7 @@ from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS, xrpl
 from hummingbot.connector.exchange.xrpl.xrpl_api_order_book_data_source import XRPLAPIOrderBookDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_api_user_stream_data_source import XRPLAPIUserStreamDataSource
 from hummingbot.connector.exchange.xrpl.xrpl_auth import XRPLAuth
+from hummingbot.connector.exchange.xrpl.xrpl_submission_engine import XRPLSubmissionEngine
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
     XRPLMarket,
     _wait_for_final_transaction_outcome,
@@ -101,6 +102,9 @@ class XrplExchange(ExchangePyBase):
         self._nonce_creator = NonceCreator.for_microseconds()
         self._custom_markets = custom_markets or {}
         self._last_clients_refresh_time = 0
+        self._submission_engine = XRPLSubmissionEngine(connector=self)
+        # Orders being replaced, with their state before the replacement, by client id of the replacing order
+        self._replaced_orders: Dict[str, Tuple[InFlightOrder, OrderState]] = {}
 
         super().__init__(client_config_map)
 
@@ -342,7 +346,15 @@ class XrplExchange(ExchangePyBase):
         memo = Memo(
             memo_data=convert_string_to_hex(order_id, padding=False),
         )
-        request = OfferCreate(account=account, flags=flags, taker_gets=we_pay, taker_pays=we_get, memos=[memo])
+        # An offer replacing another one cancels it in the same transaction
+        request = OfferCreate(
+            account=account,
+            flags=flags,
+            taker_gets=we_pay,
+            taker_pays=we_get,
+            memos=[memo],
+            offer_sequence=kwargs.get("offer_sequence"),
+        )
 
         try:
             retry = 0
@@ -354,10 +366,8 @@ class XrplExchange(ExchangePyBase):
             while retry < CONSTANTS.PLACE_ORDER_MAX_RETRY:
                 async with self._xrpl_place_order_client_lock:
                     async with AsyncWebsocketClient(self._wss_node_url) as client:
-                        filled_tx = await self.tx_autofill(request, client)
-                        signed_tx = self.tx_sign(filled_tx, self._auth.get_wallet())
+                        signed_tx, submit_response = await self._submission_engine.submit(request, client)
                         o_id = f"{signed_tx.sequence}-{signed_tx.last_ledger_sequence}"
-                        submit_response = await self.tx_submit(signed_tx, client)
                         transact_time = time.time()
                         prelim_result = submit_response.result["engine_result"]
 
@@ -456,8 +466,7 @@ class XrplExchange(ExchangePyBase):
             return False, None
 
         try:
-            # await self._make_network_check_request()
-            resp = await self.wait_for_final_transaction_outcome(transaction, prelim_result)
+            resp = await self._submission_engine.wait_for_validation(transaction, prelim_result)
             return True, resp
         except (TimeoutError, asyncio.exceptions.TimeoutError):
             self.logger().debug(
@@ -468,6 +477,8 @@ class XrplExchange(ExchangePyBase):
                 return await self._verify_transaction_result(submit_data, try_count + 1)
             else:
                 self.logger().error("Max retries reached. Verify transaction failed due to timeout.")
+                # The transaction may never be validated, the next one is autofilled to avoid a sequence gap
+                self._submission_engine.reset()
                 return False, None
 
         except Exception as e:
@@ -481,9 +492,11 @@ class XrplExchange(ExchangePyBase):
                     return await self._verify_transaction_result(submit_data, try_count + 1)
                 else:
                     self.logger().error("Max retries reached. Verify transaction failed with code 429.")
+                    self._submission_engine.reset()
                     return False, None
 
             self.logger().error(f"Submitted transaction failed: {e}")
+            self._submission_engine.reset()
 
             return False, None
 
@@ -507,10 +520,7 @@ class XrplExchange(ExchangePyBase):
                     )
                     request = OfferCancel(account=self._auth.get_account(), offer_sequence=int(sequence), memos=[memo])
 
-                    filled_tx = await self.tx_autofill(request, client)
-                    signed_tx = self.tx_sign(filled_tx, self._auth.get_wallet())
-
-                    submit_response = await self.tx_submit(signed_tx, client)
+                    signed_tx, submit_response = await self._submission_engine.submit(request, client)
                     prelim_result = submit_response.result["engine_result"]
 
                 if prelim_result is None:
@@ -524,7 +534,6 @@ class XrplExchange(ExchangePyBase):
 
                 cancel_result = True
                 cancel_data = {"transaction": signed_tx, "prelim_result": prelim_result}
-                await self._sleep(0.3)
 
         except Exception as e:
             self.logger().error(
@@ -693,6 +702,10 @@ class XrplExchange(ExchangePyBase):
 
                 meta = event_message.get("meta")
 
+                if event_message.get("type") == "ledgerClosed":
+                    self._submission_engine.process_ledger_closed(event_message)
+                    continue
+
                 if transaction is None or meta is None:
                     self._logger.debug(f"Received event message without transaction or meta: {event_message}")
                     continue
@@ -701,6 +714,8 @@ class XrplExchange(ExchangePyBase):
                     f"Handling TransactionType: {transaction.get('TransactionType')}, Hash: {transaction.get('hash')} OfferSequence: {transaction.get('OfferSequence')}, Sequence: {transaction.get('Sequence')}..."
                 )
 
+                self._submission_engine.process_transaction(event_message)
+
                 balance_changes = get_balance_changes(meta)
                 order_book_changes = get_order_book_changes(meta)
 
@@ -1394,13 +1409,7 @@ class XrplExchange(ExchangePyBase):
 
         :return: the id assigned by the connector to the order (the client id)
         """
-        prefix = f"{self.client_order_id_prefix}-{self._nonce_creator.get_tracking_nonce()}-"
-        order_id = get_new_client_order_id(
-            is_buy=True,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=prefix,
-            max_id_len=self.client_order_id_max_length,
-        )
+        order_id = self._new_client_order_id(is_buy=True, trading_pair=trading_pair)
 
         safe_ensure_future(
             self._create_order(
@@ -1431,13 +1440,7 @@ class XrplExchange(ExchangePyBase):
         :param price: the order price
         :return: the id assigned by the connector to the order (the client id)
         """
-        prefix = f"{self.client_order_id_prefix}-{self._nonce_creator.get_tracking_nonce()}-"
-        order_id = get_new_client_order_id(
-            is_buy=False,
-            trading_pair=trading_pair,
-            hbot_order_id_prefix=prefix,
-            max_id_len=self.client_order_id_max_length,
-        )
+        order_id = self._new_client_order_id(is_buy=False, trading_pair=trading_pair)
         safe_ensure_future(
             self._create_order(
                 trade_type=TradeType.SELL,
@@ -1451,6 +1454,97 @@ class XrplExchange(ExchangePyBase):
         )
         return order_id
 
+    def replace_order(
+        self, trading_pair: str, client_order_id: str, price: Decimal, amount: Optional[Decimal] = None
+    ) -> str:
+        """
+        Replaces an open order with a new order of the same side and type. The OfferCreate of the new order cancels the
+        offer of the replaced order in the same transaction (OfferSequence), instead of submitting an OfferCancel and
+        then an OfferCreate. If the new order fails, the replaced order gets back the state it had before.
+
+        :param trading_pair: the token pair of the order
+        :param client_order_id: the client id of the order to replace
+        :param price: the price of the new order
+        :param amount: the amount of the new order, the amount of the replaced order if not specified
+        :return: the id assigned by the connector to the new order (the client id)
+        """
+        tracked_order = self._order_tracker.fetch_tracked_order(client_order_id)
+        if tracked_order is None:
+            raise ValueError(f"Order {client_order_id} is not being tracked.")
+        amount = tracked_order.amount if amount is None else amount
+
+        if tracked_order.exchange_order_id is None:
+            # The offer of the order is not known yet, it has to be cancelled on its own
+            self.cancel(trading_pair=trading_pair, client_order_id=client_order_id)
+            place_order = self.buy if tracked_order.trade_type is TradeType.BUY else self.sell
+            return place_order(trading_pair, amount, tracked_order.order_type, price)
+
+        sequence, _ = tracked_order.exchange_order_id.split("-")
+        previous_state = tracked_order.current_state
+        self._order_tracker.process_order_update(OrderUpdate(
+            client_order_id=client_order_id,
+            trading_pair=trading_pair,
+            update_timestamp=self._time(),
+            new_state=OrderState.PENDING_CANCEL,
+        ))
+        order_id = self._new_client_order_id(is_buy=tracked_order.trade_type is TradeType.BUY,
+                                             trading_pair=trading_pair)
+        safe_ensure_future(
+            self._create_replacing_order(
+                replaced_order=tracked_order,
+                replaced_order_state=previous_state,
+                order_id=order_id,
+                amount=amount,
+                price=price,
+                offer_sequence=int(sequence),
+            )
+        )
+        return order_id
+
+    async def _create_replacing_order(
+        self,
+        replaced_order: InFlightOrder,
+        replaced_order_state: OrderState,
+        order_id: str,
+        amount: Decimal,
+        price: Decimal,
+        offer_sequence: int,
+    ):
+        self._replaced_orders[order_id] = (replaced_order, replaced_order_state)
+        try:
+            await self._create_order(
+                trade_type=replaced_order.trade_type,
+                order_id=order_id,
+                trading_pair=replaced_order.trading_pair,
+                amount=amount,
+                order_type=replaced_order.order_type,
+                price=price,
+                offer_sequence=offer_sequence,
+            )
+        finally:
+            self._replaced_orders.pop(order_id, None)
+
+    def _update_order_after_failure(self, order_id: str, trading_pair: str):
+        super()._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+        replaced_order, replaced_order_state = self._replaced_orders.pop(order_id, (None, None))
+        if replaced_order is not None and replaced_order.current_state is OrderState.PENDING_CANCEL:
+            # The OfferCreate was not applied, so the offer of the replaced order is still on the book
+            self._order_tracker.process_order_update(OrderUpdate(
+                client_order_id=replaced_order.client_order_id,
+                trading_pair=replaced_order.trading_pair,
+                update_timestamp=self._time(),
+                new_state=replaced_order_state,
+            ))
+
+    def _new_client_order_id(self, is_buy: bool, trading_pair: str) -> str:
+        prefix = f"{self.client_order_id_prefix}-{self._nonce_creator.get_tracking_nonce()}-"
+        return get_new_client_order_id(
+            is_buy=is_buy,
+            trading_pair=trading_pair,
+            hbot_order_id_prefix=prefix,
+            max_id_len=self.client_order_id_max_length,
+        )
+
     async def _update_trading_rules(self):
         trading_rules_info = await self._make_trading_rules_request()
         trading_rules_list = self._format_trading_rules(trading_rules_info)
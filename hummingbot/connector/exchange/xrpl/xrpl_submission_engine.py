@@ -0,0 +1,181 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from xrpl.asyncio.clients import Client
+from xrpl.asyncio.transaction import XRPLReliableSubmissionException
+from xrpl.asyncio.transaction.main import _LEDGER_OFFSET
+from xrpl.models import Response, Transaction
+from xrpl.models.response import ResponseStatus
+
+from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange.xrpl.xrpl_exchange import XrplExchange
+
+
+class XRPLSubmissionEngine:
+    """
+    Submits the transactions of the account of the connector.
+
+    - The account sequence, the fee and the last validated ledger are kept locally, so consecutive transactions are
+      filled and signed without querying the node. Only the first transaction, the first one after a rejection and
+      the ones submitted when the fee or the ledger are outdated are autofilled by the node.
+    - Transactions don't wait for the previous ones to be validated: several offers can be created and cancelled in
+      the same ledger with consecutive sequences.
+    - The validation of the transactions is taken from the account transactions and ledgers subscription stream.
+      The node is polled only when the stream doesn't deliver ledgers.
+    """
+
+    def __init__(self, connector: "XrplExchange"):
+        self._connector = connector
+        self._next_sequence: Optional[int] = None
+        self._network_id: Optional[int] = None
+        self._fee: Optional[str] = None
+        self._fee_timestamp: float = 0
+        self._validated_ledger_index: Optional[int] = None
+        self._validated_ledger_timestamp: float = 0
+        self._ledger_stream_timestamp: float = 0
+        # account sequence of the transaction -> future with the validated transaction message
+        self._validations: Dict[int, asyncio.Future] = {}
+
+    @property
+    def is_ledger_stream_alive(self) -> bool:
+        return self._connector._time() - self._ledger_stream_timestamp < CONSTANTS.LEDGER_STREAM_MAX_DELAY
+
+    async def submit(self, transaction: Transaction, client: Client) -> Tuple[Transaction, Response]:
+        """
+        Fills, signs and submits a transaction. The calls have to be serialized by the caller, so transactions are
+        submitted in the order of their sequences.
+
+        :return: the signed transaction and the response of the submission
+        """
+        filled_transaction = self._fill(transaction)
+        autofilled = filled_transaction is None
+        if autofilled:
+            filled_transaction = await self._connector.tx_autofill(transaction, client)
+        signed_transaction = self._connector.tx_sign(filled_transaction, self._connector._auth.get_wallet())
+        # Registered before submitting, the stream can deliver the validation before the submission response
+        self._validations[signed_transaction.sequence] = asyncio.get_running_loop().create_future()
+        try:
+            submit_response = await self._connector.tx_submit(signed_transaction, client)
+        except Exception:
+            self._validations.pop(signed_transaction.sequence, None)
+            self.reset()
+            raise
+        self._process_submission(signed_transaction, submit_response.result.get("engine_result"), autofilled)
+        return signed_transaction, submit_response
+
+    async def wait_for_validation(self, transaction: Transaction, prelim_result: str) -> Response:
+        """
+        Waits until the transaction is included in a validated ledger.
+
+        :return: a response with the validated transaction message
+        :raises XRPLReliableSubmissionException: if the transaction failed or its LastLedgerSequence was passed
+        """
+        future = self._validations.get(transaction.sequence)
+        if future is None or not self.is_ledger_stream_alive:
+            self._validations.pop(transaction.sequence, None)
+            return await self._wait_for_final_transaction_outcome(transaction, prelim_result)
+
+        try:
+            while not future.done():
+                if (self._validated_ledger_index is not None
+                        and self._validated_ledger_index >= transaction.last_ledger_sequence):
+                    # The sequence of the expired transaction was not consumed, the following local sequences would
+                    # leave a gap in the account sequence
+                    self.reset()
+                    raise XRPLReliableSubmissionException(
+                        f"The latest validated ledger sequence {self._validated_ledger_index} is greater than "
+                        f"LastLedgerSequence {transaction.last_ledger_sequence} in the transaction. Prelim result: "
+                        f"{prelim_result}")
+                if not self.is_ledger_stream_alive:
+                    return await self._wait_for_final_transaction_outcome(transaction, prelim_result)
+                # Checked again at every ledger close
+                await asyncio.wait([future], timeout=CONSTANTS.LEDGER_CLOSE_INTERVAL)
+        finally:
+            self._validations.pop(transaction.sequence, None)
+
+        message = future.result()
+        transaction_result = message.get("meta", {}).get("TransactionResult")
+        if transaction_result != "tesSUCCESS":
+            if transaction_result is None or transaction_result[0:3] != "tec":
+                # Only tec results consume the sequence of a failed transaction
+                self.reset()
+            raise XRPLReliableSubmissionException(f"Transaction failed: {transaction_result}")
+        validated_transaction = self._transaction_of_message(message)
+        return Response(status=ResponseStatus.SUCCESS,
+                        result=dict(message, hash=message.get("hash", validated_transaction.get("hash"))))
+
+    async def _wait_for_final_transaction_outcome(self, transaction: Transaction, prelim_result: str) -> Response:
+        try:
+            return await self._connector.wait_for_final_transaction_outcome(transaction, prelim_result)
+        except XRPLReliableSubmissionException:
+            self.reset()
+            raise
+
+    def process_transaction(self, message: Dict[str, Any]):
+        """
+        Resolves the validation of a submitted transaction with a validated transaction message of the stream.
+        """
+        transaction = self._transaction_of_message(message)
+        if not message.get("validated", False) or transaction.get("Account") != self._connector._auth.get_account():
+            return
+        future = self._validations.get(transaction.get("Sequence"))
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def process_ledger_closed(self, message: Dict[str, Any]):
+        ledger_index = message.get("ledger_index")
+        if ledger_index is not None:
+            now = self._connector._time()
+            self._ledger_stream_timestamp = now
+            self._set_validated_ledger_index(int(ledger_index), now)
+
+    def reset(self):
+        """
+        Discards the local account state, the next transaction is autofilled by the node.
+        """
+        self._next_sequence = None
+        self._fee = None
+
+    @staticmethod
+    def _transaction_of_message(message: Dict[str, Any]) -> Dict[str, Any]:
+        return message.get("transaction") or message.get("tx") or message.get("tx_json") or {}
+
+    def _fill(self, transaction: Transaction) -> Optional[Transaction]:
+        now = self._connector._time()
+        if (self._next_sequence is None
+                or self._fee is None
+                or now - self._fee_timestamp > CONSTANTS.FEE_REFRESH_INTERVAL
+                or self._validated_ledger_index is None
+                or now - self._validated_ledger_timestamp > CONSTANTS.LEDGER_STREAM_MAX_DELAY):
+            return None
+        transaction_json = transaction.to_dict()
+        transaction_json["sequence"] = self._next_sequence
+        transaction_json["fee"] = self._fee
+        transaction_json["last_ledger_sequence"] = self._validated_ledger_index + _LEDGER_OFFSET
+        transaction_json["source_tag"] = CONSTANTS.HBOT_SOURCE_TAG_ID
+        if self._network_id is not None:
+            transaction_json["network_id"] = self._network_id
+        return type(transaction).from_dict(transaction_json)
+
+    def _process_submission(self, transaction: Transaction, prelim_result: Optional[str], autofilled: bool):
+        if prelim_result is None or (prelim_result[0:3] not in ("tes", "tec") and prelim_result != "terQUEUED"):
+            # The sequence was not used or is not the one the ledger expects, it is fetched again from the node
+            self._validations.pop(transaction.sequence, None)
+            self.reset()
+            return
+
+        self._next_sequence = transaction.sequence + 1
+        if autofilled:
+            now = self._connector._time()
+            self._fee = transaction.fee
+            self._fee_timestamp = now
+            self._network_id = transaction.network_id
+            if transaction.last_ledger_sequence is not None:
+                self._set_validated_ledger_index(transaction.last_ledger_sequence - _LEDGER_OFFSET, now)
+
+    def _set_validated_ledger_index(self, ledger_index: int, timestamp: float):
+        if self._validated_ledger_index is None or ledger_index >= self._validated_ledger_index:
+            self._validated_ledger_index = ledger_index
+            self._validated_ledger_timestamp = timestamp
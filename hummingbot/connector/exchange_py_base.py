@@ -2,6 +2,7 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
@@ -11,6 +12,7 @@ from async_timeout import timeout
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.pre_trade_risk_engine import PreTradeRiskEngine, PreTradeRiskLimits
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -26,8 +28,16 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.event.events import MarketEvent
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_tracer import (
+    OrderLatencyStage,
+    OrderLatencyTrace,
+    OrderLatencyTracker,
+    current_order_latency_trace,
+)
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -83,6 +93,9 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        self._order_latency_tracker: Optional[OrderLatencyTracker] = None
+        self._pre_trade_risk_engine: Optional[PreTradeRiskEngine] = None
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -183,6 +196,42 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    @property
+    def order_latency_tracker(self) -> Optional[OrderLatencyTracker]:
+        return self._order_latency_tracker
+
+    def enable_order_latency_tracing(self, max_records: int = 1000):
+        """
+        Starts recording the latency breakdown (validate, throttle wait, sign, send, ack) of every order placed
+        by the connector. The traces are available through `order_latency_tracker`.
+        :param max_records: number of most recent order traces to keep
+        """
+        self._order_latency_tracker = OrderLatencyTracker(max_records=max_records)
+
+    def disable_order_latency_tracing(self):
+        self._order_latency_tracker = None
+
+    @property
+    def pre_trade_risk_engine(self) -> Optional[PreTradeRiskEngine]:
+        return self._pre_trade_risk_engine
+
+    def enable_pre_trade_risk_checks(self, limits: PreTradeRiskLimits):
+        """
+        Starts checking every order created by the connector against the risk limits before it is sent to the
+        exchange. The orders rejected by the checks are marked as failed.
+        :param limits: the limits to enforce
+        """
+        self.disable_pre_trade_risk_checks()
+        self._pre_trade_risk_engine = PreTradeRiskEngine(limits=limits)
+        for event_tag in self._pre_trade_risk_events():
+            self.add_listener(event_tag, self._pre_trade_risk_engine)
+
+    def disable_pre_trade_risk_checks(self):
+        if self._pre_trade_risk_engine is not None:
+            for event_tag in self._pre_trade_risk_events():
+                self.remove_listener(event_tag, self._pre_trade_risk_engine)
+        self._pre_trade_risk_engine = None
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -407,6 +456,36 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        latency_trace = None
+        latency_trace_token = None
+        if self._order_latency_tracker is not None:
+            latency_trace = OrderLatencyTrace(client_order_id=order_id, trading_pair=trading_pair)
+            latency_trace_token = current_order_latency_trace.set(latency_trace)
+        try:
+            await self._track_and_place_order(
+                trade_type=trade_type,
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                order_type=order_type,
+                price=price,
+                latency_trace=latency_trace,
+                **kwargs,
+            )
+        finally:
+            # Later requests of the same task must not be attributed to this order
+            if latency_trace_token is not None:
+                current_order_latency_trace.reset(latency_trace_token)
+
+    async def _track_and_place_order(self,
+                                     trade_type: TradeType,
+                                     order_id: str,
+                                     trading_pair: str,
+                                     amount: Decimal,
+                                     order_type: OrderType,
+                                     price: Optional[Decimal],
+                                     latency_trace: Optional[OrderLatencyTrace],
+                                     **kwargs):
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -448,8 +527,31 @@ class ExchangePyBase(ExchangeBase, ABC):
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
+
+        if self._pre_trade_risk_engine is not None:
+            rejection = self._pre_trade_risk_engine.check_order(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                trade_type=trade_type,
+                amount=quantized_amount,
+                price=price if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER] else None,
+                mid_price=self._mid_price_for_risk_checks(trading_pair),
+                timestamp=self._time(),
+                top_of_book_price=(self._top_of_book_price_for_risk_checks(trading_pair, trade_type)
+                                   if order_type is OrderType.MARKET else None),
+            )
+            if rejection is not None:
+                self.logger().warning(f"{trade_type.name.title()} order {order_id} for {quantized_amount} "
+                                      f"{trading_pair} was rejected by the pre-trade risk checks: {rejection}.")
+                self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+                return
         try:
+            if latency_trace is not None:
+                latency_trace.add_stage_duration(OrderLatencyStage.VALIDATE,
+                                                 time.perf_counter() - latency_trace.start_timestamp)
             await self._place_order_and_process_update(order=order, **kwargs,)
+            if latency_trace is not None:
+                self._register_order_latency_trace(latency_trace)
 
         except asyncio.CancelledError:
             raise
@@ -487,6 +589,34 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return exchange_order_id
 
+    def _register_order_latency_trace(self, latency_trace: OrderLatencyTrace):
+        if latency_trace.last_response_timestamp is not None:
+            latency_trace.add_stage_duration(OrderLatencyStage.ACK,
+                                             time.perf_counter() - latency_trace.last_response_timestamp)
+        if self._order_latency_tracker is not None:
+            self._order_latency_tracker.add_trace(latency_trace)
+        self.logger().debug(f"Order {latency_trace.client_order_id} ({latency_trace.trading_pair}) placement "
+                            f"latency: {latency_trace.to_dict()}")
+
+    @staticmethod
+    def _pre_trade_risk_events() -> List[MarketEvent]:
+        return [MarketEvent.OrderFilled, MarketEvent.OrderCancelled, MarketEvent.OrderFailure, MarketEvent.OrderExpired,
+                MarketEvent.BuyOrderCompleted, MarketEvent.SellOrderCompleted]
+
+    def _mid_price_for_risk_checks(self, trading_pair: str) -> Optional[Decimal]:
+        try:
+            return self.get_mid_price(trading_pair)
+        except Exception:
+            # The price band check is skipped while the order book is not available
+            return None
+
+    def _top_of_book_price_for_risk_checks(self, trading_pair: str, trade_type: TradeType) -> Optional[Decimal]:
+        try:
+            return self.get_price(trading_pair, trade_type is TradeType.BUY)
+        except Exception:
+            # Market orders are not checked for self trades while the order book is not available
+            return None
+
     def _on_order_failure(
         self,
         order_id: str,
@@ -667,6 +797,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         self._stop_network()
         self.order_book_tracker.start()
+        RuntimeMetrics.get_instance().register_queue_depths(self.name, self._queue_depths)
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
             self._trading_fees_polling_task = safe_ensure_future(self._trading_fees_polling_loop())
@@ -700,6 +831,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._last_timestamp = 0
         self._poll_notifier = asyncio.Event()
 
+        RuntimeMetrics.get_instance().unregister_queue_depths(self.name)
         self.order_book_tracker.stop()
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
@@ -848,6 +980,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_user_stream_tracker_task(self):
         return safe_ensure_future(self._user_stream_tracker.start())
 
+    def _queue_depths(self) -> Dict[str, int]:
+        """
+        Called by the performance metrics to report the messages waiting to be processed by the connector.
+        """
+        queue_depths = self.order_book_tracker.queue_depths()
+        if self._user_stream_tracker is not None:
+            queue_depths["user_stream"] = self._user_stream_tracker.user_stream.qsize()
+        return queue_depths
+
     # === Exchange / Trading logic methods that call the API ===
 
     async def _update_trading_rules(self):
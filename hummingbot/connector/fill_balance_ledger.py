@@ -0,0 +1,124 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class TokenFillBalance:
+    """
+    Running balance change of a single token caused by order fills.
+
+    Keeps a checkpoint (timestamp, cumulative balance change) per fill, sorted by timestamp, so the balance change
+    since any timestamp is found with a binary search.
+    When the number of checkpoints exceeds `max_checkpoints` the oldest half is collapsed, and the balance change
+    since a timestamp within the collapsed checkpoints only includes the fills after them.
+    """
+
+    def __init__(self, max_checkpoints: int):
+        self._max_checkpoints = max_checkpoints
+        self._timestamps: List[float] = []
+        self._cumulative_balances: List[Decimal] = []
+        self._total = s_decimal_0
+        self._first_timestamp: Optional[float] = None
+        # Cumulative balance change of the collapsed checkpoints
+        self._collapsed_balance = s_decimal_0
+
+    @property
+    def total(self) -> Decimal:
+        return self._total
+
+    @property
+    def checkpoints_count(self) -> int:
+        return len(self._timestamps)
+
+    def add(self, timestamp: float, amount: Decimal):
+        self._total += amount
+        if self._first_timestamp is None or timestamp < self._first_timestamp:
+            self._first_timestamp = timestamp
+        if len(self._timestamps) == 0 or timestamp >= self._timestamps[-1]:
+            self._timestamps.append(timestamp)
+            self._cumulative_balances.append(self._total)
+        else:
+            # Fills are expected in timestamp order, a late fill requires updating the following checkpoints
+            index = bisect_right(self._timestamps, timestamp)
+            previous_balance = self._cumulative_balances[index - 1] if index > 0 else self._collapsed_balance
+            self._timestamps.insert(index, timestamp)
+            self._cumulative_balances.insert(index, previous_balance + amount)
+            for i in range(index + 1, len(self._cumulative_balances)):
+                self._cumulative_balances[i] += amount
+
+        if len(self._timestamps) > self._max_checkpoints:
+            collapsed_count = len(self._timestamps) // 2
+            self._collapsed_balance = self._cumulative_balances[collapsed_count - 1]
+            del self._timestamps[:collapsed_count]
+            del self._cumulative_balances[:collapsed_count]
+
+    def balance_since(self, starting_timestamp: float) -> Decimal:
+        """
+        :param starting_timestamp: fills with a timestamp greater than this one are included
+        :return: the balance change caused by the fills since the timestamp
+        """
+        index = bisect_right(self._timestamps, starting_timestamp)
+        if index > 0:
+            return self._total - self._cumulative_balances[index - 1]
+        if self._first_timestamp is None or starting_timestamp < self._first_timestamp:
+            return self._total
+        return self._total - self._collapsed_balance
+
+
+class FillBalanceLedger(EventListener):
+    """
+    Keeps the running balance change per token caused by the order fills of a connector, to answer the balance change
+    since a timestamp without scanning all the fill events.
+    For BUY fills, the quote balance goes down while the base balance goes up, and for SELL fills it's the opposite.
+    This does not account for fees.
+    """
+
+    def __init__(self, max_checkpoints_per_token: int = 10_000):
+        super().__init__()
+        self._max_checkpoints_per_token = max_checkpoints_per_token
+        self._token_balances: Dict[str, TokenFillBalance] = {}
+
+    def __call__(self, event: OrderFilledEvent):
+        if isinstance(event, OrderFilledEvent):
+            self.add_fill(event)
+
+    def add_fill(self, event: OrderFilledEvent):
+        base, quote = split_hb_trading_pair(event.trading_pair)
+        quote_value = event.price * event.amount
+        if event.trade_type is TradeType.BUY:
+            self._token_balance(base).add(event.timestamp, event.amount)
+            self._token_balance(quote).add(event.timestamp, -quote_value)
+        else:
+            self._token_balance(base).add(event.timestamp, -event.amount)
+            self._token_balance(quote).add(event.timestamp, quote_value)
+
+    def balance_since(self, token: str, starting_timestamp: float = 0) -> Decimal:
+        """
+        :param token: the token symbol
+        :param starting_timestamp: fills with a timestamp greater than this one are included
+        :return: the balance change of the token caused by the fills since the timestamp
+        """
+        token_balance = self._token_balances.get(token)
+        if token_balance is None:
+            return s_decimal_0
+        return token_balance.balance_since(starting_timestamp)
+
+    def balances_since(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        return {token: token_balance.balance_since(starting_timestamp)
+                for token, token_balance in self._token_balances.items()}
+
+    def clear(self):
+        self._token_balances.clear()
+
+    def _token_balance(self, token: str) -> TokenFillBalance:
+        token_balance = self._token_balances.get(token)
+        if token_balance is None:
+            token_balance = TokenFillBalance(max_checkpoints=self._max_checkpoints_per_token)
+            self._token_balances[token] = token_balance
+        return token_balance
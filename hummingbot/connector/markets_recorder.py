@@ -12,7 +12,7 @@ import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import DBArchiveConfigMap, MarketDataCollectionConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
@@ -35,7 +35,9 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.model.controllers import Controllers
+from hummingbot.model.db_archiver import DBArchiver
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
@@ -48,7 +50,7 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
 
 
 class MarketsRecorder:
@@ -76,7 +78,8 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 db_archive: Optional[DBArchiveConfigMap] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +90,9 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._db_archive_config: Optional[DBArchiveConfigMap] = db_archive
+        self._db_archive_task: Optional[asyncio.Future] = None
+        self._controller_performance_synced = False
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -130,6 +136,15 @@ class MarketsRecorder:
     def _start_market_data_recording(self):
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
+    def _start_db_archive(self):
+        self._db_archive_task = self._ev_loop.run_in_executor(None, self._archive_db)
+
+    def _archive_db(self):
+        try:
+            DBArchiver(self._sql_manager).archive(self._db_archive_config.db_archive_hot_months)
+        except Exception:
+            self.logger().error("Unexpected error archiving the trades database.", exc_info=True)
+
     async def _record_market_data(self):
         while True:
             try:
@@ -185,6 +200,8 @@ class MarketsRecorder:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._db_archive_config is not None and self._db_archive_config.db_archive_enabled:
+            self._start_db_archive()
 
     def stop(self):
         for market in self._markets:
@@ -195,17 +212,30 @@ class MarketsRecorder:
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
+            self._sync_controller_performance(session)
             existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
             serialized_config = executor.executor_info.json()
             executor_dict = json.loads(serialized_config)
+            performance = None
+            controller_id = executor_dict.get("controller_id")
+            if controller_id is not None:
+                performance = ControllerPerformance.get(session, controller_id)
+                if performance is None:
+                    # Built from the stored executors, so the previous results of an updated executor are included
+                    performance = ControllerPerformance.rebuild(session, [controller_id])[controller_id]
             if existing_executor:
-                # Update existing executor
+                # Update existing executor, replacing its previous results in the controller performance
+                if performance is not None and existing_executor.controller_id == performance.controller_id:
+                    performance.add_executor(existing_executor, sign=-1)
                 for attr, value in executor_dict.items():
                     setattr(existing_executor, attr, value)
+                stored_executor = existing_executor
             else:
                 # Insert new executor
-                new_executor = Executors(**executor_dict)
-                session.add(new_executor)
+                stored_executor = Executors(**executor_dict)
+                session.add(stored_executor)
+            if performance is not None:
+                performance.add_executor(stored_executor)
             session.commit()
 
     def store_position(self, position: Position):
@@ -239,6 +269,28 @@ class MarketsRecorder:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
 
+    def get_controllers_performance(self) -> Dict[str, PerformanceReport]:
+        """
+        Returns the performance of the stored executors of every controller, read from the controller rollups.
+        """
+        with self._sql_manager.get_new_session() as session:
+            self._sync_controller_performance(session)
+            rollups = session.query(ControllerPerformance).all()
+            return {rollup.controller_id: rollup.to_performance_report() for rollup in rollups}
+
+    def _sync_controller_performance(self, session: Session):
+        """
+        Once per recorder, rebuilds the rollups of the controllers with executors stored before the rollups existed
+        (indexing the executors by controller first in those databases).
+        """
+        if self._controller_performance_synced:
+            return
+        for index in Executors.__table__.indexes:
+            index.create(bind=self._sql_manager.engine, checkfirst=True)
+        if len(ControllerPerformance.sync_with_executors(session)) > 0:
+            session.commit()
+        self._controller_performance_synced = True
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
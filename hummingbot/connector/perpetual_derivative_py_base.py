@@ -27,10 +27,12 @@ if TYPE_CHECKING:
 
 class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+    POSITIONS_RECONCILIATION_INTERVAL = 60.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
         self._last_funding_fee_payment_ts: Dict[str, float] = {}
+        self._last_positions_reconciliation_timestamp = 0
 
         self._perpetual_trading = PerpetualTrading(self.trading_pairs)
         self._funding_info_listener_task: Optional[asyncio.Task] = None
@@ -54,6 +56,16 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         status_d["funding_info"] = self._perpetual_trading.is_funding_info_initialized()
         return status_d
 
+    @property
+    def position_updates_streamed(self) -> bool:
+        """
+        Indicates if the connector keeps the positions updated from the exchange stream channels, through
+        `_perpetual_trading.process_position_update` or `_perpetual_trading.position_update_stream`. In that case the
+        positions are only requested to the exchange every POSITIONS_RECONCILIATION_INTERVAL seconds, or when a
+        stream update was missed.
+        """
+        return False
+
     @property
     def position_mode(self) -> PositionMode:
         """Returns the current position mode."""
@@ -209,8 +221,15 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             self._funding_info_listener_task.cancel()
             self._funding_info_listener_task = None
         self._last_funding_fee_payment_ts.clear()
+        self._last_positions_reconciliation_timestamp = 0
         super()._stop_network()
 
+    def _queue_depths(self) -> Dict[str, int]:
+        queue_depths = super()._queue_depths()
+        queue_depths["funding_info"] = self._perpetual_trading.funding_info_stream.qsize()
+        queue_depths["position_update"] = self._perpetual_trading.position_update_stream.qsize()
+        return queue_depths
+
     async def _create_order(
         self,
         trade_type: TradeType,
@@ -297,11 +316,44 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
 
     async def _status_polling_loop_fetch_updates(self):
         await safe_gather(
-            self._update_positions(),
+            self._reconcile_positions(),
             self._update_balances(),
             self._update_order_status(),
+            self._reconcile_funding_info(),
         )
 
+    async def _reconcile_positions(self):
+        """
+        Requests the positions to the exchange. When positions are streamed this only happens every
+        POSITIONS_RECONCILIATION_INTERVAL seconds, or when a position stream update was missed.
+        """
+        out_of_sync_pairs = self._perpetual_trading.out_of_sync_position_pairs
+        reconciliation_due = (
+            self.current_timestamp - self._last_positions_reconciliation_timestamp
+            >= self.POSITIONS_RECONCILIATION_INTERVAL
+        )
+        if not self.position_updates_streamed or reconciliation_due or len(out_of_sync_pairs) > 0:
+            await self._update_positions()
+            self._perpetual_trading.mark_positions_in_sync(list(out_of_sync_pairs))
+            self._last_positions_reconciliation_timestamp = self.current_timestamp
+
+    async def _reconcile_funding_info(self):
+        """
+        Requests the funding info again for the trading pairs that missed a funding info stream update.
+        """
+        for trading_pair in self._perpetual_trading.out_of_sync_funding_info_pairs:
+            try:
+                funding_info = await self._orderbook_ds.get_funding_info(trading_pair)
+                self._perpetual_trading.initialize_funding_info(funding_info)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error while reconciling funding info for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not fetch funding info for {trading_pair}. Check network connection.",
+                )
+
     async def _execute_set_position_mode(self, mode: PositionMode):
         success, successful_pairs, msg = await self._execute_set_position_mode_for_pairs(
             mode=mode, trading_pairs=self.trading_pairs
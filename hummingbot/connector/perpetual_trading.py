@@ -3,9 +3,10 @@ import copy
 import logging
 import warnings
 from collections import defaultdict
-from typing import Dict, List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional, Set
 
-from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.derivative.position import Position, PositionUpdate
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionMode, PositionSide
 from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate
@@ -27,8 +28,15 @@ class PerpetualTrading:
         self._funding_info: Dict[str, FundingInfo] = {}
         self._funding_payment_span: List[int] = [0, 0]
         self._funding_info_stream = asyncio.Queue()
+        self._position_update_stream = asyncio.Queue()
+
+        self._last_funding_info_update_id: Dict[str, int] = {}
+        self._last_position_update_id: Dict[str, int] = {}
+        self._out_of_sync_funding_info_pairs: Set[str] = set()
+        self._out_of_sync_position_pairs: Set[str] = set()
 
         self._funding_info_updater_task: Optional[asyncio.Task] = None
+        self._position_updater_task: Optional[asyncio.Task] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -57,6 +65,28 @@ class PerpetualTrading:
         """
         return self._funding_info_stream
 
+    @property
+    def position_update_stream(self) -> asyncio.Queue:
+        """
+        The stream to which to supply position updates to be processed by the class.
+        """
+        return self._position_update_stream
+
+    @property
+    def out_of_sync_funding_info_pairs(self) -> Set[str]:
+        """
+        Trading pairs for which a funding info update was missed, and whose funding info should be requested again.
+        """
+        return set(self._out_of_sync_funding_info_pairs)
+
+    @property
+    def out_of_sync_position_pairs(self) -> Set[str]:
+        """
+        Trading pairs for which a position update was missed or could not be applied, and whose positions should be
+        requested again.
+        """
+        return set(self._out_of_sync_position_pairs)
+
     def set_position(self, pos_key: str, position: Position):
         self.logger().debug(f"Setting position {pos_key} to {Position}")
         self._account_positions[pos_key] = position
@@ -69,6 +99,7 @@ class PerpetualTrading:
         Initializes a single trading pair funding information.
         """
         self._funding_info[funding_info.trading_pair] = funding_info
+        self._out_of_sync_funding_info_pairs.discard(funding_info.trading_pair)
 
     def is_funding_info_initialized(self) -> bool:
         """
@@ -81,21 +112,31 @@ class PerpetualTrading:
 
     def start(self):
         """
-        Starts the async task that updates the funding information from the updates stream queue.
+        Starts the async tasks that update the funding information and the positions from the updates stream queues.
         """
         self.stop()
         self._funding_info_updater_task = safe_ensure_future(
             self._funding_info_updater()
         )
+        self._position_updater_task = safe_ensure_future(
+            self._position_updater()
+        )
 
     def stop(self):
         """
-        Stops the funding info updating async task.
+        Stops the funding info and positions updating async tasks.
         """
         if self._funding_info_updater_task is not None:
             self._funding_info_updater_task.cancel()
             self._funding_info_updater_task = None
+        if self._position_updater_task is not None:
+            self._position_updater_task.cancel()
+            self._position_updater_task = None
         self._funding_info.clear()
+        self._last_funding_info_update_id.clear()
+        self._last_position_update_id.clear()
+        self._out_of_sync_funding_info_pairs.clear()
+        self._out_of_sync_position_pairs.clear()
 
     def position_key(self, trading_pair: str, side: PositionSide = None, mode: PositionMode = None) -> str:
         """
@@ -167,18 +208,124 @@ class PerpetualTrading:
         """
         return self._funding_info[trading_pair]
 
+    def process_funding_info_update(self, funding_info_update: FundingInfoUpdate):
+        """
+        Applies a funding info update to the funding info of its trading pair. Updates older than the last applied
+        one are discarded.
+        :param funding_info_update: the funding info update received from the exchange
+        """
+        trading_pair = funding_info_update.trading_pair
+        if self._is_in_sequence(
+            trading_pair=trading_pair,
+            update_id=funding_info_update.update_id,
+            last_update_ids=self._last_funding_info_update_id,
+            out_of_sync_pairs=self._out_of_sync_funding_info_pairs,
+        ):
+            funding_info = self._funding_info[trading_pair]
+            funding_info.update(funding_info_update)
+
+    def process_position_update(self, position_update: PositionUpdate) -> bool:
+        """
+        Applies a position update to the tracked positions. A position is removed when its amount is zero.
+        Updates older than the last applied one are discarded.
+        :param position_update: the position update received from the exchange
+        :return: False if the update could not be applied because it opens a position without an entry price,
+        True otherwise
+        """
+        trading_pair = position_update.trading_pair
+        if not self._is_in_sequence(
+            trading_pair=trading_pair,
+            update_id=position_update.update_id,
+            last_update_ids=self._last_position_update_id,
+            out_of_sync_pairs=self._out_of_sync_position_pairs,
+        ):
+            return True
+
+        pos_key = self.position_key(trading_pair, position_update.position_side)
+        position = self._account_positions.get(pos_key)
+        if position_update.amount == 0:
+            self.remove_position(pos_key)
+        elif position is not None:
+            position.update_position(
+                position_side=position_update.position_side,
+                unrealized_pnl=position_update.unrealized_pnl,
+                entry_price=position_update.entry_price,
+                amount=position_update.amount,
+                leverage=position_update.leverage,
+            )
+        elif position_update.entry_price is not None:
+            leverage = position_update.leverage
+            self.set_position(
+                pos_key,
+                Position(
+                    trading_pair=trading_pair,
+                    position_side=position_update.position_side,
+                    unrealized_pnl=(
+                        position_update.unrealized_pnl if position_update.unrealized_pnl is not None else Decimal("0")
+                    ),
+                    entry_price=position_update.entry_price,
+                    amount=position_update.amount,
+                    leverage=leverage if leverage is not None else Decimal(self.get_leverage(trading_pair)),
+                ),
+            )
+        else:
+            self._out_of_sync_position_pairs.add(trading_pair)
+            return False
+        return True
+
+    def mark_positions_in_sync(self, trading_pairs: List[str]):
+        """
+        Flags the positions of the trading pairs as reconciled with the exchange.
+        :param trading_pairs: the trading pairs whose positions have been requested again
+        """
+        self._out_of_sync_position_pairs.difference_update(trading_pairs)
+
+    def _is_in_sequence(
+        self,
+        trading_pair: str,
+        update_id: Optional[int],
+        last_update_ids: Dict[str, int],
+        out_of_sync_pairs: Set[str],
+    ) -> bool:
+        """
+        Checks the sequence number of an update. Returns False for updates older than the last processed one. When
+        one or more updates were skipped the trading pair is flagged as out of sync, but the update is still applied
+        since it carries the most recent state.
+        """
+        if update_id is None:
+            return True
+        last_update_id = last_update_ids.get(trading_pair)
+        if last_update_id is not None:
+            if update_id <= last_update_id:
+                return False
+            if update_id > last_update_id + 1:
+                self.logger().warning(
+                    f"Missed updates for {trading_pair} between sequence numbers {last_update_id} and {update_id}."
+                )
+                out_of_sync_pairs.add(trading_pair)
+        last_update_ids[trading_pair] = update_id
+        return True
+
     async def _funding_info_updater(self):
         while True:
             try:
                 funding_info_message: FundingInfoUpdate = await self._funding_info_stream.get()
-                trading_pair = funding_info_message.trading_pair
-                funding_info = self._funding_info[trading_pair]
-                funding_info.update(funding_info_message)
+                self.process_funding_info_update(funding_info_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unexpected error updating funding info.", exc_info=True)
 
+    async def _position_updater(self):
+        while True:
+            try:
+                position_message: PositionUpdate = await self._position_update_stream.get()
+                self.process_position_update(position_message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error updating positions.", exc_info=True)
+
     def get_buy_collateral_token(self, trading_pair: str) -> str:
         warnings.warn(
             "This method is replaced by PerpetualDerivativePyBase.get_buy_collateral_token, and will be removed"
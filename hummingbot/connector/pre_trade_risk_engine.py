@@ -0,0 +1,233 @@
+import heapq
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderExpiredEvent,
+    OrderFilledEvent,
+    SellOrderCompletedEvent,
+)
+
+
+@dataclass
+class PreTradeRiskLimits:
+    """
+    Limits enforced on every order before it is sent to the exchange. A limit set to None is not checked.
+
+    - max_open_notional: maximum notional (amount * price, in quote units) of the open orders per base asset. The
+      orders of a base asset in different quote assets are limited separately, their notionals are not added up
+    - max_position: maximum absolute position per base asset, including the open orders as if they were filled
+    - max_orders_per_interval: maximum number of orders accepted during any `order_rate_interval` seconds
+    - max_price_deviation: maximum deviation of a limit order price from the mid price, as a fraction of the mid price
+    - self_trade_prevention: rejects the orders that would cross an open order of the same trading pair. A market
+      order is rejected when the open order is at or through the best price of the order book on its side, market
+      orders are not checked while that price is not available
+    """
+    max_open_notional: Dict[str, Decimal] = field(default_factory=dict)
+    max_position: Dict[str, Decimal] = field(default_factory=dict)
+    max_orders_per_interval: Optional[int] = None
+    order_rate_interval: float = 1.0
+    max_price_deviation: Optional[Decimal] = None
+    self_trade_prevention: bool = True
+
+
+class _OpenOrder:
+    __slots__ = ("trading_pair", "base_asset", "quote_asset", "trade_type", "price", "remaining_amount")
+
+    def __init__(self, trading_pair: str, base_asset: str, quote_asset: str, trade_type: TradeType, price: Decimal,
+                 amount: Decimal):
+        self.trading_pair = trading_pair
+        self.base_asset = base_asset
+        self.quote_asset = quote_asset
+        self.trade_type = trade_type
+        self.price = price
+        self.remaining_amount = amount
+
+
+class PreTradeRiskEngine(EventListener):
+    """
+    Risk gate of the orders of a connector, evaluated synchronously when an order is created.
+
+    The state of the checks is kept in in-memory counters (open notional per base and quote asset, open amounts and
+    position per asset, best open prices per trading pair and the timestamps of the last accepted orders). The counters are updated when an
+    order is accepted and from the fill, cancel, failure, expiration and completion events of the connector, so
+    checking an order doesn't require any request to the exchange.
+    """
+
+    def __init__(self, limits: PreTradeRiskLimits):
+        super().__init__()
+        self._limits = limits
+        self._open_orders: Dict[str, _OpenOrder] = {}
+        self._open_notional: Dict[Tuple[str, str], Decimal] = defaultdict(lambda: s_decimal_0)
+        self._open_buy_amount: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self._open_sell_amount: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self._positions: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        # Heaps of (price, order id) of the open orders per trading pair, the highest buy price is stored negated.
+        # Closed orders are discarded lazily when they reach the top of the heap.
+        self._buy_prices: Dict[str, List[Tuple[Decimal, str]]] = defaultdict(list)
+        self._sell_prices: Dict[str, List[Tuple[Decimal, str]]] = defaultdict(list)
+        self._accepted_orders_timestamps: Deque[float] = deque()
+
+    def __call__(self, event):
+        if isinstance(event, OrderFilledEvent):
+            self.process_fill(event)
+        elif isinstance(event, (OrderCancelledEvent, MarketOrderFailureEvent, OrderExpiredEvent,
+                                BuyOrderCompletedEvent, SellOrderCompletedEvent)):
+            self.process_order_done(event.order_id)
+
+    @property
+    def limits(self) -> PreTradeRiskLimits:
+        return self._limits
+
+    def position(self, asset: str) -> Decimal:
+        return self._positions.get(asset, s_decimal_0)
+
+    def open_notional(self, asset: str, quote_asset: str) -> Decimal:
+        return self._open_notional.get((asset, quote_asset), s_decimal_0)
+
+    def check_order(self,
+                    order_id: str,
+                    trading_pair: str,
+                    trade_type: TradeType,
+                    amount: Decimal,
+                    price: Optional[Decimal],
+                    mid_price: Optional[Decimal],
+                    timestamp: Optional[float] = None,
+                    top_of_book_price: Optional[Decimal] = None) -> Optional[str]:
+        """
+        Checks an order against the limits. When the order is accepted it is added to the open orders counters.
+
+        :param order_id: the client id of the order
+        :param trading_pair: the trading pair of the order
+        :param trade_type: the side of the order
+        :param amount: the order amount
+        :param price: the order price, None or NaN for market orders
+        :param mid_price: the current mid price of the trading pair, None or NaN if it is not available
+        :param timestamp: the time of the order creation, used by the order rate limit
+        :param top_of_book_price: the best price a market order would take, the best ask for buys and the best bid for
+            sells, None or NaN if it is not available
+
+        :return: None if the order is accepted, otherwise the reason of the rejection
+        """
+        limits = self._limits
+        timestamp = time.time() if timestamp is None else timestamp
+        base_asset, quote_asset = split_hb_trading_pair(trading_pair)
+        is_buy = trade_type == TradeType.BUY
+        has_price = price is not None and not price.is_nan()
+        has_top_of_book_price = top_of_book_price is not None and not top_of_book_price.is_nan()
+        has_mid_price = mid_price is not None and not mid_price.is_nan() and mid_price > s_decimal_0
+
+        if limits.max_orders_per_interval is not None:
+            timestamps = self._accepted_orders_timestamps
+            while len(timestamps) > 0 and timestamps[0] <= timestamp - limits.order_rate_interval:
+                timestamps.popleft()
+            if len(timestamps) >= limits.max_orders_per_interval:
+                return (f"more than {limits.max_orders_per_interval} orders in {limits.order_rate_interval} "
+                        f"seconds")
+
+        if has_price and has_mid_price and limits.max_price_deviation is not None:
+            deviation = abs(price - mid_price) / mid_price
+            if deviation > limits.max_price_deviation:
+                return f"price {price} deviates {deviation:.2%} from the mid price {mid_price}"
+
+        # Market orders are checked against the best price they would take
+        crossing_price = price if has_price else (top_of_book_price if has_top_of_book_price else None)
+        if limits.self_trade_prevention and crossing_price is not None:
+            best_opposite_price = self._best_open_price(trading_pair=trading_pair, is_buy=not is_buy)
+            if best_opposite_price is not None and (
+                    (is_buy and crossing_price >= best_opposite_price)
+                    or (not is_buy and crossing_price <= best_opposite_price)):
+                return f"the order would cross the open {'sell' if is_buy else 'buy'} order at {best_opposite_price}"
+
+        notional_price = price if has_price else (mid_price if has_mid_price else None)
+        max_open_notional = limits.max_open_notional.get(base_asset)
+        if max_open_notional is not None:
+            if notional_price is None:
+                return "the notional of the order can't be calculated without price"
+            open_notional = self._open_notional[(base_asset, quote_asset)] + amount * notional_price
+            if open_notional > max_open_notional:
+                return (f"the open notional of {base_asset} would be {open_notional} {quote_asset} "
+                        f"(limit {max_open_notional})")
+
+        max_position = limits.max_position.get(base_asset)
+        if max_position is not None:
+            if is_buy:
+                position = self._positions[base_asset] + self._open_buy_amount[base_asset] + amount
+            else:
+                position = self._positions[base_asset] - self._open_sell_amount[base_asset] - amount
+            if abs(position) > max_position:
+                return f"the position of {base_asset} could reach {position} (limit {max_position})"
+
+        self._add_open_order(order_id=order_id,
+                             open_order=_OpenOrder(trading_pair=trading_pair,
+                                                   base_asset=base_asset,
+                                                   quote_asset=quote_asset,
+                                                   trade_type=trade_type,
+                                                   price=notional_price if notional_price is not None else s_decimal_0,
+                                                   amount=amount),
+                             has_price=has_price)
+        if limits.max_orders_per_interval is not None:
+            self._accepted_orders_timestamps.append(timestamp)
+        return None
+
+    def process_fill(self, event: OrderFilledEvent):
+        base_asset, _ = split_hb_trading_pair(event.trading_pair)
+        if event.trade_type == TradeType.BUY:
+            self._positions[base_asset] += event.amount
+        else:
+            self._positions[base_asset] -= event.amount
+
+        open_order = self._open_orders.get(event.order_id)
+        if open_order is not None:
+            filled_amount = min(event.amount, open_order.remaining_amount)
+            open_order.remaining_amount -= filled_amount
+            self._remove_open_amount(open_order=open_order, amount=filled_amount)
+
+    def process_order_done(self, order_id: str):
+        open_order = self._open_orders.pop(order_id, None)
+        if open_order is not None:
+            self._remove_open_amount(open_order=open_order, amount=open_order.remaining_amount)
+            open_order.remaining_amount = s_decimal_0
+
+    def _add_open_order(self, order_id: str, open_order: _OpenOrder, has_price: bool):
+        self._open_orders[order_id] = open_order
+        base_asset = open_order.base_asset
+        self._open_notional[(base_asset, open_order.quote_asset)] += open_order.remaining_amount * open_order.price
+        if open_order.trade_type == TradeType.BUY:
+            self._open_buy_amount[base_asset] += open_order.remaining_amount
+            if has_price:
+                heapq.heappush(self._buy_prices[open_order.trading_pair], (-open_order.price, order_id))
+        else:
+            self._open_sell_amount[base_asset] += open_order.remaining_amount
+            if has_price:
+                heapq.heappush(self._sell_prices[open_order.trading_pair], (open_order.price, order_id))
+
+    def _remove_open_amount(self, open_order: _OpenOrder, amount: Decimal):
+        base_asset = open_order.base_asset
+        self._open_notional[(base_asset, open_order.quote_asset)] -= amount * open_order.price
+        if open_order.trade_type == TradeType.BUY:
+            self._open_buy_amount[base_asset] -= amount
+        else:
+            self._open_sell_amount[base_asset] -= amount
+
+    def _best_open_price(self, trading_pair: str, is_buy: bool) -> Optional[Decimal]:
+        prices = (self._buy_prices if is_buy else self._sell_prices).get(trading_pair)
+        if not prices:
+            return None
+        while len(prices) > 0:
+            order_price, order_id = prices[0]
+            open_order = self._open_orders.get(order_id)
+            if open_order is not None and open_order.remaining_amount > s_decimal_0:
+                return -order_price if is_buy else order_price
+            heapq.heappop(prices)
+        return None
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -22,6 +22,7 @@ class TimeSynchronizer:
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._time_offset_ms_cache: Optional[float] = None
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -35,17 +36,23 @@ class TimeSynchronizer:
         if not self._time_offset_ms:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            # The offset only changes when samples are added, so it is not recalculated for every signed request
+            if self._time_offset_ms_cache is None:
+                median = numpy.median(self._time_offset_ms)
+                weighted_average = numpy.average(self._time_offset_ms,
+                                                 weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+                self._time_offset_ms_cache = numpy.mean([median, weighted_average])
+            offset = self._time_offset_ms_cache
 
         return offset
 
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        self._time_offset_ms_cache = None
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._time_offset_ms_cache = None
 
     def time(self) -> float:
         """
@@ -8,6 +8,7 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -90,6 +91,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            bint sample_tick
+        runtime_metrics = RuntimeMetrics.get_instance()
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -112,11 +116,17 @@ cdef class Clock:
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
+                # Run through all the child iterators, measuring their tick duration when this tick is sampled.
+                sample_tick = runtime_metrics.should_sample_tick()
                 for ci in self._current_context:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        if sample_tick:
+                            tick_start = time.perf_counter()
+                            child_iterator.c_tick(self._current_tick)
+                            runtime_metrics.observe_tick(type(ci).__name__, time.perf_counter() - tick_start)
+                        else:
+                            child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
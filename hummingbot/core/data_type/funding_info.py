@@ -60,6 +60,7 @@ class FundingInfo:
     def update(self, info_update: "FundingInfoUpdate"):
         update_dict = asdict(info_update)
         update_dict.pop("trading_pair")
+        update_dict.pop("update_id")
         for key, value in update_dict.items():
             if value is not None:
                 setattr(self, key, value)
@@ -72,3 +73,4 @@ class FundingInfoUpdate:
     mark_price: Optional[Decimal] = None
     next_funding_utc_timestamp: Optional[int] = None
     rate: Optional[Decimal] = None
+    update_id: Optional[int] = None
@@ -38,6 +38,7 @@ NaN = float("nan")
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_LEVELS_CHANGE_EVENT_TAG = OrderBookEvent.TopLevelsChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,6 +56,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._top_levels = 5
+        self._top_levels_version = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,15 +68,40 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double lowest_top_bid = float("-inf")
+            double highest_top_ask = float("inf")
+            int level = 0
+            bint top_levels_changed = False
+
+        # Find the price of the last of the top levels, diffs at or above it change the top levels.
+        bid_iterator = self._bid_book.rbegin()
+        while bid_iterator != self._bid_book.rend() and level < self._top_levels:
+            lowest_top_bid = deref(bid_iterator).getPrice()
+            inc(bid_iterator)
+            level += 1
+        if level < self._top_levels:
+            lowest_top_bid = float("-inf")
+        level = 0
+        ask_iterator = self._ask_book.begin()
+        while ask_iterator != self._ask_book.end() and level < self._top_levels:
+            highest_top_ask = deref(ask_iterator).getPrice()
+            inc(ask_iterator)
+            level += 1
+        if level < self._top_levels:
+            highest_top_ask = float("inf")
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
+            if bid.getPrice() >= lowest_top_bid:
+                top_levels_changed = True
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
         for ask in asks:
+            if ask.getPrice() <= highest_top_ask:
+                top_levels_changed = True
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
@@ -96,6 +124,9 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        if top_levels_changed:
+            self.c_notify_top_levels_change()
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -136,6 +167,12 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_notify_top_levels_change()
+
+    cdef c_notify_top_levels_change(self):
+        self._top_levels_version += 1
+        self.c_trigger_event(self.ORDER_BOOK_TOP_LEVELS_CHANGE_EVENT_TAG, self)
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -161,6 +198,25 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def top_levels(self) -> int:
+        """
+        Number of price levels on each side whose changes increase the top levels version and trigger a
+        TopLevelsChangeEvent.
+        """
+        return self._top_levels
+
+    @top_levels.setter
+    def top_levels(self, value: int):
+        self._top_levels = value
+
+    @property
+    def top_levels_version(self) -> int:
+        """
+        Counter increased every time the top levels of the book change, readers can compare it to skip recalculations.
+        """
+        return self._top_levels_version
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
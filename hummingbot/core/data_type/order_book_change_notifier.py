@@ -0,0 +1,56 @@
+import asyncio
+from typing import List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class OrderBookChangeNotifier:
+    """
+    Wakes up a consumer when the top levels of any of the watched order books change.
+
+    The changes are coalesced, any number of them between two checks of the consumer results in a single wake up.
+    """
+
+    def __init__(self):
+        self._change_event = asyncio.Event()
+        # The order books keep weak references to their listeners, the forwarder is owned by the notifier
+        self._forwarder = EventForwarder(to_function=self._on_top_levels_change)
+        self._order_books: List[OrderBook] = []
+
+    @property
+    def changed(self) -> bool:
+        """
+        True if any watched order book changed since the last call to `clear`.
+        """
+        return self._change_event.is_set()
+
+    def watch(self, order_book: OrderBook):
+        if order_book not in self._order_books:
+            order_book.add_listener(OrderBookEvent.TopLevelsChangeEvent, self._forwarder)
+            self._order_books.append(order_book)
+
+    def stop(self):
+        for order_book in self._order_books:
+            order_book.remove_listener(OrderBookEvent.TopLevelsChangeEvent, self._forwarder)
+        self._order_books.clear()
+
+    def clear(self):
+        self._change_event.clear()
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """
+        Waits until any watched order book changes, without clearing the change.
+
+        :param timeout: maximum time to wait, in seconds
+        :return: True if an order book changed, False if the timeout expired
+        """
+        try:
+            await asyncio.wait_for(self._change_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _on_top_levels_change(self, _: OrderBook):
+        self._change_event.set()
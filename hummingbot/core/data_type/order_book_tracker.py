@@ -75,6 +75,17 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        :return: the number of messages waiting in the stream queues, and in the tracking queues of all trading pairs
+        """
+        return {
+            "order_book_diff": self._order_book_diff_stream.qsize(),
+            "order_book_snapshot": self._order_book_snapshot_stream.qsize(),
+            "order_book_trade": self._order_book_trade_stream.qsize(),
+            "order_book_tracking": sum(queue.qsize() for queue in self._tracking_message_queues.values()),
+        }
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -79,6 +79,35 @@ class OrderCandidate:
         self._populate_percent_fee_value(exchange, fee)
         self._apply_fee_impact_on_potential_returns(exchange, fee)
 
+    def populate_percent_fee_collateral_entries(self, fee_percent: Decimal, fee_added_to_cost: bool):
+        """
+        Populates the same entries as `populate_collateral_entries` for a spot order whose fee is only a percent
+        fee, added to the order cost in the order collateral token or deducted from the returns. It doesn't require
+        building the trade fee nor any price from the exchange.
+
+        :param fee_percent: the percent fee of the order
+        :param fee_added_to_cost: True if the fee is added to the order cost, False if deducted from the returns
+        """
+        base, quote = split_hb_trading_pair(self.trading_pair)
+        if self.order_side == TradeType.BUY:
+            self.order_collateral = TokenAmount(quote, self.amount * self.price)
+            self.potential_returns = TokenAmount(base, self.amount)
+        else:
+            self.order_collateral = TokenAmount(base, self.amount)
+            self.potential_returns = TokenAmount(quote, self.amount * self.price)
+        self.percent_fee_collateral = None
+        self.percent_fee_value = None
+        self.fixed_fee_collaterals = []
+        if fee_added_to_cost:
+            if fee_percent != Decimal("0"):
+                fee_amount = self.order_collateral.amount * fee_percent
+                self.percent_fee_collateral = TokenAmount(self.order_collateral.token, fee_amount)
+                self.percent_fee_value = TokenAmount(self.order_collateral.token, fee_amount)
+        else:
+            fee_amount = self.potential_returns.amount * fee_percent
+            self.percent_fee_value = TokenAmount(self.potential_returns.token, fee_amount)
+            self.potential_returns.amount -= fee_amount
+
     def adjust_from_balances(self, available_balances: Dict[str, Decimal]):
         if not self.is_zero_order:
             self._adjust_for_order_collateral(available_balances)
@@ -11,13 +11,13 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, max_order_filled_events: Optional[int] = None):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # Order fill events are kept for longer (all of them by default), because they are required for PnL calculation
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        self._order_filled_logged_events = deque(maxlen=max_order_filled_events)
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
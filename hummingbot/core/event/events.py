@@ -38,6 +38,7 @@ class MarketEvent(Enum):
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
     OrderBookDataSourceUpdateEvent = 904
+    TopLevelsChangeEvent = 905
 
 
 class OrderBookDataSourceEvent(int, Enum):
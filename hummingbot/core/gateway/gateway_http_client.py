@@ -10,6 +10,7 @@ from aiohttp import ContentTypeError
 
 from hummingbot.client.config.security import Security
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_quote_cache import GatewayPriceRequest, GatewayQuoteCache
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -46,6 +47,8 @@ class GatewayHttpClient:
     An HTTP client for making requests to the gateway API.
     """
 
+    QUOTE_CACHE_TTL = 1.0
+
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
     _base_url: str
@@ -67,6 +70,7 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._quote_cache = GatewayQuoteCache(fetch_quote=self._request_price, ttl=self.QUOTE_CACHE_TTL)
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -449,9 +453,46 @@ class GatewayHttpClient:
             fail_silently: bool = False,
             pool_id: Optional[str] = None
     ) -> Dict[str, Any]:
+        """
+        Requests a price through the quote cache, identical requests in flight or recently answered are not sent again.
+        """
         if side not in [TradeType.BUY, TradeType.SELL]:
             raise ValueError("Only BUY and SELL prices are supported.")
 
+        return await self._quote_cache.get_price(
+            chain, network, connector, base_asset, quote_asset, amount, side,
+            fail_silently=fail_silently, pool_id=pool_id,
+        )
+
+    async def get_prices(
+            self,
+            price_requests: List[GatewayPriceRequest],
+            fail_silently: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Requests several prices, grouped per chain and without repeating identical requests.
+
+        :return: the price response for each request, in the same order, or the exception raised by its request
+        """
+        for price_request in price_requests:
+            if price_request.side not in [TradeType.BUY, TradeType.SELL]:
+                raise ValueError("Only BUY and SELL prices are supported.")
+
+        return await self._quote_cache.get_prices(price_requests, fail_silently=fail_silently)
+
+    async def _request_price(
+            self,
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType,
+            fail_silently: bool = False,
+            pool_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+
         request_payload = {
             "chain": chain,
             "network": network,
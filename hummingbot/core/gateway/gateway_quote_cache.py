@@ -0,0 +1,151 @@
+import asyncio
+import time
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import cachetools
+
+from hummingbot.core.data_type.common import TradeType
+
+QuoteKey = Tuple[str, str, str, str, str, str, str, Optional[str], bool]
+
+
+class GatewayPriceRequest(NamedTuple):
+    chain: str
+    network: str
+    connector: str
+    base_asset: str
+    quote_asset: str
+    amount: Decimal
+    side: TradeType
+    pool_id: Optional[str] = None
+
+
+class GatewayQuoteCache:
+    """
+    Quote layer in front of the gateway price endpoint.
+
+    Identical requests issued while one is in flight share the same HTTP call (single-flight), and the responses are
+    cached for `ttl` seconds, so strategies and data feeds asking for the same (pair, side, amount) within a block
+    only hit the gateway once.
+    """
+
+    def __init__(
+            self,
+            fetch_quote: Callable[..., Awaitable[Dict[str, Any]]],
+            ttl: float = 1.0,
+            max_cached_quotes: int = 1000,
+            timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param fetch_quote: coroutine function requesting the price to the gateway, with the signature of
+            `GatewayHttpClient.get_price`
+        :param ttl: seconds a quote is reused
+        :param max_cached_quotes: maximum number of quotes kept in the cache
+        :param timer: clock used to expire the quotes
+        """
+        self._fetch_quote = fetch_quote
+        self._quotes: cachetools.TTLCache = cachetools.TTLCache(maxsize=max_cached_quotes, ttl=ttl, timer=timer)
+        self._in_flight: Dict[QuoteKey, asyncio.Future] = {}
+
+    @staticmethod
+    def quote_key(
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType,
+            pool_id: Optional[str] = None,
+            fail_silently: bool = False,
+    ) -> QuoteKey:
+        # The amount is normalized the same way it is sent to the gateway, so Decimal("1") and Decimal("1.0") match
+        return (chain, network, connector, base_asset, quote_asset, f"{amount:.18f}", side.name,
+                pool_id or None, fail_silently)
+
+    async def get_price(
+            self,
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType,
+            fail_silently: bool = False,
+            pool_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        key = self.quote_key(chain, network, connector, base_asset, quote_asset, amount, side, pool_id, fail_silently)
+        quote = self._quotes.get(key)
+        if quote is not None:
+            return quote
+
+        request = self._in_flight.get(key)
+        if request is None or request.get_loop() is not asyncio.get_running_loop():
+            request = asyncio.ensure_future(self._request_quote(
+                key, chain, network, connector, base_asset, quote_asset, amount, side, fail_silently, pool_id))
+            self._in_flight[key] = request
+        # Shielded so a cancelled caller does not cancel the request other callers are waiting for
+        return await asyncio.shield(request)
+
+    async def get_prices(self, requests: List[GatewayPriceRequest], fail_silently: bool = False) -> List[Any]:
+        """
+        Requests several prices at once. The requests are grouped per chain and network, duplicates are only sent
+        once, and the groups are requested concurrently.
+
+        :return: the price response for each request, in the same order, or the exception raised by its request
+        """
+        requests_per_chain: Dict[Tuple[str, str], Dict[QuoteKey, GatewayPriceRequest]] = defaultdict(dict)
+        keys = []
+        for request in requests:
+            key = self.quote_key(*request, fail_silently=fail_silently)
+            keys.append(key)
+            requests_per_chain[(request.chain, request.network)][key] = request
+
+        responses: Dict[QuoteKey, Any] = {}
+        chain_results = await asyncio.gather(
+            *[self._get_chain_prices(chain_requests, fail_silently)
+              for chain_requests in requests_per_chain.values()])
+        for chain_responses in chain_results:
+            responses.update(chain_responses)
+        return [responses[key] for key in keys]
+
+    def clear(self):
+        self._quotes.clear()
+
+    async def _get_chain_prices(
+            self,
+            chain_requests: Dict[QuoteKey, GatewayPriceRequest],
+            fail_silently: bool,
+    ) -> Dict[QuoteKey, Any]:
+        results = await asyncio.gather(
+            *[self.get_price(*request[:7], fail_silently=fail_silently, pool_id=request.pool_id)
+              for request in chain_requests.values()],
+            return_exceptions=True)
+        return dict(zip(chain_requests.keys(), results))
+
+    async def _request_quote(
+            self,
+            key: QuoteKey,
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType,
+            fail_silently: bool,
+            pool_id: Optional[str],
+    ) -> Dict[str, Any]:
+        try:
+            quote = await self._fetch_quote(chain, network, connector, base_asset, quote_asset, amount, side,
+                                            fail_silently=fail_silently, pool_id=pool_id)
+            # Empty responses are returned by the gateway client when failing silently, they are not cached
+            if quote:
+                self._quotes[key] = quote
+            return quote
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
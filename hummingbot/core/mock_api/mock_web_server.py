@@ -4,6 +4,7 @@ import asyncio
 import logging
 import random
 from collections import namedtuple
+from concurrent.futures import Future
 from threading import Thread
 from typing import Optional
 
@@ -77,6 +78,7 @@ class MockWebServer:
         self._impl: Optional[web.Application] = None
         self._runner: Optional[web.AppRunner] = None
         self._started: bool = False
+        self._thread: Optional[Thread] = None
         self._stock_responses = []
         self.host = "127.0.0.1"
 
@@ -245,7 +247,8 @@ class MockWebServer:
         self._impl = None
         self._port = None
         self._started = False
-        self._ev_loop.stop()
+        # Stopping on the next iteration lets the future returned by stop() get its result first
+        self._ev_loop.call_soon(self._ev_loop.stop)
 
     def _start_web_app(self):
         """
@@ -262,12 +265,20 @@ class MockWebServer:
         """
         if self.started:
             self.stop()
-        thread = Thread(target=self._start_web_app)
-        thread.daemon = True
-        thread.start()
+        self._thread = Thread(target=self._start_web_app)
+        self._thread.daemon = True
+        self._thread.start()
 
-    def stop(self):
+    def stop(self) -> Future:
         """
          Stop the Humming Web App
+        :return: the future of the stop, done once the web app is cleaned up
         """
-        asyncio.run_coroutine_threadsafe(self._stop(), self._ev_loop)
+        return asyncio.run_coroutine_threadsafe(self._stop(), self._ev_loop)
+
+    def join(self, timeout: Optional[float] = None):
+        """
+         Wait until the thread of the Humming Web App is done, after it was stopped
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
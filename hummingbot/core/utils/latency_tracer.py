@@ -0,0 +1,90 @@
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Deque, Dict, Iterable, Optional
+
+import numpy as np
+
+
+class OrderLatencyStage(Enum):
+    VALIDATE = "validate"
+    THROTTLE_WAIT = "throttle_wait"
+    SIGN = "sign"
+    SEND = "send"
+    ACK = "ack"
+
+
+@dataclass
+class OrderLatencyTrace:
+    """
+    Latency breakdown (in seconds) of the placement of a single order.
+
+    - validate: quantization, tracking and trading rules checks before the order is submitted
+    - throttle_wait: time waiting for the throttler to allow the request
+    - sign: time spent authenticating (signing) the request
+    - send: network round trip of the request
+    - ack: time from the response arrival until the order is marked as open
+    """
+    client_order_id: str
+    trading_pair: str
+    start_timestamp: float = field(default_factory=time.perf_counter)
+    stages: Dict[OrderLatencyStage, float] = field(default_factory=dict)
+    last_response_timestamp: Optional[float] = None
+
+    def add_stage_duration(self, stage: OrderLatencyStage, duration: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+
+    def mark_response_received(self):
+        self.last_response_timestamp = time.perf_counter()
+
+    @property
+    def total(self) -> float:
+        return sum(self.stages.values())
+
+    def to_dict(self) -> Dict[str, float]:
+        return {stage.value: self.stages.get(stage, 0.0) for stage in OrderLatencyStage}
+
+
+# Trace of the order being placed in the current asyncio task (each order creation runs in its own task).
+current_order_latency_trace: ContextVar[Optional[OrderLatencyTrace]] = ContextVar("current_order_latency_trace",
+                                                                                  default=None)
+
+
+class OrderLatencyTracker:
+    """
+    Keeps the latency traces of the last orders placed by a connector and provides percentiles per stage, to find
+    where the tail latency of the order placement comes from.
+    """
+
+    def __init__(self, max_records: int = 1000):
+        self._traces: Deque[OrderLatencyTrace] = deque(maxlen=max_records)
+
+    @property
+    def traces(self) -> Deque[OrderLatencyTrace]:
+        return self._traces
+
+    def add_trace(self, trace: OrderLatencyTrace):
+        self._traces.append(trace)
+
+    def clear(self):
+        self._traces.clear()
+
+    def stage_percentiles(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[str, Dict[float, float]]:
+        """
+        Calculates the requested percentiles (in seconds) for every stage and for the total order placement time.
+        :param percentiles: the percentiles to calculate, between 0 and 100
+        :return: a dictionary with the stage name as key and a dictionary of percentile -> value as value
+        """
+        percentiles = list(percentiles)
+        result = {}
+        if len(self._traces) == 0:
+            return result
+        durations = np.array([[trace.stages.get(stage, 0.0) for stage in OrderLatencyStage]
+                              for trace in self._traces])
+        columns = {stage.value: durations[:, index] for index, stage in enumerate(OrderLatencyStage)}
+        columns["total"] = durations.sum(axis=1)
+        for name, values in columns.items():
+            result[name] = dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
+        return result
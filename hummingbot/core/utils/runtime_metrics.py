@@ -0,0 +1,304 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from hummingbot.logger import HummingbotLogger
+
+# Upper bounds (in seconds) of the histogram buckets, from sub millisecond callbacks up to ticks that block the loop
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """
+    Fixed buckets histogram of durations (in seconds). Observing a value costs a bisection on the bucket bounds, so
+    it can be used in the clock tick without keeping the samples.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._counts: List[int] = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._last = 0.0
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        return self._buckets
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def last(self) -> float:
+        return self._last
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._last = value
+        if value > self._max:
+            self._max = value
+
+    def cumulative_counts(self) -> List[int]:
+        """
+        :return: the number of observations lower or equal than each bucket bound, plus the total count (+Inf)
+        """
+        result = []
+        total = 0
+        for count in self._counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, quantile: float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket that contains it (the max for the +Inf bucket).
+        :param quantile: the quantile to estimate, between 0 and 1
+        """
+        if self._count == 0:
+            return 0.0
+        rank = quantile * self._count
+        for bound, cumulative_count in zip(self._buckets, self.cumulative_counts()):
+            if cumulative_count >= rank:
+                return min(bound, self._max)
+        return self._max
+
+
+class RuntimeMetrics:
+    """
+    Runtime performance metrics of the bot:
+    - tick duration of every time iterator run by the clock (strategies and connectors)
+    - event loop lag, sampled by a task that measures how late it wakes up
+    - depth of the connectors queues (order book tracker and user stream), read only when the metrics are collected
+    - control loop duration of the strategy v2 runnables (executors and controllers)
+
+    The durations are kept in fixed buckets histograms and are only measured for one every `tick_sampling` ticks or
+    control loops, so the overhead is negligible. Nothing is measured while the metrics are disabled.
+    The metrics are exposed in the Prometheus text format through a local HTTP endpoint, and as a summary table for
+    the `status --perf` command.
+    """
+    _pm_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["RuntimeMetrics"] = None
+
+    METRICS_PATH = "/metrics"
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._pm_logger is None:
+            cls._pm_logger = logging.getLogger(__name__)
+        return cls._pm_logger
+
+    @classmethod
+    def get_instance(cls) -> "RuntimeMetrics":
+        if cls._shared_instance is None:
+            cls._shared_instance = RuntimeMetrics()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._enabled = False
+        self._tick_sampling = 1
+        self._loop_lag_interval = 1.0
+        self._tick_count = 0
+        self._tick_histograms: Dict[str, Histogram] = {}
+        self._control_loop_histograms: Dict[str, Histogram] = {}
+        self._loop_lag = Histogram()
+        self._queue_depth_collectors: Dict[str, Callable[[], Dict[str, int]]] = {}
+        self._loop_lag_task: Optional[asyncio.Task] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def tick_histograms(self) -> Dict[str, Histogram]:
+        return self._tick_histograms
+
+    @property
+    def control_loop_histograms(self) -> Dict[str, Histogram]:
+        return self._control_loop_histograms
+
+    @property
+    def loop_lag(self) -> Histogram:
+        return self._loop_lag
+
+    def enable(self, tick_sampling: int = 1, loop_lag_interval: float = 1.0):
+        """
+        Starts measuring the ticks and control loops, and the event loop lag sampling task.
+        :param tick_sampling: measure one every `tick_sampling` clock ticks and control loops
+        :param loop_lag_interval: seconds between event loop lag samples
+        """
+        self._tick_sampling = max(1, tick_sampling)
+        self._loop_lag_interval = loop_lag_interval
+        self._enabled = True
+        if self._loop_lag_task is None or self._loop_lag_task.done():
+            self._loop_lag_task = asyncio.ensure_future(self._sample_loop_lag())
+
+    def disable(self):
+        self._enabled = False
+        if self._loop_lag_task is not None:
+            self._loop_lag_task.cancel()
+            self._loop_lag_task = None
+
+    def reset(self):
+        self._tick_count = 0
+        self._tick_histograms.clear()
+        self._control_loop_histograms.clear()
+        self._loop_lag = Histogram()
+
+    def should_sample_tick(self) -> bool:
+        """
+        Called by the clock once per tick to decide if the iterators ticks are measured.
+        """
+        if not self._enabled:
+            return False
+        self._tick_count += 1
+        return self._tick_count % self._tick_sampling == 0
+
+    def observe_tick(self, iterator_name: str, duration: float):
+        histogram = self._tick_histograms.get(iterator_name)
+        if histogram is None:
+            histogram = self._tick_histograms[iterator_name] = Histogram()
+        histogram.observe(duration)
+
+    def should_sample_control_loop(self, loop_count: int) -> bool:
+        """
+        Called by each runnable with the number of iterations of its control loop, so every runnable is sampled at the
+        same ratio regardless of how many runnables are running.
+        """
+        return self._enabled and loop_count % self._tick_sampling == 0
+
+    def observe_control_loop(self, runnable_name: str, duration: float):
+        histogram = self._control_loop_histograms.get(runnable_name)
+        if histogram is None:
+            histogram = self._control_loop_histograms[runnable_name] = Histogram()
+        histogram.observe(duration)
+
+    def register_queue_depths(self, owner: str, collector: Callable[[], Dict[str, int]]):
+        """
+        Registers a function that returns the current size of the queues of `owner` (e.g. a connector) by queue name.
+        It is only called when the metrics are collected.
+        """
+        self._queue_depth_collectors[owner] = collector
+
+    def unregister_queue_depths(self, owner: str):
+        self._queue_depth_collectors.pop(owner, None)
+
+    def queue_depths(self) -> Dict[Tuple[str, str], int]:
+        depths = {}
+        for owner, collector in list(self._queue_depth_collectors.items()):
+            try:
+                for queue_name, size in collector().items():
+                    depths[(owner, queue_name)] = size
+            except Exception:
+                self.logger().debug(f"Error collecting the queue depths of {owner}.", exc_info=True)
+        return depths
+
+    async def _sample_loop_lag(self):
+        while True:
+            expected_wake_up = time.perf_counter() + self._loop_lag_interval
+            await asyncio.sleep(self._loop_lag_interval)
+            self._loop_lag.observe(max(0.0, time.perf_counter() - expected_wake_up))
+
+    def to_prometheus_text(self) -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        self._add_histogram_family(
+            lines, "hummingbot_tick_duration_seconds", "Duration of the clock tick of each time iterator.",
+            "iterator", self._tick_histograms)
+        self._add_histogram_family(
+            lines, "hummingbot_control_loop_duration_seconds", "Duration of the control task of each runnable.",
+            "runnable", self._control_loop_histograms)
+        self._add_histogram_family(
+            lines, "hummingbot_event_loop_lag_seconds", "Delay of the event loop waking up a sleeping task.",
+            None, {"": self._loop_lag})
+        lines.append("# HELP hummingbot_queue_depth Number of messages waiting in a queue.")
+        lines.append("# TYPE hummingbot_queue_depth gauge")
+        for (owner, queue_name), size in sorted(self.queue_depths().items()):
+            lines.append(f'hummingbot_queue_depth{{owner="{owner}",queue="{queue_name}"}} {size}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _add_histogram_family(lines: List[str], metric: str, description: str, label: Optional[str],
+                              histograms: Dict[str, Histogram]):
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} histogram")
+        for name, histogram in sorted(histograms.items()):
+            label_pair = f'{label}="{name}",' if label is not None else ""
+            cumulative_counts = histogram.cumulative_counts()
+            for bound, cumulative_count in zip(histogram.buckets, cumulative_counts):
+                lines.append(f'{metric}_bucket{{{label_pair}le="{bound}"}} {cumulative_count}')
+            lines.append(f'{metric}_bucket{{{label_pair}le="+Inf"}} {cumulative_counts[-1]}')
+            labels = f"{{{label_pair.rstrip(',')}}}" if label_pair else ""
+            lines.append(f"{metric}_sum{labels} {histogram.sum}")
+            lines.append(f"{metric}_count{labels} {histogram.count}")
+
+    def format_status(self) -> str:
+        """
+        Summary of the metrics for the `status --perf` command. Durations are in milliseconds.
+        """
+        if not self._enabled:
+            return "Performance metrics are disabled. Enable them with `config perf_metrics`."
+        lines = [f"  Event loop lag (ms): last {self._loop_lag.last * 1e3:.2f} | "
+                 f"p99 {self._loop_lag.quantile(0.99) * 1e3:.2f} | max {self._loop_lag.max * 1e3:.2f}"]
+        for title, histograms in (("Tick duration", self._tick_histograms),
+                                  ("Control loop duration", self._control_loop_histograms)):
+            if len(histograms) == 0:
+                continue
+            lines.append(f"\n  {title} (ms):")
+            lines.append(f"    {'Name':<40}{'Count':>10}{'Mean':>10}{'p50':>10}{'p99':>10}{'Max':>10}")
+            for name, histogram in sorted(histograms.items(), key=lambda item: item[1].sum, reverse=True):
+                mean = histogram.sum / histogram.count if histogram.count > 0 else 0.0
+                lines.append(f"    {name[:39]:<40}{histogram.count:>10}{mean * 1e3:>10.2f}"
+                             f"{histogram.quantile(0.5) * 1e3:>10.2f}{histogram.quantile(0.99) * 1e3:>10.2f}"
+                             f"{histogram.max * 1e3:>10.2f}")
+        queue_depths = self.queue_depths()
+        if len(queue_depths) > 0:
+            lines.append("\n  Queue depths:")
+            for (owner, queue_name), size in sorted(queue_depths.items()):
+                lines.append(f"    {owner} {queue_name}: {size}")
+        return "\n".join(lines)
+
+    async def start_http_server(self, port: int, host: str = "127.0.0.1"):
+        """
+        Serves the metrics in the Prometheus text format at http://{host}:{port}/metrics
+        """
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get(self.METRICS_PATH, self._handle_metrics_request)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+        except Exception:
+            # The server can be started again once the port is available
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        self.logger().info(f"Performance metrics available at http://{host}:{port}{self.METRICS_PATH}")
+
+    async def stop_http_server(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_metrics_request(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.to_prometheus_text(), content_type="text/plain", charset="utf-8")
@@ -1,9 +1,11 @@
 import json
+import time
 from asyncio import wait_for
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.latency_tracer import OrderLatencyStage, current_order_latency_trace
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -80,18 +82,24 @@ class RESTAssistant:
 
         data = json.dumps(data) if data is not None else data
 
+        # The request is owned by this method, so only the params (the only container shared with the caller) are
+        # copied before the pre-processors and the authenticator modify it, instead of deep copying the full request
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=dict(params) if params is not None else None,
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
             throttler_limit_id=throttler_limit_id
         )
 
+        latency_trace = current_order_latency_trace.get()
+        throttle_start = time.perf_counter() if latency_trace is not None else 0
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            if latency_trace is not None:
+                latency_trace.add_stage_duration(OrderLatencyStage.THROTTLE_WAIT, time.perf_counter() - throttle_start)
+            response = await self._call(request=request, timeout=timeout)
 
             if 400 <= response.status:
                 if not return_err:
@@ -103,9 +111,22 @@ class RESTAssistant:
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = deepcopy(request)
+        return await self._call(request=request, timeout=timeout)
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        latency_trace = current_order_latency_trace.get()
         request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
-        resp = await wait_for(self._connection.call(request), timeout)
+        if latency_trace is None:
+            request = await self._authenticate(request)
+            resp = await wait_for(self._connection.call(request), timeout)
+        else:
+            sign_start = time.perf_counter()
+            request = await self._authenticate(request)
+            send_start = time.perf_counter()
+            latency_trace.add_stage_duration(OrderLatencyStage.SIGN, send_start - sign_start)
+            resp = await wait_for(self._connection.call(request), timeout)
+            latency_trace.add_stage_duration(OrderLatencyStage.SEND, time.perf_counter() - send_start)
+            latency_trace.mark_response_received()
         resp = await self._post_process_response(resp)
         return resp
 
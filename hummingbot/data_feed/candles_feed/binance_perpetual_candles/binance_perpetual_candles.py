@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
@@ -99,7 +99,18 @@ class BinancePerpetualCandles(CandlesBase):
         ]
 
     def ws_subscription_payload(self):
-        candle_params = [f"{self._ex_trading_pair.lower()}@kline_{self.interval}"]
+        return self.ws_multiplexed_subscription_payload([self.stream_key])
+
+    @property
+    def supports_ws_multiplexing(self) -> bool:
+        return True
+
+    def ws_message_stream_key(self, data: dict) -> Optional[Tuple[str, str]]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+
+    def ws_multiplexed_subscription_payload(self, stream_keys: List[Tuple[str, str]]):
+        candle_params = [f"{ex_trading_pair.lower()}@kline_{interval}" for ex_trading_pair, interval in stream_keys]
         payload = {
             "method": "SUBSCRIBE",
             "params": candle_params,
@@ -107,6 +118,15 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    def ws_multiplexed_unsubscription_payload(self, stream_keys: List[Tuple[str, str]]):
+        candle_params = [f"{ex_trading_pair.lower()}@kline_{interval}" for ex_trading_pair, interval in stream_keys]
+        payload = {
+            "method": "UNSUBSCRIBE",
+            "params": candle_params,
+            "id": 2
+        }
+        return payload
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
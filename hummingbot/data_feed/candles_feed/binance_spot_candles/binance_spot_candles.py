@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_spot_candles import constants as CONSTANTS
@@ -85,7 +85,18 @@ class BinanceSpotCandles(CandlesBase):
         ]
 
     def ws_subscription_payload(self):
-        candle_params = [f"{self._ex_trading_pair.lower()}@kline_{self.interval}"]
+        return self.ws_multiplexed_subscription_payload([self.stream_key])
+
+    @property
+    def supports_ws_multiplexing(self) -> bool:
+        return True
+
+    def ws_message_stream_key(self, data: dict) -> Optional[Tuple[str, str]]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+
+    def ws_multiplexed_subscription_payload(self, stream_keys: List[Tuple[str, str]]):
+        candle_params = [f"{ex_trading_pair.lower()}@kline_{interval}" for ex_trading_pair, interval in stream_keys]
         payload = {
             "method": "SUBSCRIBE",
             "params": candle_params,
@@ -93,6 +104,15 @@ class BinanceSpotCandles(CandlesBase):
         }
         return payload
 
+    def ws_multiplexed_unsubscription_payload(self, stream_keys: List[Tuple[str, str]]):
+        candle_params = [f"{ex_trading_pair.lower()}@kline_{interval}" for ex_trading_pair, interval in stream_keys]
+        payload = {
+            "method": "UNSUBSCRIBE",
+            "params": candle_params,
+            "id": 2
+        }
+        return payload
+
     def _parse_websocket_message(self, data: dict):
         candles_row_dict = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,13 +14,19 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.historical_candles_downloader import HistoricalCandlesDownloader
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a fixed size CandlesStore (a NumPy
+    backed double-ended queue) to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,12 +56,16 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesStore(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_cache_version: int = -1
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        # When set, the websocket updates are received through the hub shared by the feeds of the connector
+        self._hub: Optional["CandlesHub"] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -70,16 +79,27 @@ class CandlesBase(NetworkBase):
         """
         await self.stop_network()
         await self.initialize_exchange_data()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._hub is not None:
+            await self._hub.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
         This method stops the network by canceling the _listen_candles_task task.
         """
+        if self._hub is not None:
+            self._hub.unsubscribe(self)
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
 
+    def attach_to_hub(self, hub: "CandlesHub"):
+        """
+        Makes the feed receive its websocket updates through the hub instead of opening its own connection.
+        """
+        self._hub = hub
+
     async def initialize_exchange_data(self):
         """
         This method is used to set up the exchange data before starting the network.
@@ -91,7 +111,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles store has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -138,12 +158,33 @@ class CandlesBase(NetworkBase):
     def interval_in_seconds(self):
         return self.get_seconds_from_interval(self.interval)
 
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns a counter that increases every time a candle is added or updated. It can be used by
+        readers to skip recalculations when the candles didn't change.
+        """
+        return self._candles.version
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read-only view (no copy) of the stored candles as a NumPy array, oldest first, with
+        the columns defined in `columns`.
+        """
+        return self._candles.values
+
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles store as a Pandas DataFrame.
+        The DataFrame is built only when the candles change, and a copy of it is returned so callers can add
+        columns (I.E. indicators) without affecting other readers.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_cache_version != self._candles.version:
+            self._candles_df_cache = pd.DataFrame(self._candles.values, columns=self.columns, dtype=float, copy=True)
+            self._candles_df_cache_version = self._candles.version
+        return self._candles_df_cache.copy()
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -161,28 +202,24 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
-    async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+    async def get_historical_candles(self,
+                                     config: HistoricalCandlesConfig,
+                                     max_concurrent_requests: int = 5,
+                                     checkpoint_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        This method downloads the candles between the start and end time of the config, fetching the REST requests
+        concurrently.
+        :param config: the historical candles configuration
+        :param max_concurrent_requests: maximum number of REST requests in flight
+        :param checkpoint_path: directory where the progress is stored, to resume the download if it's interrupted
+        :return: a DataFrame with the candles, oldest first
+        """
         try:
-            await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
-            candles_df = candles_df[
-                (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
+            downloader = HistoricalCandlesDownloader(candles=self,
+                                                     max_concurrent_requests=max_concurrent_requests,
+                                                     checkpoint_path=checkpoint_path)
+            candles_df = await downloader.download(config)
+            self.check_candles_sorted_and_equidistant(candles_df.values)
             return candles_df
         except ValueError as e:
             self.logger().error(f"Error fetching historical candles: {str(e)}")
@@ -320,7 +357,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles store until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -398,6 +435,42 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def supports_ws_multiplexing(self) -> bool:
+        """
+        Exchanges able to stream several trading pairs and intervals through the same websocket connection, and to
+        tell them apart in the messages, can share the connection in a CandlesHub.
+        """
+        return False
+
+    @property
+    def stream_key(self) -> Tuple[str, str]:
+        """
+        This property returns the (exchange trading pair, interval) identifying the candles stream of the feed.
+        """
+        return self._ex_trading_pair, self.interval
+
+    def ws_message_stream_key(self, data: dict) -> Optional[Tuple[str, str]]:
+        """
+        This method returns the stream key of a websocket candles message, or None if it's not a candles message.
+        Required to support websocket multiplexing.
+        """
+        raise NotImplementedError
+
+    def ws_multiplexed_subscription_payload(self, stream_keys: List[Tuple[str, str]]):
+        """
+        This method returns the payload subscribing to several candles streams through one websocket connection.
+        Required to support websocket multiplexing.
+        """
+        raise NotImplementedError
+
+    def ws_multiplexed_unsubscription_payload(self, stream_keys: List[Tuple[str, str]]):
+        """
+        This method returns the payload unsubscribing from several candles streams of a websocket connection.
+        Required to support websocket multiplexing.
+        """
+        raise NotImplementedError
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
@@ -407,27 +480,35 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._process_candle_row(parsed_message)
+
+    def _process_candle_row(self, parsed_message: dict):
+        """
+        Adds the candle received through the websocket to the store, or updates the latest one, and starts filling the
+        historical candles when it's the first one.
+        :param parsed_message: the candle in the format returned by `_parse_websocket_message`
+        """
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
@@ -1,4 +1,4 @@
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from hummingbot.data_feed.candles_feed.ascend_ex_spot_candles.ascend_ex_spot_candles import AscendExSpotCandles
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
@@ -6,6 +6,7 @@ from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCa
 from hummingbot.data_feed.candles_feed.bybit_perpetual_candles.bybit_perpetual_candles import BybitPerpetualCandles
 from hummingbot.data_feed.candles_feed.bybit_spot_candles.bybit_spot_candles import BybitSpotCandles
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.candles_feed.gate_io_perpetual_candles import GateioPerpetualCandles
 from hummingbot.data_feed.candles_feed.gate_io_spot_candles import GateioSpotCandles
@@ -35,7 +36,10 @@ class CandlesFactory:
     """
     The CandlesFactory class creates and returns a Candle object based on the specified configuration.
     It uses a mapping of connector names to their respective candle classes.
+    The candles of connectors supporting websocket multiplexing share the connections of the CandlesHub of the
+    connector.
     """
+    _hubs: Dict[str, CandlesHub] = {}
     _candles_map: Dict[str, Type[CandlesBase]] = {
         "binance_perpetual": BinancePerpetualCandles,
         "binance": BinanceSpotCandles,
@@ -66,10 +70,31 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
-            return connector_class(
+            candles = connector_class(
                 candles_config.trading_pair,
                 candles_config.interval,
                 candles_config.max_records
             )
+            if candles.supports_ws_multiplexing:
+                candles.attach_to_hub(cls.get_hub(candles_config.connector))
+            return candles
         else:
             raise UnsupportedConnectorException(candles_config.connector)
+
+    @classmethod
+    def get_hub(cls, connector: str, base_interval: Optional[str] = None) -> CandlesHub:
+        """
+        Returns the CandlesHub shared by the candles of the connector.
+
+        :param connector: the connector name
+        :param base_interval: when set, the candles of higher intervals started after this call are built from the
+            candles of this interval instead of subscribing to their own stream
+        :return: the CandlesHub of the connector
+        """
+        hub = cls._hubs.get(connector)
+        if hub is None:
+            hub = CandlesHub()
+            cls._hubs[connector] = hub
+        if base_interval is not None:
+            hub.base_interval = base_interval
+        return hub
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.logger import HummingbotLogger
+
+StreamKey = Tuple[str, str]
+
+
+class CandlesHubConnection:
+    """
+    A websocket connection of the hub and the candles streams subscribed through it.
+    """
+
+    def __init__(self):
+        self.stream_keys: Set[StreamKey] = set()
+        self.ws: Optional[WSAssistant] = None
+        self.listen_task: Optional[asyncio.Task] = None
+
+
+class CandlesHub:
+    """
+    Shares the websocket connections of the candles feeds of one connector.
+
+    Every subscribed (trading pair, interval) stream is multiplexed over a pool of connections, each one carrying up to
+    `max_streams_per_connection` streams, and the messages are routed to the feeds subscribed to the stream.
+    When `base_interval` is set, the feeds of higher intervals (multiples of the base one that divide a day) are built
+    locally aggregating the candles of the base interval stream, so no additional stream is subscribed for them.
+    Their history is still filled with one REST request of their own interval.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, max_streams_per_connection: int = 200, base_interval: Optional[str] = None):
+        self._max_streams_per_connection = max_streams_per_connection
+        self.base_interval = base_interval
+        self._stream_feeds: Dict[StreamKey, List[CandlesBase]] = defaultdict(list)
+        self._stream_connections: Dict[StreamKey, CandlesHubConnection] = {}
+        self._connections: List[CandlesHubConnection] = []
+        # Feeds built from the base interval candles, and the feed of the base interval used for them, per trading pair
+        self._derived_feeds: Dict[str, List[CandlesBase]] = defaultdict(list)
+        self._base_feeds: Dict[str, CandlesBase] = {}
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def stream_keys(self) -> List[StreamKey]:
+        return list(self._stream_connections.keys())
+
+    def is_derived(self, feed: CandlesBase) -> bool:
+        if self.base_interval is None or feed.interval == self.base_interval:
+            return False
+        base_seconds = feed.get_seconds_from_interval(self.base_interval)
+        interval_seconds = feed.interval_in_seconds
+        return interval_seconds % base_seconds == 0 and CandlesBase.interval_to_seconds["1d"] % interval_seconds == 0
+
+    async def subscribe(self, feed: CandlesBase):
+        if self.is_derived(feed):
+            await self._subscribe_derived_feed(feed)
+        else:
+            self._subscribe_stream_feed(feed)
+
+    def unsubscribe(self, feed: CandlesBase):
+        pair_derived_feeds = self._derived_feeds.get(feed._trading_pair, [])
+        if feed in pair_derived_feeds:
+            pair_derived_feeds.remove(feed)
+            if len(pair_derived_feeds) == 0:
+                del self._derived_feeds[feed._trading_pair]
+                base_feed = self._base_feeds.pop(feed._trading_pair)
+                self._unsubscribe_stream_feed(base_feed)
+        else:
+            self._unsubscribe_stream_feed(feed)
+
+    async def _subscribe_derived_feed(self, feed: CandlesBase):
+        trading_pair = feed._trading_pair
+        required_records = feed.interval_in_seconds // feed.get_seconds_from_interval(self.base_interval) + 1
+        base_feed = self._base_feeds.get(trading_pair)
+        if base_feed is None or base_feed.max_records < required_records:
+            new_base_feed = type(feed)(trading_pair, self.base_interval, required_records)
+            await new_base_feed.initialize_exchange_data()
+            self._subscribe_stream_feed(new_base_feed)
+            if base_feed is not None:
+                self._unsubscribe_stream_feed(base_feed)
+            self._base_feeds[trading_pair] = new_base_feed
+        self._derived_feeds[trading_pair].append(feed)
+
+    def _subscribe_stream_feed(self, feed: CandlesBase):
+        stream_key = feed.stream_key
+        feeds = self._stream_feeds[stream_key]
+        if feed in feeds:
+            return
+        feeds.append(feed)
+        if stream_key in self._stream_connections:
+            return
+
+        connection = next((connection for connection in self._connections
+                           if len(connection.stream_keys) < self._max_streams_per_connection), None)
+        if connection is None:
+            connection = CandlesHubConnection()
+            self._connections.append(connection)
+            connection.stream_keys.add(stream_key)
+            connection.listen_task = safe_ensure_future(self._listen_for_subscriptions(connection))
+        else:
+            connection.stream_keys.add(stream_key)
+            if connection.ws is not None:
+                safe_ensure_future(self._send(connection, feed.ws_multiplexed_subscription_payload([stream_key])))
+        self._stream_connections[stream_key] = connection
+
+    def _unsubscribe_stream_feed(self, feed: CandlesBase):
+        stream_key = feed.stream_key
+        feeds = self._stream_feeds.get(stream_key, [])
+        if feed not in feeds:
+            return
+        feeds.remove(feed)
+        if len(feeds) > 0:
+            return
+
+        del self._stream_feeds[stream_key]
+        connection = self._stream_connections.pop(stream_key)
+        connection.stream_keys.discard(stream_key)
+        if len(connection.stream_keys) == 0:
+            self._connections.remove(connection)
+            if connection.listen_task is not None:
+                connection.listen_task.cancel()
+                connection.listen_task = None
+        elif connection.ws is not None:
+            safe_ensure_future(self._send(connection, feed.ws_multiplexed_unsubscription_payload([stream_key])))
+
+    def _connection_feed(self, connection: CandlesHubConnection) -> Optional[CandlesBase]:
+        """
+        Returns one of the feeds of the connection, used to build the requests and parse the messages.
+        """
+        for stream_key in connection.stream_keys:
+            feeds = self._stream_feeds.get(stream_key)
+            if feeds:
+                return feeds[0]
+
+    async def _listen_for_subscriptions(self, connection: CandlesHubConnection):
+        while True:
+            ws: Optional[WSAssistant] = None
+            try:
+                feed = self._connection_feed(connection)
+                ws = await feed._connected_websocket_assistant()
+                connection.ws = ws
+                await ws.send(WSJSONRequest(payload=feed.ws_multiplexed_subscription_payload(
+                    list(connection.stream_keys))))
+                self.logger().info(f"Subscribed to {len(connection.stream_keys)} public klines streams...")
+                await self._process_websocket_messages(connection, ws, feed)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                connection.ws = None
+                ws and await ws.disconnect()
+                for stream_key in connection.stream_keys:
+                    for feed in self._stream_feeds.get(stream_key, []):
+                        await feed._on_order_stream_interruption()
+
+    async def _process_websocket_messages(self, connection: CandlesHubConnection, ws: WSAssistant,
+                                          feed: CandlesBase):
+        while True:
+            try:
+                await asyncio.wait_for(self._process_websocket_messages_task(ws, feed), timeout=feed._ping_timeout)
+            except asyncio.TimeoutError:
+                if feed._ping_timeout is not None:
+                    await ws.send(request=WSJSONRequest(payload=feed._ping_payload))
+
+    async def _process_websocket_messages_task(self, ws: WSAssistant, connection_feed: CandlesBase):
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            stream_key = connection_feed.ws_message_stream_key(data)
+            if stream_key is None:
+                # ping or pong messages
+                parsed_message = connection_feed._parse_websocket_message(data)
+                if isinstance(parsed_message, WSJSONRequest):
+                    await ws.send(request=parsed_message)
+                continue
+            for feed in self._stream_feeds.get(stream_key, []):
+                parsed_message = feed._parse_websocket_message(data)
+                if isinstance(parsed_message, dict):
+                    feed._process_candle_row(parsed_message)
+                    if self._base_feeds.get(feed._trading_pair) is feed:
+                        self._update_derived_feeds(feed)
+
+    def _update_derived_feeds(self, base_feed: CandlesBase):
+        candles = base_feed.candles_array
+        if len(candles) == 0:
+            return
+        latest_timestamp = candles[-1, 0]
+        for feed in self._derived_feeds.get(base_feed._trading_pair, []):
+            candle = self.aggregate_candles(candles, latest_timestamp - latest_timestamp % feed.interval_in_seconds)
+            if candle is not None:
+                feed._process_candle_row(candle)
+
+    @staticmethod
+    def aggregate_candles(candles: np.ndarray, start_timestamp: float) -> Optional[Dict[str, float]]:
+        """
+        Builds the candle starting at `start_timestamp` with the candles of a lower interval since then.
+        :param candles: array of candles with the CandlesBase columns, oldest first
+        :param start_timestamp: the timestamp of the candle to build
+        :return: the candle as a dictionary, or None if the candles don't cover the start timestamp yet
+        """
+        if len(candles) == 0 or candles[0, 0] > start_timestamp:
+            return None
+        period_candles = candles[np.searchsorted(candles[:, 0], start_timestamp):]
+        volumes = period_candles[:, 5:].sum(axis=0)
+        return {
+            "timestamp": start_timestamp,
+            "open": period_candles[0, 1],
+            "high": period_candles[:, 2].max(),
+            "low": period_candles[:, 3].min(),
+            "close": period_candles[-1, 4],
+            "volume": volumes[0],
+            "quote_asset_volume": volumes[1],
+            "n_trades": volumes[2],
+            "taker_buy_base_volume": volumes[3],
+            "taker_buy_quote_volume": volumes[4],
+        }
+
+    @staticmethod
+    async def _send(connection: CandlesHubConnection, payload: dict):
+        if connection.ws is not None:
+            await connection.ws.send(WSJSONRequest(payload=payload))
+
+    @staticmethod
+    async def _sleep(delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
@@ -0,0 +1,143 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+
+class CandlesStore:
+    """
+    Fixed size store of candles backed by a preallocated NumPy array.
+
+    The store exposes the same interface the candles feeds used from ``collections.deque`` (append, extend,
+    extendleft, indexing, maxlen, etc.), but keeps the rows in a contiguous block of memory so readers can get a
+    zero-copy view of the candles with ``values``. The backing array has twice the capacity needed, the live
+    window slides forward on every append and is moved back to the beginning only when it reaches the end of the
+    array, so appends are amortized O(1) and the live rows are always contiguous.
+
+    Every mutation increases ``version``, which allows readers to cache anything derived from the candles and
+    rebuild it only when the data changes.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen = maxlen
+        self._n_columns = n_columns
+        self._buffer = np.zeros((2 * max(maxlen, 1), n_columns), dtype=float)
+        self._start = 0
+        self._size = 0
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter increased on every change of the stored candles.
+        """
+        return self._version
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Returns a read-only view (no copy) of the stored candles, oldest first.
+        The view is only guaranteed to be consistent until the next mutation of the store.
+        """
+        view = self._buffer[self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.values)
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        if isinstance(index, slice):
+            return self.values[index]
+        return self.values[self._normalize_index(index)]
+
+    def __setitem__(self, index: int, row: Iterable[float]):
+        self._buffer[self._start + self._normalize_index(index)] = row
+        self._version += 1
+
+    def append(self, row: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if self._start + self._size == len(self._buffer):
+            self._compact(self._size)
+        self._buffer[self._start + self._size] = row
+        if self._size == self._maxlen:
+            self._start += 1
+        else:
+            self._size += 1
+        self._version += 1
+
+    def appendleft(self, row: Iterable[float]):
+        self.extendleft([row])
+
+    def extend(self, rows: Iterable[Iterable[float]]):
+        new_rows = self._as_rows(rows)[-self._maxlen:] if self._maxlen > 0 else self._as_rows([])
+        if len(new_rows) == 0:
+            return
+        rows_to_keep = min(self._size, self._maxlen - len(new_rows))
+        if self._start + self._size + len(new_rows) > len(self._buffer):
+            self._compact(rows_to_keep)
+        end = self._start + self._size
+        self._buffer[end:end + len(new_rows)] = new_rows
+        self._size += len(new_rows)
+        if self._size > self._maxlen:
+            self._start += self._size - self._maxlen
+            self._size = self._maxlen
+        self._version += 1
+
+    def extendleft(self, rows: Iterable[Iterable[float]]):
+        """
+        Same semantics as ``deque.extendleft``: the rows are prepended one by one (so they end up in reversed order)
+        and, if the store is full, the newest candles are discarded.
+        """
+        new_rows = self._as_rows(rows)[::-1][:self._maxlen]
+        if len(new_rows) == 0:
+            return
+        rows_to_keep = min(self._size, self._maxlen - len(new_rows))
+        if self._start >= len(new_rows):
+            self._start -= len(new_rows)
+            self._buffer[self._start:self._start + len(new_rows)] = new_rows
+        else:
+            merged = np.concatenate([new_rows, self._buffer[self._start:self._start + rows_to_keep]])
+            self._buffer[:len(merged)] = merged
+            self._start = 0
+        self._size = len(new_rows) + rows_to_keep
+        self._version += 1
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self._version += 1
+
+    def _compact(self, rows_to_keep: int):
+        """
+        Moves the newest ``rows_to_keep`` rows to the beginning of the backing array.
+        """
+        end = self._start + self._size
+        self._buffer[:rows_to_keep] = self._buffer[end - rows_to_keep:end]
+        self._start = 0
+        self._size = rows_to_keep
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candles store index out of range")
+        return index
+
+    def _as_rows(self, rows: Iterable[Iterable[float]]) -> np.ndarray:
+        if not isinstance(rows, np.ndarray):
+            rows = list(rows)
+        array = np.asarray(rows, dtype=float)
+        if array.ndim == 1:
+            array = np.repeat(array[:, np.newaxis], self._n_columns, axis=1)
+        return array.reshape(-1, self._n_columns)
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import os
+import shutil
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class HistoricalCandlesDownloader:
+    """
+    Downloads the candles of a time range splitting it in chunks of one REST request, fetched concurrently.
+
+    The rate limits are still enforced by the throttler of the candles feed, `max_concurrent_requests` only bounds the
+    number of requests waiting for it. The candles are placed in an array preallocated for the whole range.
+    When a `checkpoint_path` is provided, every downloaded chunk is stored there, so a download interrupted by an error
+    resumes from the missing chunks, even when it is restarted with a different end time. The checkpoints are deleted
+    once the download completes.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 candles: "CandlesBase",
+                 max_concurrent_requests: int = 5,
+                 checkpoint_path: Optional[str] = None,
+                 max_retries: int = 3):
+        self._candles = candles
+        self._max_concurrent_requests = max_concurrent_requests
+        self._checkpoint_path = checkpoint_path
+        self._max_retries = max_retries
+
+    def chunks(self, start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Splits the range in the (start time, end time) of the chunks fetched with one request each, both included.
+        The chunk boundaries are multiples of the chunk duration, so the same chunks (and their checkpoints) are used
+        by downloads of different ranges, e.g. a download restarted later with a more recent end time.
+        """
+        interval = self._candles.interval_in_seconds
+        chunk_duration = self._candles.candles_max_result_per_rest_request * interval
+        first_chunk_start = (start_time // chunk_duration) * chunk_duration
+        return [(max(chunk_start, start_time), min(chunk_start + chunk_duration - interval, end_time))
+                for chunk_start in range(first_chunk_start, end_time + 1, chunk_duration)]
+
+    async def download(self, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        await self._candles.initialize_exchange_data()
+        start_time = self._candles._round_timestamp_to_interval_multiple(config.start_time)
+        end_time = self._candles._round_timestamp_to_interval_multiple(config.end_time)
+        interval = self._candles.interval_in_seconds
+        records = (end_time - start_time) // interval + 1
+        candles = np.full((records, len(self._candles.columns)), np.nan)
+        checkpoint_dir = self._checkpoint_dir()
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        async def download_chunk(chunk_start: int, chunk_end: int):
+            chunk = self._load_checkpoint(checkpoint_dir, chunk_start, chunk_end)
+            if chunk is None:
+                async with semaphore:
+                    chunk = await self._fetch_chunk(chunk_start, chunk_end)
+                self._save_checkpoint(checkpoint_dir, chunk_start, chunk_end, chunk)
+            if len(chunk) > 0:
+                indexes = ((chunk[:, 0] - start_time) // interval).astype(int)
+                candles[indexes] = chunk
+
+        tasks = [asyncio.ensure_future(download_chunk(chunk_start, chunk_end))
+                 for chunk_start, chunk_end in self.chunks(start_time, end_time)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if checkpoint_dir is not None:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        candles = candles[~np.isnan(candles[:, 0])]
+        if len(candles) < records:
+            self.logger().warning(f"{records - len(candles)} of the {records} {self._candles.name} candles between "
+                                  f"{start_time} and {end_time} are missing, the downloaded candles have gaps.")
+        candles_df = pd.DataFrame(candles, columns=self._candles.columns)
+        return candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
+
+    async def _fetch_chunk(self, chunk_start: int, chunk_end: int) -> np.ndarray:
+        interval = self._candles.interval_in_seconds
+        records = (chunk_end - chunk_start) // interval + 1
+        for attempt in range(self._max_retries + 1):
+            try:
+                chunk = await self._candles.fetch_candles(start_time=chunk_start, end_time=chunk_end, limit=records)
+                break
+            except (asyncio.CancelledError, ValueError):
+                raise
+            except Exception:
+                if attempt == self._max_retries:
+                    raise
+                self.logger().warning(
+                    f"Error fetching the {self._candles.name} candles from {chunk_start} to {chunk_end}. Retrying...",
+                    exc_info=True)
+                await self._candles._sleep(1.0)
+        if len(chunk) == 0:
+            return np.empty((0, len(self._candles.columns)))
+        # Keep the candles of the chunk aligned to the interval, the exchange may return some outside of it
+        timestamps = chunk[:, 0]
+        in_chunk = ((timestamps >= chunk_start) & (timestamps <= chunk_end)
+                    & ((timestamps - chunk_start) % interval == 0))
+        return chunk[in_chunk]
+
+    def _checkpoint_dir(self) -> Optional[str]:
+        # One directory per trading pair and interval, the chunk files are keyed by their own start and end times
+        if self._checkpoint_path is None:
+            return None
+        return os.path.join(self._checkpoint_path, f"candles_{self._candles.name}_{self._candles.interval}")
+
+    @staticmethod
+    def _chunk_file(checkpoint_dir: str, chunk_start: int, chunk_end: int) -> str:
+        return os.path.join(checkpoint_dir, f"{chunk_start}_{chunk_end}.npy")
+
+    def _load_checkpoint(self, checkpoint_dir: Optional[str], chunk_start: int, chunk_end: int) -> Optional[np.ndarray]:
+        if checkpoint_dir is None:
+            return None
+        chunk_file = self._chunk_file(checkpoint_dir, chunk_start, chunk_end)
+        if not os.path.exists(chunk_file):
+            return None
+        return np.load(chunk_file)
+
+    def _save_checkpoint(self, checkpoint_dir: Optional[str], chunk_start: int, chunk_end: int, chunk: np.ndarray):
+        if checkpoint_dir is None:
+            return
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        chunk_file = self._chunk_file(checkpoint_dir, chunk_start, chunk_end)
+        # Written to a temporary file first so an interruption never leaves a partial chunk
+        temporary_file = f"{chunk_file}.tmp.npy"
+        np.save(temporary_file, chunk)
+        os.replace(temporary_file, chunk_file)
@@ -79,7 +79,7 @@ class KucoinPerpetualCandles(CandlesBase):
 
     @property
     def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        df = super().candles_df
         return df.sort_values(by="timestamp", ascending=True)
 
     @property
@@ -70,7 +70,7 @@ class KucoinSpotCandles(CandlesBase):
 
     @property
     def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        df = super().candles_df
         return df.sort_values(by="timestamp", ascending=True)
 
     @property
@@ -0,0 +1,145 @@
+import itertools
+import multiprocessing
+import os
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+import pandas as pd
+
+# The header of the block has the sequence number of the writes, the number of rows stored and the generation of the
+# writer, which is set to RETIRED when the writer closes the block
+HEADER_SIZE = 3
+SEQUENCE, ROWS, GENERATION = 0, 1, 2
+RETIRED = -1
+
+_generations = itertools.count(1)
+
+
+class SharedCandlesHandle(NamedTuple):
+    """
+    Identifies a block of shared memory with candles, it can be sent to other processes to read them.
+    """
+    name: str
+    capacity: int
+    columns: Tuple[str, ...]
+    generation: int
+    owner_pid: int
+
+
+def _block_arrays(buffer, capacity: int, n_columns: int) -> Tuple[np.ndarray, np.ndarray]:
+    header = np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=buffer)
+    rows = np.ndarray((capacity, n_columns), dtype=np.float64, buffer=buffer, offset=header.nbytes)
+    return header, rows
+
+
+class SharedCandlesWriter:
+    """
+    Publishes the candles of a feed in a block of shared memory, so the processes computing features from them can
+    read them without the candles being pickled for every computation.
+
+    The writes are guarded with a sequence number (seqlock): it is odd while the rows are being written, and readers
+    retry when it changed while they were copying the rows.
+    """
+
+    def __init__(self, columns: List[str], capacity: int):
+        self._columns = tuple(columns)
+        self._capacity = capacity
+        size = (HEADER_SIZE + capacity * len(self._columns)) * np.dtype(np.float64).itemsize
+        self._shared_memory = SharedMemory(create=True, size=size)
+        self._header, self._rows = _block_arrays(self._shared_memory.buf, capacity, len(self._columns))
+        self._generation = next(_generations)
+        self._header[:] = 0
+        self._header[GENERATION] = self._generation
+        self._version = -1
+
+    @property
+    def handle(self) -> SharedCandlesHandle:
+        return SharedCandlesHandle(name=self._shared_memory.name, capacity=self._capacity, columns=self._columns,
+                                   generation=self._generation, owner_pid=os.getpid())
+
+    def publish(self, candles: np.ndarray, version: int):
+        """
+        Writes the last candles that fit in the block, unless the candles version was already published.
+        """
+        if version == self._version:
+            return
+        candles = candles[-self._capacity:]
+        self._header[SEQUENCE] += 1
+        self._rows[:len(candles)] = candles
+        self._header[ROWS] = len(candles)
+        self._header[SEQUENCE] += 1
+        self._version = version
+
+    def close(self):
+        # Lets the readers attached to the block detach from it
+        self._header[GENERATION] = RETIRED
+        # The arrays have to be released before the memory is closed
+        self._header = self._rows = None
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+
+
+class _AttachedBlock(NamedTuple):
+    shared_memory: SharedMemory
+    header: np.ndarray
+    rows: np.ndarray
+    generation: int
+
+
+# Blocks attached by the current process, reused between reads
+_attached_blocks: Dict[str, _AttachedBlock] = {}
+
+
+def _shares_resource_tracker(owner_pid: int) -> bool:
+    # The processes started by multiprocessing use the resource tracker of the process that started them
+    parent = multiprocessing.parent_process()
+    return os.getpid() == owner_pid or (parent is not None and parent.pid == owner_pid)
+
+
+def _attach(handle: SharedCandlesHandle) -> _AttachedBlock:
+    shared_memory = SharedMemory(name=handle.name)
+    if not _shares_resource_tracker(handle.owner_pid):
+        # Attaching registers the block to be unlinked when this process exits, but it is owned by the writer process
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+    header, rows = _block_arrays(shared_memory.buf, handle.capacity, len(handle.columns))
+    return _AttachedBlock(shared_memory=shared_memory, header=header, rows=rows, generation=handle.generation)
+
+
+def _detach(name: str):
+    # The arrays of the block are released with the popped block, before the memory is closed
+    shared_memory = _attached_blocks.pop(name).shared_memory
+    shared_memory.close()
+
+
+def _detach_stale_blocks():
+    stale_names = [name for name, block in _attached_blocks.items()
+                   if int(block.header[GENERATION]) != block.generation]
+    for name in stale_names:
+        _detach(name)
+
+
+def read_shared_candles(handle: SharedCandlesHandle, max_retries: int = 100) -> pd.DataFrame:
+    """
+    Returns a copy of the candles published in a block of shared memory as a DataFrame.
+
+    The blocks are attached once and reused between reads, the attachments of blocks closed by their writers are closed
+    on the next read.
+    """
+    _detach_stale_blocks()
+    block = _attached_blocks.get(handle.name)
+    if block is None:
+        block = _attach(handle)
+        _attached_blocks[handle.name] = block
+    header, rows = block.header, block.rows
+    for _ in range(max_retries):
+        sequence = int(header[SEQUENCE])
+        if sequence % 2 == 0:
+            values = rows[:int(header[ROWS])].copy()
+            if int(header[SEQUENCE]) == sequence:
+                return pd.DataFrame(values, columns=list(handle.columns))
+        # Let the writer finish
+        time.sleep(0)
+    raise TimeoutError(f"The candles in {handle.name} kept changing while they were read.")
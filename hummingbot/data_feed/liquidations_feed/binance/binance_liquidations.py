@@ -161,10 +161,7 @@ class BinancePerpetualLiquidations(LiquidationsBase):
                 # SELL-Side means here, that a long position was forcefully liquidated and the other way round
                 liquidation_side = LiquidationSide.LONG if side == "SELL" else LiquidationSide.SHORT
 
-                if trading_pair not in self._liquidations:
-                    self._liquidations[trading_pair] = []
-
-                self._liquidations[trading_pair].append(Liquidation(
+                self.add_liquidation(Liquidation(
                     timestamp=timestamp,
                     trading_pair=trading_pair,
                     quantity=quantity,
@@ -2,8 +2,9 @@ import asyncio
 import time
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 from pandas import DataFrame
@@ -36,6 +37,136 @@ class Liquidation:
     side: LiquidationSide
 
 
+class LiquidationsStore:
+    """
+    Stores the liquidations of a trading pair in columnar numpy arrays sorted by timestamp (in milliseconds).
+
+    The liquidations are appended at the end of the arrays and the stale ones are evicted moving the start of the
+    stored window, so both operations are O(1) amortised: the arrays are only compacted or grown when the end is
+    reached. Keeping the window contiguous allows the time range queries to use binary search.
+    """
+
+    SIDE_CODES = {LiquidationSide.LONG: 1, LiquidationSide.SHORT: -1}
+
+    def __init__(self, retention_ms: int, initial_capacity: int = 1024):
+        self._retention_ms = retention_ms
+        self._timestamps = np.empty(initial_capacity, dtype=np.int64)
+        self._quantities = np.empty(initial_capacity, dtype=np.float64)
+        self._prices = np.empty(initial_capacity, dtype=np.float64)
+        self._sides = np.empty(initial_capacity, dtype=np.int8)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[self._start:self._end]
+
+    @property
+    def quantities(self) -> np.ndarray:
+        return self._quantities[self._start:self._end]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices[self._start:self._end]
+
+    @property
+    def sides(self) -> np.ndarray:
+        return self._sides[self._start:self._end]
+
+    def append(self, timestamp: int, quantity: float, price: float, side: LiquidationSide):
+        """
+        Adds a liquidation, evicting the ones older than the retention period before it.
+
+        :param timestamp: the timestamp of the liquidation in milliseconds
+        """
+        self.evict(timestamp - self._retention_ms)
+        if self._end == self.capacity:
+            self._make_room()
+        if self._end > self._start and timestamp < self._timestamps[self._end - 1]:
+            # Out of order liquidations are rare, they are inserted in place to keep the timestamps sorted
+            index = self._start + int(np.searchsorted(self.timestamps, timestamp, side="right"))
+            for column in (self._timestamps, self._quantities, self._prices, self._sides):
+                column[index + 1:self._end + 1] = column[index:self._end]
+        else:
+            index = self._end
+        self._timestamps[index] = timestamp
+        self._quantities[index] = quantity
+        self._prices[index] = price
+        self._sides[index] = self.SIDE_CODES[side]
+        self._end += 1
+
+    def evict(self, before_timestamp: int):
+        """
+        Removes the liquidations with a timestamp older than or equal to `before_timestamp` (in milliseconds).
+        """
+        if self._end > self._start and self._timestamps[self._start] <= before_timestamp:
+            self._start += int(np.searchsorted(self.timestamps, before_timestamp, side="right"))
+            if self._start == self._end:
+                self._start = self._end = 0
+
+    def window(self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Returns the (start, end) positions, relative to the stored liquidations, of the ones with a timestamp within
+        [start_timestamp, end_timestamp].
+        """
+        timestamps = self.timestamps
+        start = 0 if start_timestamp is None else int(np.searchsorted(timestamps, start_timestamp, side="left"))
+        end = (len(timestamps) if end_timestamp is None
+               else int(np.searchsorted(timestamps, end_timestamp, side="right")))
+        return start, max(start, end)
+
+    def volume_by_side(self,
+                       start_timestamp: Optional[int] = None,
+                       end_timestamp: Optional[int] = None,
+                       in_quote: bool = False) -> Dict[LiquidationSide, float]:
+        """
+        Sums the liquidated amount of each side within the time range.
+
+        :param in_quote: if True the amounts are expressed in quote asset (quantity * price)
+        """
+        start, end = self.window(start_timestamp, end_timestamp)
+        amounts = self.quantities[start:end]
+        if in_quote:
+            amounts = amounts * self.prices[start:end]
+        sides = self.sides[start:end]
+        return {side: float(amounts[sides == code].sum()) for side, code in self.SIDE_CODES.items()}
+
+    def to_df(self,
+              trading_pair: str,
+              start_timestamp: Optional[int] = None,
+              end_timestamp: Optional[int] = None) -> DataFrame:
+        start, end = self.window(start_timestamp, end_timestamp)
+        sides = self.sides[start:end]
+        return pd.DataFrame({
+            "timestamp": self.timestamps[start:end].copy(),
+            "trading_pair": trading_pair,
+            "quantity": self.quantities[start:end].copy(),
+            "price": self.prices[start:end].copy(),
+            "side": np.where(sides == self.SIDE_CODES[LiquidationSide.LONG],
+                             LiquidationSide.LONG, LiquidationSide.SHORT).astype(object),
+        })
+
+    def _make_room(self):
+        size = len(self)
+        current_capacity = self.capacity
+        # Grow when more than half of the arrays is in use, otherwise compacting is enough
+        capacity = current_capacity * 2 if size > current_capacity // 2 else current_capacity
+        for name in ("_timestamps", "_quantities", "_prices", "_sides"):
+            column = getattr(self, name)
+            new_column = np.empty(capacity, dtype=column.dtype) if capacity != current_capacity else column
+            new_column[:size] = column[self._start:self._end]
+            setattr(self, name, new_column)
+        self._start = 0
+        self._end = size
+
+
 class LiquidationsBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing liquidation data from crypto exchanges. The storage
@@ -49,7 +180,7 @@ class LiquidationsBase(NetworkBase):
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self._max_retention_seconds = max_retention_seconds
         self._trading_pairs = trading_pairs
-        self._liquidations = {}
+        self._liquidations: Dict[str, LiquidationsStore] = {}
         self._listen_liquidations_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._subscribed_to_channels = False
@@ -117,46 +248,59 @@ class LiquidationsBase(NetworkBase):
     def _cleanup_old_liquidations(self):
         try:
             current_time_ms = int(time.time() * 1000)
-            if self._liquidations:
-                for trading_pair, liquidations in list(self._liquidations.items()):
-                    self._liquidations[trading_pair] = [
-                        liq for liq in liquidations if
-                        current_time_ms - liq.timestamp < self._max_retention_seconds * 1000
-                    ]
+            for liquidations in self._liquidations.values():
+                liquidations.evict(current_time_ms - self._max_retention_seconds * 1000)
         except Exception:
             self.logger().exception(
                 "Unexpected error occurred when cleaning up outdated liquidations. Retrying in 1 seconds...",
             )
 
-    def liquidations_df(self, trading_pair=None) -> DataFrame:
+    def add_liquidation(self, liquidation: Liquidation):
+        """
+        Stores a liquidation received from the exchange.
+        """
+        liquidations = self._liquidations.get(liquidation.trading_pair)
+        if liquidations is None:
+            liquidations = LiquidationsStore(retention_ms=self._max_retention_seconds * 1000)
+            self._liquidations[liquidation.trading_pair] = liquidations
+        liquidations.append(timestamp=liquidation.timestamp,
+                            quantity=liquidation.quantity,
+                            price=liquidation.price,
+                            side=liquidation.side)
+
+    def liquidations_df(self, trading_pair=None, start_timestamp: Optional[int] = None,
+                        end_timestamp: Optional[int] = None) -> DataFrame:
         """
         This method returns the liquidations stored as a Pandas DataFrame.
         If no trading_pair is specified, all liquidations are returned in a single DataFrame.
         If the specified trading_pair has no data, an empty DataFrame is returned.
+        The liquidations can be limited to a time range with start_timestamp and end_timestamp (in milliseconds).
         """
         # Dynamically retrieve column names from the Liquidation dataclass
         column_names = [f.name for f in fields(Liquidation)]
+        trading_pairs = [trading_pair] if trading_pair else list(self._liquidations.keys())
+        frames = [self._liquidations[pair].to_df(pair, start_timestamp, end_timestamp)
+                  for pair in trading_pairs if len(self._liquidations.get(pair, ())) > 0]
+        if not frames:
+            return pd.DataFrame(columns=column_names)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def liquidations_volume(self,
+                            trading_pair: str,
+                            seconds: float,
+                            in_quote: bool = False) -> Dict[LiquidationSide, float]:
+        """
+        Returns the amount liquidated for each side of the trading pair during the last seconds.
 
-        # Check if a specific trading pair is requested
-        if trading_pair:
-            # Retrieve the list of Liquidation objects for the specified trading pair
-            liquidations = self._liquidations.get(trading_pair)
-            # If no liquidations are found for the trading pair, return an empty DataFrame
-            if not liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of dataclass instances to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in liquidations])
-        else:
-            # No specific trading pair is requested, combine all pairs
-            all_liquidations = []
-            # Iterate over all trading pairs and collect their liquidations
-            for pair_liquidations in self._liquidations.values():
-                all_liquidations.extend(pair_liquidations)
-            # If no liquidations are collected, return an empty DataFrame
-            if not all_liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of all liquidations to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in all_liquidations])
+        :param in_quote: if True the amounts are expressed in quote asset (quantity * price), otherwise in base asset
+        """
+        liquidations = self._liquidations.get(trading_pair)
+        if liquidations is None:
+            return {side: 0.0 for side in LiquidationSide}
+        start_timestamp = int((time.time() - seconds) * 1000)
+        return liquidations.volume_by_side(start_timestamp=start_timestamp, in_quote=in_quote)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
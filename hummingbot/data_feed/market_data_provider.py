@@ -13,6 +13,7 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.core.gateway.gateway_quote_cache import GatewayPriceRequest
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
@@ -87,18 +88,21 @@ class MarketDataProvider:
             rate_oracle = RateOracle.get_instance()
             for connector, connector_pairs in self._rates_required.items():
                 if connector == "gateway":
-                    tasks = []
+                    price_requests = []
                     for connector_pair in connector_pairs:
                         connector, chain, network = connector_pair.connector_name.split("_")
                         base, quote = connector_pair.trading_pair.split("-")
-                        tasks.append(
-                            self.gateway_client.get_price(
+                        price_requests.append(
+                            GatewayPriceRequest(
                                 chain=chain, network=network, connector=connector,
                                 base_asset=base, quote_asset=quote, amount=Decimal("1"),
                                 side=TradeType.BUY))
                     try:
-                        results = await asyncio.gather(*tasks)
+                        results = await self.gateway_client.get_prices(price_requests)
                         for connector_pair, rate in zip(connector_pairs, results):
+                            if isinstance(rate, Exception):
+                                self.logger().error(f"Error fetching price from {connector_pair}: {rate}")
+                                continue
                             rate_oracle.set_price(connector_pair.trading_pair, Decimal(rate["price"]))
                     except Exception as e:
                         self.logger().error(f"Error fetching prices from {connector_pairs}: {e}", exc_info=True)
@@ -0,0 +1,71 @@
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import BigInteger, Column, Integer, Text
+from sqlalchemy.orm import Session
+
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.trade_fill import TradeFill
+
+
+class ArchivedTradeSummary(HummingbotBase):
+    """
+    Totals of the trade fills of a closed month moved to an archive database, kept in the trades database so the
+    history of a strategy can be summarized without opening the archives.
+    """
+    __tablename__ = "ArchivedTradeSummary"
+
+    # The month of the trades, as YYYY-MM
+    period = Column(Text, primary_key=True, nullable=False)
+    config_file_path = Column(Text, primary_key=True, nullable=False)
+    strategy = Column(Text, primary_key=True, nullable=False)
+    market = Column(Text, primary_key=True, nullable=False)
+    symbol = Column(Text, primary_key=True, nullable=False)
+    trade_type = Column(Text, primary_key=True, nullable=False)
+    trades_count = Column(Integer, nullable=False)
+    volume = Column(SqliteDecimal(6), nullable=False)
+    volume_quote = Column(SqliteDecimal(6), nullable=False)
+    fees_quote = Column(SqliteDecimal(6), nullable=False)
+    first_timestamp = Column(BigInteger, nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"ArchivedTradeSummary(period='{self.period}', config_file_path='{self.config_file_path}', " \
+               f"strategy='{self.strategy}', market='{self.market}', symbol='{self.symbol}', " \
+               f"trade_type='{self.trade_type}', trades_count={self.trades_count}, volume={self.volume}, " \
+               f"volume_quote={self.volume_quote}, fees_quote={self.fees_quote}, " \
+               f"first_timestamp={self.first_timestamp}, last_timestamp={self.last_timestamp})"
+
+    @staticmethod
+    def add_trades(session: Session, period: str, trades: List[TradeFill]):
+        """
+        Adds the trade fills to the summaries of their period, creating the summaries that don't exist yet.
+        """
+        summaries = {}
+        for trade in trades:
+            key = (period, trade.config_file_path, trade.strategy, trade.market, trade.symbol, trade.trade_type)
+            summary = summaries.get(key)
+            if summary is None:
+                summary = session.get(ArchivedTradeSummary, key)
+                if summary is None:
+                    summary = ArchivedTradeSummary(period=period,
+                                                   config_file_path=trade.config_file_path,
+                                                   strategy=trade.strategy,
+                                                   market=trade.market,
+                                                   symbol=trade.symbol,
+                                                   trade_type=trade.trade_type,
+                                                   trades_count=0,
+                                                   volume=Decimal("0"),
+                                                   volume_quote=Decimal("0"),
+                                                   fees_quote=Decimal("0"),
+                                                   first_timestamp=trade.timestamp,
+                                                   last_timestamp=trade.timestamp)
+                    session.add(summary)
+                summaries[key] = summary
+            summary.trades_count += 1
+            summary.volume += Decimal(trade.amount)
+            summary.volume_quote += Decimal(trade.amount) * Decimal(trade.price)
+            summary.fees_quote += Decimal(trade.trade_fee_in_quote or 0)
+            summary.first_timestamp = min(summary.first_timestamp, trade.timestamp)
+            summary.last_timestamp = max(summary.last_timestamp, trade.timestamp)
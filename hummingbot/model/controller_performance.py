@@ -0,0 +1,136 @@
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from sqlalchemy import JSON, Column, Float, Integer, Text, func
+from sqlalchemy.orm import Session
+
+from hummingbot.model import HummingbotBase
+from hummingbot.model.executors import Executors
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import PerformanceReport
+
+
+class ControllerPerformance(HummingbotBase):
+    """
+    Rollup of the performance of the executors stored for a controller, kept up to date every time an executor is
+    stored so the performance of a controller can be loaded without reading all its executors.
+    """
+    __tablename__ = "ControllerPerformance"
+
+    controller_id = Column(Text, primary_key=True)
+    realized_pnl_quote = Column(Float, nullable=False)
+    volume_traded = Column(Float, nullable=False)
+    executors_count = Column(Integer, nullable=False)
+    # Dict[close_type value, count]
+    close_type_counts = Column(JSON, nullable=False)
+
+    @classmethod
+    def empty(cls, controller_id: str) -> "ControllerPerformance":
+        return ControllerPerformance(controller_id=controller_id,
+                                     realized_pnl_quote=0.0,
+                                     volume_traded=0.0,
+                                     executors_count=0,
+                                     close_type_counts={})
+
+    def add_executor(self, executor: Executors, sign: int = 1):
+        """
+        Adds the executor results to the rollup, or removes them when sign is -1 (used before updating an executor).
+        """
+        self.realized_pnl_quote += sign * (executor.net_pnl_quote or 0.0)
+        self.volume_traded += sign * (executor.filled_amount_quote or 0.0)
+        self.executors_count += sign
+        if executor.close_type:
+            close_type_counts = dict(self.close_type_counts)
+            key = str(executor.close_type)
+            close_type_counts[key] = close_type_counts.get(key, 0) + sign
+            if close_type_counts[key] <= 0:
+                del close_type_counts[key]
+            # The JSON column is reassigned so the change is detected
+            self.close_type_counts = close_type_counts
+
+    def to_performance_report(self) -> PerformanceReport:
+        return PerformanceReport(
+            realized_pnl_quote=Decimal(self.realized_pnl_quote),
+            volume_traded=Decimal(self.volume_traded),
+            close_type_counts={CloseType(int(close_type)): count
+                               for close_type, count in self.close_type_counts.items()},
+        )
+
+    @staticmethod
+    def get(session: Session, controller_id: str) -> Optional["ControllerPerformance"]:
+        return session.query(ControllerPerformance).filter(
+            ControllerPerformance.controller_id == controller_id).one_or_none()
+
+    @staticmethod
+    def rebuild_all(session: Session):
+        """
+        Recalculates the rollups of all controllers aggregating the stored executors in the database.
+        """
+        session.query(ControllerPerformance).delete()
+        session.add_all(ControllerPerformance._aggregate_executors(session).values())
+
+    @staticmethod
+    def rebuild(session: Session, controller_ids: List[str]) -> Dict[str, "ControllerPerformance"]:
+        """
+        Recalculates the rollups of the given controllers from their stored executors. Controllers without executors
+        get an empty rollup.
+        """
+        aggregated = ControllerPerformance._aggregate_executors(session, controller_ids)
+        rollups = {}
+        for controller_id in controller_ids:
+            rollup = ControllerPerformance.get(session, controller_id)
+            if rollup is None:
+                rollup = ControllerPerformance.empty(controller_id)
+                session.add(rollup)
+            source = aggregated.get(controller_id, ControllerPerformance.empty(controller_id))
+            rollup.realized_pnl_quote = source.realized_pnl_quote
+            rollup.volume_traded = source.volume_traded
+            rollup.executors_count = source.executors_count
+            rollup.close_type_counts = source.close_type_counts
+            rollups[controller_id] = rollup
+        return rollups
+
+    @staticmethod
+    def sync_with_executors(session: Session) -> List[str]:
+        """
+        Rebuilds the rollups of the controllers that have stored executors not counted in their rollup (executors
+        stored before the rollups existed). Rollups counting more executors than stored are kept, since the
+        executors of archived periods are only kept in the rollups.
+        :return: the ids of the rebuilt controllers
+        """
+        executors_counts = dict(session.query(Executors.controller_id, func.count(Executors.id))
+                                .filter(Executors.controller_id.isnot(None))
+                                .group_by(Executors.controller_id)
+                                .all())
+        rollup_counts = dict(session.query(ControllerPerformance.controller_id,
+                                           ControllerPerformance.executors_count).all())
+        outdated = [controller_id for controller_id, count in executors_counts.items()
+                    if rollup_counts.get(controller_id, 0) < count]
+        if len(outdated) > 0:
+            ControllerPerformance.rebuild(session, outdated)
+        return outdated
+
+    @staticmethod
+    def _aggregate_executors(session: Session,
+                             controller_ids: Optional[List[str]] = None) -> Dict[str, "ControllerPerformance"]:
+        query = (session.query(Executors.controller_id,
+                               Executors.close_type,
+                               func.count(Executors.id),
+                               func.sum(Executors.net_pnl_quote),
+                               func.sum(Executors.filled_amount_quote))
+                 .filter(Executors.controller_id.isnot(None)))
+        if controller_ids is not None:
+            query = query.filter(Executors.controller_id.in_(controller_ids))
+        rows = query.group_by(Executors.controller_id, Executors.close_type).all()
+        rollups: Dict[str, ControllerPerformance] = {}
+        for controller_id, close_type, count, net_pnl_quote, filled_amount_quote in rows:
+            rollup = rollups.get(controller_id)
+            if rollup is None:
+                rollup = ControllerPerformance.empty(controller_id)
+                rollups[controller_id] = rollup
+            rollup.realized_pnl_quote += net_pnl_quote or 0.0
+            rollup.volume_traded += filled_amount_quote or 0.0
+            rollup.executors_count += count
+            if close_type:
+                rollup.close_type_counts = {**rollup.close_type_counts, str(close_type): count}
+        return rollups
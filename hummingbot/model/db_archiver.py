@@ -0,0 +1,181 @@
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from os.path import dirname
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Table, create_engine, delete, func, select
+from sqlalchemy.engine import Connection
+
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model import HummingbotBase
+from hummingbot.model.archived_trade_summary import ArchivedTradeSummary
+from hummingbot.model.controller_performance import ControllerPerformance
+from hummingbot.model.executors import Executors
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+# Maximum number of order ids used in an IN clause, below the SQLite limit of variables in a statement
+ORDER_IDS_CHUNK_SIZE = 500
+# Orders are only archived once they can't be updated anymore, open orders stay in the trades database
+TERMINAL_ORDER_STATUSES = (MarketEvent.BuyOrderCompleted.name,
+                           MarketEvent.SellOrderCompleted.name,
+                           MarketEvent.OrderCancelled.name,
+                           MarketEvent.OrderFailure.name,
+                           MarketEvent.OrderExpired.name)
+
+
+class DBArchiver:
+    """
+    Moves the rows of the closed months of the trades database to one archive database per month, leaving only the
+    recent months in the trades database so it stays small and fast to write.
+
+    The archives have the same schema as the trades database and can be queried with
+    `SQLConnectionManager.query_archives`. The totals of the archived trade fills are kept in the trades database as
+    `ArchivedTradeSummary` rows, and the totals of the archived executors in the `ControllerPerformance` rollups.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    ARCHIVED_TABLES: List[Table] = [Order.__table__,
+                                    TradeFill.__table__,
+                                    OrderStatus.__table__,
+                                    MarketData.__table__,
+                                    Executors.__table__]
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: SQLConnectionManager):
+        self._sql_manager: SQLConnectionManager = sql
+
+    @staticmethod
+    def month_start(timestamp: float, months_back: int = 0) -> float:
+        """
+        Returns the timestamp in seconds of the start of the month of the timestamp, moved back a number of months.
+        """
+        date = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        month_index = date.year * 12 + date.month - 1 - months_back
+        return datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=timezone.utc).timestamp()
+
+    def archive(self, hot_months: int, now: Optional[float] = None) -> List[str]:
+        """
+        Archives all the closed months older than the hot months.
+
+        :param hot_months: the number of months kept in the trades database, including the current one
+        :param now: the current timestamp in seconds
+        :return: the paths of the archive databases written
+        """
+        cutoff = self.month_start(now if now is not None else time.time(), hot_months - 1)
+        oldest_timestamp = self._oldest_timestamp()
+        archive_paths = []
+        if oldest_timestamp is None:
+            return archive_paths
+        month = self.month_start(oldest_timestamp)
+        while month < cutoff:
+            next_month = self.month_start(month + 32 * 24 * 60 * 60)
+            archive_path = self._archive_period(month, next_month)
+            if archive_path is not None:
+                archive_paths.append(archive_path)
+            month = next_month
+        return archive_paths
+
+    def _oldest_timestamp(self) -> Optional[float]:
+        """
+        Returns the timestamp in seconds of the oldest row that can be archived.
+        """
+        with self._sql_manager.engine.connect() as conn:
+            timestamps = [
+                conn.execute(select(func.min(Order.last_update_timestamp))
+                             .where(Order.last_status.in_(TERMINAL_ORDER_STATUSES))).scalar(),
+                conn.execute(select(func.min(MarketData.timestamp))).scalar(),
+            ]
+            timestamps = [float(timestamp) / 1e3 for timestamp in timestamps if timestamp is not None]
+            oldest_close = conn.execute(select(func.min(Executors.close_timestamp))).scalar()
+        if oldest_close is not None:
+            timestamps.append(oldest_close)
+        return min(timestamps) if len(timestamps) > 0 else None
+
+    def _archive_period(self, start_timestamp: float, end_timestamp: float) -> Optional[str]:
+        """
+        Moves the rows of the period to its archive database. The rows are committed to the archive before they are
+        deleted from the trades database, so a failure leaves them in both and the period is archived again the next
+        time.
+        """
+        start_ms, end_ms = int(start_timestamp * 1e3), int(end_timestamp * 1e3)
+        date = datetime.fromtimestamp(start_timestamp, tz=timezone.utc)
+        period = f"{date.year:04d}-{date.month:02d}"
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                conn = session.connection()
+                orders = conn.execute(select(Order.__table__).where(
+                    Order.last_update_timestamp >= start_ms,
+                    Order.last_update_timestamp < end_ms,
+                    Order.last_status.in_(TERMINAL_ORDER_STATUSES))).fetchall()
+                order_ids = [order.id for order in orders]
+                trade_fills = self._select_by_order_ids(conn, TradeFill.__table__, order_ids)
+                order_statuses = self._select_by_order_ids(conn, OrderStatus.__table__, order_ids)
+                market_data_filter = (MarketData.timestamp >= Decimal(start_ms), MarketData.timestamp < Decimal(end_ms))
+                market_data = conn.execute(select(MarketData.__table__).where(*market_data_filter)).fetchall()
+                executors_filter = (Executors.close_timestamp >= int(start_timestamp),
+                                    Executors.close_timestamp < int(end_timestamp))
+                executors = conn.execute(select(Executors.__table__).where(*executors_filter)).fetchall()
+
+                rows: Dict[Table, List] = {Order.__table__: orders,
+                                           TradeFill.__table__: trade_fills,
+                                           OrderStatus.__table__: order_statuses,
+                                           MarketData.__table__: market_data,
+                                           Executors.__table__: executors}
+                if not any(rows.values()):
+                    return None
+
+                archive_path = self._sql_manager.archive_db_path(date.year, date.month)
+                self._write_archive(archive_path, rows)
+
+                ArchivedTradeSummary.add_trades(session, period, trade_fills)
+                # The rollups must count the executors before they are deleted, they are their only record afterwards
+                ControllerPerformance.sync_with_executors(session)
+                session.flush()
+                for table in (TradeFill.__table__, OrderStatus.__table__):
+                    for chunk in self._chunks(order_ids):
+                        conn.execute(delete(table).where(table.c.order_id.in_(chunk)))
+                for chunk in self._chunks(order_ids):
+                    conn.execute(delete(Order.__table__).where(Order.id.in_(chunk)))
+                conn.execute(delete(MarketData.__table__).where(*market_data_filter))
+                conn.execute(delete(Executors.__table__).where(*executors_filter))
+
+        self.logger().info(f"Archived {len(orders)} orders, {len(trade_fills)} trade fills, {len(market_data)} "
+                           f"market data snapshots and {len(executors)} executors of {period} in {archive_path}.")
+        return archive_path
+
+    def _write_archive(self, archive_path: str, rows: Dict[Table, List]):
+        os.makedirs(dirname(archive_path), exist_ok=True)
+        engine = create_engine(f"sqlite:///{archive_path}")
+        try:
+            HummingbotBase.metadata.create_all(engine, tables=self.ARCHIVED_TABLES)
+            with engine.begin() as conn:
+                for table, table_rows in rows.items():
+                    if len(table_rows) > 0:
+                        # Replacing makes archiving a period again after a failure idempotent
+                        conn.execute(table.insert().prefix_with("OR REPLACE"),
+                                     [dict(row._mapping) for row in table_rows])
+        finally:
+            engine.dispose()
+
+    def _select_by_order_ids(self, conn: Connection, table: Table, order_ids: List[str]) -> List:
+        rows = []
+        for chunk in self._chunks(order_ids):
+            rows.extend(conn.execute(select(table).where(table.c.order_id.in_(chunk))).fetchall())
+        return rows
+
+    @staticmethod
+    def _chunks(values: List[str]) -> List[Tuple[str, ...]]:
+        return [tuple(values[i:i + ORDER_IDS_CHUNK_SIZE]) for i in range(0, len(values), ORDER_IDS_CHUNK_SIZE)]
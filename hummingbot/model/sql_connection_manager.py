@@ -1,9 +1,12 @@
 import logging
+import re
+from datetime import datetime, timezone
 from enum import Enum
-from os.path import join
-from typing import TYPE_CHECKING, Optional
+from glob import glob
+from os.path import basename, dirname, join, splitext
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -22,6 +25,13 @@ class SQLConnectionType(Enum):
     TRADE_FILLS = 1
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # With WAL the readers don't block the writer, and a normal synchronous mode is safe in WAL mode
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class SQLConnectionManager(TransactionBase):
     _scm_logger: Optional[HummingbotLogger] = None
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
@@ -73,6 +83,11 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", _set_sqlite_pragmas)
+                with self._engine.connect() as conn:
+                    # The journal mode is persistent, it only has to be set once in the database file
+                    conn.exec_driver_sql("PRAGMA journal_mode=WAL")
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -103,6 +118,67 @@ class SQLConnectionManager(TransactionBase):
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    @property
+    def archive_dir(self) -> str:
+        return join(dirname(self.db_path), "archive")
+
+    def archive_db_path(self, year: int, month: int) -> str:
+        """
+        Path of the database where the rows of a closed month are archived, see `DBArchiver`.
+        """
+        db_stem = splitext(basename(self.db_path))[0]
+        return join(self.archive_dir, f"{db_stem}_{year:04d}_{month:02d}.sqlite")
+
+    def archive_db_paths(self, start_timestamp: Optional[float] = None,
+                         end_timestamp: Optional[float] = None) -> List[str]:
+        """
+        Returns the paths of the archive databases of the months overlapping the time range, oldest first.
+
+        :param start_timestamp: the start of the range in seconds
+        :param end_timestamp: the end of the range in seconds
+        """
+        db_stem = splitext(basename(self.db_path))[0]
+        pattern = re.compile(rf"^{re.escape(db_stem)}_(\d{{4}})_(\d{{2}})\.sqlite$")
+        start_month = self._month_of(start_timestamp) if start_timestamp is not None else None
+        end_month = self._month_of(end_timestamp) if end_timestamp is not None else None
+        paths = []
+        for path in sorted(glob(join(self.archive_dir, f"{db_stem}_*.sqlite"))):
+            match = pattern.match(basename(path))
+            if match is None:
+                continue
+            month = (int(match.group(1)), int(match.group(2)))
+            if (start_month is None or month >= start_month) and (end_month is None or month <= end_month):
+                paths.append(path)
+        return paths
+
+    def query_archives(self,
+                       query_factory: Callable[[Session], Query],
+                       start_timestamp: Optional[float] = None,
+                       end_timestamp: Optional[float] = None) -> List:
+        """
+        Runs a query in the archive databases of the months overlapping the time range and returns all the results.
+        The returned objects are detached from their sessions, so their relationships must be loaded by the query.
+
+        :param query_factory: creates the query to run from the session of an archive database
+        :param start_timestamp: the start of the range in seconds
+        :param end_timestamp: the end of the range in seconds
+        """
+        results = []
+        for path in self.archive_db_paths(start_timestamp, end_timestamp):
+            engine = create_engine(f"sqlite:///{path}")
+            try:
+                with Session(bind=engine) as session:
+                    results.extend(query_factory(session).all())
+                    session.expunge_all()
+            finally:
+                engine.dispose()
+        return results
+
+    @staticmethod
+    def _month_of(timestamp: float):
+        date = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return date.year, date.month
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
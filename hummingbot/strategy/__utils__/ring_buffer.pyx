@@ -1,11 +1,20 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length circular buffer of floats.
+
+    Besides the values, the buffer keeps running statistics (sum and sum of squares of the values, shifted by a
+    reference value to avoid cancellation errors, and the sum of squared differences between consecutive values),
+    updated in O(1) every time a value is added. To avoid the accumulation of floating point errors the statistics are
+    recalculated from the stored values once every `length` additions, which keeps the amortized cost O(1).
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,14 +27,59 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double removed_value
+            double last_value
+            int64_t count = self.c_count()
+
+        if self._is_full:
+            removed_value = self._buffer[self._delimiter]
+            self._shifted_sum -= removed_value - self._shift
+            self._shifted_sum_of_squares -= (removed_value - self._shift) ** 2
+            if self._length > 1:
+                self._sum_of_squared_differences -= (
+                    self._buffer[(self._delimiter + 1) % self._length] - removed_value) ** 2
+        elif count == 0:
+            self._shift = value
+        if count > 0 and self._length > 1:
+            last_value = self._buffer[(self._delimiter + self._length - 1) % self._length]
+            self._sum_of_squared_differences += (value - last_value) ** 2
+
+        self._buffer[self._delimiter] = value
+        self._shifted_sum += value - self._shift
+        self._shifted_sum_of_squares += (value - self._shift) ** 2
         self.c_increment_delimiter()
 
+        self._updates_since_recalculation += 1
+        if self._updates_since_recalculation >= self._length:
+            self.c_recalculate_statistics()
+
+    cdef void c_reset_statistics(self):
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
+        self._sum_of_squared_differences = 0
+        self._updates_since_recalculation = 0
+
+    cdef void c_recalculate_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+        self._updates_since_recalculation = 0
+        if values.size == 0:
+            self.c_reset_statistics()
+            return
+        self._shift = np.mean(values)
+        shifted_values = values - self._shift
+        self._shifted_sum = np.sum(shifted_values)
+        self._shifted_sum_of_squares = np.sum(np.square(shifted_values))
+        self._sum_of_squared_differences = np.sum(np.square(np.diff(values)))
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
@@ -42,39 +96,54 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_count(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        return self._shift * self.c_count() + self._shifted_sum
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._shift + self._shifted_sum / self._length
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = max(
+                (self._shifted_sum_of_squares - self._shifted_sum * self._shifted_sum / self._length) / self._length,
+                0.0)
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance())
         return result
 
+    cdef double c_realized_volatility(self):
+        """
+        Square root of the sum of the squared differences between consecutive values divided by the number of values
+        """
+        cdef int64_t count = self.c_count()
+        if count == 0:
+            return np.nan
+        return sqrt(max(self._sum_of_squared_differences, 0.0) / count)
+
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] values = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return values[:self._delimiter].copy()
+        return np.concatenate((values[self._delimiter:], values[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -89,6 +158,14 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def count(self) -> int:
+        return self.c_count()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +178,10 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def realized_volatility(self):
+        return self.c_realized_volatility()
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +194,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
         for val in data[-value:]:
             self.add_value(val)
@@ -35,7 +35,10 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        count = self._processing_buffer.count
+        if count == 0:
+            return np.nan
+        return self._processing_buffer.sum / count
 
     @property
     def current_value(self) -> float:
@@ -51,7 +54,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.count
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -13,16 +13,26 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _trade_sample_timestamps
+        dict _trades_consolidated
+        dict _trades_consolidated_count
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
         int _sampling_length
         int _samples_length
+        int _estimation_interval
+        int _ticks_since_estimation
+        bint _trade_samples_changed
+        str _fit_method
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_sample(self, double timestamp, double price_level, double amount)
+    cdef c_remove_oldest_trade_sample(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,8 +2,10 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from array import array
+from bisect import bisect_left, insort
 from decimal import Decimal
-from typing import Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -26,11 +28,33 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the trading intensity parameters (alpha, kappa) of the order book, fitting lambda = alpha * exp(-kappa * d)
+    to the volume traded at every distance d from the mid price of the quote that preceded each trade.
+
+    Quotes are kept in arrays sorted by timestamp, so every trade is matched to its quote with a binary search, and the
+    volume per price level is consolidated incrementally as trade samples enter and leave the sampling window.
+    The parameters are refitted only when the trade samples changed, and at most once every `estimation_interval`
+    calls to `calculate`.
+
+    Supported fit methods:
+    - curve_fit: non-linear least squares fit of the exponential (default)
+    - log_linear: closed form least squares fit of log(lambda) = log(alpha) - kappa * d, much cheaper to calculate
+    """
+    FIT_METHODS = ("curve_fit", "log_linear")
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 estimation_interval: int = 1,
+                 fit_method: str = "curve_fit"):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._trade_sample_timestamps = []
+        self._trades_consolidated = {}
+        self._trades_consolidated_count = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +62,12 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = array("d")
+        self._quote_prices = array("d")
+        self.estimation_interval = estimation_interval
+        self._ticks_since_estimation = 0
+        self._trade_samples_changed = False
+        self.fit_method = fit_method
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -64,57 +93,84 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def estimation_interval(self) -> int:
+        return self._estimation_interval
+
+    @estimation_interval.setter
+    def estimation_interval(self, interval: int):
+        if interval < 1:
+            raise ValueError(f"The estimation interval must be greater than 0 (got {interval}).")
+        self._estimation_interval = interval
+
+    @property
+    def fit_method(self) -> str:
+        return self._fit_method
+
+    @fit_method.setter
+    def fit_method(self, method: str):
+        if method not in self.FIT_METHODS:
+            raise ValueError(f"Invalid fit method {method}. Valid methods are {', '.join(self.FIT_METHODS)}.")
+        self._fit_method = method
+
+    @property
+    def trades_consolidated(self) -> Dict[float, float]:
+        """The volume traded at every price level within the sampling window"""
+        return dict(self._trades_consolidated)
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        # Quotes are received in descending order of timestamp and stored in ascending order
+        quotes = sorted(reversed(value), key=lambda quote: quote["timestamp"])
+        self._quote_timestamps = array("d", [quote["timestamp"] for quote in quotes])
+        self._quote_prices = array("d", [float(quote["price"]) for quote in quotes])
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_idx
+            int latest_processed_quote_idx = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # Latest quote that happened before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx >= 0:
+                latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+                self.c_add_trade_sample(self._quote_timestamps[quote_idx] + 1,
+                                        abs(trade.price - self._quote_prices[quote_idx]),
+                                        trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_sample_timestamps) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
-        if self.is_sampling_buffer_full:
+        self._ticks_since_estimation += 1
+        if (self.is_sampling_buffer_full
+                and self._trade_samples_changed
+                and self._ticks_since_estimation >= self._estimation_interval):
             self.c_estimate_intensity()
+            self._trade_samples_changed = False
+            self._ticks_since_estimation = 0
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,39 +179,51 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
+    cdef c_add_trade_sample(self, double timestamp, double price_level, double amount):
+        if timestamp not in self._trade_samples:
+            self._trade_samples[timestamp] = []
+            insort(self._trade_sample_timestamps, timestamp)
+        self._trade_samples[timestamp].append((price_level, amount))
+
+        self._trades_consolidated[price_level] = self._trades_consolidated.get(price_level, 0) + amount
+        self._trades_consolidated_count[price_level] = self._trades_consolidated_count.get(price_level, 0) + 1
+        self._trade_samples_changed = True
+
+    cdef c_remove_oldest_trade_sample(self):
+        timestamp = self._trade_sample_timestamps.pop(0)
+        for price_level, amount in self._trade_samples.pop(timestamp):
+            count = self._trades_consolidated_count[price_level] - 1
+            if count == 0:
+                del self._trades_consolidated[price_level]
+                del self._trades_consolidated_count[price_level]
+            else:
+                self._trades_consolidated[price_level] -= amount
+                self._trades_consolidated_count[price_level] = count
+        self._trade_samples_changed = True
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
+    cdef c_estimate_intensity(self):
+        if len(self._trades_consolidated) == 0:
+            return
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Calculate lambdas / trading intensities, sorted by descending price level
+        price_levels = np.fromiter(self._trades_consolidated.keys(), dtype=float, count=len(self._trades_consolidated))
+        lambdas = np.fromiter(self._trades_consolidated.values(), dtype=float, count=len(self._trades_consolidated))
+        order = np.argsort(price_levels)[::-1]
+        price_levels = price_levels[order]
+        lambdas = lambdas[order]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = 10**-10
+
+        if self._fit_method == "log_linear":
+            self._estimate_intensity_log_linear(price_levels, lambdas)
+            return
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
                                price_levels,
-                               lambdas_adj,
+                               lambdas,
                                p0=(self._alpha, self._kappa),
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
@@ -164,3 +232,16 @@ cdef class TradingIntensityIndicator:
             self._alpha = Decimal(str(params[0][0]))
         except (RuntimeError, ValueError) as e:
             pass
+
+    def _estimate_intensity_log_linear(self, price_levels: np.ndarray, lambdas: np.ndarray):
+        log_lambdas = np.log(lambdas)
+        if len(price_levels) < 2 or np.ptp(price_levels) == 0:
+            return
+        slope, intercept = np.polyfit(price_levels, log_lambdas, 1)
+        if slope > 0:
+            # kappa is bounded to be non negative; the best fit with kappa = 0 is the mean of the log intensities
+            slope = 0
+            intercept = np.mean(log_lambdas)
+        if np.isfinite(slope) and np.isfinite(intercept):
+            self._kappa = -slope
+            self._alpha = np.exp(intercept)
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from decimal import Decimal
 from typing import Any, Dict, List, Tuple, Union
 
@@ -10,6 +11,7 @@ from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_candidate import OrderCandidate, PerpetualOrderCandidate
+from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.hedge.hedge_config_map_pydantic import HedgeConfigMap
@@ -38,6 +40,11 @@ class HedgeStrategy(StrategyPyBase):
     The amount of asset to hedge is calculated by the following formula:
     amount_to_hedge = sum of asset value of all market pairs * hedge_ratio + hedge asset value
     The amount of asset to hedge must be greater than the minimum trade size to be traded.
+
+    Hedges are checked every hedge_interval. With hedge_on_fill, the fills of the monitored markets are added to the
+    amounts of the last check in memory, and the net exposure is hedged on the next tick. With use_vwap_price, the
+    hedge order is sized from the hedge market VWAP and priced at the order book depth it needs, within the slippage.
+    Hedges worth more than max_order_value are split in several orders placed every split_interval.
     """
 
     @classmethod
@@ -81,10 +88,19 @@ class HedgeStrategy(StrategyPyBase):
         self._min_trade_size = config_map.min_trade_size
         self._hedge_interval = config_map.hedge_interval
         self._value_mode = config_map.value_mode
+        self._hedge_on_fill = config_map.hedge_on_fill
+        self._use_vwap_price = config_map.use_vwap_price
+        self._max_order_value = config_map.max_order_value
+        self._split_interval = config_map.split_interval
+        self._split_in_progress = False
+        self._has_unhedged_fills = False
+        self._exposure_snapshot: Dict[MarketTradingPairTuple, Decimal] = {}
+        self._fill_amounts: Dict[MarketTradingPairTuple, Decimal] = defaultdict(lambda: Decimal("0"))
         self._offsets = offsets
         self._status_report_interval = status_report_interval
         self._all_markets = self._hedge_market_pairs + self._market_pairs
         self._last_timestamp = 0
+        self._last_snapshot_timestamp = 0
         self._all_markets_ready = False
         self._max_order_age = max_order_age
         self._status_messages = []
@@ -291,6 +307,7 @@ class HedgeStrategy(StrategyPyBase):
         :param timestamp: Current time.
         """
         self._last_timestamp = timestamp
+        self._last_snapshot_timestamp = timestamp
         self.apply_initial_setting()
 
     def apply_initial_setting(self) -> None:
@@ -334,7 +351,11 @@ class HedgeStrategy(StrategyPyBase):
         if self.check_and_cancel_active_orders():
             self.interval_log("hedge", "Active orders present. Skipping hedge check until active orders expires.")
             return
-        if timestamp - self._last_timestamp < self._hedge_interval:
+        # The hedges triggered by fills don't delay the interval check, which rereads the balances
+        interval_due = timestamp - self._last_snapshot_timestamp >= self._hedge_interval
+        split_due = self._split_in_progress and timestamp - self._last_timestamp >= self._split_interval
+        fill_due = self._has_unhedged_fills and not self._split_in_progress
+        if not (interval_due or split_due or fill_due):
             return
         self._all_markets_ready = all([market.ready for market in self.active_markets])
         if not self._all_markets_ready:
@@ -355,9 +376,55 @@ class HedgeStrategy(StrategyPyBase):
             return
         self.interval_log("hedge", "Checking hedge conditions...")
         self._status_messages = []
+        if interval_due:
+            self.update_exposure_snapshot()
+            self._last_snapshot_timestamp = timestamp
+        self._has_unhedged_fills = False
+        self._split_in_progress = False
         self.hedge()
         self._last_timestamp = timestamp
 
+    def did_fill_order(self, order_filled_event: OrderFilledEvent) -> None:
+        """
+        Add the filled amount to the exposure of its market, and trigger a hedge if it was filled on a monitored market.
+        Fills older than the exposure snapshot are ignored, since they are already included in its balances.
+        :param order_filled_event: The order filled event.
+        """
+        if not self._hedge_on_fill or order_filled_event.timestamp < self._last_snapshot_timestamp:
+            return
+        market_pair = self.get_market_pair_from_fill(order_filled_event)
+        if market_pair is None:
+            return
+        amount = order_filled_event.amount
+        self._fill_amounts[market_pair] += amount if order_filled_event.trade_type == TradeType.BUY else -amount
+        if market_pair in self._market_pairs:
+            self._has_unhedged_fills = True
+
+    def get_market_pair_from_fill(self, order_filled_event: OrderFilledEvent) -> Union[MarketTradingPairTuple, None]:
+        """
+        Get the market pair of a filled order.
+        The hedge orders are found in the strategy order tracker. Any other fill is matched to the first monitored
+        market with the same trading pair, since the exposure is netted by base asset.
+        :param order_filled_event: The order filled event.
+        :return: The market pair of the filled order, None if the trading pair is not monitored.
+        """
+        market_pair = self.order_tracker.get_market_pair_from_order_id(order_filled_event.order_id)
+        if market_pair is not None:
+            return market_pair
+        for market_pair in self._market_pairs:
+            if market_pair.trading_pair == order_filled_event.trading_pair:
+                return market_pair
+        return None
+
+    def update_exposure_snapshot(self) -> None:
+        """
+        Store the base amount of all markets, to which the fills are added until the next hedge interval check.
+        """
+        if not self._hedge_on_fill:
+            return
+        self._exposure_snapshot = {market_pair: self.get_base_amount(market_pair) for market_pair in self._all_markets}
+        self._fill_amounts.clear()
+
     def get_positions(self, market_pair: MarketTradingPairTuple, position_side: PositionSide = None) -> List[Position]:
         """
         Get the active positions of a market.
@@ -413,13 +480,34 @@ class HedgeStrategy(StrategyPyBase):
         base_price = market_pair.get_mid_price()
         return base_amount * base_price
 
+    def get_exposure(self, market_pair: MarketTradingPairTuple) -> Decimal:
+        """
+        Get the base asset exposure of a market. When hedging on fills, this is the base amount of the last hedge
+        interval check plus the amount filled since, otherwise the current base amount.
+
+        :params market_pair: The market pair to get the exposure of.
+        :returns: The base asset exposure of the market pair.
+        """
+        if market_pair not in self._exposure_snapshot:
+            return self.get_base_amount(market_pair)
+        return self._exposure_snapshot[market_pair] + self._fill_amounts[market_pair]
+
+    def get_exposure_value(self, market_pair: MarketTradingPairTuple) -> Decimal:
+        """
+        Get the base asset exposure value of a market.
+
+        :params market_pair: The market pair to get the exposure value of.
+        :returns: The base asset exposure value of the market pair.
+        """
+        return self.get_exposure(market_pair) * market_pair.get_mid_price()
+
     def get_hedge_direction_and_value(self) -> Tuple[bool, Decimal]:
         """
         Calculate the value that is required to be hedged.
         :returns: A tuple of the hedge direction (buy/sell) and the value to be hedged.
         """
-        total_value = sum(self.get_base_value(market_pair) for market_pair in self._market_pairs)
-        hedge_value = self.get_base_value(self._hedge_market_pair)
+        total_value = sum(self.get_exposure_value(market_pair) for market_pair in self._market_pairs)
+        hedge_value = self.get_exposure_value(self._hedge_market_pair)
         net_value = total_value * self._hedge_ratio + hedge_value
         is_buy = net_value < 0
         value_to_hedge = abs(net_value)
@@ -433,6 +521,41 @@ class HedgeStrategy(StrategyPyBase):
         """
         return 1 + self._slippage if is_buy else 1 - self._slippage
 
+    def get_hedge_order_price(self, market_pair: MarketTradingPairTuple, is_buy: bool, amount: Decimal) -> Decimal:
+        """
+        Get the price of a hedge order. It is the mid price moved by the slippage, or with use_vwap_price the order
+        book price needed to fill the amount, bounded by the slippage.
+        :params market_pair: The market pair to hedge on.
+        :params is_buy: The direction of the hedge.
+        :params amount: The amount to hedge.
+        :returns: The price of the hedge order.
+        """
+        price = market_pair.get_mid_price() * self.get_slippage_ratio(is_buy)
+        if self._use_vwap_price and amount > 0:
+            book_price = market_pair.get_price_for_volume(is_buy, amount).result_price
+            if book_price.is_finite() and book_price > 0:
+                price = min(price, book_price) if is_buy else max(price, book_price)
+        return price
+
+    def is_split_required(self, value_to_hedge: Decimal) -> bool:
+        """
+        Check if a hedge is worth more than the maximum order value and must be split.
+        :params value_to_hedge: The value to hedge.
+        :returns: True if the hedge must be split, False otherwise.
+        """
+        return 0 < self._max_order_value < value_to_hedge
+
+    def cap_order_amount(self, market_pair: MarketTradingPairTuple, amount: Decimal) -> Decimal:
+        """
+        Limit the amount of a hedge order to the maximum order value. The remainder is hedged by the next orders.
+        :params market_pair: The market pair to hedge on.
+        :params amount: The amount to hedge.
+        :returns: The amount of the hedge order.
+        """
+        if self._max_order_value <= 0:
+            return amount
+        return min(amount, self._max_order_value / market_pair.get_mid_price())
+
     def calculate_hedge_price_and_amount(self, is_buy: bool, value_to_hedge: Decimal) -> Tuple[Decimal, Decimal]:
         """
         Calculate the price and amount to hedge.
@@ -440,9 +563,13 @@ class HedgeStrategy(StrategyPyBase):
         :params value_to_hedge: The value to hedge.
         :returns: The price and amount to hedge.
         """
-        price = self._hedge_market_pair.get_mid_price()
-        amount = value_to_hedge / price
-        price = price * self.get_slippage_ratio(is_buy)
+        amount = value_to_hedge / self._hedge_market_pair.get_mid_price()
+        if self._use_vwap_price and amount > 0:
+            vwap = self._hedge_market_pair.get_vwap_for_volume(is_buy, amount).result_price
+            if vwap.is_finite() and vwap > 0:
+                amount = value_to_hedge / vwap
+        amount = self.cap_order_amount(self._hedge_market_pair, amount)
+        price = self.get_hedge_order_price(self._hedge_market_pair, is_buy, amount)
         trading_pair = self._hedge_market_pair.trading_pair
         quantized_price = self._hedge_market_pair.market.quantize_order_price(trading_pair, price)
         quantized_amount = self._hedge_market_pair.market.quantize_order_amount(trading_pair, amount)
@@ -454,6 +581,7 @@ class HedgeStrategy(StrategyPyBase):
         """
         is_buy, value_to_hedge = self.get_hedge_direction_and_value()
         price, amount = self.calculate_hedge_price_and_amount(is_buy, value_to_hedge)
+        self._split_in_progress = self.is_split_required(value_to_hedge)
         if amount == Decimal("0"):
             self.logger().debug("No hedge required.")
             self._status_messages.append("No hedge required.")
@@ -480,11 +608,11 @@ class HedgeStrategy(StrategyPyBase):
         """
         total_amount = 0
         for market_pair in market_list:
-            amount = self.get_base_amount(market_pair)
-            total_amount += self.get_base_amount(market_pair)
+            amount = self.get_exposure(market_pair)
+            total_amount += amount
             self.logger().debug("Market pair: %s amount: %s, total_amount: %s", market_pair, amount, total_amount)
 
-        hedge_amount = self.get_base_amount(hedge_pair)
+        hedge_amount = self.get_exposure(hedge_pair)
         net_amount = total_amount * self._hedge_ratio + hedge_amount
         is_buy = net_amount < 0
         amount_to_hedge = abs(net_amount)
@@ -504,7 +632,10 @@ class HedgeStrategy(StrategyPyBase):
                 self.logger().debug("No hedge required for %s.", asset)
                 self._status_messages.append(f"No hedge required for {asset}.")
                 continue
-            price = hedge_market.get_mid_price() * self.get_slippage_ratio(is_buy)
+            if self.is_split_required(amount_to_hedge * hedge_market.get_mid_price()):
+                self._split_in_progress = True
+                amount_to_hedge = self.cap_order_amount(hedge_market, amount_to_hedge)
+            price = self.get_hedge_order_price(hedge_market, is_buy, amount_to_hedge)
             self.logger().info(
                 "Hedge by amount. Mid price: %s Hedge direction: %s. Hedge price: %s. Hedge amount: %s",
                 hedge_market.get_mid_price(), is_buy, price, amount_to_hedge
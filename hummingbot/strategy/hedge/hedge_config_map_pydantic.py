@@ -159,6 +159,42 @@ class HedgeConfigMap(BaseStrategyConfigMap):
             prompt_on_new=True,
         ),
     )
+    hedge_on_fill: bool = Field(
+        default=False,
+        description="Whether to hedge as soon as an order is filled on the monitored markets.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to hedge as soon as an order is filled on the monitored markets (y/n)?",
+            prompt_on_new=False,
+        ),
+    )
+    use_vwap_price: bool = Field(
+        default=False,
+        description="Whether to price and size the hedge order from the hedge market order book depth.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to price hedge orders from the hedge market order book depth, "
+            "using the slippage as the maximum deviation from the mid price (y/n)?",
+            prompt_on_new=False,
+        ),
+    )
+    max_order_value: Decimal = Field(
+        default=Decimal("0"),
+        description="The maximum value in quote asset of a hedge order. Larger hedges are split. 0 means no limit.",
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the maximum value in quote asset of a hedge order, "
+            "larger hedges will be split in several orders (0 for no limit)",
+            prompt_on_new=False,
+        ),
+    )
+    split_interval: int = Field(
+        default=10,
+        description="The interval in seconds between the orders of a split hedge.",
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the interval in seconds between the orders of a split hedge",
+            prompt_on_new=False,
+        ),
+    )
     hedge_connector: ExchangeEnum = Field(
         default=...,
         description="The name of the hedge exchange connector.",
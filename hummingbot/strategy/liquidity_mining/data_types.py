@@ -39,3 +39,25 @@ class Proposal:
 
     def quote(self):
         return self.market.split("-")[1]
+
+    def copy(self) -> "Proposal":
+        return Proposal(self.market,
+                        PriceSize(self.buy.price, self.buy.size),
+                        PriceSize(self.sell.price, self.sell.size))
+
+
+class MarketState:
+    """
+    The market state a proposal was created with.
+    mid_price and spread are the ones of the proposal of the active orders of the market.
+    base_balance and quote_balance are the available balances (including the amounts in the active orders) when the
+    proposal of the market was last calculated.
+    """
+    def __init__(self, mid_price: Decimal, spread: Decimal, base_balance: Decimal, quote_balance: Decimal):
+        self.mid_price: Decimal = mid_price
+        self.spread: Decimal = spread
+        self.base_balance: Decimal = base_balance
+        self.quote_balance: Decimal = quote_balance
+
+    def __repr__(self):
+        return f"[ mid: {self.mid_price} spread: {self.spread} base: {self.base_balance} quote: {self.quote_balance} ]"
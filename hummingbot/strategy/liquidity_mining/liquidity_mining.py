@@ -1,12 +1,14 @@
 import asyncio
 import logging
+from collections import deque
 from decimal import Decimal
 from statistics import mean
-from typing import Dict, List, Set, Union
+from typing import Deque, Dict, List, Optional, Set, Union
 
 import numpy as np
 import pandas as pd
 
+from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.parrot import get_campaign_summary
 from hummingbot.core.clock import Clock
@@ -24,7 +26,7 @@ from hummingbot.strategy.utils import order_age
 
 from ...client.config.client_config_map import ClientConfigMap
 from ...client.config.config_helpers import ClientConfigAdapter
-from .data_types import PriceSize, Proposal
+from .data_types import MarketState, PriceSize, Proposal
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
@@ -85,8 +87,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        self._mid_prices: Dict[str, Deque[Decimal]] = {
+            market: deque(maxlen=volatility_interval * avg_volatility_period) for market in market_infos
+        }
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        # Base proposals (before inventory skew and budget constraint) of the last calculation per market
+        self._base_proposals: Dict[str, Proposal] = {}
+        # Market state of the last proposal calculated per market, and of the proposal of the active orders
+        self._proposal_states: Dict[str, MarketState] = {}
+        self._market_states: Dict[str, MarketState] = {}
+        self._buy_fee_percents: Dict[str, Decimal] = {}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -100,6 +110,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
         limit_orders = self.order_tracker.active_limit_orders
         return [o[1] for o in limit_orders]
 
+    def active_orders_by_market(self) -> Dict[str, List[LimitOrder]]:
+        """
+        Active orders indexed by market
+        """
+        active_orders = {}
+        for market_pair, orders in self.order_tracker.market_pair_to_active_orders.items():
+            if len(orders) > 0:
+                active_orders.setdefault(market_pair.trading_pair, []).extend(orders)
+        return active_orders
+
     @property
     def sell_budgets(self):
         return self._sell_budgets
@@ -129,13 +149,15 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
         self.update_mid_prices()
         self.update_volatility()
-        proposals = self.create_base_proposals()
         self._token_balances = self.adjusted_available_balances()
+        active_orders = self.active_orders_by_market()
+        markets_to_refresh = self.markets_to_refresh(active_orders)
+        proposals = self.create_base_proposals(markets_to_refresh)
         if self._inventory_skew_enabled:
             self.apply_inventory_skew(proposals)
         self.apply_budget_constraint(proposals)
-        self.cancel_active_orders(proposals)
-        self.execute_orders_proposal(proposals)
+        self.cancel_active_orders(proposals, markets_to_refresh, active_orders)
+        self.execute_orders_proposal(proposals, markets_to_refresh)
 
         self._last_timestamp = timestamp
 
@@ -300,19 +322,54 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     self._empty_ob_market_infos.pop(market)
         return len(self._market_infos)
 
-    def create_base_proposals(self):
+    def market_spread(self, market: str) -> Decimal:
+        spread = self._spread
+        if not self._volatility[market].is_nan():
+            # volatility applies only when it is higher than the spread setting.
+            spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
+        if self._max_spread > s_decimal_zero:
+            spread = min(spread, self._max_spread)
+        return spread
+
+    def markets_to_refresh(self, active_orders: Dict[str, List[LimitOrder]]) -> Set[str]:
+        """
+        Returns the markets whose refresh time has passed and whose proposal has to be recalculated: the markets
+        without active orders, the ones whose mid price or spread moved more than half the order refresh tolerance
+        since the proposal of their active orders, and the ones whose base or quote balance changed since their
+        proposal was last calculated. The proposals of the other markets would keep their active orders.
+        """
+        markets = set()
+        tolerance = self._order_refresh_tolerance_pct / Decimal("2")
+        for market, market_info in self._market_infos.items():
+            if self._refresh_times[market] > self.current_timestamp:
+                continue
+            market_state = self._market_states.get(market)
+            if market_state is None or market not in active_orders:
+                markets.add(market)
+                continue
+            base, quote = market.split("-")
+            mid_price = market_info.get_mid_price()
+            if (self._token_balances.get(base) != market_state.base_balance
+                    or self._token_balances.get(quote) != market_state.quote_balance
+                    or market_state.mid_price == s_decimal_zero
+                    or abs(mid_price - market_state.mid_price) / market_state.mid_price > tolerance
+                    or abs(self.market_spread(market) - market_state.spread) > tolerance):
+                markets.add(market)
+        return markets
+
+    def create_base_proposals(self, markets: Optional[Set[str]] = None):
         """
         Each tick this strategy creates a set of proposals based on the market_info and the parameters from the
         constructor.
+        :param markets: the markets whose proposal is recalculated, the last proposal is used for the other markets.
+        All the proposals are recalculated if it is None.
         """
         proposals = []
         for market, market_info in self._market_infos.items():
-            spread = self._spread
-            if not self._volatility[market].is_nan():
-                # volatility applies only when it is higher than the spread setting.
-                spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
-            if self._max_spread > s_decimal_zero:
-                spread = min(spread, self._max_spread)
+            if markets is not None and market not in markets and market in self._base_proposals:
+                proposals.append(self._base_proposals[market].copy())
+                continue
+            spread = self.market_spread(market)
             mid_price = market_info.get_mid_price()
             buy_price = mid_price * (Decimal("1") - spread)
             buy_price = self._exchange.quantize_order_price(market, buy_price)
@@ -320,7 +377,14 @@ class LiquidityMiningStrategy(StrategyPyBase):
             sell_price = mid_price * (Decimal("1") + spread)
             sell_price = self._exchange.quantize_order_price(market, sell_price)
             sell_size = self.base_order_size(market, sell_price)
-            proposals.append(Proposal(market, PriceSize(buy_price, buy_size), PriceSize(sell_price, sell_size)))
+            proposal = Proposal(market, PriceSize(buy_price, buy_size), PriceSize(sell_price, sell_size))
+            self._base_proposals[market] = proposal.copy()
+            base, quote = market.split("-")
+            self._proposal_states[market] = MarketState(mid_price=mid_price,
+                                                        spread=spread,
+                                                        base_balance=self._token_balances.get(base),
+                                                        quote_balance=self._token_balances.get(quote))
+            proposals.append(proposal)
         return proposals
 
     def total_port_value_in_token(self) -> Decimal:
@@ -377,12 +441,22 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
             quote_size = proposal.buy.size * proposal.buy.price
             quote_size = balances[proposal.quote()] if balances[proposal.quote()] < quote_size else quote_size
-            buy_fee = build_trade_fee(self._exchange.name, True, proposal.base(), proposal.quote(),
-                                      OrderType.LIMIT, TradeType.BUY, proposal.buy.size, proposal.buy.price)
-            buy_size = quote_size / (proposal.buy.price * (Decimal("1") + buy_fee.percent))
+            buy_size = quote_size / (proposal.buy.price * (Decimal("1") + self.buy_fee_percent(proposal)))
             proposal.buy.size = self._exchange.quantize_order_amount(proposal.market, buy_size)
             balances[proposal.quote()] -= quote_size
 
+    def buy_fee_percent(self, proposal: Proposal) -> Decimal:
+        """
+        Percent fee of the maker buy orders of the market of the proposal, calculated once per market.
+        """
+        fee_percent = self._buy_fee_percents.get(proposal.market)
+        if fee_percent is None:
+            buy_fee = build_trade_fee(self._exchange.name, True, proposal.base(), proposal.quote(),
+                                      OrderType.LIMIT, TradeType.BUY, proposal.buy.size, proposal.buy.price)
+            fee_percent = buy_fee.percent
+            self._buy_fee_percents[proposal.market] = fee_percent
+        return fee_percent
+
     def is_within_tolerance(self, cur_orders: List[LimitOrder], proposal: Proposal):
         """
         False if there are no buys or sells or if the difference between the proposed price and current price is less
@@ -400,34 +474,91 @@ class LiquidityMiningStrategy(StrategyPyBase):
             return False
         return True
 
-    def cancel_active_orders(self, proposals: List[Proposal]):
+    def cancel_active_orders(self,
+                             proposals: List[Proposal],
+                             markets: Optional[Set[str]] = None,
+                             active_orders: Optional[Dict[str, List[LimitOrder]]] = None):
         """
         Cancel any orders that have an order age greater than self._max_order_age or if orders are not within tolerance
+        :param proposals: the proposals of all the markets
+        :param markets: the markets whose orders are checked against their proposal, all of them if it is None
+        :param active_orders: the active orders by market
         """
+        if active_orders is None:
+            active_orders = self.active_orders_by_market()
+        orders_to_cancel = []
         for proposal in proposals:
             to_cancel = False
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
+            cur_orders = active_orders.get(proposal.market, [])
             if cur_orders and any(order_age(o, self.current_timestamp) > self._max_order_age for o in cur_orders):
                 to_cancel = True
-            elif self._refresh_times[proposal.market] <= self.current_timestamp and \
-                    cur_orders and not self.is_within_tolerance(cur_orders, proposal):
-                to_cancel = True
+            elif (markets is None or proposal.market in markets) and \
+                    self._refresh_times[proposal.market] <= self.current_timestamp and cur_orders:
+                if not self.is_within_tolerance(cur_orders, proposal):
+                    to_cancel = True
+                elif proposal.market in self._market_states and proposal.market in self._proposal_states:
+                    # The active orders are kept for the current balances
+                    market_state = self._market_states[proposal.market]
+                    market_state.base_balance = self._proposal_states[proposal.market].base_balance
+                    market_state.quote_balance = self._proposal_states[proposal.market].quote_balance
             if to_cancel:
-                for order in cur_orders:
-                    self.cancel_order(self._market_infos[proposal.market], order.client_order_id)
-                    # To place new order on the next tick
-                    self._refresh_times[order.trading_pair] = self.current_timestamp + 0.1
+                orders_to_cancel.extend(cur_orders)
+                self._market_states.pop(proposal.market, None)
+                # To place new order on the next tick
+                self._refresh_times[proposal.market] = self.current_timestamp + 0.1
+        self.cancel_orders(orders_to_cancel)
+
+    def cancel_orders(self, orders: List[LimitOrder]):
+        """
+        Cancels the orders of all the markets with a single batch cancel request to the exchange.
+        """
+        orders_to_cancel = []
+        for order in orders:
+            if self.order_tracker.check_and_track_cancel(order.client_order_id):
+                self.log_with_clock(logging.INFO,
+                                    f"({order.trading_pair}) Canceling the limit order {order.client_order_id}.")
+                orders_to_cancel.append(order)
+        if len(orders_to_cancel) > 0:
+            self._exchange.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+
+    def create_orders(self, orders: List[LimitOrder], order_type: OrderType):
+        """
+        Creates the orders of all the markets with a single batch request when the exchange implements batch order
+        creation (batch orders are created as LIMIT orders), otherwise the orders are created one by one.
+        """
+        if len(orders) == 0:
+            return
+        if (order_type == OrderType.LIMIT
+                and type(self._exchange).batch_order_create is not ConnectorBase.batch_order_create):
+            for order in self._exchange.batch_order_create(orders_to_create=orders):
+                self.start_tracking_limit_order(market_pair=self._market_infos[order.trading_pair],
+                                                order_id=order.client_order_id,
+                                                is_buy=order.is_buy,
+                                                price=order.price,
+                                                quantity=order.quantity)
+        else:
+            for order in orders:
+                place_order = self.buy_with_specific_market if order.is_buy else self.sell_with_specific_market
+                place_order(self._market_infos[order.trading_pair],
+                            order.quantity,
+                            order_type=order_type,
+                            price=order.price)
 
-    def execute_orders_proposal(self, proposals: List[Proposal]):
+    def execute_orders_proposal(self, proposals: List[Proposal], markets: Optional[Set[str]] = None):
         """
         Execute a list of proposals if the current timestamp is less than its refresh timestamp.
         Update the refresh timestamp.
+        :param proposals: the proposals of all the markets
+        :param markets: the markets whose proposal can be executed, all of them if it is None
         """
+        maker_order_type: OrderType = self._exchange.get_maker_order_type()
+        active_orders = self.active_orders_by_market()
+        orders_to_create = []
         for proposal in proposals:
-            maker_order_type: OrderType = self._exchange.get_maker_order_type()
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
+            if (markets is not None and proposal.market not in markets) or proposal.market in active_orders or \
+                    self._refresh_times[proposal.market] > self.current_timestamp:
                 continue
+            market_info = self._market_infos[proposal.market]
             mid_price = self._market_infos[proposal.market].get_mid_price()
             spread = s_decimal_zero
             if proposal.buy.size > 0:
@@ -435,23 +566,25 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 self.logger().info(f"({proposal.market}) Creating a bid order {proposal.buy} value: "
                                    f"{proposal.buy.size * proposal.buy.price:.2f} {proposal.quote()} spread: "
                                    f"{spread:.2%}")
-                self.buy_with_specific_market(
-                    self._market_infos[proposal.market],
-                    proposal.buy.size,
-                    order_type=maker_order_type,
-                    price=proposal.buy.price
-                )
+                orders_to_create.append(LimitOrder(client_order_id="",
+                                                   trading_pair=proposal.market,
+                                                   is_buy=True,
+                                                   base_currency=market_info.base_asset,
+                                                   quote_currency=market_info.quote_asset,
+                                                   price=proposal.buy.price,
+                                                   quantity=proposal.buy.size))
             if proposal.sell.size > 0:
                 spread = abs(proposal.sell.price - mid_price) / mid_price
                 self.logger().info(f"({proposal.market}) Creating an ask order at {proposal.sell} value: "
                                    f"{proposal.sell.size * proposal.sell.price:.2f} {proposal.quote()} spread: "
                                    f"{spread:.2%}")
-                self.sell_with_specific_market(
-                    self._market_infos[proposal.market],
-                    proposal.sell.size,
-                    order_type=maker_order_type,
-                    price=proposal.sell.price
-                )
+                orders_to_create.append(LimitOrder(client_order_id="",
+                                                   trading_pair=proposal.market,
+                                                   is_buy=False,
+                                                   base_currency=market_info.base_asset,
+                                                   quote_currency=market_info.quote_asset,
+                                                   price=proposal.sell.price,
+                                                   quantity=proposal.sell.size))
             if proposal.buy.size > 0 or proposal.sell.size > 0:
                 if not self._volatility[proposal.market].is_nan() and spread > self._spread:
                     adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
@@ -460,6 +593,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
                                            f"market volatility")
 
                 self._refresh_times[proposal.market] = self.current_timestamp + self._order_refresh_time
+                if proposal.market in self._proposal_states:
+                    self._market_states[proposal.market] = self._proposal_states[proposal.market]
+        self.create_orders(orders_to_create, maker_order_type)
 
     def is_token_a_quote_token(self):
         """
@@ -563,17 +699,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         for market in self._market_infos:
             mid_price = self._market_infos[market].get_mid_price()
+            # Only the last part of the prices needed for volatility calculation is kept
             self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
+        for market, mid_prices_queue in self._mid_prices.items():
+            mid_prices = list(mid_prices_queue)
             last_index = len(mid_prices) - 1
             atr = []
             first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
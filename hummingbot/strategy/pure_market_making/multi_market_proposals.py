@@ -0,0 +1,189 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+# Relative difference below which two float prices are the same price
+PRICE_PRECISION = 1e-9
+
+
+@dataclass
+class MultiMarketProposals:
+    """
+    The buy and sell orders proposed for many markets at once, as (markets, order levels) arrays.
+    An order with a zero amount is not placed.
+    """
+    buy_prices: np.ndarray
+    buy_amounts: np.ndarray
+    sell_prices: np.ndarray
+    sell_amounts: np.ndarray
+
+    @property
+    def markets_count(self) -> int:
+        return self.buy_prices.shape[0]
+
+
+def quantize(values: np.ndarray, quanta: np.ndarray, round_up: bool = False) -> np.ndarray:
+    """
+    Rounds each row of the values to a multiple of the quantum of its market.
+
+    :param values: (markets, order levels) array
+    :param quanta: (markets,) array
+    """
+    quanta = quanta[:, np.newaxis]
+    steps = np.ceil(values / quanta) if round_up else np.floor(values / quanta)
+    return steps * quanta
+
+
+def create_base_proposals(buy_reference_prices: np.ndarray,
+                          sell_reference_prices: np.ndarray,
+                          bid_spreads: np.ndarray,
+                          ask_spreads: np.ndarray,
+                          order_amounts: np.ndarray,
+                          order_levels: int = 1,
+                          order_level_spread: float = 0.0,
+                          order_level_amount: float = 0.0) -> MultiMarketProposals:
+    """
+    Creates the orders of every market around its reference prices, the same way the pure market making strategy
+    does for a single market. The markets with a NaN reference price get no orders in that side.
+
+    :param order_amounts: the amount of the first order level of each market, in base asset
+    :param order_level_amount: the amount added at each level, in base asset
+    """
+    levels = np.arange(order_levels)
+    level_spreads = levels * order_level_spread
+    buy_prices = buy_reference_prices[:, np.newaxis] * (1 - bid_spreads[:, np.newaxis] - level_spreads)
+    sell_prices = sell_reference_prices[:, np.newaxis] * (1 + ask_spreads[:, np.newaxis] + level_spreads)
+    amounts = order_amounts[:, np.newaxis] + levels * order_level_amount
+    buy_amounts = np.where(np.isnan(buy_prices), 0.0, amounts)
+    sell_amounts = np.where(np.isnan(sell_prices), 0.0, amounts)
+    return MultiMarketProposals(buy_prices=np.nan_to_num(buy_prices),
+                                buy_amounts=buy_amounts,
+                                sell_prices=np.nan_to_num(sell_prices),
+                                sell_amounts=sell_amounts)
+
+
+def calculate_bid_ask_ratios(base_asset_amounts: np.ndarray,
+                             quote_asset_amounts: np.ndarray,
+                             prices: np.ndarray,
+                             target_base_asset_ratios: np.ndarray,
+                             base_asset_ranges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of inventory_skew_calculator.calculate_bid_ask_ratios_from_base_asset_ratio.
+
+    :return: the (bid ratios, ask ratios) of the markets
+    """
+    total_portfolio_values = base_asset_amounts * prices + quote_asset_amounts
+    base_asset_values = base_asset_amounts * prices
+    base_asset_range_values = np.minimum(base_asset_ranges * prices, total_portfolio_values * 0.5)
+    target_base_asset_values = total_portfolio_values * target_base_asset_ratios
+    left_limits = np.maximum(target_base_asset_values - base_asset_range_values, 0.0)
+    right_limits = target_base_asset_values + base_asset_range_values
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # The bid ratio goes linearly from 2 at the left limit to 1 at the target and to 0 at the right limit
+        left_ratios = np.clip((base_asset_values - left_limits) / (target_base_asset_values - left_limits), 0, 1)
+        right_ratios = np.clip((base_asset_values - target_base_asset_values)
+                               / (right_limits - target_base_asset_values), 0, 1)
+    left_ratios = np.where(np.isfinite(left_ratios), left_ratios, 1.0)
+    right_ratios = np.where(np.isfinite(right_ratios), right_ratios, 0.0)
+    bid_ratios = np.where(base_asset_values < target_base_asset_values, 2.0 - left_ratios, 1.0 - right_ratios)
+
+    no_inventory = (total_portfolio_values <= 0) | (base_asset_ranges <= 0)
+    bid_ratios = np.where(no_inventory, 0.0, bid_ratios)
+    ask_ratios = np.where(no_inventory, 0.0, 2.0 - bid_ratios)
+    return bid_ratios, ask_ratios
+
+
+def apply_inventory_skew(proposals: MultiMarketProposals, bid_ratios: np.ndarray, ask_ratios: np.ndarray):
+    proposals.buy_amounts = proposals.buy_amounts * bid_ratios[:, np.newaxis]
+    proposals.sell_amounts = proposals.sell_amounts * ask_ratios[:, np.newaxis]
+
+
+def apply_order_optimization(proposals: MultiMarketProposals,
+                             top_bid_prices: np.ndarray,
+                             top_ask_prices: np.ndarray,
+                             price_quanta: np.ndarray,
+                             order_level_spread: float = 0.0):
+    """
+    Lowers the buy orders of each market to just above the top bid and raises the sell orders to just below the top ask
+    when they would cross them, applying the order level spread from there. The top prices should exclude the own
+    orders of the markets.
+    """
+    levels = np.arange(proposals.buy_prices.shape[1])
+    price_above_bids = (np.ceil(top_bid_prices / price_quanta) + 1) * price_quanta
+    top_buy_prices = np.minimum(proposals.buy_prices.max(axis=1), price_above_bids)
+    top_buy_prices = np.floor(top_buy_prices / price_quanta) * price_quanta
+    buy_prices = top_buy_prices[:, np.newaxis] * (1 - levels * order_level_spread)
+    price_below_asks = (np.floor(top_ask_prices / price_quanta) - 1) * price_quanta
+    top_sell_prices = np.maximum(proposals.sell_prices.min(axis=1), price_below_asks)
+    top_sell_prices = np.ceil(top_sell_prices / price_quanta) * price_quanta
+    sell_prices = top_sell_prices[:, np.newaxis] * (1 + levels * order_level_spread)
+    # The markets without top prices keep their orders
+    proposals.buy_prices = np.where(np.isnan(buy_prices), proposals.buy_prices, buy_prices)
+    proposals.sell_prices = np.where(np.isnan(sell_prices), proposals.sell_prices, sell_prices)
+
+
+def _allocate_budget(costs: np.ndarray, asset_indexes: np.ndarray, balances: np.ndarray) -> np.ndarray:
+    """
+    Allocates the balance of each asset to the orders spending it, in market and level order. Returns the part of the
+    cost of each order that can be paid.
+
+    :param costs: (markets, order levels) array with the amount of asset each order spends
+    :param asset_indexes: (markets,) array with the index in balances of the asset spent by each market
+    """
+    flat_costs = costs.ravel()
+    flat_assets = np.repeat(asset_indexes, costs.shape[1])
+    order = np.argsort(flat_assets, kind="stable")
+    sorted_costs = flat_costs[order]
+    sorted_assets = flat_assets[order]
+    cumulative_costs = np.cumsum(sorted_costs)
+    # Restart the cumulative cost at the first order of each asset
+    group_starts = np.flatnonzero(np.r_[True, sorted_assets[1:] != sorted_assets[:-1]])
+    group_offsets = np.repeat(cumulative_costs[group_starts] - sorted_costs[group_starts],
+                              np.diff(np.r_[group_starts, len(sorted_costs)]))
+    spent_before = cumulative_costs - sorted_costs - group_offsets
+    remaining = np.maximum(balances[sorted_assets] - spent_before, 0.0)
+    allocated = np.empty_like(flat_costs)
+    allocated[order] = np.minimum(sorted_costs, remaining)
+    return allocated.reshape(costs.shape)
+
+
+def apply_budget_constraint(proposals: MultiMarketProposals,
+                            base_asset_indexes: np.ndarray,
+                            quote_asset_indexes: np.ndarray,
+                            available_balances: np.ndarray,
+                            buy_fee_pcts: np.ndarray):
+    """
+    Reduces the orders to the available balances, shared between all the markets trading the same asset. Like in the
+    pure market making strategy, the first order exceeding the remaining balance uses it all and the following ones
+    are removed.
+
+    :param base_asset_indexes: (markets,) array with the index in available_balances of the base asset of each market
+    :param quote_asset_indexes: (markets,) array with the index in available_balances of the quote asset of each market
+    :param available_balances: the balance of each asset available for the orders
+    :param buy_fee_pcts: (markets,) array with the fee of the buy orders of each market, as a fraction
+    """
+    if proposals.markets_count == 0:
+        return
+    buy_unit_costs = proposals.buy_prices * (1 + buy_fee_pcts[:, np.newaxis])
+    buy_costs = proposals.buy_amounts * buy_unit_costs
+    allocated_quote = _allocate_budget(buy_costs, quote_asset_indexes, available_balances)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        proposals.buy_amounts = np.where(buy_costs > 0, allocated_quote / buy_unit_costs, 0.0)
+    proposals.sell_amounts = _allocate_budget(proposals.sell_amounts, base_asset_indexes, available_balances)
+
+
+def is_within_tolerance(current_prices: np.ndarray, proposal_prices: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Checks for each market if the prices of its active orders are all within the tolerance of the proposed ones.
+    The levels without an active order or without a proposed order are NaN, a market where they don't match has to
+    be refreshed.
+
+    :param current_prices: (markets, order levels) array with the prices of the active orders, sorted like the proposal
+    :return: (markets,) boolean array, True for the markets whose orders don't need to be refreshed
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deviations = np.abs(proposal_prices - current_prices) / current_prices
+    both_missing = np.isnan(current_prices) & np.isnan(proposal_prices)
+    return np.all((deviations <= tolerance + PRICE_PRECISION) | both_missing, axis=1)
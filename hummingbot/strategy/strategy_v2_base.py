@@ -20,6 +20,7 @@ from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.strategy_v2.controllers.controller_worker_pool import ControllerWorkerPool
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
 )
@@ -73,6 +74,17 @@ class StrategyV2ConfigBase(BaseClientModel):
             prompt=lambda mi: "Enter the config update interval in seconds (e.g. 60): ",
         )
     )
+    controllers_worker_processes: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: (
+                "Enter the number of worker processes where the controllers compute their data "
+                "(0 to compute it in the main process): "
+            ),
+        )
+    )
 
     @validator("controllers_config", pre=True, always=True)
     def parse_controllers_config(cls, v):
@@ -207,6 +219,9 @@ class StrategyV2Base(ScriptStrategyBase):
         self.market_data_provider = MarketDataProvider(connectors)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
         self.controllers: Dict[str, ControllerBase] = {}
+        self.controllers_worker_pool: Optional[ControllerWorkerPool] = None
+        if config.controllers_worker_processes > 0:
+            self.controllers_worker_pool = ControllerWorkerPool(max_workers=config.controllers_worker_processes)
         self.initialize_controllers()
 
     def initialize_controllers(self):
@@ -221,6 +236,7 @@ class StrategyV2Base(ScriptStrategyBase):
     def add_controller(self, config: ControllerConfigBase):
         try:
             controller = config.get_controller_class()(config, self.market_data_provider, self.actions_queue)
+            controller.set_worker_pool(self.controllers_worker_pool)
             controller.start()
             self.controllers[config.id] = controller
         except Exception as e:
@@ -282,6 +298,8 @@ class StrategyV2Base(ScriptStrategyBase):
         self.listen_to_executor_actions_task.cancel()
         for controller in self.controllers.values():
             controller.stop()
+        if self.controllers_worker_pool is not None:
+            self.controllers_worker_pool.stop()
         for i in range(self.max_executors_close_attempts):
             if all([executor.is_done for executor in self.get_all_executors()]):
                 continue
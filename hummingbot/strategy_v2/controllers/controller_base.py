@@ -4,8 +4,9 @@ import asyncio
 import importlib
 import inspect
 from decimal import Decimal
-from typing import Callable, Dict, List, Set
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
 
+import pandas as pd
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientFieldData
@@ -19,6 +20,9 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 from hummingbot.strategy_v2.utils.common import generate_unique_id
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.controllers.controller_worker_pool import ControllerWorkerPool
+
 
 class ControllerConfigBase(BaseClientModel):
     """
@@ -133,6 +137,7 @@ class ControllerBase(RunnableBase):
         self.processed_data = {}
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
+        self._worker_pool: Optional[ControllerWorkerPool] = None
 
     def start(self):
         """
@@ -149,6 +154,12 @@ class ControllerBase(RunnableBase):
         for candles_config in self.config.candles_config:
             self.market_data_provider.initialize_candles_feed(candles_config)
 
+    def set_worker_pool(self, worker_pool: Optional[ControllerWorkerPool]):
+        """
+        Sets the pool of worker processes where `compute_processed_data` runs, or None to run it in this process.
+        """
+        self._worker_pool = worker_pool
+
     def get_balance_requirements(self) -> List[TokenAmount]:
         """
         Get the balance requirements for the controller.
@@ -190,6 +201,33 @@ class ControllerBase(RunnableBase):
         """
         raise NotImplementedError
 
+    async def update_processed_data_from_candles(self):
+        """
+        Updates the processed data with the result of `compute_processed_data`. The computation runs in a worker
+        process when the controller has a worker pool, and in this process otherwise. The controllers whose
+        processed data only depends on their configuration and candles can call this method from
+        `update_processed_data`.
+        """
+        if self._worker_pool is not None:
+            processed_data = await self._worker_pool.compute_processed_data(self)
+        else:
+            candles = [self.market_data_provider.get_candles_df(connector_name=candles_config.connector,
+                                                                trading_pair=candles_config.trading_pair,
+                                                                interval=candles_config.interval,
+                                                                max_records=candles_config.max_records)
+                       for candles_config in self.config.candles_config]
+            processed_data = self.compute_processed_data(self.config, candles)
+        self.processed_data.update(processed_data)
+
+    @staticmethod
+    def compute_processed_data(config: ControllerConfigBase, candles: List[pd.DataFrame]) -> Dict:
+        """
+        This method can be overridden by the derived classes to calculate the processed data from the configuration
+        and the candles of the controller, in the order of `config.candles_config`. It must not use the state of the
+        controller, so it can run in another process. See `update_processed_data_from_candles`.
+        """
+        raise NotImplementedError
+
     def determine_executor_actions(self) -> List[ExecutorAction]:
         """
         This method should be overridden by the derived classes to implement the logic to determine the actions
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.shared_candles import (
+    SharedCandlesHandle,
+    SharedCandlesWriter,
+    read_shared_candles,
+)
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+
+
+def _compute_in_worker(compute: Callable[["ControllerConfigBase", List[pd.DataFrame]], Dict],
+                       config: "ControllerConfigBase",
+                       candles_handles: List[SharedCandlesHandle]) -> Dict:
+    candles = [read_shared_candles(handle) for handle in candles_handles]
+    return compute(config, candles)
+
+
+class ControllerWorkerPool:
+    """
+    Pool of worker processes where the controllers compute their processed data (indicators, fits, grids...), so the
+    CPU heavy computations of a controller don't delay the order book updates and the order handling of the main
+    process.
+
+    The candles stay owned by the feeds of the main process and are published to the workers through shared memory.
+    The workers only return the processed data: the executor actions are still determined and executed in the main
+    process, which owns the connectors.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, max_workers: int):
+        # The workers are spawned instead of forked, forking a process with an event loop and threads is not safe
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        self._candles_writers: Dict[Tuple[str, str, str, int], SharedCandlesWriter] = {}
+
+    def publish_candles(self, market_data_provider: MarketDataProvider,
+                        candles_config: CandlesConfig) -> SharedCandlesHandle:
+        """
+        Publishes the last candles of the feed to its block of shared memory, if they changed since the last time.
+        """
+        feed = market_data_provider.get_candles_feed(candles_config)
+        key = (candles_config.connector, candles_config.trading_pair, candles_config.interval,
+               candles_config.max_records)
+        writer = self._candles_writers.get(key)
+        if writer is None:
+            writer = SharedCandlesWriter(columns=feed.columns, capacity=candles_config.max_records)
+            self._candles_writers[key] = writer
+        writer.publish(feed.candles_array, feed.candles_version)
+        return writer.handle
+
+    async def compute_processed_data(self, controller: "ControllerBase") -> Dict:
+        """
+        Runs `compute_processed_data` of the controller in a worker process with the candles of its configuration.
+        """
+        candles_handles = [self.publish_candles(controller.market_data_provider, candles_config)
+                           for candles_config in controller.config.candles_config]
+        return await asyncio.get_running_loop().run_in_executor(self._executor,
+                                                                _compute_in_worker,
+                                                                type(controller).compute_processed_data,
+                                                                controller.config,
+                                                                candles_handles)
+
+    def stop(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for writer in self._candles_writers.values():
+            writer.close()
+        self._candles_writers.clear()
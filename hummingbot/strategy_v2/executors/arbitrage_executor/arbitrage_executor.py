@@ -152,8 +152,16 @@ class ArbitrageExecutor(ExecutorBase):
                                              order_amount: Decimal):
         return await self.connectors[exchange].get_quote_price(trading_pair, is_buy, order_amount)
 
+    async def on_start(self):
+        self.watch_order_books([(self.buying_market.connector_name, self.buying_market.trading_pair),
+                                (self.selling_market.connector_name, self.selling_market.trading_pair)])
+        await super().on_start()
+
     async def control_task(self):
         if self.status == RunnableStatus.RUNNING:
+            if not self.order_books_changed:
+                # The profitability can't change until the top of any of the order books does
+                return
             try:
                 await self.update_trade_pnl_pct()
                 await self.update_tx_cost()
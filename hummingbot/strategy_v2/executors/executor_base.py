@@ -6,6 +6,7 @@ from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
+from hummingbot.core.data_type.order_book_change_notifier import OrderBookChangeNotifier
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -68,6 +69,10 @@ class ExecutorBase(RunnableBase):
             (MarketEvent.OrderFailure, self._failed_order_forwarder),
         ]
 
+        # Set when the executor watches the order books it depends on, see watch_order_books
+        self._order_book_change_notifier: Optional[OrderBookChangeNotifier] = None
+        self._order_books_changed: bool = True
+
     @property
     def status(self):
         """
@@ -169,6 +174,9 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        if self._order_book_change_notifier is not None:
+            self._order_book_change_notifier.stop()
+            self._order_book_change_notifier.clear()
 
     async def on_start(self):
         """
@@ -182,6 +190,36 @@ class ExecutorBase(RunnableBase):
         """
         pass
 
+    def watch_order_books(self, markets: List[Tuple[str, str]]):
+        """
+        Wakes up the control loop as soon as the top levels of the order books of the markets change, instead of
+        waiting for the update interval. If any of the connectors has no order book (AMM) the executor keeps polling.
+
+        :param markets: list of (connector name, trading pair)
+        """
+        if any(self.is_amm_connector(exchange=connector_name) for connector_name, _ in markets):
+            return
+        notifier = OrderBookChangeNotifier()
+        for connector_name, trading_pair in markets:
+            notifier.watch(self.connectors[connector_name].get_order_book(trading_pair))
+        self._order_book_change_notifier = notifier
+
+    @property
+    def order_books_changed(self) -> bool:
+        """
+        True if the watched order books changed before the current iteration of the control loop, or if the executor
+        doesn't watch order books, so the calculations depending on them can be skipped otherwise.
+        """
+        return self._order_book_change_notifier is None or self._order_books_changed
+
+    async def wait_for_next_iteration(self):
+        if self._order_book_change_notifier is None:
+            await super().wait_for_next_iteration()
+        else:
+            self._order_books_changed = await self._order_book_change_notifier.wait_for_change(
+                timeout=self.update_interval)
+            self._order_book_change_notifier.clear()
+
     def early_stop(self, keep_position: bool = False):
         """
         This method allows strategy to stop the executor early.
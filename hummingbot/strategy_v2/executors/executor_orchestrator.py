@@ -119,17 +119,14 @@ class ExecutorOrchestrator:
 
     def _initialize_cached_performance(self):
         """
-        Initialize cached performance by querying the database for stored executors.
+        Initialize cached performance from the performance rollups of the controllers stored in the database.
         """
-        db_executors = MarketsRecorder.get_instance().get_all_executors()
-        for executor in db_executors:
-            controller_id = executor.controller_id
-            if controller_id not in self.cached_performance:
-                self.cached_performance[controller_id] = PerformanceReport()
-                self.active_executors[controller_id] = []
-                self.archived_executors[controller_id] = []
-                self.positions_held[controller_id] = []
-            self._update_cached_performance(controller_id, executor)
+        controllers_performance = MarketsRecorder.get_instance().get_controllers_performance()
+        for controller_id, performance in controllers_performance.items():
+            self.cached_performance[controller_id] = performance
+            self.active_executors[controller_id] = []
+            self.archived_executors[controller_id] = []
+            self.positions_held[controller_id] = []
 
     def _update_cached_performance(self, controller_id: str, executor_info: ExecutorInfo):
         """
@@ -124,9 +124,15 @@ class XEMMExecutor(ExecutorBase):
             self.logger().error("Not enough budget to open position.")
             self.stop()
 
+    async def on_start(self):
+        # The taker price only depends on the taker order book, the executor is woken up when it changes
+        self.watch_order_books([(self.taker_connector, self.taker_trading_pair)])
+        await super().on_start()
+
     async def control_task(self):
         if self.status == RunnableStatus.RUNNING:
-            await self.update_prices_and_tx_costs()
+            if self.order_books_changed:
+                await self.update_prices_and_tx_costs()
             await self.control_maker_order()
         elif self.status == RunnableStatus.SHUTTING_DOWN:
             await self.control_shutdown_process()
@@ -1,8 +1,10 @@
 import asyncio
 import logging
+import time
 from abc import ABC
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
@@ -62,17 +64,33 @@ class RunnableBase(ABC):
         """
         The main control loop of the smart component.
         This method is responsible for executing the control task at the specified interval.
+        The duration of the control task is recorded in the runtime metrics when they are enabled.
         """
+        runtime_metrics = RuntimeMetrics.get_instance()
+        loop_count = 0
         await self.on_start()
         while not self.terminated.is_set():
             try:
-                await self.control_task()
+                loop_count += 1
+                if runtime_metrics.should_sample_control_loop(loop_count):
+                    start = time.perf_counter()
+                    await self.control_task()
+                    runtime_metrics.observe_control_loop(self.__class__.__name__, time.perf_counter() - start)
+                else:
+                    await self.control_task()
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
-                await asyncio.sleep(self.update_interval)
+                await self.wait_for_next_iteration()
         self.on_stop()
 
+    async def wait_for_next_iteration(self):
+        """
+        Waits before the next execution of the control task.
+        This method can be overridden in subclasses to wake up earlier than the update interval.
+        """
+        await asyncio.sleep(self.update_interval)
+
     def on_stop(self):
         """
         Method to be executed when the control loop is stopped.
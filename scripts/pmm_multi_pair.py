@@ -0,0 +1,258 @@
+import logging
+import os
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List
+
+import numpy as np
+from pydantic import Field
+
+from hummingbot.client.config.config_data_types import BaseClientModel, ClientFieldData
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.strategy.pure_market_making.multi_market_proposals import (
+    MultiMarketProposals,
+    apply_budget_constraint,
+    apply_inventory_skew,
+    apply_order_optimization,
+    calculate_bid_ask_ratios,
+    create_base_proposals,
+    is_within_tolerance,
+    quantize,
+)
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class PMMMultiPairConfig(BaseClientModel):
+    script_file_name: str = Field(default_factory=lambda: os.path.basename(__file__))
+    exchange: str = Field("binance_paper_trade", client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Exchange where the bot will trade"))
+    trading_pairs: str = Field("ETH-USDT,BTC-USDT,SOL-USDT", client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Trading pairs in which the bot will place orders (comma separated)"))
+    order_amount_quote: Decimal = Field(20, client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Order amount of each pair (denominated in quote asset)"))
+    bid_spread: Decimal = Field(0.001, client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Bid order spread (0.001 = 0.1%)"))
+    ask_spread: Decimal = Field(0.001, client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Ask order spread (0.001 = 0.1%)"))
+    order_levels: int = Field(1, client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Number of orders on each side"))
+    order_level_spread: Decimal = Field(0.001, client_data=ClientFieldData(
+        prompt_on_new=False, prompt=lambda mi: "Spread between order levels (0.001 = 0.1%)"))
+    order_refresh_time: int = Field(15, client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Order refresh time (in seconds)"))
+    order_refresh_tolerance: Decimal = Field(0, client_data=ClientFieldData(
+        prompt_on_new=False, prompt=lambda mi: "Price change that refreshes the orders (0.001 = 0.1%)"))
+    inventory_skew_enabled: bool = Field(False, client_data=ClientFieldData(
+        prompt_on_new=False, prompt=lambda mi: "Adjust the order amounts to keep the inventory ratio (True/False)"))
+    inventory_target_base_pct: Decimal = Field(0.5, client_data=ClientFieldData(
+        prompt_on_new=False, prompt=lambda mi: "Target base asset ratio of each pair (0.5 = 50%)"))
+    inventory_range_multiplier: Decimal = Field(1, client_data=ClientFieldData(
+        prompt_on_new=False, prompt=lambda mi: "Inventory range, expressed in multiples of the total order size"))
+    order_optimization_enabled: bool = Field(False, client_data=ClientFieldData(
+        prompt_on_new=False, prompt=lambda mi: "Jump to the top of the order book (True/False)"))
+    price_type: str = Field("mid", client_data=ClientFieldData(
+        prompt_on_new=True, prompt=lambda mi: "Price type to use (mid or last)"))
+
+
+class PMMMultiPair(ScriptStrategyBase):
+    """
+    Pure market making over many trading pairs of an exchange from a single strategy.
+    The proposals of all the pairs are built in one pass over NumPy arrays: base orders around the price source,
+    inventory skew, order optimization and a budget constraint shared by the pairs trading the same assets.
+    Like the pure market making strategy, the orders of a pair are cancelled every order_refresh_time unless they are
+    within the refresh tolerance, and the new orders are created once the previous ones are gone. The cancellations and
+    creations of all the pairs are sent in batches.
+    """
+
+    price_source = PriceType.MidPrice
+
+    @classmethod
+    def init_markets(cls, config: PMMMultiPairConfig):
+        cls.markets = {config.exchange: set(config.trading_pairs.split(","))}
+        cls.price_source = PriceType.LastTrade if config.price_type == "last" else PriceType.MidPrice
+
+    def __init__(self, connectors: Dict[str, ConnectorBase], config: PMMMultiPairConfig):
+        super().__init__(connectors)
+        self.config = config
+        self.trading_pairs: List[str] = config.trading_pairs.split(",")
+        pairs_assets = [split_hb_trading_pair(trading_pair) for trading_pair in self.trading_pairs]
+        self.assets: List[str] = sorted({asset for pair_assets in pairs_assets for asset in pair_assets})
+        self.base_asset_indexes = np.array([self.assets.index(base) for base, _ in pairs_assets])
+        self.quote_asset_indexes = np.array([self.assets.index(quote) for _, quote in pairs_assets])
+        self.refresh_timestamps = np.zeros(len(self.trading_pairs))
+        self.price_quanta: List[Decimal] = []
+        self.size_quanta: List[Decimal] = []
+
+    @property
+    def connector(self) -> ConnectorBase:
+        return self.connectors[self.config.exchange]
+
+    def on_tick(self):
+        active_orders = self.active_orders_by_pair()
+        has_orders = np.array([len(active_orders[trading_pair]) > 0 for trading_pair in self.trading_pairs])
+        refresh_due = has_orders & (self.refresh_timestamps <= self.current_timestamp)
+        if not np.any(refresh_due | ~has_orders):
+            return
+
+        proposals = self.create_proposals(active_orders, refresh_due)
+        if np.any(refresh_due):
+            current_buy_prices, current_sell_prices = self.active_order_prices(active_orders)
+            tolerance = float(self.config.order_refresh_tolerance)
+            within_tolerance = (
+                is_within_tolerance(current_buy_prices,
+                                    self.proposed_prices(proposals.buy_prices, proposals.buy_amounts), tolerance)
+                & is_within_tolerance(current_sell_prices,
+                                      self.proposed_prices(proposals.sell_prices, proposals.sell_amounts), tolerance))
+            self.refresh_timestamps[refresh_due & within_tolerance] = (self.current_timestamp
+                                                                       + self.config.order_refresh_time)
+            to_cancel = np.flatnonzero(refresh_due & ~within_tolerance)
+            orders_to_cancel = [order for index in to_cancel for order in active_orders[self.trading_pairs[index]]]
+            if orders_to_cancel:
+                self.connector.batch_order_cancel(orders_to_cancel=orders_to_cancel)
+
+        to_create = np.flatnonzero(~has_orders)
+        if len(to_create) > 0:
+            self.place_orders(proposals, to_create)
+            self.refresh_timestamps[to_create] = self.current_timestamp + self.config.order_refresh_time
+
+    def active_orders_by_pair(self) -> Dict[str, List[LimitOrder]]:
+        active_orders = defaultdict(list)
+        for order in self.get_active_orders(connector_name=self.config.exchange):
+            active_orders[order.trading_pair].append(order)
+        return active_orders
+
+    def create_proposals(self, active_orders: Dict[str, List[LimitOrder]],
+                         refresh_due: np.ndarray) -> MultiMarketProposals:
+        """
+        Creates the proposals of all the pairs. Like in the pure market making strategy, the budget includes the
+        balance locked in the active orders of the pairs being refreshed, since those orders are replaced by the
+        proposals. The balance locked in the orders that stay on the book is not available.
+        """
+        connector = self.connector
+        config = self.config
+        markets = len(self.trading_pairs)
+        ref_prices = np.array([float(connector.get_price_by_type(trading_pair, self.price_source))
+                               for trading_pair in self.trading_pairs])
+        self.price_quanta = [connector.get_order_price_quantum(trading_pair, Decimal(str(price)))
+                             for trading_pair, price in zip(self.trading_pairs, ref_prices)]
+        price_quanta = np.array([float(quantum) for quantum in self.price_quanta])
+        order_amounts = float(config.order_amount_quote) / ref_prices
+        self.size_quanta = [connector.get_order_size_quantum(trading_pair, Decimal(str(amount)))
+                            for trading_pair, amount in zip(self.trading_pairs, order_amounts)]
+        size_quanta = np.array([float(quantum) for quantum in self.size_quanta])
+
+        proposals = create_base_proposals(
+            buy_reference_prices=ref_prices,
+            sell_reference_prices=ref_prices,
+            bid_spreads=np.full(markets, float(config.bid_spread)),
+            ask_spreads=np.full(markets, float(config.ask_spread)),
+            order_amounts=order_amounts,
+            order_levels=config.order_levels,
+            order_level_spread=float(config.order_level_spread))
+
+        if config.inventory_skew_enabled:
+            balances = np.array([float(connector.get_balance(asset)) for asset in self.assets])
+            total_order_sizes = 2 * order_amounts * config.order_levels
+            bid_ratios, ask_ratios = calculate_bid_ask_ratios(
+                base_asset_amounts=balances[self.base_asset_indexes],
+                quote_asset_amounts=balances[self.quote_asset_indexes],
+                prices=ref_prices,
+                target_base_asset_ratios=np.full(markets, float(config.inventory_target_base_pct)),
+                base_asset_ranges=total_order_sizes * float(config.inventory_range_multiplier))
+            apply_inventory_skew(proposals, bid_ratios, ask_ratios)
+
+        if config.order_optimization_enabled:
+            top_bid_prices = np.array([float(connector.get_price(trading_pair, False))
+                                       for trading_pair in self.trading_pairs])
+            top_ask_prices = np.array([float(connector.get_price(trading_pair, True))
+                                       for trading_pair in self.trading_pairs])
+            apply_order_optimization(proposals, top_bid_prices, top_ask_prices, price_quanta,
+                                     float(config.order_level_spread))
+
+        proposals.buy_prices = quantize(proposals.buy_prices, price_quanta)
+        proposals.sell_prices = quantize(proposals.sell_prices, price_quanta, round_up=True)
+        available_balances = np.array([float(connector.get_available_balance(asset)) for asset in self.assets])
+        for index in np.flatnonzero(refresh_due):
+            for order in active_orders[self.trading_pairs[index]]:
+                if order.is_buy:
+                    available_balances[self.assets.index(order.quote_currency)] += float(order.quantity * order.price)
+                else:
+                    available_balances[self.assets.index(order.base_currency)] += float(order.quantity)
+        buy_fee_pcts = np.array([
+            float(connector.get_fee(base, quote, OrderType.LIMIT, TradeType.BUY, Decimal(str(amount)),
+                                    Decimal(str(price))).percent)
+            for (base, quote), amount, price in zip(map(split_hb_trading_pair, self.trading_pairs),
+                                                    order_amounts, ref_prices)])
+        apply_budget_constraint(proposals, self.base_asset_indexes, self.quote_asset_indexes, available_balances,
+                                buy_fee_pcts)
+        proposals.buy_amounts = quantize(proposals.buy_amounts, size_quanta)
+        proposals.sell_amounts = quantize(proposals.sell_amounts, size_quanta)
+        return proposals
+
+    @staticmethod
+    def proposed_prices(prices: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+        """
+        Returns the prices of the proposed orders, NaN where no order is proposed, with an extra NaN level to compare
+        them with the active order prices.
+        """
+        proposed_prices = np.where(amounts > 0, prices, np.nan)
+        return np.pad(proposed_prices, ((0, 0), (0, 1)), constant_values=np.nan)
+
+    def active_order_prices(self, active_orders: Dict[str, List[LimitOrder]]):
+        """
+        Returns the prices of the active buy and sell orders of every pair as (pairs, order levels + 1) arrays sorted
+        like the proposals, NaN where there is no order. The extra level detects the pairs with more orders than
+        levels.
+        """
+        levels = self.config.order_levels
+        buy_prices = np.full((len(self.trading_pairs), levels + 1), np.nan)
+        sell_prices = np.full((len(self.trading_pairs), levels + 1), np.nan)
+        for index, trading_pair in enumerate(self.trading_pairs):
+            orders = active_orders[trading_pair]
+            buys = sorted((float(order.price) for order in orders if order.is_buy), reverse=True)[:levels + 1]
+            sells = sorted(float(order.price) for order in orders if not order.is_buy)[:levels + 1]
+            buy_prices[index, :len(buys)] = buys
+            sell_prices[index, :len(sells)] = sells
+        return buy_prices, sell_prices
+
+    @staticmethod
+    def to_decimal(value: float, quantum: Decimal) -> Decimal:
+        return int(round(value / float(quantum))) * quantum
+
+    def place_orders(self, proposals: MultiMarketProposals, market_indexes: np.ndarray):
+        orders_to_create = []
+        for index in market_indexes:
+            trading_pair = self.trading_pairs[index]
+            base, quote = split_hb_trading_pair(trading_pair)
+            for is_buy, prices, amounts in ((True, proposals.buy_prices, proposals.buy_amounts),
+                                            (False, proposals.sell_prices, proposals.sell_amounts)):
+                for price, amount in zip(prices[index], amounts[index]):
+                    if amount > 0 and price > 0:
+                        orders_to_create.append(LimitOrder(client_order_id="",
+                                                           trading_pair=trading_pair,
+                                                           is_buy=is_buy,
+                                                           base_currency=base,
+                                                           quote_currency=quote,
+                                                           price=self.to_decimal(price, self.price_quanta[index]),
+                                                           quantity=self.to_decimal(amount,
+                                                                                    self.size_quanta[index])))
+        if not orders_to_create:
+            return
+        submitted_orders: List[LimitOrder] = self.connector.batch_order_create(orders_to_create=orders_to_create)
+        for order in submitted_orders:
+            self.start_tracking_limit_order(market_pair=self._market_trading_pair_tuple(self.config.exchange,
+                                                                                        order.trading_pair),
+                                            order_id=order.client_order_id,
+                                            is_buy=order.is_buy,
+                                            price=order.price,
+                                            quantity=order.quantity)
+
+    def did_fill_order(self, event: OrderFilledEvent):
+        msg = (f"{event.trade_type.name} {round(event.amount, 2)} {event.trading_pair} {self.config.exchange} "
+               f"at {round(event.price, 2)}")
+        self.log_with_clock(logging.INFO, msg)
+        self.notify_hb_app_with_timestamp(msg)
@@ -0,0 +1,269 @@
+"""
+End to end throughput and latency benchmark of the Binance spot connector against a local mock exchange.
+
+The mock exchange replays order book diff and trade messages (generated, or from a recording with one raw stream
+message per line) at increasing rates. For every rate the benchmark measures:
+- order book update latency: from the moment a diff is sent until it changes the top of the connector order book
+- processed rate and backlog of the diffs applied to the order book
+- connector tick duration, and tick delay (how late each tick runs, i.e. the event loop lag)
+- process memory (RSS) growth
+Then it measures the order placement round trip, from `buy` until the order created event, with the per stage
+breakdown of the connector order latency tracker.
+
+The throughput limit is the highest rate whose diffs are applied at 95% or more of the rate they are sent, with a p99
+update latency below --max-latency. The results are written as JSON.
+
+Usage:
+    python -m test.benchmark.connector_benchmark --rates 100,1000,5000 --stage-duration 10 --output results.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from contextlib import suppress
+from decimal import Decimal
+from test.benchmark.mock_binance_exchange import MockBinanceExchange
+from test.benchmark.stream_replayer import StreamReplayer
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import psutil
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderBookEvent
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentiles(values: Iterable[float], points: Iterable[float] = PERCENTILES) -> Dict[str, float]:
+    values = list(values)
+    if len(values) == 0:
+        return {}
+    return {f"p{point}": value for point, value in zip(points, np.percentile(values, list(points)).tolist())}
+
+
+class ConnectorBenchmark:
+    """
+    Runs the Binance spot connector against MockBinanceExchange and collects the benchmark results.
+    """
+
+    def __init__(
+        self,
+        rates: List[float],
+        stage_duration: float = 10.0,
+        drain_timeout: float = 5.0,
+        tick_interval: float = 1.0,
+        order_count: int = 100,
+        max_latency: float = 0.1,
+        recording: Optional[str] = None,
+        base_asset: str = "COINALPHA",
+        quote_asset: str = "HBOT",
+    ):
+        self._rates = rates
+        self._stage_duration = stage_duration
+        self._drain_timeout = drain_timeout
+        self._tick_interval = tick_interval
+        self._order_count = order_count
+        self._max_latency = max_latency
+        self._trading_pair = f"{base_asset}-{quote_asset}"
+        self._exchange = MockBinanceExchange(base_asset=base_asset, quote_asset=quote_asset)
+        recorded_messages = StreamReplayer.load_recording(recording) if recording else None
+        self._replayer = StreamReplayer(symbol=self._exchange.symbol, recorded_messages=recorded_messages)
+        self._process = psutil.Process()
+        self._connector: Optional[BinanceExchange] = None
+
+        self._update_latencies: List[float] = []
+        self._tick_durations: List[float] = []
+        self._tick_delays: List[float] = []
+        self._order_sent_times: Dict[str, float] = {}
+        self._order_created: Dict[str, asyncio.Future] = {}
+        self._top_levels_forwarder = EventForwarder(to_function=self._on_top_levels_change)
+        self._order_created_forwarder = EventForwarder(to_function=self._on_buy_order_created)
+
+    async def run(self) -> Dict[str, Any]:
+        await self._exchange.start()
+        tick_task = None
+        try:
+            self._connector = BinanceExchange(
+                client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                binance_api_key="benchmarkKey",
+                binance_api_secret="benchmarkSecret",
+                trading_pairs=[self._trading_pair],
+            )
+            self._connector.enable_order_latency_tracing(max_records=self._order_count)
+            self._connector.add_listener(MarketEvent.BuyOrderCreated, self._order_created_forwarder)
+            await self._connector.start_network()
+            tick_task = asyncio.ensure_future(self._tick_loop())
+            await self._exchange.wait_til_connected()
+            await self._wait_til_ready()
+
+            order_book = self._connector.get_order_book(self._trading_pair)
+            order_book.add_listener(OrderBookEvent.TopLevelsChangeEvent, self._top_levels_forwarder)
+
+            stages = [await self._run_stage(order_book, rate) for rate in self._rates]
+            order_placement = await self._run_order_placement()
+        finally:
+            if tick_task is not None:
+                tick_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await tick_task
+            if self._connector is not None:
+                await self._connector.stop_network()
+                await self._close_connector_session()
+            await self._exchange.stop()
+
+        return {
+            "connector": self._connector.name,
+            "trading_pair": self._trading_pair,
+            "timestamp": time.time(),
+            "stage_duration": self._stage_duration,
+            "throughput_limit": self._throughput_limit(stages),
+            "stages": stages,
+            "order_placement": order_placement,
+        }
+
+    async def _close_connector_session(self):
+        # The connector keeps its aiohttp session open when its network stops
+        connections_factory = self._connector._web_assistants_factory._connections_factory
+        if connections_factory._shared_client is not None:
+            await connections_factory._shared_client.close()
+            connections_factory._shared_client = None
+
+    async def _wait_til_ready(self, timeout: float = 30.0):
+        start = time.perf_counter()
+        while not self._connector.ready:
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError(f"The connector was not ready after {timeout}s: {self._connector.status_dict}")
+            await asyncio.sleep(0.1)
+
+    async def _run_stage(self, order_book: OrderBook, rate: float) -> Dict[str, Any]:
+        self._update_latencies.clear()
+        self._tick_durations.clear()
+        self._tick_delays.clear()
+        self._replayer.diff_send_times.clear()
+        rss_start = self._process.memory_info().rss
+        first_update_id = self._replayer.last_update_id
+
+        sent = await self._exchange.replay(self._replayer, rate=rate, duration=self._stage_duration)
+        applied_in_time = max(0, order_book.last_diff_uid - first_update_id)
+        backlog = self._replayer.last_update_id - order_book.last_diff_uid
+
+        drain_start = time.perf_counter()
+        while (order_book.last_diff_uid < self._replayer.last_update_id
+               and time.perf_counter() - drain_start < self._drain_timeout):
+            await asyncio.sleep(0.01)
+        drain_time = time.perf_counter() - drain_start
+
+        return {
+            "rate": rate,
+            "messages_sent": sent,
+            "diffs_sent": self._replayer.last_update_id - first_update_id,
+            "processed_rate": applied_in_time / self._stage_duration,
+            "backlog": backlog,
+            "drain_time": drain_time,
+            "drained": order_book.last_diff_uid >= self._replayer.last_update_id,
+            "update_latency": percentiles(self._update_latencies),
+            "update_latency_samples": len(self._update_latencies),
+            "tick_duration": percentiles(self._tick_durations),
+            "tick_delay": percentiles(self._tick_delays),
+            "rss_start": rss_start,
+            "rss_end": self._process.memory_info().rss,
+            "rss_growth": self._process.memory_info().rss - rss_start,
+        }
+
+    async def _run_order_placement(self) -> Dict[str, Any]:
+        round_trips = []
+        price = Decimal("90")
+        for _ in range(self._order_count):
+            start = time.perf_counter()
+            order_id = self._connector.buy(self._trading_pair, Decimal("1"), OrderType.LIMIT, price)
+            created = self._order_created.setdefault(order_id, asyncio.get_event_loop().create_future())
+            await asyncio.wait_for(created, timeout=10)
+            round_trips.append(time.perf_counter() - start)
+        await self._connector.cancel_all(timeout_seconds=10)
+        self._order_created.clear()
+        return {
+            "orders": len(round_trips),
+            "round_trip": percentiles(round_trips),
+            "stages": {
+                stage: {f"p{point}": value for point, value in values.items()}
+                for stage, values in self._connector.order_latency_tracker.stage_percentiles(PERCENTILES).items()
+            },
+        }
+
+    async def _tick_loop(self):
+        next_tick = time.perf_counter() + self._tick_interval
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+            start = time.perf_counter()
+            self._tick_delays.append(start - next_tick)
+            self._connector.tick(time.time())
+            self._tick_durations.append(time.perf_counter() - start)
+            next_tick += self._tick_interval
+
+    def _on_top_levels_change(self, order_book: OrderBook):
+        sent_time = self._replayer.diff_send_times.pop(order_book.last_diff_uid, None)
+        if sent_time is not None:
+            self._update_latencies.append(time.perf_counter() - sent_time)
+
+    def _on_buy_order_created(self, event: BuyOrderCreatedEvent):
+        created = self._order_created.setdefault(event.order_id, asyncio.get_event_loop().create_future())
+        if not created.done():
+            created.set_result(event)
+
+    def _throughput_limit(self, stages: List[Dict[str, Any]]) -> Optional[float]:
+        sustained = [
+            stage["rate"] for stage in stages
+            if stage["processed_rate"] >= 0.95 * stage["diffs_sent"] / self._stage_duration
+            and stage["update_latency"].get("p99", float("inf")) <= self._max_latency
+        ]
+        return max(sustained) if sustained else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binance spot connector throughput and latency benchmark")
+    parser.add_argument("--rates", default="100,500,1000,2000,5000",
+                        help="Comma separated stream message rates (messages per second) to replay")
+    parser.add_argument("--stage-duration", type=float, default=10.0, help="Seconds each rate is replayed")
+    parser.add_argument("--tick-interval", type=float, default=1.0, help="Seconds between connector ticks")
+    parser.add_argument("--orders", type=int, default=100, help="Number of orders placed to measure round trips")
+    parser.add_argument("--max-latency", type=float, default=0.1,
+                        help="Maximum p99 order book update latency (seconds) of a sustained rate")
+    parser.add_argument("--recording", default=None,
+                        help="File with one recorded Binance diff or trade stream message per line")
+    parser.add_argument("--output", default="benchmark_results.json", help="File the JSON results are written to")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    benchmark = ConnectorBenchmark(
+        rates=[float(rate) for rate in args.rates.split(",")],
+        stage_duration=args.stage_duration,
+        tick_interval=args.tick_interval,
+        order_count=args.orders,
+        max_latency=args.max_latency,
+        recording=args.recording,
+    )
+    ev_loop = asyncio.get_event_loop()
+    try:
+        results = ev_loop.run_until_complete(benchmark.run())
+    finally:
+        # The tasks cancelled when the connector network stops have to finish before the loop is closed
+        pending_tasks = asyncio.all_tasks(ev_loop)
+        for task in pending_tasks:
+            task.cancel()
+        ev_loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+        ev_loop.run_until_complete(ev_loop.shutdown_asyncgens())
+        ev_loop.close()
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+    print(f"Throughput limit: {results['throughput_limit']} messages/s. Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from test.benchmark.stream_replayer import StreamReplayer
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import aiohttp
+
+import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
+from hummingbot.core.mock_api.mock_web_server import MockWebServer
+from hummingbot.core.mock_api.mock_web_socket_server import MockWebSocketServerFactory
+
+
+class MockBinanceExchange:
+    """
+    Local Binance spot exchange used by the benchmarks.
+
+    The REST API is served by MockWebServer with stock responses: every order is accepted and every cancel succeeds.
+    The public and user streams are served by MockWebSocketServer, and the public stream replays diff and trade
+    messages with a StreamReplayer from the websocket server event loop, so the replay does not compete with the
+    connector for its event loop.
+    """
+
+    HOST = "api.binance.com"
+    LISTEN_KEY = "benchmarkListenKey"
+
+    def __init__(self, base_asset: str, quote_asset: str, mid_price: float = 100.0, domain: str = "com"):
+        self._base_asset = base_asset
+        self._quote_asset = quote_asset
+        self._symbol = f"{base_asset}{quote_asset}"
+        self._mid_price = mid_price
+        self._domain = domain
+        self._web_app: Optional[MockWebServer] = None
+        self._patchers: List[Any] = []
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @property
+    def public_stream_url(self) -> str:
+        return CONSTANTS.WSS_URL.format(self._domain)
+
+    @property
+    def user_stream_url(self) -> str:
+        return f"{CONSTANTS.WSS_URL.format(self._domain)}/{self.LISTEN_KEY}"
+
+    async def start(self):
+        """
+        Starts the REST and websocket servers and reroutes the Binance connector requests to them.
+        Must be called before the connector is created.
+        """
+        self._web_app = MockWebServer.get_instance()
+        self._web_app.start()
+        await self._web_app.wait_til_started()
+        self._add_stock_responses()
+
+        rest_url = f"http://{MockWebServer.host}:{self._web_app.port}/api.binance.{{}}/api/"
+        self._patchers = [
+            patch.object(CONSTANTS, "REST_URL", rest_url),
+            patch.object(
+                aiohttp.ClientSession,
+                "ws_connect",
+                autospec=True,
+                side_effect=MockWebSocketServerFactory.reroute_ws_connect,
+            ),
+        ]
+        for patcher in self._patchers:
+            patcher.start()
+
+        for url in (self.public_stream_url, self.user_stream_url):
+            ws_server = MockWebSocketServerFactory.start_new_server(url)
+            await ws_server.wait_til_started()
+
+    async def stop(self):
+        """
+        Shuts down the REST and websocket servers and waits until their threads are done, so none of their tasks is
+        left pending when the process exits.
+        """
+        for patcher in self._patchers:
+            patcher.stop()
+        self._patchers = []
+        loop = asyncio.get_event_loop()
+        for url in (self.public_stream_url, self.user_stream_url):
+            ws_server = MockWebSocketServerFactory.get_ws_server(url)
+            if ws_server is None or not ws_server.started:
+                continue
+            if ws_server.websocket is not None:
+                # The server closes its websocket on shutdown, it can only be cleaned up once a client connected
+                await self._run_on_server_loop(url, ws_server._runner.cleanup())
+            ws_server.ev_loop.call_soon_threadsafe(ws_server.ev_loop.stop)
+            await loop.run_in_executor(None, ws_server._thread.join)
+        MockWebSocketServerFactory._ws_servers.clear()
+        if self._web_app is not None:
+            await asyncio.wrap_future(self._web_app.stop())
+            await loop.run_in_executor(None, self._web_app.join)
+            self._web_app = None
+
+    async def wait_til_connected(self):
+        """
+        Waits until the connector opened the public and user streams, and sends a first user stream message so the
+        connector user stream is considered initialized.
+        """
+        loop = asyncio.get_event_loop()
+        for url in (self.public_stream_url, self.user_stream_url):
+            ws_server = MockWebSocketServerFactory.get_ws_server(url)
+            await loop.run_in_executor(None, ws_server.wait_til_websocket_is_initialized)
+        await self._run_on_server_loop(
+            self.user_stream_url,
+            MockWebSocketServerFactory.send_json(
+                self.user_stream_url,
+                {"e": "outboundAccountPosition", "E": int(time.time() * 1e3), "u": int(time.time() * 1e3), "B": []},
+            ),
+        )
+
+    async def replay(self, replayer: StreamReplayer, rate: float, duration: float) -> int:
+        """
+        Replays the public stream messages at `rate` messages per second during `duration` seconds.
+        :return: the number of messages sent
+        """
+        ws_server = MockWebSocketServerFactory.get_ws_server(self.public_stream_url)
+        return await self._run_on_server_loop(
+            self.public_stream_url,
+            replayer.replay(send=ws_server.websocket.send_str, rate=rate, duration=duration),
+        )
+
+    async def _run_on_server_loop(self, url: str, coroutine) -> Any:
+        ws_server = MockWebSocketServerFactory.get_ws_server(url)
+        future = asyncio.run_coroutine_threadsafe(coroutine, ws_server.ev_loop)
+        return await asyncio.wrap_future(future)
+
+    def _add_stock_responses(self):
+        timestamp_ms = int(time.time() * 1e3)
+        responses: Dict[tuple, Any] = {
+            ("GET", "/api/v3/ping"): {},
+            ("GET", "/api/v3/time"): {"serverTime": timestamp_ms},
+            ("GET", "/api/v3/exchangeInfo"): self._exchange_info(),
+            ("GET", "/api/v3/depth"): self._order_book_snapshot(),
+            ("GET", "/api/v3/ticker/24hr"): {"symbol": self._symbol, "lastPrice": str(self._mid_price)},
+            ("GET", "/api/v3/account"): {
+                "balances": [
+                    {"asset": self._base_asset, "free": "1000000", "locked": "0"},
+                    {"asset": self._quote_asset, "free": "100000000", "locked": "0"},
+                ],
+            },
+            ("GET", "/api/v3/myTrades"): [],
+            ("POST", "/api/v3/order"): {
+                "symbol": self._symbol,
+                "orderId": 1,
+                "transactTime": timestamp_ms,
+                "status": "NEW",
+            },
+            ("GET", "/api/v3/order"): {
+                "symbol": self._symbol,
+                "orderId": 1,
+                "status": "NEW",
+                "updateTime": timestamp_ms,
+            },
+            ("DELETE", "/api/v3/order"): {"symbol": self._symbol, "orderId": 1, "status": "CANCELED"},
+            ("POST", "/api/v3/userDataStream"): {"listenKey": self.LISTEN_KEY},
+            ("PUT", "/api/v3/userDataStream"): {},
+        }
+        for (method, path), data in responses.items():
+            self._web_app.update_response(method, self.HOST, path, data)
+
+    def _exchange_info(self) -> Dict[str, Any]:
+        return {
+            "symbols": [
+                {
+                    "symbol": self._symbol,
+                    "status": "TRADING",
+                    "baseAsset": self._base_asset,
+                    "quoteAsset": self._quote_asset,
+                    "permissionSets": [["SPOT"]],
+                    "orderTypes": ["LIMIT", "LIMIT_MAKER", "MARKET"],
+                    "filters": [
+                        {"filterType": "PRICE_FILTER", "minPrice": "0.01", "maxPrice": "1000000", "tickSize": "0.01"},
+                        {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000000", "stepSize": "0.001"},
+                        {"filterType": "NOTIONAL", "minNotional": "0.01"},
+                    ],
+                }
+            ]
+        }
+
+    def _order_book_snapshot(self, depth: int = 20) -> Dict[str, Any]:
+        return {
+            "lastUpdateId": 1,
+            "bids": [[f"{self._mid_price - 0.01 * (level + 2):.8f}", "1"] for level in range(depth)],
+            "asks": [[f"{self._mid_price + 0.01 * (level + 2):.8f}", "1"] for level in range(depth)],
+        }
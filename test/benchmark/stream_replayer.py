@@ -0,0 +1,138 @@
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+DIFF_EVENT_TYPE = "depthUpdate"
+TRADE_EVENT_TYPE = "trade"
+
+
+class StreamReplayer:
+    """
+    Replays Binance order book diff and trade stream messages at a configurable rate.
+
+    The messages are taken from a recording (one raw stream message per line, looped when exhausted) or generated.
+    Generated diffs alternate the best bid and best ask on every message, so every diff changes the top of the book.
+    The update ids, trade ids, event times and symbol of every message are rewritten, so the replayed stream is
+    continuous after the order book snapshot. The send time of every diff is kept by update id to measure how long
+    it takes until the diff is applied to the order book.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        recorded_messages: Optional[List[Dict[str, Any]]] = None,
+        mid_price: float = 100.0,
+        tick_size: float = 0.01,
+        trade_ratio: int = 10,
+        first_update_id: int = 2,
+    ):
+        self._symbol = symbol
+        self._recorded_messages = recorded_messages
+        self._mid_price = mid_price
+        self._tick_size = tick_size
+        self._trade_ratio = trade_ratio
+        self._next_update_id = first_update_id
+        self._next_trade_id = 1
+        self._generated_count = 0
+        self._generated_diffs = 0
+        self._messages = self._message_iterator()
+        self.diff_send_times: Dict[int, float] = {}
+
+    @staticmethod
+    def load_recording(path: str) -> List[Dict[str, Any]]:
+        """
+        Loads the diff and trade messages of a stream recording with one raw stream message per line.
+        Combined stream messages ({"stream": ..., "data": {...}}) are unwrapped.
+        """
+        messages = []
+        with open(path) as recording:
+            for line in recording:
+                if not line.strip():
+                    continue
+                message = json.loads(line)
+                message = message.get("data", message)
+                if message.get("e") in (DIFF_EVENT_TYPE, TRADE_EVENT_TYPE):
+                    messages.append(message)
+        return messages
+
+    @property
+    def last_update_id(self) -> int:
+        """
+        The update id of the last diff sent.
+        """
+        return self._next_update_id - 1
+
+    def next_message(self) -> Dict[str, Any]:
+        """
+        Returns the next message of the stream, with its ids and times rewritten for the replay.
+        """
+        message = dict(next(self._messages))
+        timestamp_ms = int(time.time() * 1e3)
+        message["s"] = self._symbol
+        message["E"] = timestamp_ms
+        if message["e"] == DIFF_EVENT_TYPE:
+            message["U"] = message["u"] = self._next_update_id
+            self._next_update_id += 1
+        else:
+            message["t"] = self._next_trade_id
+            message["T"] = timestamp_ms
+            self._next_trade_id += 1
+        return message
+
+    async def replay(self, send: Callable[[str], Awaitable[Any]], rate: float, duration: float) -> int:
+        """
+        Sends messages through `send` at `rate` messages per second during `duration` seconds. When the sender falls
+        behind, the pending messages are sent in a burst to keep the average rate.
+        :return: the number of messages sent
+        """
+        sent = 0
+        start = time.perf_counter()
+        while True:
+            elapsed = time.perf_counter() - start
+            if elapsed >= duration:
+                break
+            due = int(elapsed * rate) + 1
+            while sent < due:
+                message = self.next_message()
+                payload = json.dumps(message)
+                if message["e"] == DIFF_EVENT_TYPE:
+                    self.diff_send_times[message["u"]] = time.perf_counter()
+                await send(payload)
+                sent += 1
+            await asyncio.sleep(max(0.0, sent / rate - (time.perf_counter() - start)))
+        return sent
+
+    def _message_iterator(self) -> Iterator[Dict[str, Any]]:
+        if self._recorded_messages:
+            while True:
+                for message in self._recorded_messages:
+                    yield message
+        else:
+            while True:
+                yield self._generate_message()
+
+    def _generate_message(self) -> Dict[str, Any]:
+        index = self._generated_count
+        self._generated_count += 1
+        if self._trade_ratio > 0 and index % self._trade_ratio == self._trade_ratio - 1:
+            return {
+                "e": TRADE_EVENT_TYPE,
+                "p": f"{self._mid_price:.8f}",
+                "q": "1",
+                "m": index % 2 == 0,
+            }
+        # The inner levels are added and removed alternately, so the best bid and ask change with every diff
+        inner_amount = "1" if self._generated_diffs % 2 == 0 else "0"
+        self._generated_diffs += 1
+        return {
+            "e": DIFF_EVENT_TYPE,
+            "b": [
+                [f"{self._mid_price - self._tick_size:.8f}", inner_amount],
+                [f"{self._mid_price - 2 * self._tick_size:.8f}", "1"],
+            ],
+            "a": [
+                [f"{self._mid_price + self._tick_size:.8f}", inner_amount],
+                [f"{self._mid_price + 2 * self._tick_size:.8f}", "1"],
+            ],
+        }
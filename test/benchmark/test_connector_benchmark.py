@@ -0,0 +1,31 @@
+import json
+import subprocess
+import sys
+import tempfile
+from os.path import abspath, dirname, exists, join
+from unittest import TestCase
+
+
+class ConnectorBenchmarkTests(TestCase):
+
+    def test_benchmark_runs_end_to_end_and_writes_results(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = join(temp_dir, "results.json")
+
+            # The benchmark closes its event loop when done, so it runs in its own process
+            process = subprocess.run(
+                [sys.executable, "-m", "test.benchmark.connector_benchmark", "--rates", "100", "--stage-duration", "1",
+                 "--orders", "2", "--output", output],
+                cwd=dirname(dirname(dirname(abspath(__file__)))),
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+
+            self.assertEqual(0, process.returncode, process.stderr)
+            self.assertTrue(exists(output))
+            with open(output) as results_file:
+                results = json.load(results_file)
+            self.assertEqual([100.0], [stage["rate"] for stage in results["stages"]])
+            self.assertNotIn("Task was destroyed but it is pending", process.stderr)
+            self.assertNotIn("Event loop is closed", process.stderr)
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import tempfile
+from test.benchmark.stream_replayer import StreamReplayer
+from unittest import TestCase
+
+
+class StreamReplayerTests(TestCase):
+
+    def test_generated_diffs_have_consecutive_update_ids(self):
+        replayer = StreamReplayer(symbol="COINALPHAHBOT", trade_ratio=3, first_update_id=2)
+
+        messages = [replayer.next_message() for _ in range(6)]
+
+        diffs = [message for message in messages if message["e"] == "depthUpdate"]
+        trades = [message for message in messages if message["e"] == "trade"]
+        self.assertEqual([2, 3, 4, 5], [diff["U"] for diff in diffs])
+        self.assertEqual([2, 3, 4, 5], [diff["u"] for diff in diffs])
+        self.assertEqual([1, 2], [trade["t"] for trade in trades])
+        self.assertTrue(all(message["s"] == "COINALPHAHBOT" for message in messages))
+        self.assertEqual(5, replayer.last_update_id)
+
+    def test_generated_diffs_change_top_of_book_on_every_diff(self):
+        replayer = StreamReplayer(symbol="COINALPHAHBOT", trade_ratio=2)
+
+        diffs = [message for message in (replayer.next_message() for _ in range(8)) if message["e"] == "depthUpdate"]
+
+        inner_bid_amounts = [diff["b"][0][1] for diff in diffs]
+        self.assertEqual(["1", "0", "1", "0"], inner_bid_amounts)
+
+    def test_recorded_messages_are_looped_and_rewritten(self):
+        recording = [
+            {"e": "depthUpdate", "s": "BTCUSDT", "U": 100, "u": 105, "b": [["10", "1"]], "a": []},
+            {"e": "trade", "s": "BTCUSDT", "t": 7, "p": "10", "q": "1", "m": True},
+        ]
+        replayer = StreamReplayer(symbol="COINALPHAHBOT", recorded_messages=recording, first_update_id=2)
+
+        messages = [replayer.next_message() for _ in range(4)]
+
+        self.assertEqual(["depthUpdate", "trade", "depthUpdate", "trade"], [message["e"] for message in messages])
+        self.assertEqual(2, messages[0]["u"])
+        self.assertEqual(3, messages[2]["u"])
+        self.assertEqual(2, messages[3]["t"])
+        self.assertEqual(105, recording[0]["u"])
+
+    def test_load_recording_unwraps_combined_stream_messages(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl") as recording:
+            recording.write(json.dumps({"stream": "btcusdt@depth", "data": {"e": "depthUpdate", "u": 1}}) + "\n")
+            recording.write("\n")
+            recording.write(json.dumps({"result": None, "id": 1}) + "\n")
+            recording.write(json.dumps({"e": "trade", "t": 1}) + "\n")
+            recording.flush()
+
+            messages = StreamReplayer.load_recording(recording.name)
+
+        self.assertEqual([{"e": "depthUpdate", "u": 1}, {"e": "trade", "t": 1}], messages)
+
+    def test_replay_keeps_diff_send_times(self):
+        replayer = StreamReplayer(symbol="COINALPHAHBOT", trade_ratio=0, first_update_id=2)
+        sent_payloads = []
+
+        async def send(payload: str):
+            sent_payloads.append(json.loads(payload))
+
+        sent = asyncio.new_event_loop().run_until_complete(replayer.replay(send=send, rate=100, duration=0.05))
+
+        self.assertEqual(sent, len(sent_payloads))
+        self.assertGreater(sent, 0)
+        self.assertEqual({payload["u"] for payload in sent_payloads}, set(replayer.diff_send_times))
@@ -99,6 +99,14 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | False                |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | db_archive                        |                      |\n"
+                           "    | ∟ db_archive_enabled              | False                |\n"
+                           "    | ∟ db_archive_hot_months           | 3                    |\n"
+                           "    | perf_metrics                      |                      |\n"
+                           "    | ∟ perf_metrics_enabled            | False                |\n"
+                           "    | ∟ perf_metrics_port               | 9464                 |\n"
+                           "    | ∟ perf_metrics_tick_sampling      | 1                    |\n"
+                           "    | ∟ perf_metrics_loop_lag_interval  | 1.0                  |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
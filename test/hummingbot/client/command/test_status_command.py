@@ -74,3 +74,12 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_runtime_metrics_status_when_metrics_disabled(self):
+        self.async_run_with_timeout(self.app.runtime_metrics_status())
+
+        self.assertTrue(
+            self.cli_mock_assistant.check_log_called_with(
+                msg="Performance metrics are disabled. Enable them with `config perf_metrics`."
+            )
+        )
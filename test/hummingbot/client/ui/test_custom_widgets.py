@@ -1,12 +1,13 @@
 import asyncio
 import unittest
 from typing import Awaitable
+from unittest.mock import patch
 
 from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +92,57 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+    def test_log_keeps_only_max_line_count_lines(self):
+        text_area = CustomTextArea(max_line_count=3, initial_text="first")
+
+        for index in range(5):
+            text_area.log(f"line {index}")
+
+        self.assertEqual(["line 2", "line 3", "line 4"], list(text_area.log_lines))
+        self.assertEqual("line 2\nline 3\nline 4", text_area.document.text)
+
+    def test_log_appends_new_lines_to_the_document(self):
+        text_area = CustomTextArea(max_line_count=4, initial_text="first")
+
+        text_area.log("second\nthird")
+        rendered_text = text_area.document.text
+        text_area.log("fourth")
+        self.assertEqual("first\nsecond\nthird\nfourth", text_area.document.text)
+        self.assertTrue(text_area.document.text.startswith(rendered_text))
+
+        text_area.log("fifth\nsixth")
+        self.assertEqual("third\nfourth\nfifth\nsixth", text_area.document.text)
+
+        for index in range(5):
+            text_area.log(f"silent {index}", silent=True)
+        text_area.log("last")
+        self.assertEqual("\n".join(text_area.log_lines), text_area.document.text)
+        self.assertEqual("last", text_area.document.lines[-1])
+
+    def test_log_without_saving_shows_only_new_text(self):
+        text_area = CustomTextArea(max_line_count=3, initial_text="first")
+
+        text_area.log("live status", save_log=False)
+        self.assertEqual("live status", text_area.document.text)
+        text_area.log("silent line", silent=True)
+        self.assertEqual("live status", text_area.document.text)
+        text_area.log("second")
+        self.assertEqual("first\nsilent line\nsecond", text_area.document.text)
+
+    def test_log_refreshes_document_once_per_interval_when_loop_is_running(self):
+        text_area = CustomTextArea(max_line_count=100, initial_text="first", refresh_interval=0.01)
+
+        async def log_lines():
+            with patch.object(text_area, "_refresh_document", wraps=text_area._refresh_document) as refresh_mock:
+                for index in range(50):
+                    text_area.log(f"line {index}")
+                self.assertEqual("first", text_area.document.text)
+                await asyncio.sleep(0.05)
+                self.assertEqual(1, refresh_mock.call_count)
+
+        self.async_run_with_timeout(log_lines())
+
+        self.assertEqual(51, len(text_area.document.lines))
+        self.assertEqual("line 49", text_area.document.lines[-1])
+        self.assertEqual(len(text_area.document.text), text_area.document.cursor_position)
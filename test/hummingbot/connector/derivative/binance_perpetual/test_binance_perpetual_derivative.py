@@ -461,6 +461,33 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
 
         self.assertEqual(len(self.exchange.account_positions), 0)
 
+    @aioresponses()
+    def test_streamed_positions_only_requested_on_reconciliation(self, req_mock):
+        self._simulate_trading_rules_initialized()
+
+        url = web_utils.private_rest_url(
+            CONSTANTS.POSITION_INFORMATION_URL, domain=self.domain
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        positions = self._get_position_risk_api_endpoint_single_position_list()
+        req_mock.get(regex_url, body=json.dumps(positions), repeat=True)
+
+        self.async_run_with_timeout(self.exchange._reconcile_positions())
+        self.exchange._set_current_timestamp(
+            self.exchange.current_timestamp + self.exchange.POSITIONS_RECONCILIATION_INTERVAL - 1
+        )
+        self.async_run_with_timeout(self.exchange._reconcile_positions())
+
+        position_requests = [key for key in req_mock.requests if regex_url.match(str(key[1]))]
+        self.assertEqual(1, sum(len(req_mock.requests[key]) for key in position_requests))
+
+        self.exchange._perpetual_trading._out_of_sync_position_pairs.add(self.trading_pair)
+        self.async_run_with_timeout(self.exchange._reconcile_positions())
+
+        position_requests = [key for key in req_mock.requests if regex_url.match(str(key[1]))]
+        self.assertEqual(2, sum(len(req_mock.requests[key]) for key in position_requests))
+        self.assertEqual(set(), self.exchange._perpetual_trading.out_of_sync_position_pairs)
+
     @aioresponses()
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_new_account_position_detected_on_stream_event(self, mock_api, ws_connect_mock):
@@ -24,6 +24,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import BuyOrderCreatedEvent, SellOrderCreatedEvent
 from hummingbot.core.network_iterator import NetworkStatus
@@ -1790,3 +1791,90 @@ class HyperliquidPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.Perpe
                 f"at {Decimal('10000')}."
             )
         )
+
+    @aioresponses()
+    def test_batch_order_create_sends_all_orders_in_one_signed_action(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = self.order_creation_url
+        mock_api.post(url, body=json.dumps({'status': 'ok', 'response': {'type': 'order', 'data': {
+            'statuses': [{'resting': {'oid': self.expected_exchange_order_id}},
+                         {'filled': {'oid': self.expected_exchange_order_id + "1"}},
+                         {'resting': {'oid': self.expected_exchange_order_id + "2"}}]}}}))
+
+        orders = [
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=is_buy,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100"), position=position)
+            for is_buy, position in ((True, PositionAction.OPEN),
+                                     (False, PositionAction.CLOSE),
+                                     (True, PositionAction.NIL))
+        ]
+        orders = [order.copy_with_id(client_order_id=self.exchange._new_hex_order_id(
+            is_buy=order.is_buy, trading_pair=order.trading_pair)) for order in orders]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual(["r", "s", "v"], sorted(request_data["signature"]))
+        self.assertEqual([order.client_order_id for order in orders],
+                         [order_wire["c"] for order_wire in request_data["action"]["orders"]])
+        self.assertEqual([False, True, False],
+                         [order_wire["r"] for order_wire in request_data["action"]["orders"]])
+
+        self.assertEqual(str(self.expected_exchange_order_id),
+                         self.exchange.in_flight_orders[orders[0].client_order_id].exchange_order_id)
+        self.assertEqual(PositionAction.CLOSE, self.exchange.in_flight_orders[orders[1].client_order_id].position)
+        # Orders without position action open a position
+        self.assertEqual(PositionAction.OPEN, self.exchange.in_flight_orders[orders[2].client_order_id].position)
+
+    def test_batch_order_with_invalid_position_action_fails(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        in_flight_order = self.exchange._start_tracking_and_validate_order(
+            trade_type=TradeType.BUY,
+            order_id="0x1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+            price=Decimal("10000"),
+            position_action=PositionAction.NIL,
+        )
+
+        self.assertIsNone(in_flight_order)
+        self.assertNotIn("0x1", self.exchange.in_flight_orders)
+        self.assertEqual("0x1", self.order_failure_logger.event_log[0].order_id)
+        self.assertTrue(self.is_logged(
+            "ERROR", "Invalid position action PositionAction.NIL for order 0x1. The order will not be created."))
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_all_cancels_in_one_signed_action(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        for order_number in ("1", "2"):
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + order_number,
+                exchange_order_id=self.exchange_order_id_prefix + order_number,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+                position_action=PositionAction.OPEN,
+            )
+        orders = [order.to_limit_order() for order in self.exchange.in_flight_orders.values()]
+        url = web_utils.public_rest_url(CONSTANTS.CANCEL_ORDER_URL)
+        mock_api.post(url, body=json.dumps({'status': 'ok', 'response': {'type': 'cancel', 'data': {
+            'statuses': ['success', 'success']}}}))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(orders_to_cancel=orders))
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        request_data = json.loads(cancel_requests[0].kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders],
+                         [cancel["cloid"] for cancel in request_data["action"]["cancels"]])
+        self.assertEqual([CancellationResult(order.client_order_id, True) for order in orders], results)
+        self.assertEqual(2, len(self.order_cancelled_logger.event_log))
@@ -12,6 +12,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.pre_trade_risk_engine import PreTradeRiskLimits
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -19,6 +20,7 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
+from hummingbot.core.utils.latency_tracer import current_order_latency_trace
 
 
 class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -1157,6 +1159,83 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    @aioresponses()
+    def test_create_order_registers_latency_trace_when_tracing_enabled(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.enable_order_latency_tracing(max_records=10)
+
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response))
+
+        self.async_run_with_timeout(self.exchange._create_order(
+            trade_type=TradeType.BUY,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+            price=Decimal("10000"),
+        ))
+
+        self.assertEqual(1, len(self.exchange.order_latency_tracker.traces))
+        trace = self.exchange.order_latency_tracker.traces[0]
+        self.assertEqual("OID1", trace.client_order_id)
+        self.assertEqual(
+            {"validate", "throttle_wait", "sign", "send", "ack"},
+            {stage.value for stage in trace.stages})
+        self.assertIn("send", self.exchange.order_latency_tracker.stage_percentiles())
+
+        self.exchange.disable_order_latency_tracing()
+        self.assertIsNone(self.exchange.order_latency_tracker)
+
+    @aioresponses()
+    def test_create_order_resets_latency_trace_of_the_task(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.enable_order_latency_tracing(max_records=10)
+
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response))
+
+        async def create_order_and_get_current_trace():
+            await self.exchange._create_order(
+                trade_type=TradeType.BUY,
+                order_id="OID1",
+                trading_pair=self.trading_pair,
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+                price=Decimal("10000"),
+            )
+            return current_order_latency_trace.get()
+
+        self.assertIsNone(self.async_run_with_timeout(create_order_and_get_current_trace()))
+        self.assertEqual(1, len(self.exchange.order_latency_tracker.traces))
+
+    def test_create_order_rejected_by_pre_trade_risk_checks(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.enable_pre_trade_risk_checks(
+            PreTradeRiskLimits(max_open_notional={self.base_asset: Decimal("1500")}))
+
+        self.async_run_with_timeout(self.exchange._create_order(
+            trade_type=TradeType.BUY,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+            price=Decimal("20"),
+        ))
+
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertTrue(self.is_logged(
+            "WARNING",
+            "Buy order OID1 for 100.000000 COINALPHA-HBOT was rejected by the pre-trade risk checks: the open "
+            "notional of COINALPHA would be 2000.0000000000 HBOT (limit 1500)."))
+
+        self.exchange.disable_pre_trade_risk_checks()
+        self.assertIsNone(self.exchange.pre_trade_risk_engine)
+
     def test_format_trading_rules__min_notional_present(self):
         trading_rules = [{
             "symbol": "COINALPHAHBOT",
@@ -54,3 +54,33 @@ class HyperliquidAuthTests(TestCase):
         self.assertEqual(4, len(params))
         self.assertEqual(None, params.get("vaultAddress"))
         self.assertEqual("order", params.get("action")["type"])
+
+    @patch(
+        "hummingbot.connector.exchange.hyperliquid.hyperliquid_auth.HyperliquidAuth._get_timestamp")
+    def test_sign_multiple_orders_in_one_action(self, ts_mock: MagicMock):
+        order = {
+            "asset": 4,
+            "isBuy": True,
+            "limitPx": 1201,
+            "sz": 0.01,
+            "reduceOnly": False,
+            "orderType": {"limit": {"tif": "Gtc"}},
+            "cloid": "0x000000000000000000000000000ee056",
+        }
+        params = {
+            "type": "order",
+            "grouping": "na",
+            "orders": [order, dict(order, isBuy=False, cloid="0x000000000000000000000000000ee057")],
+        }
+        request = RESTRequest(
+            method=RESTMethod.POST,
+            url="https://test.url/exchange",
+            data=json.dumps(params),
+            is_auth_required=True,
+        )
+        ts_mock.return_value = self._get_timestamp()
+
+        self.async_run_with_timeout(self.auth.rest_authenticate(request))
+        params = json.loads(request.data)
+        self.assertEqual([True, False], [order_wire["b"] for order_wire in params["action"]["orders"]])
+        self.assertEqual(["r", "s", "v"], sorted(params["signature"]))
@@ -22,6 +22,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
@@ -1826,3 +1827,66 @@ class HyperliquidExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorT
             "INFO",
             f"Recreating missing trade in TradeFill: {trade_fill_non_tracked_order}"
         ))
+
+    @aioresponses()
+    def test_batch_order_create_sends_all_orders_in_one_signed_action(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = self.order_creation_url
+        mock_api.post(url, body=json.dumps({'status': 'ok', 'response': {'type': 'order', 'data': {
+            'statuses': [{'resting': {'oid': self.expected_exchange_order_id}},
+                         {'error': 'Insufficient margin to place order.'}]}}}))
+
+        orders = [
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=is_buy,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100"))
+            for is_buy in (True, False)
+        ]
+        orders = [order.copy_with_id(client_order_id=self.exchange._new_hex_order_id(
+            is_buy=order.is_buy, trading_pair=order.trading_pair)) for order in orders]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual(["r", "s", "v"], sorted(request_data["signature"]))
+        self.assertEqual([order.client_order_id for order in orders],
+                         [order_wire["c"] for order_wire in request_data["action"]["orders"]])
+        self.assertEqual([True, False], [order_wire["b"] for order_wire in request_data["action"]["orders"]])
+
+        created_order = self.exchange.in_flight_orders[orders[0].client_order_id]
+        self.assertEqual(str(self.expected_exchange_order_id), created_order.exchange_order_id)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(orders[1].client_order_id, self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_sends_all_cancels_in_one_signed_action(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        for order_number in ("1", "2"):
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + order_number,
+                exchange_order_id=self.exchange_order_id_prefix + order_number,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [order.to_limit_order() for order in self.exchange.in_flight_orders.values()]
+        url = web_utils.public_rest_url(CONSTANTS.CANCEL_ORDER_URL)
+        mock_api.post(url, body=json.dumps({'status': 'ok', 'response': {'type': 'cancel', 'data': {
+            'statuses': ['success', {'error': 'Order was never placed, already canceled, or filled.'}]}}}))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(orders_to_cancel=orders))
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        request_data = json.loads(cancel_requests[0].kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders],
+                         [cancel["cloid"] for cancel in request_data["action"]["cancels"]])
+        self.assertEqual([CancellationResult(orders[0].client_order_id, True),
+                          CancellationResult(orders[1].client_order_id, False)], results)
+        self.assertNotIn(orders[0].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(orders[0].client_order_id, self.order_cancelled_logger.event_log[0].order_id)
@@ -0,0 +1,107 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from pyinjective.composer import injective_exchange_tx_pb
+from pyinjective.proto.cosmos.base.v1beta1.coin_pb2 import Coin
+
+from hummingbot.connector.exchange.injective_v2 import injective_constants as CONSTANTS
+from hummingbot.connector.exchange.injective_v2.data_sources.injective_transaction_pipeline import (
+    InjectiveTransactionPipeline,
+)
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+
+
+class InjectiveTransactionPipelineTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.sequence = 10
+        self.data_source = MagicMock()
+        self.data_source.trading_account_sequence = AsyncMock(side_effect=self._next_sequence)
+        self.data_source.trading_account_number = AsyncMock(return_value=1)
+        self.data_source.timeout_height = AsyncMock(return_value=1000)
+        self.data_source.injective_chain_id = "injective-1"
+        self.data_source.throttler = AsyncThrottler(rate_limits=CONSTANTS.PUBLIC_NODE_RATE_LIMITS)
+        self.data_source._time.return_value = 1640001112.223
+        self.data_source._configure_gas_fee_for_transaction = AsyncMock(side_effect=self._configure_gas_fee)
+        self.data_source._sign_and_encode.return_value = b"signed"
+        self.data_source.query_executor.send_tx_sync_mode = AsyncMock(
+            return_value={"code": 0, "txhash": "HASH1", "rawLog": "[]"})
+        self.data_source.set_trading_account_sequence.side_effect = self._set_sequence
+
+        self.pipeline = InjectiveTransactionPipeline(data_source=self.data_source, coalescing_window=0.01)
+        self.creation_message = injective_exchange_tx_pb.MsgBatchUpdateOrders(sender="inj1sender")
+        self.cancel_message = injective_exchange_tx_pb.MsgBatchCancelSpotOrders(sender="inj1sender")
+
+    def _next_sequence(self) -> int:
+        sequence = self.sequence
+        self.sequence += 1
+        return sequence
+
+    def _set_sequence(self, sequence: int):
+        self.sequence = sequence
+
+    @staticmethod
+    def _configure_gas_fee(transaction):
+        transaction.with_gas(gas=100_000)
+        transaction.with_fee(fee=[Coin(amount="50000000000000", denom="inj")])
+
+    async def test_requests_in_coalescing_window_sent_in_one_transaction(self):
+        creation_result, cancel_result = await asyncio.gather(
+            self.pipeline.send(messages=[self.creation_message], orders_count=2),
+            self.pipeline.send(messages=[self.cancel_message], orders_count=1),
+        )
+
+        self.assertEqual("HASH1", creation_result["txhash"])
+        self.assertEqual(creation_result, cancel_result)
+        self.data_source.query_executor.send_tx_sync_mode.assert_awaited_once()
+        transaction = self.data_source._sign_and_encode.call_args.kwargs["transaction"]
+        self.assertEqual(2, len(transaction.msgs))
+        self.assertEqual(10, transaction.sequence)
+
+    async def test_gas_estimation_reused_for_same_messages(self):
+        await self.pipeline.send(messages=[self.creation_message], orders_count=2)
+        await self.pipeline.send(messages=[self.creation_message], orders_count=2)
+
+        self.assertEqual(1, self.data_source._configure_gas_fee_for_transaction.await_count)
+        transaction = self.data_source._sign_and_encode.call_args.kwargs["transaction"]
+        self.assertEqual(100_000, transaction.fee.gas_limit)
+        self.assertEqual(11, transaction.sequence)
+
+        await self.pipeline.send(messages=[self.creation_message], orders_count=3)
+
+        self.assertEqual(2, self.data_source._configure_gas_fee_for_transaction.await_count)
+
+    async def test_rejected_transaction_restores_sequence(self):
+        self.data_source.query_executor.send_tx_sync_mode.return_value = {
+            "code": 5, "txhash": "HASH1", "rawLog": "insufficient funds"}
+
+        result = await self.pipeline.send(messages=[self.creation_message], orders_count=1)
+
+        self.assertEqual(5, result["code"])
+        self.assertEqual(10, self.sequence)
+        self.data_source.initialize_trading_account.assert_not_called()
+
+    async def test_sequence_mismatch_sets_expected_sequence(self):
+        self.data_source.query_executor.send_tx_sync_mode.return_value = {
+            "code": 32,
+            "txhash": "HASH1",
+            "rawLog": "account sequence mismatch, expected 15, got 10: incorrect account sequence"}
+
+        await self.pipeline.send(messages=[self.creation_message], orders_count=1)
+
+        self.assertEqual(15, self.sequence)
+        self.data_source.initialize_trading_account.assert_not_called()
+
+    async def test_broadcast_error_raised_to_all_requests(self):
+        self.data_source.query_executor.send_tx_sync_mode.side_effect = RuntimeError("connection error")
+
+        results = await asyncio.gather(
+            self.pipeline.send(messages=[self.creation_message], orders_count=1),
+            self.pipeline.send(messages=[self.cancel_message], orders_count=1),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertEqual(10, self.sequence)
@@ -1513,6 +1513,53 @@ class XRPLAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertTrue(process_order_update_mock.called)
         self.assertTrue(result)
 
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.safe_ensure_future")
+    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.XrplExchange._place_order")
+    def test_replace_order_failure_restores_replaced_order(self, place_order_mock, safe_ensure_future_mock):
+        place_order_mock.side_effect = Exception("tecUNFUNDED_OFFER")
+        self.connector.start_tracking_order(
+            order_id="hbot",
+            exchange_order_id="1234-4321",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("1"),
+            amount=Decimal("1"),
+            order_type=OrderType.LIMIT,
+        )
+        self.connector._order_tracker.process_order_update(OrderUpdate(
+            client_order_id="hbot",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        ))
+        # The order tracker applies the updates in tasks
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        new_order_id = self.connector.replace_order(self.trading_pair, "hbot", price=Decimal("1.1"))
+        self.async_run_with_timeout(asyncio.sleep(0))
+        replaced_order = self.connector._order_tracker.fetch_order(client_order_id="hbot")
+        self.assertEqual(OrderState.PENDING_CANCEL, replaced_order.current_state)
+
+        self.async_run_with_timeout(safe_ensure_future_mock.call_args[0][0])
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(1234, place_order_mock.call_args.kwargs["offer_sequence"])
+        self.assertTrue(self.connector._order_tracker.fetch_order(client_order_id=new_order_id).is_failure)
+        self.assertEqual(OrderState.OPEN, replaced_order.current_state)
+
+    @patch("hummingbot.connector.exchange_py_base.ExchangePyBase._sleep")
+    def test_verify_transaction_timeout_resets_submission_engine(self, sleep_mock):
+        self.connector._submission_engine._next_sequence = 12
+        self.connector._submission_engine.wait_for_validation = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        verified, response = self.async_run_with_timeout(
+            self.connector._verify_transaction_result({"transaction": MagicMock(), "prelim_result": "tesSUCCESS"})
+        )
+
+        self.assertFalse(verified)
+        self.assertIsNone(response)
+        self.assertIsNone(self.connector._submission_engine._next_sequence)
+
     def test_format_trading_rules(self):
         trading_rules_info = {"XRP-USD": {"base_tick_size": 8, "quote_tick_size": 8, "minimum_order_size": 0.01}}
 
@@ -0,0 +1,154 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from xrpl.asyncio.transaction import XRPLReliableSubmissionException, sign
+from xrpl.asyncio.transaction.main import _LEDGER_OFFSET
+from xrpl.models import OfferCancel, OfferCreate, Response, Transaction
+from xrpl.models.response import ResponseStatus
+from xrpl.wallet import Wallet
+
+from hummingbot.connector.exchange.xrpl.xrpl_submission_engine import XRPLSubmissionEngine
+
+
+class XRPLSubmissionEngineTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.wallet = Wallet.create()
+        self.now = 1640001112.223
+        self.connector = MagicMock()
+        self.connector._time.side_effect = lambda: self.now
+        self.connector._auth.get_wallet.return_value = self.wallet
+        self.connector._auth.get_account.return_value = self.wallet.classic_address
+        self.connector.tx_autofill = AsyncMock(side_effect=self._autofill)
+        self.connector.tx_sign.side_effect = sign
+        self.connector.tx_submit = AsyncMock(return_value=self._submit_response("tesSUCCESS"))
+        self.connector.wait_for_final_transaction_outcome = AsyncMock()
+        self.client = MagicMock()
+        self.account_sequence = 100
+
+        self.engine = XRPLSubmissionEngine(connector=self.connector)
+
+    def _autofill(self, transaction: Transaction, client) -> Transaction:
+        transaction_json = transaction.to_dict()
+        transaction_json.update(sequence=self.account_sequence, fee="24", last_ledger_sequence=1000 + _LEDGER_OFFSET)
+        return Transaction.from_dict(transaction_json)
+
+    @staticmethod
+    def _submit_response(engine_result: str) -> Response:
+        return Response(status=ResponseStatus.SUCCESS,
+                        result={"engine_result": engine_result, "engine_result_message": ""})
+
+    def _cancel_request(self, offer_sequence: int) -> OfferCancel:
+        return OfferCancel(account=self.wallet.classic_address, offer_sequence=offer_sequence)
+
+    def _validated_message(self, transaction: Transaction, result: str = "tesSUCCESS"):
+        return {
+            "type": "transaction",
+            "validated": True,
+            "transaction": {"Account": transaction.account, "Sequence": transaction.sequence,
+                            "hash": transaction.get_hash()},
+            "meta": {"TransactionResult": result, "AffectedNodes": []},
+        }
+
+    async def test_consecutive_transactions_filled_locally(self):
+        first, _ = await self.engine.submit(self._cancel_request(1), self.client)
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1001})
+        second, _ = await self.engine.submit(self._cancel_request(2), self.client)
+        third, _ = await self.engine.submit(self._cancel_request(3), self.client)
+
+        self.assertEqual(1, self.connector.tx_autofill.await_count)
+        self.assertEqual([100, 101, 102], [first.sequence, second.sequence, third.sequence])
+        self.assertEqual("24", third.fee)
+        self.assertEqual(1001 + _LEDGER_OFFSET, third.last_ledger_sequence)
+
+    async def test_rejected_transaction_autofills_next_transaction(self):
+        await self.engine.submit(self._cancel_request(1), self.client)
+        self.connector.tx_submit.return_value = self._submit_response("tefPAST_SEQ")
+        await self.engine.submit(self._cancel_request(2), self.client)
+        self.connector.tx_submit.return_value = self._submit_response("tesSUCCESS")
+        await self.engine.submit(self._cancel_request(3), self.client)
+
+        self.assertEqual(2, self.connector.tx_autofill.await_count)
+
+    async def test_validation_taken_from_stream(self):
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1000})
+        transaction, _ = await self.engine.submit(self._cancel_request(1), self.client)
+
+        validation = asyncio.ensure_future(self.engine.wait_for_validation(transaction, "tesSUCCESS"))
+        await asyncio.sleep(0)
+        self.engine.process_transaction(self._validated_message(transaction))
+        response = await validation
+
+        self.assertEqual(transaction.get_hash(), response.result["hash"])
+        self.connector.wait_for_final_transaction_outcome.assert_not_called()
+
+    async def test_failed_transaction_in_stream_raises(self):
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1000})
+        transaction, _ = await self.engine.submit(self._cancel_request(1), self.client)
+        self.engine.process_transaction(self._validated_message(transaction, result="tecNO_ENTRY"))
+
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await self.engine.wait_for_validation(transaction, "tesSUCCESS")
+
+    async def test_transaction_expired_when_ledger_passes_last_ledger_sequence(self):
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1000})
+        transaction, _ = await self.engine.submit(self._cancel_request(1), self.client)
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": transaction.last_ledger_sequence})
+
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await self.engine.wait_for_validation(transaction, "tesSUCCESS")
+
+    async def test_validation_polled_without_ledger_stream(self):
+        transaction, _ = await self.engine.submit(self._cancel_request(1), self.client)
+
+        await self.engine.wait_for_validation(transaction, "tesSUCCESS")
+
+        self.connector.wait_for_final_transaction_outcome.assert_awaited_once_with(transaction, "tesSUCCESS")
+
+    async def test_expired_transaction_autofills_next_transaction(self):
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1000})
+        expired, _ = await self.engine.submit(self._cancel_request(1), self.client)
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": expired.last_ledger_sequence})
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await self.engine.wait_for_validation(expired, "tesSUCCESS")
+
+        retried, _ = await self.engine.submit(self._cancel_request(1), self.client)
+
+        # The expired transaction did not consume its sequence, the ledger still expects it
+        self.assertEqual(2, self.connector.tx_autofill.await_count)
+        self.assertEqual(self.account_sequence, retried.sequence)
+
+    async def test_failed_transaction_not_consuming_sequence_autofills_next_transaction(self):
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1000})
+        failed, _ = await self.engine.submit(self._cancel_request(1), self.client)
+        self.engine.process_transaction(self._validated_message(failed, result="tefPAST_SEQ"))
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await self.engine.wait_for_validation(failed, "tesSUCCESS")
+
+        await self.engine.submit(self._cancel_request(2), self.client)
+
+        self.assertEqual(2, self.connector.tx_autofill.await_count)
+
+    async def test_failed_transaction_consuming_sequence_keeps_local_sequence(self):
+        self.engine.process_ledger_closed({"type": "ledgerClosed", "ledger_index": 1000})
+        failed, _ = await self.engine.submit(self._cancel_request(1), self.client)
+        self.engine.process_transaction(self._validated_message(failed, result="tecNO_ENTRY"))
+        with self.assertRaises(XRPLReliableSubmissionException):
+            await self.engine.wait_for_validation(failed, "tesSUCCESS")
+
+        next_transaction, _ = await self.engine.submit(self._cancel_request(2), self.client)
+
+        self.assertEqual(1, self.connector.tx_autofill.await_count)
+        self.assertEqual(failed.sequence + 1, next_transaction.sequence)
+
+    async def test_transaction_filled_locally_keeps_its_type(self):
+        await self.engine.submit(self._cancel_request(1), self.client)
+        offer = OfferCreate(account=self.wallet.classic_address, taker_gets="1000000", taker_pays="1000000",
+                            offer_sequence=100)
+
+        transaction, _ = await self.engine.submit(offer, self.client)
+
+        self.assertIsInstance(transaction, OfferCreate)
+        self.assertEqual(100, transaction.offer_sequence)
@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -580,3 +581,69 @@ class BudgetCheckerTest(unittest.TestCase):
 
         self.assertEqual(Decimal("7"), first_adjusted_candidate.amount)
         self.assertEqual(Decimal("5"), second_adjusted_candidate.amount)
+
+    def _grid_candidates(self):
+        candidates = []
+        for level in range(1, 16):
+            for side, price in ((TradeType.BUY, Decimal("2") - Decimal("0.05") * level),
+                                (TradeType.SELL, Decimal("2") + Decimal("0.05") * level)):
+                candidates.append(OrderCandidate(
+                    trading_pair=self.trading_pair,
+                    is_maker=level % 2 == 0,
+                    order_type=OrderType.LIMIT,
+                    order_side=side,
+                    amount=Decimal("1.3") * level,
+                    price=price,
+                ))
+        return candidates
+
+    def _assert_same_candidates(self, expected_candidates, candidates):
+        for expected, candidate in zip(expected_candidates, candidates):
+            self.assertEqual(expected.amount, candidate.amount)
+            self.assertEqual(expected.resized, candidate.resized)
+            self.assertEqual(expected.order_collateral, candidate.order_collateral)
+            self.assertEqual(expected.percent_fee_collateral, candidate.percent_fee_collateral)
+            self.assertEqual(expected.percent_fee_value, candidate.percent_fee_value)
+            self.assertEqual(expected.fixed_fee_collaterals, candidate.fixed_fee_collaterals)
+            self.assertEqual(expected.potential_returns, candidate.potential_returns)
+
+    def test_adjust_candidates_in_batch_same_as_per_candidate(self):
+        self.exchange.set_balance(self.base_asset, Decimal("40"))
+        self.exchange.set_balance(self.quote_asset, Decimal("70"))
+
+        for all_or_none in (True, False):
+            candidates = self._grid_candidates()
+            expected_candidates = [
+                self.budget_checker.adjust_candidate_and_lock_available_collateral(candidate, all_or_none)
+                for candidate in candidates
+            ]
+            self.budget_checker.reset_locked_collateral()
+
+            with patch.object(self.budget_checker, "adjust_candidate_and_lock_available_collateral") as per_candidate:
+                adjusted_candidates = self.budget_checker.adjust_candidates(candidates, all_or_none=all_or_none)
+
+            per_candidate.assert_not_called()
+            self.assertTrue(any(candidate.resized for candidate in adjusted_candidates))
+            self._assert_same_candidates(expected_candidates, adjusted_candidates)
+            # The candidates passed are not modified
+            self.assertEqual(Decimal("1.3"), candidates[0].amount)
+            self.assertIsNone(candidates[0].order_collateral)
+
+    def test_adjust_candidates_with_fixed_fees_sized_per_candidate(self):
+        trade_fee_schema = TradeFeeSchema(
+            maker_percent_fee_decimal=Decimal("0.01"),
+            taker_percent_fee_decimal=Decimal("0.01"),
+            maker_fixed_fees=[TokenAmount(self.quote_asset, Decimal("1"))],
+        )
+        exchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trade_fee_schema=trade_fee_schema)
+        exchange.set_balance(self.base_asset, Decimal("40"))
+        exchange.set_balance(self.quote_asset, Decimal("70"))
+        budget_checker: BudgetChecker = exchange.budget_checker
+
+        with patch.object(budget_checker, "_adjust_candidates_in_batch") as batch:
+            adjusted_candidates = budget_checker.adjust_candidates(self._grid_candidates(), all_or_none=False)
+
+        batch.assert_not_called()
+        self.assertEqual(1, len(adjusted_candidates[2].fixed_fee_collaterals))
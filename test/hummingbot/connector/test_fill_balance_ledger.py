@@ -0,0 +1,61 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.fill_balance_ledger import FillBalanceLedger
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class FillBalanceLedgerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ledger = FillBalanceLedger(max_checkpoints_per_token=4)
+
+    @staticmethod
+    def _fill_event(timestamp: float, trade_type: TradeType, price: Decimal, amount: Decimal) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=amount,
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    def test_balances_since_timestamp(self):
+        self.ledger(self._fill_event(1, TradeType.BUY, Decimal("10"), Decimal("2")))
+        self.ledger(self._fill_event(2, TradeType.SELL, Decimal("11"), Decimal("1")))
+        self.ledger(self._fill_event(3, TradeType.BUY, Decimal("9"), Decimal("3")))
+
+        self.assertEqual({"COINALPHA": Decimal("4"), "HBOT": Decimal("-36")}, self.ledger.balances_since())
+        self.assertEqual(Decimal("2"), self.ledger.balance_since("COINALPHA", 1))
+        self.assertEqual(Decimal("-16"), self.ledger.balance_since("HBOT", 1))
+        self.assertEqual(Decimal("0"), self.ledger.balance_since("HBOT", 3))
+        self.assertEqual(Decimal("0"), self.ledger.balance_since("OTHER"))
+
+    def test_fill_received_out_of_order(self):
+        self.ledger(self._fill_event(1, TradeType.BUY, Decimal("10"), Decimal("1")))
+        self.ledger(self._fill_event(3, TradeType.BUY, Decimal("10"), Decimal("2")))
+        self.ledger(self._fill_event(2, TradeType.BUY, Decimal("10"), Decimal("4")))
+
+        self.assertEqual(Decimal("7"), self.ledger.balance_since("COINALPHA"))
+        self.assertEqual(Decimal("6"), self.ledger.balance_since("COINALPHA", 1))
+        self.assertEqual(Decimal("2"), self.ledger.balance_since("COINALPHA", 2))
+
+    def test_checkpoints_are_collapsed_when_exceeding_the_limit(self):
+        for timestamp in range(1, 7):
+            self.ledger(self._fill_event(timestamp, TradeType.BUY, Decimal("10"), Decimal("1")))
+
+        self.assertEqual(Decimal("6"), self.ledger.balance_since("COINALPHA"))
+        self.assertEqual(Decimal("2"), self.ledger.balance_since("COINALPHA", 4))
+        self.assertEqual(Decimal("6"), self.ledger.balance_since("COINALPHA", 0))
+        # The first two checkpoints were collapsed, only the fills after them are included
+        self.assertEqual(Decimal("4"), self.ledger.balance_since("COINALPHA", 1))
+
+    def test_ignores_other_events(self):
+        self.ledger("not a fill")
+
+        self.assertEqual({}, self.ledger.balances_since())
@@ -22,6 +22,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.order import Order
@@ -495,3 +496,123 @@ class MarketsRecorderTests(TestCase):
             query = session.query(Executors)
             executors = query.all()
         self.assertEqual(1, len(executors))
+
+    def test_store_or_update_executor_updates_controller_performance(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+        def executor_mock(executor_id: str, close_type: CloseType, net_pnl_quote: Decimal):
+            executor = MagicMock(spec=PositionExecutor)
+            executor.config = PositionExecutorConfig(
+                id=executor_id, timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+                side=TradeType.BUY, entry_price=Decimal("1000"), amount=Decimal("1"), leverage=1,
+            )
+            executor.executor_info = ExecutorInfo(
+                id=executor_id, timestamp=1234, type="position_executor", close_timestamp=1235, close_type=close_type,
+                status=RunnableStatus.TERMINATED, controller_id="test_controller", custom_info={},
+                config=executor.config, net_pnl_pct=Decimal("0.1"), net_pnl_quote=net_pnl_quote,
+                cum_fees_quote=Decimal("0.1"), filled_amount_quote=Decimal("100"), is_active=False,
+                is_trading=False)
+            return executor
+
+        recorder.store_or_update_executor(executor_mock("1", CloseType.TAKE_PROFIT, Decimal("10")))
+        recorder.store_or_update_executor(executor_mock("2", CloseType.STOP_LOSS, Decimal("-5")))
+        # Storing the same executor again replaces its previous results
+        recorder.store_or_update_executor(executor_mock("2", CloseType.TAKE_PROFIT, Decimal("-2")))
+
+        performance = recorder.get_controllers_performance()
+
+        self.assertEqual(["test_controller"], list(performance.keys()))
+        self.assertEqual(Decimal("8"), performance["test_controller"].realized_pnl_quote)
+        self.assertEqual(Decimal("200"), performance["test_controller"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, performance["test_controller"].close_type_counts)
+
+        with self.manager.get_new_session() as session:
+            ControllerPerformance.rebuild_all(session)
+            session.commit()
+        self.assertEqual(performance, recorder.get_controllers_performance())
+
+    def test_get_controllers_performance_builds_rollups_for_existing_executors(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        with self.manager.get_new_session() as session:
+            for executor_id, controller_id, close_type, net_pnl_quote in [("1", "first", CloseType.TAKE_PROFIT.value, 2.5),
+                                                                          ("2", "first", CloseType.STOP_LOSS.value, -1.0),
+                                                                          ("3", "second", None, 0.5)]:
+                session.add(Executors(id=executor_id, timestamp=1234, type="position_executor", close_type=close_type,
+                                      status=RunnableStatus.TERMINATED.value, config={}, net_pnl_pct=0,
+                                      net_pnl_quote=net_pnl_quote, cum_fees_quote=0, filled_amount_quote=10,
+                                      is_active=False, is_trading=False, custom_info={}, controller_id=controller_id))
+            session.commit()
+
+        performance = recorder.get_controllers_performance()
+
+        self.assertEqual(Decimal("1.5"), performance["first"].realized_pnl_quote)
+        self.assertEqual(Decimal("20"), performance["first"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, performance["first"].close_type_counts)
+        self.assertEqual(Decimal("0.5"), performance["second"].realized_pnl_quote)
+        self.assertEqual({}, performance["second"].close_type_counts)
+
+    def test_controller_performance_includes_executors_stored_before_the_rollups(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        with self.manager.get_new_session() as session:
+            for executor_id, controller_id in [("1", "first"), ("2", "first"), ("3", "second")]:
+                session.add(Executors(id=executor_id, timestamp=1234, type="position_executor",
+                                      close_type=CloseType.TAKE_PROFIT.value, status=RunnableStatus.TERMINATED.value,
+                                      config={}, net_pnl_pct=0, net_pnl_quote=1.0, cum_fees_quote=0,
+                                      filled_amount_quote=10, is_active=False, is_trading=False, custom_info={},
+                                      controller_id=controller_id))
+            # A partial rollup that only counts one of the executors of the first controller
+            session.add(ControllerPerformance(controller_id="first", realized_pnl_quote=1.0, volume_traded=10.0,
+                                              executors_count=1, close_type_counts={"3": 1}))
+            session.commit()
+
+        executor = MagicMock(spec=PositionExecutor)
+        executor.config = PositionExecutorConfig(
+            id="3", timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, entry_price=Decimal("1000"), amount=Decimal("1"), leverage=1,
+        )
+        executor.executor_info = ExecutorInfo(
+            id="3", timestamp=1234, type="position_executor", close_timestamp=1235, close_type=CloseType.STOP_LOSS,
+            status=RunnableStatus.TERMINATED, controller_id="second", custom_info={},
+            config=executor.config, net_pnl_pct=Decimal("0.1"), net_pnl_quote=Decimal("-4"),
+            cum_fees_quote=Decimal("0.1"), filled_amount_quote=Decimal("100"), is_active=False, is_trading=False)
+        # Updating an executor stored before its controller had a rollup replaces its results
+        recorder.store_or_update_executor(executor)
+
+        performance = recorder.get_controllers_performance()
+
+        self.assertEqual(Decimal("2"), performance["first"].realized_pnl_quote)
+        self.assertEqual(Decimal("20"), performance["first"].volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, performance["first"].close_type_counts)
+        self.assertEqual(Decimal("-4"), performance["second"].realized_pnl_quote)
+        self.assertEqual(Decimal("100"), performance["second"].volume_traded)
+        self.assertEqual({CloseType.STOP_LOSS: 1}, performance["second"].close_type_counts)
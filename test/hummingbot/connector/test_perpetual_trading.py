@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock
 
-from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.derivative.position import Position, PositionUpdate
 from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import PositionMode, PositionSide
 from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate
@@ -161,3 +161,130 @@ class PerpetualTest(unittest.TestCase):
             pass
 
         self.assertEqual(Decimal("10"), self.perpetual_trading.funding_info[self.trading_pair].index_price)
+
+    def test_funding_info_update_older_than_last_update_is_discarded(self):
+        funding_info = FundingInfo(
+            self.trading_pair,
+            index_price=Decimal("1"),
+            mark_price=Decimal("2"),
+            next_funding_utc_timestamp=3,
+            rate=Decimal("4"),
+        )
+        self.perpetual_trading.initialize_funding_info(funding_info)
+
+        self.perpetual_trading.process_funding_info_update(
+            FundingInfoUpdate(self.trading_pair, mark_price=Decimal("20"), update_id=2)
+        )
+        self.perpetual_trading.process_funding_info_update(
+            FundingInfoUpdate(self.trading_pair, mark_price=Decimal("10"), update_id=1)
+        )
+
+        self.assertEqual(Decimal("20"), self.perpetual_trading.get_funding_info(self.trading_pair).mark_price)
+        self.assertEqual(set(), self.perpetual_trading.out_of_sync_funding_info_pairs)
+
+    def test_funding_info_update_gap_flags_trading_pair_until_reinitialized(self):
+        funding_info = FundingInfo(
+            self.trading_pair,
+            index_price=Decimal("1"),
+            mark_price=Decimal("2"),
+            next_funding_utc_timestamp=3,
+            rate=Decimal("4"),
+        )
+        self.perpetual_trading.initialize_funding_info(funding_info)
+
+        self.perpetual_trading.process_funding_info_update(FundingInfoUpdate(self.trading_pair, update_id=1))
+        self.perpetual_trading.process_funding_info_update(
+            FundingInfoUpdate(self.trading_pair, rate=Decimal("5"), update_id=3)
+        )
+
+        self.assertEqual(Decimal("5"), self.perpetual_trading.get_funding_info(self.trading_pair).rate)
+        self.assertEqual({self.trading_pair}, self.perpetual_trading.out_of_sync_funding_info_pairs)
+        self.assertTrue(
+            self._is_logged("WARNING", f"Missed updates for {self.trading_pair} between sequence numbers 1 and 3.")
+        )
+
+        self.perpetual_trading.initialize_funding_info(funding_info)
+
+        self.assertEqual(set(), self.perpetual_trading.out_of_sync_funding_info_pairs)
+
+    def test_position_update_opens_updates_and_closes_position(self):
+        self.perpetual_trading.set_leverage(self.trading_pair, 5)
+
+        self.assertTrue(self.perpetual_trading.process_position_update(
+            PositionUpdate(
+                trading_pair=self.trading_pair,
+                position_side=PositionSide.LONG,
+                amount=Decimal("1"),
+                entry_price=Decimal("100"),
+                update_id=1,
+            )
+        ))
+        position = self.perpetual_trading.get_position(self.trading_pair, PositionSide.LONG)
+        self.assertEqual(Decimal("1"), position.amount)
+        self.assertEqual(Decimal("0"), position.unrealized_pnl)
+        self.assertEqual(Decimal("5"), position.leverage)
+
+        self.perpetual_trading.process_position_update(
+            PositionUpdate(
+                trading_pair=self.trading_pair,
+                position_side=PositionSide.LONG,
+                amount=Decimal("2"),
+                unrealized_pnl=Decimal("3"),
+                update_id=2,
+            )
+        )
+        self.assertEqual(Decimal("2"), position.amount)
+        self.assertEqual(Decimal("3"), position.unrealized_pnl)
+        self.assertEqual(Decimal("100"), position.entry_price)
+
+        self.perpetual_trading.process_position_update(
+            PositionUpdate(
+                trading_pair=self.trading_pair,
+                position_side=PositionSide.LONG,
+                amount=Decimal("0"),
+                update_id=3,
+            )
+        )
+        self.assertEqual(0, len(self.perpetual_trading.account_positions))
+        self.assertEqual(set(), self.perpetual_trading.out_of_sync_position_pairs)
+
+    def test_position_update_without_entry_price_for_unknown_position_flags_trading_pair(self):
+        result = self.perpetual_trading.process_position_update(
+            PositionUpdate(trading_pair=self.trading_pair, position_side=PositionSide.LONG, amount=Decimal("1"))
+        )
+
+        self.assertFalse(result)
+        self.assertEqual(0, len(self.perpetual_trading.account_positions))
+        self.assertEqual({self.trading_pair}, self.perpetual_trading.out_of_sync_position_pairs)
+
+        self.perpetual_trading.mark_positions_in_sync([self.trading_pair])
+
+        self.assertEqual(set(), self.perpetual_trading.out_of_sync_position_pairs)
+
+    def test_updating_positions_from_stream(self):
+        self.perpetual_trading.start()
+
+        position_update = PositionUpdate(
+            trading_pair=self.trading_pair,
+            position_side=PositionSide.SHORT,
+            amount=Decimal("-1"),
+            entry_price=Decimal("100"),
+        )
+
+        async def return_update():
+            return position_update
+
+        mock_queue = MagicMock()
+        mock_queue.get.side_effect = [
+            return_update(),
+            asyncio.CancelledError(),
+        ]
+        self.perpetual_trading._position_update_stream = mock_queue
+        self.listening_task = self.perpetual_trading._position_updater_task
+
+        try:
+            self.async_run_with_timeout(self.listening_task)
+        except asyncio.CancelledError:
+            pass
+
+        self.assertEqual(Decimal("-1"), self.perpetual_trading.get_position(self.trading_pair).amount)
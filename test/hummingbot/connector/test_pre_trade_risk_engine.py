@@ -0,0 +1,111 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.pre_trade_risk_engine import PreTradeRiskEngine, PreTradeRiskLimits
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketOrderFailureEvent, OrderCancelledEvent, OrderFilledEvent
+
+
+class PreTradeRiskEngineTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def _check(self, engine: PreTradeRiskEngine, order_id: str, trade_type: TradeType, amount: str,
+               price: str = None, mid_price: str = "100", timestamp: float = 1000, top_of_book_price: str = None,
+               trading_pair: str = None):
+        return engine.check_order(
+            order_id=order_id,
+            trading_pair=trading_pair or self.trading_pair,
+            trade_type=trade_type,
+            amount=Decimal(amount),
+            price=Decimal(price) if price is not None else None,
+            mid_price=Decimal(mid_price) if mid_price is not None else None,
+            timestamp=timestamp,
+            top_of_book_price=Decimal(top_of_book_price) if top_of_book_price is not None else None,
+        )
+
+    def _fill_event(self, order_id: str, trade_type: TradeType, amount: str, price: str = "100"):
+        return OrderFilledEvent(
+            timestamp=1000,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    def test_order_rate_limit(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits(max_orders_per_interval=2, order_rate_interval=1))
+
+        self.assertIsNone(self._check(engine, "OID1", TradeType.BUY, "1", "99", timestamp=1000))
+        self.assertIsNone(self._check(engine, "OID2", TradeType.BUY, "1", "99", timestamp=1000.5))
+        self.assertIsNotNone(self._check(engine, "OID3", TradeType.BUY, "1", "99", timestamp=1000.9))
+        self.assertIsNone(self._check(engine, "OID4", TradeType.BUY, "1", "99", timestamp=1001))
+
+    def test_price_band(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits(max_price_deviation=Decimal("0.05")))
+
+        self.assertIsNone(self._check(engine, "OID1", TradeType.BUY, "1", "96"))
+        self.assertIn("deviates", self._check(engine, "OID2", TradeType.SELL, "1", "106"))
+        # Without mid price the band can't be checked
+        self.assertIsNone(self._check(engine, "OID3", TradeType.SELL, "1", "106", mid_price=None))
+
+    def test_self_trade_prevention(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits())
+
+        self.assertIsNone(self._check(engine, "OID1", TradeType.SELL, "1", "101"))
+        self.assertIsNone(self._check(engine, "OID2", TradeType.BUY, "1", "100"))
+        self.assertIn("cross", self._check(engine, "OID3", TradeType.BUY, "1", "101"))
+        self.assertIn("cross", self._check(engine, "OID4", TradeType.SELL, "1", "99"))
+
+        engine(OrderCancelledEvent(timestamp=1000, order_id="OID1"))
+
+        self.assertIsNone(self._check(engine, "OID6", TradeType.BUY, "1", "101"))
+
+    def test_self_trade_prevention_of_market_orders(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits())
+
+        self.assertIsNone(self._check(engine, "OID1", TradeType.SELL, "1", "101"))
+        # The own sell order is behind the best ask the market buy would take
+        self.assertIsNone(self._check(engine, "OID2", TradeType.BUY, "1", top_of_book_price="100.5"))
+        # The own sell order is the best ask
+        self.assertIn("cross", self._check(engine, "OID3", TradeType.BUY, "1", top_of_book_price="101"))
+        # Without the best ask the market order is not checked
+        self.assertIsNone(self._check(engine, "OID4", TradeType.BUY, "1"))
+
+    def test_max_open_notional_released_by_fills_and_cancels(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits(max_open_notional={"COINALPHA": Decimal("1000")}))
+
+        self.assertIsNone(self._check(engine, "OID1", TradeType.BUY, "6", "100"))
+        self.assertIsNotNone(self._check(engine, "OID2", TradeType.BUY, "5", "99"))
+        self.assertEqual(Decimal("600"), engine.open_notional("COINALPHA", "HBOT"))
+
+        engine(self._fill_event("OID1", TradeType.BUY, "2"))
+        self.assertEqual(Decimal("400"), engine.open_notional("COINALPHA", "HBOT"))
+        self.assertIsNone(self._check(engine, "OID3", TradeType.BUY, "6", "99"))
+
+        engine(MarketOrderFailureEvent(timestamp=1000, order_id="OID3", order_type=OrderType.LIMIT))
+        engine(OrderCancelledEvent(timestamp=1000, order_id="OID1"))
+        self.assertEqual(Decimal("0"), engine.open_notional("COINALPHA", "HBOT"))
+
+    def test_max_open_notional_per_quote_asset(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits(max_open_notional={"COINALPHA": Decimal("1000")}))
+
+        self.assertIsNone(self._check(engine, "OID1", TradeType.BUY, "6", "100"))
+        self.assertIsNone(self._check(engine, "OID2", TradeType.BUY, "6", "100", trading_pair="COINALPHA-USDT"))
+        self.assertIsNotNone(self._check(engine, "OID3", TradeType.BUY, "5", "100", trading_pair="COINALPHA-USDT"))
+
+        self.assertEqual(Decimal("600"), engine.open_notional("COINALPHA", "HBOT"))
+        self.assertEqual(Decimal("600"), engine.open_notional("COINALPHA", "USDT"))
+
+    def test_max_position_includes_open_orders(self):
+        engine = PreTradeRiskEngine(limits=PreTradeRiskLimits(max_position={"COINALPHA": Decimal("10")}))
+        engine(self._fill_event("OID0", TradeType.BUY, "6"))
+
+        self.assertEqual(Decimal("6"), engine.position("COINALPHA"))
+        self.assertIsNone(self._check(engine, "OID1", TradeType.BUY, "3", "99"))
+        self.assertIn("position", self._check(engine, "OID2", TradeType.BUY, "2", "98"))
+        self.assertIsNone(self._check(engine, "OID3", TradeType.SELL, "16", "102"))
+        self.assertIsNotNone(self._check(engine, "OID4", TradeType.SELL, "1", "103"))
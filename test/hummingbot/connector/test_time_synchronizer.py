@@ -75,3 +75,23 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    def test_time_offset_is_recalculated_only_when_samples_change(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(100)
+        time_provider.add_time_offset_ms_sample(200)
+
+        with patch("hummingbot.connector.time_synchronizer.numpy.median", wraps=numpy.median) as median_mock:
+            first_offset = time_provider.time_offset_ms
+            second_offset = time_provider.time_offset_ms
+            self.assertEqual(1, median_mock.call_count)
+            self.assertEqual(first_offset, second_offset)
+
+            time_provider.add_time_offset_ms_sample(300)
+            third_offset = time_provider.time_offset_ms
+            self.assertEqual(2, median_mock.call_count)
+            self.assertNotEqual(first_offset, third_offset)
+
+        time_provider.clear_time_offset_ms_samples()
+        time_provider.add_time_offset_ms_sample(50)
+        self.assertEqual(50, time_provider.time_offset_ms)
@@ -50,6 +50,24 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_top_levels_change_notifications(self):
+        order_book = OrderBook(dex=False)
+        order_book.top_levels = 2
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(1, order_book.top_levels_version)
+
+        # Changes below the top levels are not notified
+        order_book.apply_numpy_diffs(np.array([[1, 2, 2]], dtype=np.float64), np.array([[6, 2, 2]], dtype=np.float64))
+        self.assertEqual(1, order_book.top_levels_version)
+
+        # Changes in the top levels of any side are notified
+        order_book.apply_numpy_diffs(np.array([[2, 3, 3]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(2, order_book.top_levels_version)
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[4.5, 1, 4]], dtype=np.float64))
+        self.assertEqual(3, order_book.top_levels_version)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,94 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict, List
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_quote_cache import GatewayPriceRequest, GatewayQuoteCache
+
+
+class GatewayQuoteCacheTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 0.0
+        self.requests: List[tuple] = []
+        self.release_requests = asyncio.Event()
+        self.release_requests.set()
+        self.quote_cache = GatewayQuoteCache(fetch_quote=self._fetch_quote, ttl=1.0, timer=lambda: self.now)
+
+    async def _fetch_quote(self, chain, network, connector, base_asset, quote_asset, amount, side,
+                           fail_silently: bool = False, pool_id=None) -> Dict[str, Any]:
+        self.requests.append((chain, network, connector, base_asset, quote_asset, amount, side, pool_id))
+        await self.release_requests.wait()
+        if base_asset == "FAIL":
+            raise IOError("Gateway error")
+        if fail_silently and base_asset == "EMPTY":
+            return {}
+        return {"price": str(len(self.requests))}
+
+    async def test_concurrent_identical_requests_are_sent_once(self):
+        self.release_requests.clear()
+        tasks = [asyncio.ensure_future(self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release_requests.set()
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual([{"price": "1"}] * 3, results)
+
+    async def test_quotes_are_cached_until_ttl_expires(self):
+        first = await self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY)
+        self.now = 0.5
+        second = await self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1.0"), TradeType.BUY)
+        other_side = await self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.SELL)
+        self.now = 1.5
+        expired = await self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY)
+
+        self.assertEqual({"price": "1"}, first)
+        self.assertEqual(first, second)
+        self.assertEqual({"price": "2"}, other_side)
+        self.assertEqual({"price": "3"}, expired)
+        self.assertEqual(3, len(self.requests))
+
+    async def test_failed_and_empty_responses_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(IOError):
+                await self.quote_cache.get_price(
+                    "ethereum", "mainnet", "uniswap", "FAIL", "DAI", Decimal("1"), TradeType.BUY)
+            await self.quote_cache.get_price(
+                "ethereum", "mainnet", "uniswap", "EMPTY", "DAI", Decimal("1"), TradeType.BUY, fail_silently=True)
+
+        self.assertEqual(4, len(self.requests))
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        self.release_requests.clear()
+        cancelled = asyncio.ensure_future(self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY))
+        waiting = asyncio.ensure_future(self.quote_cache.get_price(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        self.release_requests.set()
+
+        self.assertEqual({"price": "1"}, await waiting)
+        self.assertTrue(cancelled.cancelled())
+
+    async def test_get_prices_removes_duplicates_and_keeps_order(self):
+        price_requests = [
+            GatewayPriceRequest("ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY),
+            GatewayPriceRequest("solana", "mainnet-beta", "jupiter", "SOL", "USDC", Decimal("1"), TradeType.BUY),
+            GatewayPriceRequest("ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1"), TradeType.BUY),
+            GatewayPriceRequest("ethereum", "mainnet", "uniswap", "FAIL", "DAI", Decimal("1"), TradeType.BUY),
+        ]
+
+        results = await self.quote_cache.get_prices(price_requests)
+
+        self.assertEqual(3, len(self.requests))
+        self.assertEqual(results[0], results[2])
+        self.assertNotEqual(results[0], results[1])
+        self.assertIsInstance(results[3], IOError)
@@ -0,0 +1,42 @@
+import unittest
+
+from hummingbot.core.utils.latency_tracer import OrderLatencyStage, OrderLatencyTrace, OrderLatencyTracker
+
+
+class OrderLatencyTrackerTests(unittest.TestCase):
+
+    @staticmethod
+    def _trace(order_id: str, send_duration: float) -> OrderLatencyTrace:
+        trace = OrderLatencyTrace(client_order_id=order_id, trading_pair="COINALPHA-HBOT")
+        trace.add_stage_duration(OrderLatencyStage.VALIDATE, 0.001)
+        trace.add_stage_duration(OrderLatencyStage.SEND, send_duration)
+        return trace
+
+    def test_trace_accumulates_stage_durations(self):
+        trace = self._trace("OID1", 0.1)
+        trace.add_stage_duration(OrderLatencyStage.SEND, 0.2)
+
+        self.assertAlmostEqual(0.3, trace.stages[OrderLatencyStage.SEND])
+        self.assertAlmostEqual(0.301, trace.total)
+        self.assertEqual(0.0, trace.to_dict()["ack"])
+
+    def test_stage_percentiles(self):
+        tracker = OrderLatencyTracker(max_records=100)
+        for index in range(1, 101):
+            tracker.add_trace(self._trace(f"OID{index}", index / 100))
+
+        percentiles = tracker.stage_percentiles(percentiles=[50, 99])
+
+        self.assertAlmostEqual(0.505, percentiles["send"][50])
+        self.assertAlmostEqual(0.9901, percentiles["send"][99])
+        self.assertAlmostEqual(0.001, percentiles["validate"][99])
+        self.assertAlmostEqual(0.0, percentiles["throttle_wait"][50])
+        self.assertAlmostEqual(0.506, percentiles["total"][50])
+
+    def test_tracker_keeps_only_last_traces(self):
+        tracker = OrderLatencyTracker(max_records=2)
+        for index in range(3):
+            tracker.add_trace(self._trace(f"OID{index}", 0.1))
+
+        self.assertEqual(["OID1", "OID2"], [trace.client_order_id for trace in tracker.traces])
+        self.assertEqual({}, OrderLatencyTracker().stage_percentiles())
@@ -0,0 +1,118 @@
+import asyncio
+import socket
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.utils.runtime_metrics import Histogram, RuntimeMetrics
+
+
+class HistogramTests(IsolatedAsyncioWrapperTestCase):
+
+    def test_observations_are_counted_in_their_bucket(self):
+        histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+        for value in (0.005, 0.01, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+
+        self.assertEqual([2, 3, 4, 5], histogram.cumulative_counts())
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(2.565, histogram.sum)
+        self.assertEqual(2.0, histogram.max)
+        self.assertEqual(2.0, histogram.last)
+
+    def test_quantile_is_bucket_upper_bound(self):
+        histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+        for _ in range(90):
+            histogram.observe(0.005)
+        for _ in range(10):
+            histogram.observe(0.05)
+
+        self.assertEqual(0.01, histogram.quantile(0.5))
+        self.assertEqual(0.05, histogram.quantile(0.99))
+        self.assertEqual(0.0, Histogram().quantile(0.99))
+
+
+class RuntimeMetricsTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.metrics = RuntimeMetrics()
+
+    def tearDown(self) -> None:
+        self.metrics.disable()
+        super().tearDown()
+
+    def test_nothing_is_sampled_while_disabled(self):
+        self.assertFalse(self.metrics.should_sample_tick())
+        self.assertFalse(self.metrics.should_sample_control_loop(1))
+
+    async def test_ticks_are_sampled_at_configured_ratio(self):
+        self.metrics.enable(tick_sampling=3)
+
+        samples = [self.metrics.should_sample_tick() for _ in range(6)]
+
+        self.assertEqual([False, False, True, False, False, True], samples)
+
+    async def test_control_loops_are_sampled_at_configured_ratio(self):
+        self.metrics.enable(tick_sampling=3)
+
+        # Each runnable passes its own loop count, so another runnable doesn't shift its samples
+        samples = [self.metrics.should_sample_control_loop(loop_count) for loop_count in range(1, 7)]
+
+        self.assertEqual([False, False, True, False, False, True], samples)
+
+    async def test_http_server_can_be_started_after_a_failed_start(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy_socket:
+            busy_socket.bind(("127.0.0.1", 0))
+            busy_socket.listen(1)
+            port = busy_socket.getsockname()[1]
+
+            with self.assertRaises(OSError):
+                await self.metrics.start_http_server(port=port)
+
+        await self.metrics.start_http_server(port=port)
+        self.assertIsNotNone(self.metrics._runner)
+        await self.metrics.stop_http_server()
+
+    async def test_loop_lag_is_sampled(self):
+        self.metrics.enable(loop_lag_interval=0.01)
+
+        await asyncio.sleep(0.05)
+
+        self.assertGreater(self.metrics.loop_lag.count, 0)
+
+    async def test_prometheus_text(self):
+        self.metrics.enable()
+        self.metrics.observe_tick("PureMarketMakingStrategy", 0.002)
+        self.metrics.observe_control_loop("PositionExecutor", 0.3)
+        self.metrics.register_queue_depths("binance", lambda: {"order_book_diff": 4, "user_stream": 1})
+
+        text = self.metrics.to_prometheus_text()
+
+        self.assertIn("# TYPE hummingbot_tick_duration_seconds histogram", text)
+        self.assertIn('hummingbot_tick_duration_seconds_bucket{iterator="PureMarketMakingStrategy",le="0.0025"} 1',
+                      text)
+        self.assertIn('hummingbot_tick_duration_seconds_bucket{iterator="PureMarketMakingStrategy",le="0.001"} 0',
+                      text)
+        self.assertIn('hummingbot_tick_duration_seconds_count{iterator="PureMarketMakingStrategy"} 1', text)
+        self.assertIn('hummingbot_control_loop_duration_seconds_sum{runnable="PositionExecutor"} 0.3', text)
+        self.assertIn('hummingbot_event_loop_lag_seconds_count 0', text)
+        self.assertIn('hummingbot_queue_depth{owner="binance",queue="order_book_diff"} 4', text)
+        self.assertIn('hummingbot_queue_depth{owner="binance",queue="user_stream"} 1', text)
+
+    async def test_unregistered_queue_depths_are_not_reported(self):
+        self.metrics.register_queue_depths("binance", lambda: {"order_book_diff": 4})
+        self.metrics.unregister_queue_depths("binance")
+
+        self.assertEqual({}, self.metrics.queue_depths())
+
+    async def test_format_status(self):
+        self.assertIn("disabled", self.metrics.format_status())
+
+        self.metrics.enable()
+        self.metrics.observe_tick("BinanceExchange", 0.004)
+        self.metrics.register_queue_depths("binance", lambda: {"order_book_diff": 4})
+        status = self.metrics.format_status()
+
+        self.assertIn("Event loop lag (ms)", status)
+        self.assertIn("Tick duration (ms):", status)
+        self.assertIn("BinanceExchange", status)
+        self.assertIn("binance order_book_diff: 4", status)
@@ -8,6 +8,8 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.latency_tracer import OrderLatencyStage, OrderLatencyTrace, current_order_latency_trace
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -100,3 +102,63 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_does_not_modify_caller_params(self, mocked_call):
+        url = "https://www.test.com/url"
+        params = {"symbol": "COINALPHA"}
+
+        async def return_response(request: RESTRequest):
+            response = unittest.mock.MagicMock()
+            response.status = 200
+            return response
+
+        mocked_call.side_effect = return_response
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "signed"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(
+            connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=1)]),
+            auth=AuthDummy())
+
+        self.async_run_with_timeout(assistant.execute_request_and_get_response(
+            url=url, throttler_limit_id=url, params=params, is_auth_required=True))
+
+        self.assertEqual({"symbol": "COINALPHA"}, params)
+        self.assertEqual({"symbol": "COINALPHA", "signature": "signed"}, mocked_call.call_args[0][0].params)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_execute_request_registers_latency_stages_in_current_trace(self, mocked_call):
+        url = "https://www.test.com/url"
+
+        async def return_response(request: RESTRequest):
+            response = unittest.mock.MagicMock()
+            response.status = 200
+            return response
+
+        mocked_call.side_effect = return_response
+
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(
+            connection, throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id=url, limit=10, time_interval=1)]))
+        trace = OrderLatencyTrace(client_order_id="OID1", trading_pair="COINALPHA-HBOT")
+
+        async def execute_with_trace():
+            current_order_latency_trace.set(trace)
+            await assistant.execute_request_and_get_response(url=url, throttler_limit_id=url)
+
+        self.async_run_with_timeout(execute_with_trace())
+
+        self.assertIn(OrderLatencyStage.THROTTLE_WAIT, trace.stages)
+        self.assertIn(OrderLatencyStage.SIGN, trace.stages)
+        self.assertIn(OrderLatencyStage.SEND, trace.stages)
+        self.assertIsNotNone(trace.last_response_timestamp)
+        self.assertIsNone(current_order_latency_trace.get())
@@ -93,6 +93,24 @@ class TestCandlesBase(unittest.TestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_rebuilt_only_when_candles_change(self):
+        candles = list(self._candles_data_mock())
+        self.data_feed._candles.extend(candles[:-1])
+        version = self.data_feed.candles_version
+
+        candles_df = self.data_feed.candles_df
+        candles_df["indicator"] = 1.0
+
+        self.assertEqual(version, self.data_feed.candles_version)
+        self.assertNotIn("indicator", self.data_feed.candles_df.columns)
+        self.assertEqual(len(candles) - 1, self.data_feed.candles_df.shape[0])
+
+        self.data_feed._candles.append(candles[-1])
+
+        self.assertGreater(self.data_feed.candles_version, version)
+        self.assertEqual(len(candles), self.data_feed.candles_df.shape[0])
+        self.assertEqual(candles[-1][0], self.data_feed.candles_array[-1][0])
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
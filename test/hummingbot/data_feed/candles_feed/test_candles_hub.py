@@ -0,0 +1,153 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
+
+class CandlesHubTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # A dedicated loop, so the connections left by the tests of other candles feeds don't reach the mocks
+        cls.previous_loop = asyncio.get_event_loop()
+        cls.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(cls.ev_loop)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.ev_loop.close()
+        asyncio.set_event_loop(cls.previous_loop)
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.hub = CandlesHub()
+        self.btc_feed = self._feed("BTC-USDT", "1m")
+        self.eth_feed = self._feed("ETH-USDT", "1m")
+
+    def tearDown(self) -> None:
+        for connection in self.hub._connections:
+            connection.listen_task and connection.listen_task.cancel()
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        super().tearDown()
+
+    def _feed(self, trading_pair: str, interval: str, max_records: int = 10) -> BinanceSpotCandles:
+        feed = BinanceSpotCandles(trading_pair=trading_pair, interval=interval, max_records=max_records)
+        feed.attach_to_hub(self.hub)
+        return feed
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def _kline_message(symbol: str, interval: str, timestamp: int, close: str) -> str:
+        return json.dumps({
+            "e": "kline",
+            "E": timestamp * 1000 + 1,
+            "s": symbol,
+            "k": {"t": timestamp * 1000, "T": timestamp * 1000 + 59999, "s": symbol, "i": interval,
+                  "o": "1", "c": close, "h": close, "l": "1", "v": "2", "n": 3, "x": False,
+                  "q": "4", "V": "1", "Q": "2"},
+        })
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_share_one_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(asyncio.gather(self.btc_feed.start_network(), self.eth_feed.start_network()))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, self._kline_message("BTCUSDT", "1m", 1_700_000_040, "100"))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, self._kline_message("ETHUSDT", "1m", 1_700_000_040, "10"))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(1, self.hub.connections_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual(1, len(sent_messages))
+        self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1m"], sorted(sent_messages[0]["params"]))
+        self.assertEqual(100, self.btc_feed.candles_df["close"].iloc[-1])
+        self.assertEqual(10, self.eth_feed.candles_df["close"].iloc[-1])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_added_to_open_connection_are_subscribed(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.btc_feed.start_network())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.async_run_with_timeout(self.eth_feed.start_network())
+        self.async_run_with_timeout(self.btc_feed.stop_network())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual([("SUBSCRIBE", ["btcusdt@kline_1m"]),
+                          ("SUBSCRIBE", ["ethusdt@kline_1m"]),
+                          ("UNSUBSCRIBE", ["btcusdt@kline_1m"])],
+                         [(message["method"], message["params"]) for message in sent_messages])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_connections_are_limited_by_streams_and_closed_when_unused(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub._max_streams_per_connection = 1
+        self.async_run_with_timeout(self.btc_feed.start_network())
+        self.async_run_with_timeout(self.eth_feed.start_network())
+        same_stream_feed = self._feed("BTC-USDT", "1m")
+        self.async_run_with_timeout(same_stream_feed.start_network())
+
+        self.assertEqual(2, self.hub.connections_count)
+        self.assertEqual([("BTCUSDT", "1m"), ("ETHUSDT", "1m")], sorted(self.hub.stream_keys))
+
+        self.async_run_with_timeout(self.btc_feed.stop_network())
+        self.assertEqual(2, self.hub.connections_count)
+        self.async_run_with_timeout(same_stream_feed.stop_network())
+        self.async_run_with_timeout(self.eth_feed.stop_network())
+        self.assertEqual(0, self.hub.connections_count)
+        self.assertEqual([], self.hub.stream_keys)
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_higher_intervals_built_from_base_interval(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub.base_interval = "1m"
+        five_minutes_feed = self._feed("BTC-USDT", "5m")
+        self.async_run_with_timeout(five_minutes_feed.start_network())
+        base_feed = self.hub._base_feeds["BTC-USDT"]
+        # The base interval candles of the current period are already filled
+        base_feed._candles.extend([[1_700_000_100, 1, 5, 1, 5, 1, 1, 1, 1, 1],
+                                   [1_700_000_160, 5, 7, 4, 6, 1, 1, 1, 1, 1]])
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, self._kline_message("BTCUSDT", "1m", 1_700_000_220, "8"))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual(["btcusdt@kline_1m"], sent_messages[0]["params"])
+        candle = five_minutes_feed.candles_df.iloc[-1]
+        self.assertEqual(1_700_000_100, candle["timestamp"])
+        self.assertEqual(1, candle["open"])
+        self.assertEqual(8, candle["high"])
+        self.assertEqual(1, candle["low"])
+        self.assertEqual(8, candle["close"])
+        self.assertEqual(4, candle["volume"])
+        self.assertEqual(5, candle["n_trades"])
+
+        self.async_run_with_timeout(five_minutes_feed.stop_network())
+        self.assertEqual({}, self.hub._base_feeds)
+        self.assertEqual(0, self.hub.connections_count)
+
+    def test_aggregate_candles_requires_the_whole_period(self):
+        candles = np.array([[120, 1, 2, 1, 2, 1, 1, 1, 1, 1],
+                            [180, 2, 3, 2, 3, 1, 1, 1, 1, 1]], dtype=float)
+
+        self.assertIsNone(CandlesHub.aggregate_candles(candles, 60))
+        self.assertEqual(3, CandlesHub.aggregate_candles(candles, 180)["close"])
+        self.assertEqual(2, CandlesHub.aggregate_candles(candles, 120)["volume"])
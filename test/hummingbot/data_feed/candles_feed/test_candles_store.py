@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.store = CandlesStore(maxlen=3, n_columns=2)
+
+    @staticmethod
+    def _row(timestamp: float):
+        return [timestamp, timestamp * 10]
+
+    def test_append_until_full_discards_oldest(self):
+        for timestamp in range(1, 6):
+            self.store.append(self._row(timestamp))
+
+        self.assertEqual(3, len(self.store))
+        self.assertEqual([3, 4, 5], list(self.store.values[:, 0]))
+        self.assertEqual(5, self.store[-1][0])
+        self.assertEqual(3, self.store[0][0])
+
+    def test_append_many_times_keeps_rows_contiguous(self):
+        for timestamp in range(100):
+            self.store.append(self._row(timestamp))
+
+        values = self.store.values
+        self.assertTrue(values.flags.c_contiguous)
+        self.assertEqual([97, 98, 99], list(values[:, 0]))
+        self.assertEqual([970, 980, 990], list(values[:, 1]))
+
+    def test_values_is_read_only_view(self):
+        self.store.append(self._row(1))
+
+        with self.assertRaises(ValueError):
+            self.store.values[0, 0] = 10
+
+    def test_setitem_updates_row(self):
+        self.store.extend([self._row(1), self._row(2)])
+        self.store[-1] = self._row(7)
+
+        self.assertEqual([1, 7], list(self.store.values[:, 0]))
+
+    def test_extend_more_rows_than_maxlen(self):
+        self.store.append(self._row(1))
+        self.store.extend([self._row(timestamp) for timestamp in range(2, 7)])
+
+        self.assertEqual([4, 5, 6], list(self.store.values[:, 0]))
+
+    def test_extend_with_scalars_fills_rows(self):
+        self.store.extend(range(3))
+
+        self.assertEqual(3, len(self.store))
+        self.assertEqual([2, 2], list(self.store[-1]))
+
+    def test_extendleft_has_deque_semantics(self):
+        self.store.append(self._row(5))
+        self.store.extendleft([self._row(4), self._row(3)])
+
+        self.assertEqual([3, 4, 5], list(self.store.values[:, 0]))
+
+        self.store.clear()
+        self.store.append(self._row(5))
+        self.store.append(self._row(6))
+        self.store.append(self._row(7))
+        self.store.append(self._row(8))
+        self.store.extendleft([self._row(4)])
+
+        self.assertEqual([4, 6, 7], list(self.store.values[:, 0]))
+
+    def test_version_increases_on_every_mutation(self):
+        versions = [self.store.version]
+        self.store.append(self._row(1))
+        versions.append(self.store.version)
+        self.store[-1] = self._row(2)
+        versions.append(self.store.version)
+        self.store.extendleft([self._row(0)])
+        versions.append(self.store.version)
+        self.store.clear()
+        versions.append(self.store.version)
+
+        self.assertEqual(sorted(set(versions)), versions)
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.store[0]
+
+    def test_as_numpy_array(self):
+        self.store.extend([self._row(1), self._row(2)])
+
+        self.assertTrue(np.array_equal(np.array([[1, 10], [2, 20]]), np.asarray(self.store)))
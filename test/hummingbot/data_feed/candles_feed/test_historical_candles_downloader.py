@@ -0,0 +1,144 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Awaitable, Optional
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.historical_candles_downloader import HistoricalCandlesDownloader
+
+
+class HistoricalCandlesDownloaderTest(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        # Aligned to the 1000 candles chunks
+        self.start_time = 1_700_040_000
+        # 2500 candles, three requests of 1000 candles
+        self.end_time = self.start_time + 2499 * 60
+        self.config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                                              start_time=self.start_time, end_time=self.end_time)
+        self.failing_chunk_start: Optional[int] = None
+        self.requested_chunks = []
+        self.checkpoint_path = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.checkpoint_path, ignore_errors=True)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def _fetch_candles(self, start_time: int, end_time: int, limit: int) -> np.ndarray:
+        self.requested_chunks.append((start_time, end_time))
+        if start_time == self.failing_chunk_start:
+            raise ValueError("Chunk not available")
+        # The exchange returns one more candle before the requested start time
+        timestamps = np.arange(end_time - limit * 60, end_time + 1, 60, dtype=float)
+        candles = np.zeros((len(timestamps), 10))
+        candles[:, 0] = timestamps
+        candles[:, 4] = timestamps / 60
+        return candles
+
+    def test_chunks_cover_the_range(self):
+        downloader = HistoricalCandlesDownloader(candles=self.candles)
+
+        chunks = downloader.chunks(self.start_time, self.end_time)
+
+        self.assertEqual([(self.start_time, self.start_time + 999 * 60),
+                          (self.start_time + 1000 * 60, self.start_time + 1999 * 60),
+                          (self.start_time + 2000 * 60, self.end_time)], chunks)
+
+    def test_download_fills_all_candles_in_order(self):
+        with patch.object(self.candles, "fetch_candles", side_effect=self._fetch_candles):
+            candles_df = self.async_run_with_timeout(self.candles.get_historical_candles(self.config))
+
+        self.assertEqual(3, len(self.requested_chunks))
+        self.assertEqual(2500, len(candles_df))
+        self.assertEqual(list(np.arange(self.start_time, self.end_time + 1, 60)), list(candles_df["timestamp"]))
+        self.assertEqual(list(candles_df["timestamp"] / 60), list(candles_df["close"]))
+
+    def test_interrupted_download_resumes_from_checkpoint(self):
+        downloader = HistoricalCandlesDownloader(candles=self.candles, checkpoint_path=self.checkpoint_path)
+        self.failing_chunk_start = self.start_time + 1000 * 60
+
+        with patch.object(self.candles, "fetch_candles", side_effect=self._fetch_candles):
+            with self.assertRaises(ValueError):
+                self.async_run_with_timeout(downloader.download(self.config))
+            self.assertEqual(1, len(os.listdir(self.checkpoint_path)))
+
+            self.failing_chunk_start = None
+            self.requested_chunks.clear()
+            candles_df = self.async_run_with_timeout(downloader.download(self.config))
+
+        self.assertEqual([(self.start_time + 1000 * 60, self.start_time + 1999 * 60)], self.requested_chunks)
+        self.assertEqual(2500, len(candles_df))
+        self.assertEqual([], os.listdir(self.checkpoint_path))
+
+    def test_chunks_are_aligned_to_the_chunk_duration(self):
+        downloader = HistoricalCandlesDownloader(candles=self.candles)
+
+        chunks = downloader.chunks(self.start_time + 500 * 60, self.start_time + 1500 * 60)
+
+        self.assertEqual([(self.start_time + 500 * 60, self.start_time + 999 * 60),
+                          (self.start_time + 1000 * 60, self.start_time + 1500 * 60)], chunks)
+
+    def test_interrupted_download_resumes_with_a_later_end_time(self):
+        downloader = HistoricalCandlesDownloader(candles=self.candles, checkpoint_path=self.checkpoint_path)
+        self.failing_chunk_start = self.start_time + 2000 * 60
+
+        with patch.object(self.candles, "fetch_candles", side_effect=self._fetch_candles):
+            with self.assertRaises(ValueError):
+                self.async_run_with_timeout(downloader.download(self.config))
+
+            self.failing_chunk_start = None
+            self.requested_chunks.clear()
+            later_config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                                                   start_time=self.start_time + 60, end_time=self.end_time + 120)
+            candles_df = self.async_run_with_timeout(downloader.download(later_config))
+
+        # Only the first chunk (its start changed) and the last one are requested again
+        self.assertEqual({(self.start_time + 60, self.start_time + 999 * 60),
+                          (self.start_time + 2000 * 60, self.end_time + 120)}, set(self.requested_chunks))
+        self.assertEqual(2501, len(candles_df))
+        self.assertEqual([], os.listdir(self.checkpoint_path))
+
+    def test_missing_candles_are_logged(self):
+        async def fetch_candles(start_time: int, end_time: int, limit: int) -> np.ndarray:
+            candles = await self._fetch_candles(start_time, end_time, limit)
+            return candles[candles[:, 0] != self.start_time + 10 * 60]
+
+        downloader = HistoricalCandlesDownloader(candles=self.candles)
+        with patch.object(self.candles, "fetch_candles", side_effect=fetch_candles):
+            with self.assertLogs(HistoricalCandlesDownloader.logger().name, level="WARNING") as logs:
+                candles_df = self.async_run_with_timeout(downloader.download(self.config))
+
+        self.assertEqual(2499, len(candles_df))
+        self.assertIn("1 of the 2500 binance_BTC-USDT candles", logs.output[0])
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase._sleep", new_callable=AsyncMock)
+    def test_failed_requests_are_retried(self, _):
+        responses = [IOError("Network error")]
+
+        async def fetch_candles(start_time: int, end_time: int, limit: int) -> np.ndarray:
+            if responses:
+                raise responses.pop()
+            return await self._fetch_candles(start_time, end_time, limit)
+
+        downloader = HistoricalCandlesDownloader(candles=self.candles, max_concurrent_requests=1)
+        with patch.object(self.candles, "fetch_candles", side_effect=fetch_candles):
+            candles_df = self.async_run_with_timeout(downloader.download(self.config))
+
+        self.assertEqual(2500, len(candles_df))
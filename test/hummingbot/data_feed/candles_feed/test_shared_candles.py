@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed import shared_candles
+from hummingbot.data_feed.candles_feed.shared_candles import SharedCandlesWriter, read_shared_candles
+
+
+class SharedCandlesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.writer = SharedCandlesWriter(columns=["timestamp", "close"], capacity=3)
+
+    def tearDown(self) -> None:
+        self.writer.close()
+        super().tearDown()
+
+    def test_read_published_candles(self):
+        self.writer.publish(np.array([[1.0, 10.0], [2.0, 11.0]]), version=1)
+
+        candles_df = read_shared_candles(self.writer.handle)
+
+        self.assertEqual(["timestamp", "close"], list(candles_df.columns))
+        self.assertEqual([[1, 10], [2, 11]], candles_df.values.tolist())
+
+    def test_only_last_candles_that_fit_are_published(self):
+        self.writer.publish(np.array([[1.0, 10.0], [2.0, 11.0], [3.0, 12.0], [4.0, 13.0]]), version=1)
+
+        self.assertEqual([2, 3, 4], read_shared_candles(self.writer.handle)["timestamp"].tolist())
+
+    def test_same_version_not_published_again(self):
+        self.writer.publish(np.array([[1.0, 10.0]]), version=1)
+        self.writer.publish(np.array([[1.0, 20.0]]), version=1)
+
+        self.assertEqual([10], read_shared_candles(self.writer.handle)["close"].tolist())
+
+        self.writer.publish(np.array([[1.0, 20.0]]), version=2)
+
+        self.assertEqual([20], read_shared_candles(self.writer.handle)["close"].tolist())
+
+    def test_attachment_closed_after_writer_closes_block(self):
+        writer = SharedCandlesWriter(columns=["timestamp", "close"], capacity=3)
+        writer.publish(np.array([[1.0, 10.0]]), version=1)
+        read_shared_candles(writer.handle)
+        self.assertIn(writer.handle.name, shared_candles._attached_blocks)
+
+        name = writer.handle.name
+        writer.close()
+        self.writer.publish(np.array([[1.0, 10.0]]), version=1)
+        read_shared_candles(self.writer.handle)
+
+        self.assertNotIn(name, shared_candles._attached_blocks)
+        self.assertIn(self.writer.handle.name, shared_candles._attached_blocks)
+
+    def test_blocks_of_unrelated_processes_unregistered_from_resource_tracker(self):
+        self.writer.publish(np.array([[1.0, 10.0]]), version=1)
+        # A process not started by the writer process has its own resource tracker
+        handle = self.writer.handle._replace(owner_pid=-1)
+
+        with patch("hummingbot.data_feed.candles_feed.shared_candles.resource_tracker.unregister") as unregister_mock:
+            self.assertEqual([[1, 10]], read_shared_candles(handle).values.tolist())
+
+        unregister_mock.assert_called_once_with(shared_candles._attached_blocks[handle.name].shared_memory._name,
+                                                "shared_memory")
+
+    @patch("hummingbot.data_feed.candles_feed.shared_candles.resource_tracker.unregister")
+    def test_blocks_of_writer_process_kept_registered(self, unregister_mock):
+        self.writer.publish(np.array([[1.0, 10.0]]), version=1)
+
+        read_shared_candles(self.writer.handle)
+
+        unregister_mock.assert_not_called()
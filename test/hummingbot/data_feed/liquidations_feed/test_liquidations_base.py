@@ -0,0 +1,73 @@
+import time
+import unittest
+
+from hummingbot.data_feed.liquidations_feed.binance import BinancePerpetualLiquidations
+from hummingbot.data_feed.liquidations_feed.liquidations_base import Liquidation, LiquidationSide, LiquidationsStore
+
+
+class LiquidationsStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.store = LiquidationsStore(retention_ms=10_000, initial_capacity=4)
+
+    def test_stale_liquidations_evicted_on_append(self):
+        for timestamp in range(0, 20_000, 1_000):
+            self.store.append(timestamp=timestamp, quantity=1, price=10, side=LiquidationSide.LONG)
+        capacity = self.store.capacity
+        for timestamp in range(20_000, 200_000, 1_000):
+            self.store.append(timestamp=timestamp, quantity=1, price=10, side=LiquidationSide.LONG)
+
+        self.assertEqual(list(range(190_000, 200_000, 1_000)), list(self.store.timestamps))
+        # The arrays are compacted instead of growing once the retained liquidations fit in them
+        self.assertEqual(capacity, self.store.capacity)
+
+    def test_out_of_order_liquidations_are_kept_sorted(self):
+        self.store.append(timestamp=1_000, quantity=1, price=10, side=LiquidationSide.LONG)
+        self.store.append(timestamp=3_000, quantity=3, price=10, side=LiquidationSide.LONG)
+        self.store.append(timestamp=2_000, quantity=2, price=10, side=LiquidationSide.SHORT)
+
+        self.assertEqual([1_000, 2_000, 3_000], list(self.store.timestamps))
+        self.assertEqual([1, 2, 3], list(self.store.quantities))
+
+    def test_volume_by_side_in_time_range(self):
+        self.store.append(timestamp=1_000, quantity=1, price=10, side=LiquidationSide.LONG)
+        self.store.append(timestamp=2_000, quantity=2, price=11, side=LiquidationSide.SHORT)
+        self.store.append(timestamp=3_000, quantity=3, price=12, side=LiquidationSide.LONG)
+
+        self.assertEqual({LiquidationSide.LONG: 3, LiquidationSide.SHORT: 2},
+                         self.store.volume_by_side(start_timestamp=2_000))
+        self.assertEqual({LiquidationSide.LONG: 10, LiquidationSide.SHORT: 22},
+                         self.store.volume_by_side(end_timestamp=2_000, in_quote=True))
+        self.assertEqual({LiquidationSide.LONG: 0, LiquidationSide.SHORT: 0},
+                         self.store.volume_by_side(start_timestamp=4_000))
+
+    def test_to_df(self):
+        self.store.append(timestamp=1_000, quantity=1, price=10, side=LiquidationSide.LONG)
+        self.store.append(timestamp=2_000, quantity=2, price=11, side=LiquidationSide.SHORT)
+
+        liquidations_df = self.store.to_df("BTC-USDT", start_timestamp=1_500)
+
+        self.assertEqual(["timestamp", "trading_pair", "quantity", "price", "side"], list(liquidations_df.columns))
+        self.assertEqual([[2_000, "BTC-USDT", 2, 11, LiquidationSide.SHORT]], liquidations_df.values.tolist())
+
+
+class LiquidationsBaseTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.liquidations_feed = BinancePerpetualLiquidations(trading_pairs=set(), max_retention_seconds=60)
+
+    def test_liquidations_volume_of_last_seconds(self):
+        now_ms = int(time.time() * 1000)
+        for timestamp, quantity, side in [(now_ms - 30_000, 1, LiquidationSide.LONG),
+                                          (now_ms - 5_000, 2, LiquidationSide.LONG),
+                                          (now_ms - 1_000, 4, LiquidationSide.SHORT)]:
+            self.liquidations_feed.add_liquidation(Liquidation(timestamp=timestamp, trading_pair="BTC-USDT",
+                                                               quantity=quantity, price=100, side=side))
+
+        self.assertEqual({LiquidationSide.LONG: 2, LiquidationSide.SHORT: 4},
+                         self.liquidations_feed.liquidations_volume("BTC-USDT", seconds=10))
+        self.assertEqual({LiquidationSide.LONG: 0, LiquidationSide.SHORT: 0},
+                         self.liquidations_feed.liquidations_volume("ETH-USDT", seconds=10))
+        self.assertEqual(3, len(self.liquidations_feed.liquidations_df("BTC-USDT")))
@@ -0,0 +1,153 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from os.path import basename, join
+
+from sqlalchemy.orm import joinedload
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.archived_trade_summary import ArchivedTradeSummary
+from hummingbot.model.controller_performance import ControllerPerformance
+from hummingbot.model.db_archiver import DBArchiver
+from hummingbot.model.executors import Executors
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+def _timestamp(year: int, month: int, day: int) -> float:
+    return datetime(year, month, day, tzinfo=timezone.utc).timestamp()
+
+
+class DBArchiverTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                            SQLConnectionType.TRADE_FILLS,
+                                            db_path=join(self.temp_dir.name, "trades.sqlite"))
+        self.now = _timestamp(2024, 5, 15)
+
+    def tearDown(self) -> None:
+        self.manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def add_order(self, order_id: str, timestamp: float, amount: Decimal, price: Decimal, status: str):
+        timestamp_ms = int(timestamp * 1e3)
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(Order(id=order_id, config_file_path="config.yml", strategy="pure_market_making",
+                                  market="binance", symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT",
+                                  creation_timestamp=timestamp_ms, order_type="LIMIT", amount=amount,
+                                  leverage=1, price=price, last_status=status,
+                                  last_update_timestamp=timestamp_ms))
+                session.add(OrderStatus(order_id=order_id, timestamp=timestamp_ms, status=status))
+
+    def add_filled_order(self, order_id: str, timestamp: float, amount: Decimal, price: Decimal):
+        self.add_order(order_id, timestamp, amount, price, "BuyOrderCompleted")
+        timestamp_ms = int(timestamp * 1e3)
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(TradeFill(config_file_path="config.yml", strategy="pure_market_making",
+                                      market="binance", symbol="ETH-USDT", base_asset="ETH", quote_asset="USDT",
+                                      timestamp=timestamp_ms, order_id=order_id, trade_type="BUY",
+                                      order_type="LIMIT", price=price, amount=amount, leverage=1, trade_fee={},
+                                      trade_fee_in_quote=Decimal("0.1"), exchange_trade_id=f"trade_{order_id}"))
+                session.add(MarketData(timestamp=timestamp_ms, exchange="binance", trading_pair="ETH-USDT",
+                                       mid_price=price, best_bid=price, best_ask=price))
+
+    def test_month_start(self):
+        self.assertEqual(_timestamp(2024, 5, 1), DBArchiver.month_start(self.now))
+        self.assertEqual(_timestamp(2023, 12, 1), DBArchiver.month_start(self.now, months_back=5))
+
+    def test_closed_months_moved_to_archives(self):
+        self.add_filled_order("OID1", _timestamp(2024, 1, 10), Decimal("1"), Decimal("100"))
+        self.add_filled_order("OID2", _timestamp(2024, 1, 20), Decimal("2"), Decimal("110"))
+        self.add_filled_order("OID3", _timestamp(2024, 2, 10), Decimal("1"), Decimal("120"))
+        self.add_filled_order("OID4", _timestamp(2024, 4, 10), Decimal("1"), Decimal("130"))
+
+        archive_paths = DBArchiver(self.manager).archive(hot_months=2, now=self.now)
+
+        self.assertEqual(["trades_2024_01.sqlite", "trades_2024_02.sqlite"],
+                         [basename(path) for path in archive_paths])
+        self.assertEqual(archive_paths, self.manager.archive_db_paths())
+        with self.manager.get_new_session() as session:
+            self.assertEqual(["OID4"], [order.id for order in session.query(Order).all()])
+            self.assertEqual(["OID4"], [trade.order_id for trade in session.query(TradeFill).all()])
+            self.assertEqual(1, session.query(OrderStatus).count())
+            self.assertEqual(1, session.query(MarketData).count())
+
+            summaries = session.query(ArchivedTradeSummary).order_by(ArchivedTradeSummary.period).all()
+            self.assertEqual(["2024-01", "2024-02"], [summary.period for summary in summaries])
+            self.assertEqual(2, summaries[0].trades_count)
+            self.assertEqual(Decimal("3"), summaries[0].volume)
+            self.assertEqual(Decimal("320"), summaries[0].volume_quote)
+            self.assertEqual(Decimal("0.2"), summaries[0].fees_quote)
+
+        archived_trades = self.manager.query_archives(
+            lambda session: session.query(TradeFill).options(joinedload(TradeFill.order)),
+            start_timestamp=_timestamp(2024, 2, 1))
+        self.assertEqual(["OID3"], [trade.order_id for trade in archived_trades])
+        self.assertEqual(Decimal("120"), archived_trades[0].order.price)
+
+    def test_archive_again_only_archives_new_closed_months(self):
+        self.add_filled_order("OID1", _timestamp(2024, 1, 10), Decimal("1"), Decimal("100"))
+        archiver = DBArchiver(self.manager)
+        archiver.archive(hot_months=2, now=self.now)
+
+        self.assertEqual([], archiver.archive(hot_months=2, now=self.now))
+
+        self.add_filled_order("OID2", _timestamp(2024, 1, 20), Decimal("2"), Decimal("110"))
+        archiver.archive(hot_months=2, now=self.now)
+
+        archived_orders = self.manager.query_archives(lambda session: session.query(Order))
+        self.assertEqual(["OID1", "OID2"], sorted(order.id for order in archived_orders))
+        with self.manager.get_new_session() as session:
+            summaries = session.query(ArchivedTradeSummary).all()
+            self.assertEqual(1, len(summaries))
+            self.assertEqual(2, summaries[0].trades_count)
+            self.assertEqual(int(_timestamp(2024, 1, 10) * 1e3), summaries[0].first_timestamp)
+            self.assertEqual(int(_timestamp(2024, 1, 20) * 1e3), summaries[0].last_timestamp)
+
+    def test_open_orders_are_not_archived(self):
+        self.add_order("OID1", _timestamp(2024, 1, 10), Decimal("1"), Decimal("100"), "BuyOrderCreated")
+        self.add_order("OID2", _timestamp(2024, 1, 20), Decimal("1"), Decimal("100"), "OrderCancelled")
+
+        DBArchiver(self.manager).archive(hot_months=2, now=self.now)
+
+        archived_orders = self.manager.query_archives(lambda session: session.query(Order))
+        self.assertEqual(["OID2"], [order.id for order in archived_orders])
+        with self.manager.get_new_session() as session:
+            self.assertEqual(["OID1"], [order.id for order in session.query(Order).all()])
+            self.assertEqual(["OID1"], [status.order_id for status in session.query(OrderStatus).all()])
+
+    def test_archived_executors_are_counted_in_the_controller_rollups(self):
+        close_timestamp = int(_timestamp(2024, 1, 10))
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for executor_id in ("1", "2"):
+                    session.add(Executors(id=executor_id, timestamp=close_timestamp, type="position_executor",
+                                          close_type=CloseType.TAKE_PROFIT.value, close_timestamp=close_timestamp,
+                                          status=RunnableStatus.TERMINATED.value, config={}, net_pnl_pct=0,
+                                          net_pnl_quote=1.0, cum_fees_quote=0, filled_amount_quote=10,
+                                          is_active=False, is_trading=False, custom_info={}, controller_id="first"))
+
+        DBArchiver(self.manager).archive(hot_months=2, now=self.now)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Executors).count())
+            rollup = ControllerPerformance.get(session, "first")
+            self.assertEqual(2, rollup.executors_count)
+            self.assertEqual(2.0, rollup.realized_pnl_quote)
+
+    def test_wal_journal_mode(self):
+        with self.manager.engine.connect() as conn:
+            self.assertEqual("wal", conn.exec_driver_sql("PRAGMA journal_mode").scalar())
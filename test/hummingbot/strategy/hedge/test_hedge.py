@@ -1,6 +1,7 @@
 import unittest
 from decimal import Decimal
 from test.mock.mock_perp_connector import MockPerpConnector
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pandas as pd
 
@@ -10,7 +11,9 @@ from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
-from hummingbot.core.data_type.common import PositionMode, PositionSide
+from hummingbot.core.data_type.common import OrderType, PositionMode, PositionSide, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.strategy.hedge.hedge import HedgeStrategy
 from hummingbot.strategy.hedge.hedge_config_map_pydantic import HedgeConfigMap
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -215,3 +218,105 @@ class HedgeConfigMapPydanticTest(unittest.TestCase):
             offsets = self.offsets,
         )
         self.assertIsNone(strategy.hedge_by_amount())
+
+    def test_hedge_on_fill_adds_fills_to_exposure(self):
+        self.config_map.hedge_on_fill = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.update_exposure_snapshot()
+        _, value_before_fill = strategy.get_hedge_direction_and_value()
+
+        strategy.did_fill_order(self.get_fill_event("ETH-USDT", TradeType.BUY, Decimal("1")))
+        self.assertFalse(strategy._has_unhedged_fills)
+
+        strategy.did_fill_order(self.get_fill_event("BTC-USDT", TradeType.BUY, Decimal("1")))
+        self.assertTrue(strategy._has_unhedged_fills)
+        is_buy, value = strategy.get_hedge_direction_and_value()
+        self.assertEqual(is_buy, False)
+        self.assertEqual(value, value_before_fill + Decimal("100"))
+
+        strategy.update_exposure_snapshot()
+        self.assertEqual(len(strategy._fill_amounts), 0)
+
+    def test_hedge_on_fill_ignores_fills_older_than_the_snapshot(self):
+        self.config_map.hedge_on_fill = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.update_exposure_snapshot()
+        strategy._last_snapshot_timestamp = self.start_timestamp + 10
+
+        strategy.did_fill_order(self.get_fill_event("BTC-USDT", TradeType.BUY, Decimal("1")))
+
+        self.assertFalse(strategy._has_unhedged_fills)
+        self.assertEqual(len(strategy._fill_amounts), 0)
+
+    @patch("hummingbot.strategy.hedge.hedge.HedgeStrategy.active_markets", new_callable=PropertyMock)
+    def test_hedge_on_fill_updates_snapshot_every_hedge_interval(self, active_markets_mock):
+        active_markets_mock.return_value = []
+        self.config_map.hedge_on_fill = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy._last_timestamp = strategy._last_snapshot_timestamp = self.start_timestamp
+        strategy.hedge = MagicMock()
+        strategy.update_exposure_snapshot = MagicMock()
+        strategy.check_and_cancel_active_orders = MagicMock(return_value=False)
+
+        for seconds in range(1, 61):
+            strategy._has_unhedged_fills = True
+            strategy.tick(self.start_timestamp + seconds)
+
+        self.assertEqual(60, strategy.hedge.call_count)
+        strategy.update_exposure_snapshot.assert_called_once()
+
+    def test_hedge_split_by_max_order_value(self):
+        self.config_map.max_order_value = Decimal("50")
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        self.assertTrue(strategy.is_split_required(Decimal("150")))
+        self.assertFalse(strategy.is_split_required(Decimal("50")))
+        _, amount = strategy.calculate_hedge_price_and_amount(False, Decimal("150"))
+        self.assertEqual(amount, Decimal("0.5"))
+
+    def test_hedge_price_from_order_book_depth(self):
+        self.config_map.use_vwap_price = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        hedge_market_pair = self.market_trading_pairs["binance_perpetual"]
+        book_price = hedge_market_pair.get_price_for_volume(False, Decimal("1.5")).result_price
+
+        price, _ = strategy.calculate_hedge_price_and_amount(False, Decimal("150"))
+
+        self.assertEqual(price, max(book_price, Decimal("98")))
+        self.assertLessEqual(price, hedge_market_pair.get_mid_price())
+
+    def get_fill_event(self, trading_pair: str, trade_type: TradeType, amount: Decimal) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=self.start_timestamp,
+            order_id="OID1",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=amount,
+            trade_fee=AddedToCostTradeFee(),
+        )
@@ -519,6 +519,72 @@ class LiquidityMiningTest(unittest.TestCase):
         # assert that volatility is none zero
         self.assertAlmostEqual(float(strategy.market_status_df().loc[0, 'Volatility'].strip('%')), 10.00, delta=0.1)
 
+    def create_strategy(self, market: MockPaperExchange, market_infos: Dict[str, MarketTradingPairTuple]):
+        strategy = LiquidityMiningStrategy()
+        strategy.init_params(
+            client_config_map=ClientConfigMap(),
+            exchange=market,
+            market_infos=market_infos,
+            token="ETH",
+            order_amount=Decimal(2),
+            spread=Decimal("0.0005"),
+            inventory_skew_enabled=False,
+            target_base_pct=Decimal("0.5"),
+            order_refresh_time=5,
+            order_refresh_tolerance_pct=Decimal("0.1"),
+            max_order_age=100,
+        )
+        return strategy
+
+    @unittest.mock.patch('hummingbot.strategy.liquidity_mining.liquidity_mining.build_trade_fee')
+    def test_only_changed_markets_are_refreshed(self, estimate_fee_mock):
+        estimate_fee_mock.return_value = AddedToCostTradeFee(percent=0)
+        strategy = self.create_strategy(self.market, self.market_infos)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_ids = {order.client_order_id for order in strategy.active_orders}
+        self.assertEqual(4, len(order_ids))
+
+        # The refresh time passed but neither the prices nor the balances changed
+        self.clock.backtest_til(self.start_timestamp + 10)
+        self.assertEqual(order_ids, {order.client_order_id for order in strategy.active_orders})
+        self.assertEqual(set(), strategy.markets_to_refresh(strategy.active_orders_by_market()))
+        # The fee is calculated once per market
+        self.assertEqual(2, estimate_fee_mock.call_count)
+
+        self.market.set_balance("BTC", 50)
+        strategy._token_balances = strategy.adjusted_available_balances()
+        self.assertEqual({"ETH-BTC"}, strategy.markets_to_refresh(strategy.active_orders_by_market()))
+
+    @unittest.mock.patch('hummingbot.strategy.liquidity_mining.liquidity_mining.build_trade_fee')
+    def test_orders_created_in_batch_with_exchange_batch_order_create(self, estimate_fee_mock):
+        estimate_fee_mock.return_value = AddedToCostTradeFee(percent=0)
+
+        class BatchOrdersPaperExchange(MockPaperExchange):
+            def batch_order_create(self, orders_to_create):
+                self.batch_requests.append(orders_to_create)
+                return super().batch_order_create(orders_to_create)
+
+        market = BatchOrdersPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.batch_requests = []
+        market_infos = {}
+        for trading_pair in ["ETH-USDT", "ETH-BTC"]:
+            market.set_balanced_order_book(trading_pair=trading_pair, mid_price=100, min_price=1, max_price=200,
+                                           price_step_size=1, volume_step_size=10)
+            market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+            market_infos[trading_pair] = MarketTradingPairTuple(market, trading_pair, *trading_pair.split("-"))
+        for asset, value in {"USDT": 5000, "ETH": 500, "BTC": 100}.items():
+            market.set_balance(asset, value)
+        strategy = self.create_strategy(market, market_infos)
+
+        self.clock.add_iterator(market)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        self.assertEqual(1, len(market.batch_requests))
+        self.assertEqual(4, len(market.batch_requests[0]))
+        self.assertEqual(4, len(strategy.active_orders))
+
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotApplication.main_application')
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotCLI')
     def test_strategy_with_default_cfg_does_not_send_in_app_notifications(self, cli_class_mock,
@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio,
+)
+from hummingbot.strategy.pure_market_making.multi_market_proposals import (
+    apply_budget_constraint,
+    apply_order_optimization,
+    calculate_bid_ask_ratios,
+    create_base_proposals,
+    is_within_tolerance,
+    quantize,
+)
+
+
+class MultiMarketProposalsTest(unittest.TestCase):
+
+    def test_create_base_proposals(self):
+        proposals = create_base_proposals(buy_reference_prices=np.array([100.0, np.nan]),
+                                          sell_reference_prices=np.array([100.0, 10.0]),
+                                          bid_spreads=np.array([0.01, 0.01]),
+                                          ask_spreads=np.array([0.02, 0.02]),
+                                          order_amounts=np.array([1.0, 10.0]),
+                                          order_levels=2,
+                                          order_level_spread=0.01,
+                                          order_level_amount=0.5)
+
+        np.testing.assert_allclose([[99, 98], [0, 0]], proposals.buy_prices)
+        np.testing.assert_allclose([[1, 1.5], [0, 0]], proposals.buy_amounts)
+        np.testing.assert_allclose([[102, 103], [10.2, 10.3]], proposals.sell_prices)
+        np.testing.assert_allclose([[1, 1.5], [10, 10.5]], proposals.sell_amounts)
+
+    def test_bid_ask_ratios_match_single_market_calculation(self):
+        base_amounts = np.array([0.0, 0.5, 1.0, 1.5, 3.0, 1.0, 1.0])
+        quote_amounts = np.array([200.0, 150.0, 100.0, 50.0, 0.0, 0.0, 100.0])
+        prices = np.full(7, 100.0)
+        target_ratios = np.array([0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.2])
+        ranges = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0])
+
+        bid_ratios, ask_ratios = calculate_bid_ask_ratios(base_amounts, quote_amounts, prices, target_ratios, ranges)
+
+        for index in range(len(prices)):
+            expected = calculate_bid_ask_ratios_from_base_asset_ratio(
+                base_amounts[index], quote_amounts[index], prices[index], target_ratios[index], ranges[index])
+            self.assertAlmostEqual(expected.bid_ratio, bid_ratios[index])
+            self.assertAlmostEqual(expected.ask_ratio, ask_ratios[index])
+
+    def test_budget_shared_between_markets_with_the_same_asset(self):
+        # ETH-USDT, BTC-USDT and ETH-BTC with the assets BTC, ETH, USDT
+        proposals = create_base_proposals(buy_reference_prices=np.array([100.0, 1000.0, 0.1]),
+                                          sell_reference_prices=np.array([100.0, 1000.0, 0.1]),
+                                          bid_spreads=np.zeros(3),
+                                          ask_spreads=np.zeros(3),
+                                          order_amounts=np.array([1.0, 0.1, 1.0]),
+                                          order_levels=2)
+
+        apply_budget_constraint(proposals,
+                                base_asset_indexes=np.array([1, 0, 1]),
+                                quote_asset_indexes=np.array([2, 2, 0]),
+                                available_balances=np.array([1.0, 1.5, 250.0]),
+                                buy_fee_pcts=np.zeros(3))
+
+        # 200 USDT to buy ETH, the rest to buy BTC
+        np.testing.assert_allclose([[1, 1], [0.05, 0]], proposals.buy_amounts[:2])
+        np.testing.assert_allclose([[1, 1]], proposals.buy_amounts[2:])
+        # 1.5 ETH to sell in ETH-USDT first, then in ETH-BTC
+        np.testing.assert_allclose([[1, 0.5], [0.1, 0.1], [0, 0]], proposals.sell_amounts)
+
+    def test_order_optimization(self):
+        proposals = create_base_proposals(buy_reference_prices=np.array([100.0, 100.0]),
+                                          sell_reference_prices=np.array([100.0, 100.0]),
+                                          bid_spreads=np.array([0.05, 0.01]),
+                                          ask_spreads=np.array([0.05, 0.01]),
+                                          order_amounts=np.ones(2))
+
+        apply_order_optimization(proposals,
+                                 top_bid_prices=np.array([97.0, 98.0]),
+                                 top_ask_prices=np.array([103.0, np.nan]),
+                                 price_quanta=np.array([0.5, 0.5]))
+
+        np.testing.assert_allclose([[95], [98.5]], proposals.buy_prices)
+        np.testing.assert_allclose([[105], [101]], proposals.sell_prices)
+
+    def test_quantize_and_tolerance(self):
+        prices = quantize(np.array([[100.26, 99.74]]), np.array([0.1]))
+        np.testing.assert_allclose([[100.2, 99.7]], prices)
+
+        within_tolerance = is_within_tolerance(
+            current_prices=np.array([[100.0, np.nan], [100.0, 99.0], [100.0, np.nan]]),
+            proposal_prices=np.array([[100.05, np.nan], [100.0, np.nan], [101.0, np.nan]]),
+            tolerance=0.001)
+        self.assertEqual([True, False, False], list(within_tolerance))
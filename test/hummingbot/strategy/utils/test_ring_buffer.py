@@ -107,3 +107,40 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_statistics_match_numpy_calculations(self):
+        np.random.seed(3141592653)
+        values = np.random.normal(100, 0.1, self.BUFFER_LENGTH * 5)
+
+        for index, value in enumerate(values):
+            self.buffer.add_value(value)
+            stored_values = self.buffer.get_as_numpy_array()
+            self.assertEqual(min(index + 1, self.BUFFER_LENGTH), self.buffer.count)
+            self.assertAlmostEqual(np.sum(stored_values), self.buffer.sum, 8)
+            self.assertAlmostEqual(np.sqrt(np.sum(np.square(np.diff(stored_values))) / stored_values.size),
+                                   self.buffer.realized_volatility,
+                                   10)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(stored_values), self.buffer.mean_value, 10)
+                self.assertAlmostEqual(np.var(stored_values), self.buffer.variance, 10)
+                self.assertAlmostEqual(np.std(stored_values), self.buffer.std_dev, 10)
+
+    def test_realized_volatility(self):
+        self.assertTrue(np.isnan(self.buffer.realized_volatility))
+        self.buffer.add_value(1)
+        self.assertEqual(0, self.buffer.realized_volatility)
+        self.buffer.add_value(3)
+        self.buffer.add_value(1)
+        self.assertEqual(np.sqrt(8 / 3), self.buffer.realized_volatility)
+
+    def test_statistics_after_changing_length(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 5
+
+        self.assertTrue(self.buffer.is_full)
+        self.assertEqual(5, self.buffer.count)
+        self.assertEqual(sum(range(self.BUFFER_LENGTH - 5, self.BUFFER_LENGTH)), self.buffer.sum)
+        self.assertEqual(np.var(np.arange(self.BUFFER_LENGTH - 5, self.BUFFER_LENGTH)), self.buffer.variance)
+        self.assertEqual(np.sqrt(4 / 5), self.buffer.realized_volatility)
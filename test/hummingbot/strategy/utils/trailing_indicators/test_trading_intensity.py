@@ -259,3 +259,91 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_deterministic_log_linear_fit(self):
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        a = 2
+        b = 0.1
+
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="log_linear")
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+
+        timestamp += 1
+
+        for p in trade_price_levels:
+            new_trade = OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=a * np.exp(-b * (p - last_price)),
+                type=TradeType.SELL,
+            )
+            trading_intensity_indicator.register_trade(new_trade)
+
+        trading_intensity_indicator.calculate(timestamp)
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        self.assertAlmostEqual(a, alpha, 10)
+        self.assertAlmostEqual(b, kappa, 10)
+
+    def test_invalid_estimation_parameters_raise_error(self):
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="invalid")
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, estimation_interval=0)
+
+    def test_trades_matched_with_latest_previous_quote_and_consolidated(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        indicator.last_quotes = [
+            {"timestamp": 3, "price": 12},
+            {"timestamp": 2, "price": 11},
+            {"timestamp": 1, "price": 10},
+        ]
+
+        for trade_timestamp, price, amount in [(2.5, 13, 1), (3.5, 15, 2), (1.5, 13, 4)]:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=trade_timestamp,
+                price=price,
+                amount=amount,
+                type=TradeType.BUY,
+            ))
+        indicator.calculate(4)
+
+        # The timestamp 2 sample was evicted because the sampling length is 2
+        self.assertEqual({2: 1, 3: 2}, indicator.trades_consolidated)
+        # Only the quotes from the latest matched one are kept
+        self.assertEqual([4, 3], [quote["timestamp"] for quote in indicator.last_quotes])
+        self.assertTrue(indicator.is_sampling_buffer_full)
+
+    def test_intensity_estimated_only_when_samples_change_and_interval_elapsed(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, estimation_interval=3)
+        indicator.last_quotes = [{"timestamp": 0, "price": 1}]
+
+        def register_trades(timestamp):
+            for price in [2, 3, 4, 5]:
+                indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=price,
+                    amount=2 * np.exp(-0.1 * (price - 1)) * timestamp,
+                    type=TradeType.SELL,
+                ))
+
+        register_trades(1)
+        indicator.calculate(1)
+        self.assertEqual((0, 0), indicator.current_value)
+
+        indicator.calculate(2)
+        indicator.calculate(3)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(2, alpha, 6)
+        self.assertAlmostEqual(0.1, kappa, 6)
+
+        # No new trades, no new estimation
+        for timestamp in range(4, 10):
+            indicator.calculate(timestamp)
+        self.assertEqual((alpha, kappa), indicator.current_value)
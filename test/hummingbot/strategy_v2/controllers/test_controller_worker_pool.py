@@ -0,0 +1,64 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.strategy_v2.controllers.controller_worker_pool import ControllerWorkerPool
+
+
+class MeanCloseController(ControllerBase):
+
+    async def update_processed_data(self):
+        await self.update_processed_data_from_candles()
+
+    @staticmethod
+    def compute_processed_data(config: ControllerConfigBase, candles: List[pd.DataFrame]) -> Dict:
+        return {"controller_id": config.id, "mean_close": candles[0]["close"].mean()}
+
+
+class ControllerWorkerPoolTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self):
+        super().setUp()
+        config = ControllerConfigBase(id="test",
+                                      controller_name="test_controller",
+                                      candles_config=[CandlesConfig(connector="binance",
+                                                                    trading_pair="ETH-USDT",
+                                                                    interval="1m",
+                                                                    max_records=2)])
+        self.candles_feed = MagicMock()
+        self.candles_feed.columns = ["timestamp", "close"]
+        self.candles_feed.candles_array = np.array([[1.0, 10.0], [2.0, 20.0], [3.0, 40.0]])
+        self.candles_feed.candles_version = 1
+        self.market_data_provider = MagicMock(spec=MarketDataProvider)
+        self.market_data_provider.get_candles_feed.return_value = self.candles_feed
+        self.market_data_provider.get_candles_df.return_value = pd.DataFrame(
+            self.candles_feed.candles_array[-2:], columns=self.candles_feed.columns)
+        self.controller = MeanCloseController(config=config,
+                                              market_data_provider=self.market_data_provider,
+                                              actions_queue=AsyncMock(spec=asyncio.Queue))
+
+    async def test_processed_data_computed_in_this_process_without_pool(self):
+        await self.controller.update_processed_data()
+
+        self.assertEqual({"controller_id": "test", "mean_close": 30.0}, self.controller.processed_data)
+
+    async def test_processed_data_computed_in_worker_process(self):
+        worker_pool = ControllerWorkerPool(max_workers=1)
+        self.controller.set_worker_pool(worker_pool)
+        try:
+            await self.controller.update_processed_data()
+            self.assertEqual({"controller_id": "test", "mean_close": 30.0}, self.controller.processed_data)
+
+            self.candles_feed.candles_array = np.array([[2.0, 20.0], [3.0, 40.0], [4.0, 60.0]])
+            self.candles_feed.candles_version = 2
+            await self.controller.update_processed_data()
+            self.assertEqual(50.0, self.controller.processed_data["mean_close"])
+        finally:
+            worker_pool.stop()
@@ -1,8 +1,11 @@
+import asyncio
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import numpy as np
+
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
@@ -179,3 +182,35 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
     def test_get_in_flight_order(self):
         in_flight_orders = self.component.get_in_flight_order("connector1", "OID-BUY-1")
         self.assertEqual(in_flight_orders, None)
+
+    async def test_wait_for_next_iteration_wakes_up_on_order_book_change(self):
+        self.component.update_interval = 10
+        order_book = self.strategy.connectors["connector1"].get_order_book.return_value
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+        self.component.watch_order_books([("connector1", "ETH-USDT")])
+
+        wait_task = asyncio.create_task(self.component.wait_for_next_iteration())
+        await asyncio.sleep(0)
+        order_book.apply_numpy_diffs(np.array([[100, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+        await asyncio.wait_for(wait_task, timeout=1)
+
+        self.assertTrue(self.component.order_books_changed)
+        self.assertFalse(self.component._order_book_change_notifier.changed)
+
+    async def test_wait_for_next_iteration_without_order_book_change(self):
+        self.component.update_interval = 0.01
+        self.component.watch_order_books([("connector1", "ETH-USDT")])
+
+        await self.component.wait_for_next_iteration()
+
+        self.assertFalse(self.component.order_books_changed)
+        self.component.stop()
+        self.assertEqual([], self.component._order_book_change_notifier._order_books)
+
+    @patch.object(ExecutorBase, "is_amm_connector", return_value=True)
+    def test_amm_order_books_are_not_watched(self, _):
+        self.component.watch_order_books([("connector1", "ETH-USDT")])
+
+        self.assertIsNone(self.component._order_book_change_notifier)
+        self.assertTrue(self.component.order_books_changed)
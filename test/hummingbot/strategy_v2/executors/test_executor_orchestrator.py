@@ -31,7 +31,7 @@ class TestExecutorOrchestrator(unittest.TestCase):
     @patch.object(MarketsRecorder, "get_instance")
     def setUp(self, markets_recorder: MagicMock):
         markets_recorder.return_value = MagicMock(spec=MarketsRecorder)
-        markets_recorder.get_all_executors = MagicMock(return_value=[])
+        markets_recorder.get_controllers_performance = MagicMock(return_value={})
         markets_recorder.store_or_update_executor = MagicMock(return_value=None)
         self.mock_strategy = self.create_mock_strategy()
         self.orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
@@ -180,23 +180,15 @@ class TestExecutorOrchestrator(unittest.TestCase):
         mock_markets_recorder = MagicMock(spec=MarketsRecorder)
         mock_get_instance.return_value = mock_markets_recorder
 
-        # Create mock executor info
-        executor_info = ExecutorInfo(
-            id="123", timestamp=1234, type="position_executor",
-            status=RunnableStatus.RUNNING, config=PositionExecutorConfig(
-                timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
-                side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
-            ),
-            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(10), net_pnl_pct=Decimal(10),
-            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={"side": TradeType.BUY},
-            controller_id="test",
-        )
-
-        # Set up mock to return executor info
-        mock_markets_recorder.get_all_executors.return_value = [executor_info]
+        performance = PerformanceReport(realized_pnl_quote=Decimal(10), volume_traded=Decimal(100),
+                                        close_type_counts={CloseType.TAKE_PROFIT: 1})
+        mock_markets_recorder.get_controllers_performance.return_value = {"test": performance}
 
         orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
         self.assertEqual(len(orchestrator.cached_performance), 1)
+        self.assertEqual(performance, orchestrator.cached_performance["test"])
+        self.assertEqual([], orchestrator.active_executors["test"])
+        mock_markets_recorder.get_all_executors.assert_not_called()
 
     @patch.object(MarketsRecorder, "get_instance")
     def test_store_all_positions(self, markets_recorder_mock):